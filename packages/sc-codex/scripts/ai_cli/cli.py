@@ -17,6 +17,7 @@ from ai_cli.task_runner import (
     resolve_model,
 )
 from ai_cli.task_tool import TaskToolInput, TaskToolOutput, task_tool_input_schema
+from ai_cli.worker import TaskWorker, request as worker_request, task_status
 
 
 def _read_json(path: str | None) -> dict:
@@ -98,6 +99,26 @@ def cmd_run_child(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_worker_start(args: argparse.Namespace) -> int:
+    TaskWorker(
+        socket_path=Path(args.socket) if args.socket else None,
+        max_concurrent=args.max_concurrent,
+        queue_size=args.queue_size,
+    ).serve_forever()
+    return 0
+
+
+def cmd_worker_status(args: argparse.Namespace) -> int:
+    status = task_status(args.agent_id, Path(args.socket) if args.socket else None)
+    print(json.dumps(status, indent=2))
+    return 0 if status.get("ok") else 1
+
+
+def cmd_worker_stop(args: argparse.Namespace) -> int:
+    worker_request({"op": "stop"}, Path(args.socket) if args.socket else None)
+    return 0
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="ai_cli tooling")
     sub = ap.add_subparsers(dest="cmd", required=True)
@@ -128,6 +149,20 @@ def main() -> int:
     p_child.add_argument("--output-file", required=True, help=argparse.SUPPRESS)
     p_child.set_defaults(func=cmd_run_child)
 
+    p_worker = sub.add_parser("worker", help="Run or query the background task worker")
+    worker_sub = p_worker.add_subparsers(dest="worker_cmd", required=True)
+    p_worker_start = worker_sub.add_parser("start", help="Serve background tasks until stopped")
+    p_worker_start.add_argument("--max-concurrent", type=int, help="Concurrent runner executions (default 4)")
+    p_worker_start.add_argument("--queue-size", type=int, help="Queued tasks before submits are refused (default 64)")
+    p_worker_start.set_defaults(func=cmd_worker_start)
+    p_worker_status = worker_sub.add_parser("status", help="Show worker counters or one task's state")
+    p_worker_status.add_argument("--agent-id", help="agentId returned by a background run")
+    p_worker_status.set_defaults(func=cmd_worker_status)
+    p_worker_stop = worker_sub.add_parser("stop", help="Stop the worker after running tasks finish")
+    p_worker_stop.set_defaults(func=cmd_worker_stop)
+    for parser in (p_worker_start, p_worker_status, p_worker_stop):
+        parser.add_argument("--socket", help="Socket path (default .sc/ai-cli-worker.sock)")
+
     args = ap.parse_args()
     try:
         return args.func(args)
@@ -1,16 +1,50 @@
 #!/usr/bin/env python3
-"""Lightweight structured logging for ai_cli."""
+"""Lightweight structured logging for ai_cli.
+
+Events are appended as compact JSON lines to segment files in
+`.claude/state/logs/<package>/` (or AI_CLI_LOG_DIR):
+
+    ai-cli-<YYYYMMDD_HHMMSS_mmm>.jsonl
+
+A segment is closed once it reaches AI_CLI_LOG_MAX_BYTES or is older than
+AI_CLI_LOG_ROTATE_SECONDS; processes writing to the same directory share
+the newest open segment. Writes are buffered per process and flushed
+every AI_CLI_LOG_FLUSH_SECONDS, immediately for error events, and at
+exit. Each flush is a single O_APPEND write of whole lines, so concurrent
+writers never interleave within a line.
+"""
 from __future__ import annotations
 
+import atexit
 import inspect
 import json
 import os
 import sys
+import threading
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+SEGMENT_PREFIX = "ai-cli-"
+SEGMENT_SUFFIX = ".jsonl"
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_ROTATE_SECONDS = 3600.0
+DEFAULT_FLUSH_SECONDS = 2.0
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
 
 
+@lru_cache(maxsize=None)
 def _derive_package_name() -> str:
     env_name = os.getenv("AI_CLI_PACKAGE_NAME") or os.getenv("SC_PACKAGE_NAME")
     if env_name:
@@ -47,23 +81,248 @@ def _derive_package_name() -> str:
 
 
 def _default_log_dir() -> Path:
+    override = os.getenv("AI_CLI_LOG_DIR")
+    if override:
+        return Path(override).expanduser()
     package_name = _derive_package_name()
     return Path.cwd() / ".claude" / "state" / "logs" / package_name
 
 
+def _is_error(record: Dict[str, Any]) -> bool:
+    level = str(record.get("level") or record.get("severity") or record.get("status") or "").lower()
+    return level in ("error", "critical", "fatal") or bool(record.get("error"))
+
+
+def _segment_started(path: Path) -> Optional[float]:
+    """Creation time encoded in a segment name (epoch seconds)."""
+    stamp = path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+    try:
+        started = datetime.strptime(stamp, "%Y%m%d_%H%M%S_%f")
+    except ValueError:
+        return None
+    return started.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _segments(log_dir: Path) -> List[Path]:
+    """Segment files of a log directory, oldest first."""
+    return sorted(log_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"))
+
+
+class JsonlLogSink:
+    """Buffered, rotating JSONL writer for one log directory."""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        max_bytes: Optional[int] = None,
+        rotate_seconds: Optional[float] = None,
+        flush_seconds: Optional[float] = None,
+    ) -> None:
+        self.log_dir = Path(log_dir)
+        self.max_bytes = int(max_bytes if max_bytes is not None else _env_number("AI_CLI_LOG_MAX_BYTES", DEFAULT_MAX_BYTES))
+        self.rotate_seconds = (
+            rotate_seconds if rotate_seconds is not None
+            else _env_number("AI_CLI_LOG_ROTATE_SECONDS", DEFAULT_ROTATE_SECONDS)
+        )
+        self.flush_seconds = (
+            flush_seconds if flush_seconds is not None
+            else _env_number("AI_CLI_LOG_FLUSH_SECONDS", DEFAULT_FLUSH_SECONDS)
+        )
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._path: Optional[Path] = None
+        self._fd: Optional[int] = None
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Segment the buffered events will be appended to."""
+        return self._path
+
+    def write(self, record: Dict[str, Any]) -> Path:
+        """Buffer one event; returns the segment it goes to."""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            if self._fd is None:
+                self._open_segment()
+            path = self._path
+            self._buffer.append(line)
+            if self.flush_seconds <= 0 or _is_error(record):
+                self._flush_locked()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_periodically, args=(self._stop,), daemon=True)
+                self._flusher.start()
+            return path
+
+    def flush(self) -> None:
+        """Append buffered events to the current segment."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush and release the segment."""
+        with self._lock:
+            self._flush_locked()
+            self._close_segment()
+            self._stop.set()
+            self._stop = threading.Event()
+            self._flusher = None
+
+    def _flush_periodically(self, stop: threading.Event) -> None:
+        while not stop.wait(self.flush_seconds):
+            self.flush()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        if self._fd is None:
+            self._open_segment()
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer.clear()
+        os.write(self._fd, data)
+        if self._rotation_due():
+            self._close_segment()
+
+    def _rotation_due(self) -> bool:
+        if os.fstat(self._fd).st_size >= self.max_bytes:
+            return True
+        started = _segment_started(self._path)
+        return started is not None and time.time() - started >= self.rotate_seconds
+
+    def _open_segment(self) -> None:
+        """Join the newest segment still open for writes, or start one."""
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        path = None
+        existing = _segments(self.log_dir)
+        if existing:
+            newest = existing[-1]
+            started = _segment_started(newest)
+            try:
+                size = newest.stat().st_size
+            except OSError:
+                size = self.max_bytes
+            if started is not None and size < self.max_bytes and time.time() - started < self.rotate_seconds:
+                path = newest
+        if path is None:
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")[:-3]
+            path = self.log_dir / f"{SEGMENT_PREFIX}{stamp}{SEGMENT_SUFFIX}"
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._path = path
+
+    def _close_segment(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = None
+        self._path = None
+
+
+_sinks: Dict[Path, JsonlLogSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def _sink(log_dir: Path) -> JsonlLogSink:
+    key = Path(log_dir).resolve()
+    with _sinks_lock:
+        sink = _sinks.get(key)
+        if sink is None:
+            sink = _sinks[key] = JsonlLogSink(key)
+        return sink
+
+
+def flush_logs() -> None:
+    """Flush every buffered sink of this process."""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+    for sink in sinks:
+        sink.flush()
+
+
+@atexit.register
+def close_logs() -> None:
+    """Flush and close every sink of this process (runs at exit)."""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+        _sinks.clear()
+    for sink in sinks:
+        sink.close()
+
+
 def write_log(event: Dict[str, Any], log_dir: Optional[Path] = None) -> str:
     log_dir = log_dir or _default_log_dir()
-    log_dir.mkdir(parents=True, exist_ok=True)
     ts = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
     record = {
         "timestamp": ts,
         "pid": os.getpid(),
         **event,
     }
-    fname = f"ai-cli-{ts.replace(':','').replace('-','').replace('T','_')}.json"
-    path = log_dir / fname
-    if path.exists():
-        suffix = datetime.now(timezone.utc).strftime("%f")
-        path = log_dir / f"{path.stem}-{suffix}.json"
-    path.write_text(json.dumps(record, indent=2), encoding="utf-8")
-    return str(path)
+    return str(_sink(log_dir).write(record))
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def iter_log_events(
+    log_dir: Optional[Path] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Stream logged events with since <= timestamp < until, oldest segment first.
+
+    Naive datetimes are taken as UTC. Segments started after `until` or last
+    written before `since` are not opened; per-event `.json` files written by
+    older versions are read first.
+    """
+    log_dir = Path(log_dir or _default_log_dir())
+    since, until = _aware(since), _aware(until)
+    flush_logs()
+    if not log_dir.is_dir():
+        return
+
+    for path in sorted(log_dir.glob(f"{SEGMENT_PREFIX}*.json")):
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(record, dict) and _in_range(record, since, until):
+            yield record
+
+    for path in _segments(log_dir):
+        started = _segment_started(path)
+        if until is not None and started is not None and started >= until.timestamp():
+            continue
+        try:
+            if since is not None and path.stat().st_mtime < since.timestamp():
+                continue
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # a line another process is still writing
+                    if _in_range(record, since, until):
+                        yield record
+        except OSError:
+            continue
+
+
+def _in_range(record: Dict[str, Any], since: Optional[datetime], until: Optional[datetime]) -> bool:
+    if since is None and until is None:
+        return True
+    ts = _parse_timestamp(record.get("timestamp"))
+    if ts is None:
+        return False
+    return (since is None or ts >= since) and (until is None or ts < until)
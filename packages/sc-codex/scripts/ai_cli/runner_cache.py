@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Cross-process cache of what ai_cli learned about runner binaries.
+
+Probing `claude --version` / `codex --version` costs hundreds of
+milliseconds, and every CLI call and background child used to pay it.
+Entries are keyed by the resolved binary path and are valid while its
+mtime and size are unchanged, so an upgrade re-probes automatically:
+
+    {"version": 2, "binaries": {"/usr/local/bin/codex": {
+        "mtime_ns": ..., "size": ..., "version": "codex-cli 0.80.0",
+        "model_fallbacks": {"gpt-5.2-codex": {
+            "fallback": "gpt-5.2", "account": "chatgpt:3f2a...", "recorded_at": ...}}}}}
+
+`model_fallbacks` records models the account rejected, so later runs go
+straight to the model that worked. The rejection depends on how Codex is
+authenticated (ChatGPT login vs API key), so a fallback only applies while
+codex_account_key() is unchanged and for MODEL_FALLBACK_TTL_SECONDS.
+
+Writers from several processes are serialized by a lock file next to the
+cache (flock, or msvcrt.locking on Windows).
+
+Environment:
+  AI_CLI_RUNNER_CACHE  cache file, or "off" to always probe
+                       (default: $XDG_CACHE_HOME/synaptic-canvas/ai-cli-runners.json)
+  CODEX_HOME           Codex config directory holding auth.json (default: ~/.codex)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+CACHE_ENV_VAR = "AI_CLI_RUNNER_CACHE"
+CACHE_VERSION = 2
+# A recorded model fallback is retried after this long even if the account is unchanged
+MODEL_FALLBACK_TTL_SECONDS = 24 * 3600
+
+_lock = threading.Lock()
+
+
+def default_cache_path() -> Optional[Path]:
+    """Resolve the on-disk cache location; None when disabled."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override is not None:
+        return None if override.strip().lower() in ("", "0", "off", "none") else Path(override)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "synaptic-canvas" / "ai-cli-runners.json"
+
+
+def resolve_binary(binary: str) -> Optional[Path]:
+    """Resolved path of a binary on PATH, following symlinks."""
+    found = shutil.which(binary)
+    return Path(found).resolve() if found else None
+
+
+def _load(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if isinstance(data, dict) and data.get("version") == CACHE_VERSION and isinstance(data.get("binaries"), dict):
+        return data["binaries"]
+    return {}
+
+
+def _stat_key(binary_path: Path) -> Optional[Dict[str, int]]:
+    try:
+        st = binary_path.stat()
+    except OSError:
+        return None
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def lookup(binary_path: Path) -> Optional[Dict[str, Any]]:
+    """Cached entry for a binary, or None if missing or the binary changed."""
+    cache_path = default_cache_path()
+    key = _stat_key(binary_path)
+    if cache_path is None or key is None:
+        return None
+    entry = _load(cache_path).get(str(binary_path))
+    if not isinstance(entry, dict) or any(entry.get(k) != v for k, v in key.items()):
+        return None
+    return entry
+
+
+@contextmanager
+def _locked(cache_path: Path) -> Iterator[None]:
+    """Hold the cache's lock file exclusively (within and across processes)."""
+    with _lock:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(cache_path.with_name(f"{cache_path.name}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            print(f"Warning: could not lock runner cache {cache_path}: {e}", file=sys.stderr)
+            yield
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is None:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)  # closing the descriptor releases the flock
+
+
+def update(binary_path: Path, **fields: Any) -> None:
+    """Merge fields into a binary's entry, starting afresh if the binary changed."""
+    cache_path = default_cache_path()
+    key = _stat_key(binary_path)
+    if cache_path is None or key is None:
+        return
+    with _locked(cache_path):
+        binaries = _load(cache_path)
+        entry = binaries.get(str(binary_path))
+        if not isinstance(entry, dict) or any(entry.get(k) != v for k, v in key.items()):
+            entry = dict(key)
+        for name, value in fields.items():
+            if isinstance(value, dict) and isinstance(entry.get(name), dict):
+                value = {**entry[name], **value}
+            entry[name] = value
+        binaries[str(binary_path)] = entry
+        payload = {"version": CACHE_VERSION, "binaries": binaries}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: could not write runner cache {cache_path}: {e}", file=sys.stderr)
+
+
+def codex_account_key() -> str:
+    """Identify how Codex is authenticated, without storing credentials.
+
+    An API key (from the environment or auth.json) is identified by a hash
+    of the key, a ChatGPT login by its account id. An unreadable auth.json
+    falls back to its mtime and size.
+    """
+    for name in ("CODEX_API_KEY", "OPENAI_API_KEY"):
+        if os.environ.get(name):
+            return "apikey:" + hashlib.sha256(os.environ[name].encode("utf-8")).hexdigest()[:16]
+    auth_path = Path(os.environ.get("CODEX_HOME") or Path.home() / ".codex") / "auth.json"
+    try:
+        raw = auth_path.read_bytes()
+    except OSError:
+        return "none"
+    try:
+        auth = json.loads(raw)
+    except ValueError:
+        auth = None
+    if isinstance(auth, dict):
+        if auth.get("OPENAI_API_KEY"):
+            return "apikey:" + hashlib.sha256(str(auth["OPENAI_API_KEY"]).encode("utf-8")).hexdigest()[:16]
+        tokens = auth.get("tokens")
+        if isinstance(tokens, dict) and tokens.get("account_id"):
+            return f"chatgpt:{tokens['account_id']}"
+    return "auth:" + hashlib.sha256(raw).hexdigest()[:16]
+
+
+def model_fallback(binary: str, model: str) -> Optional[str]:
+    """Model to use instead of `model`, as learned from an earlier rejection.
+
+    Only fallbacks recorded for the current Codex account within
+    MODEL_FALLBACK_TTL_SECONDS apply.
+    """
+    binary_path = resolve_binary(binary)
+    entry = lookup(binary_path) if binary_path else None
+    recorded = ((entry or {}).get("model_fallbacks") or {}).get(model)
+    if not isinstance(recorded, dict) or recorded.get("account") != codex_account_key():
+        return None
+    if time.time() - recorded.get("recorded_at", 0) > MODEL_FALLBACK_TTL_SECONDS:
+        return None
+    return recorded.get("fallback")
+
+
+def record_model_fallback(binary: str, model: str, fallback: str) -> None:
+    binary_path = resolve_binary(binary)
+    if binary_path:
+        update(binary_path, model_fallbacks={
+            model: {"fallback": fallback, "account": codex_account_key(), "recorded_at": time.time()}
+        })
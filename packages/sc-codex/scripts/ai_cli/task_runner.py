@@ -11,7 +11,6 @@ from __future__ import annotations
 
 import json
 import os
-import shutil
 import subprocess
 import sys
 import time
@@ -19,12 +18,13 @@ import uuid
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional
 
 import yaml
 
 from ai_cli.logging import write_log
 from ai_cli.task_tool import TaskToolInput, TaskToolOutputBackground, TaskToolOutputForeground
+from ai_cli import runner_cache, worker
 
 RunnerType = Literal["claude", "codex"]
 
@@ -54,12 +54,18 @@ _CODEX_NATIVE_MODELS = {
 @lru_cache(maxsize=None)
 def _check_runner_available(runner: RunnerType) -> str:
     binary = "codex" if runner == "codex" else "claude"
-    if shutil.which(binary) is None:
+    binary_path = runner_cache.resolve_binary(binary)
+    if binary_path is None:
         raise FileNotFoundError(f"{binary} not found on PATH")
+    cached = runner_cache.lookup(binary_path)
+    if cached is not None and "version" in cached:
+        return cached["version"]
     res = subprocess.run([binary, "--version"], text=True, capture_output=True)
     if res.returncode != 0:
         raise RuntimeError(res.stderr.strip() or f"{binary} --version failed")
-    return res.stdout.strip() or res.stderr.strip()
+    version = res.stdout.strip() or res.stderr.strip()
+    runner_cache.update(binary_path, version=version)
+    return version
 
 
 def resolve_runner(preferred: Optional[str]) -> RunnerType:
@@ -89,7 +95,120 @@ def resolve_model(runner: RunnerType, model: Optional[str]) -> str:
     return resolved
 
 
+RESUME_MESSAGES = 3
+_READ_BLOCK = 64 * 1024
+_INDEX_BLOCK = 4096
+
+
+def _transcript_index(output_file: Path) -> Path:
+    """Sidecar listing `<offset> <transcript size>` of each transcript entry."""
+    return output_file.with_suffix(".idx")
+
+
+def _append_transcript(output_file: Path, entry: dict) -> None:
+    """Append one entry to a transcript and to its index."""
+    data = (json.dumps(entry) + "\n").encode("utf-8")
+    with output_file.open("ab") as f:
+        offset = f.tell()
+        f.write(data)
+        end = f.tell()
+    with _transcript_index(output_file).open("a", encoding="utf-8") as f:
+        f.write(f"{offset} {end}\n")
+
+
+def _reverse_lines(path: Path, block_size: int = _READ_BLOCK) -> Iterator[bytes]:
+    """Lines of a file from last to first, read in blocks from the end."""
+    with path.open("rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            yield from reversed(lines)
+        yield remainder
+
+
+def _assistant_texts(entry: dict) -> list[str]:
+    if entry.get("type") != "assistant":
+        return []
+    content = entry.get("message", {}).get("content")
+    if isinstance(content, str):
+        return [content]
+    texts: list[str] = []
+    if isinstance(content, list):
+        for item in content:
+            if isinstance(item, dict) and item.get("type") == "text":
+                texts.append(item.get("text", ""))
+            elif isinstance(item, str):
+                texts.append(item)
+    return texts
+
+
+def _indexed_entries(path: Path) -> Optional[tuple[Iterator[dict], bool]]:
+    """Entries newest first via the sidecar index, if it is current.
+
+    Also returns whether the index covers the whole transcript, i.e. its
+    first entry is at offset 0 (an index started partway through, or one
+    from a version that indexed only assistant entries, does not).
+    """
+    index = _transcript_index(path)
+    try:
+        last = next((line for line in _reverse_lines(index, _INDEX_BLOCK) if line.strip()), b"")
+        if int(last.split()[1]) != path.stat().st_size:
+            return None
+        with index.open("rb") as f:
+            covers_file = int(f.readline().split()[0]) == 0
+    except (OSError, ValueError, IndexError):
+        return None
+
+    def entries() -> Iterator[dict]:
+        with path.open("rb") as f:
+            for line in _reverse_lines(index, _INDEX_BLOCK):
+                if not line.strip():
+                    continue
+                f.seek(int(line.split()[0]))
+                try:
+                    yield json.loads(f.readline())
+                except json.JSONDecodeError:
+                    continue
+
+    return entries(), covers_file
+
+
+def _scanned_entries(path: Path) -> Iterator[dict]:
+    """Transcript entries newest first, without an index."""
+    for line in _reverse_lines(path):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def _last_assistant_texts(entries: Iterator[dict]) -> list[str]:
+    """Up to the last RESUME_MESSAGES assistant texts of newest-first entries."""
+    assistant_texts: list[str] = []
+    for entry in entries:
+        assistant_texts[:0] = _assistant_texts(entry)
+        if len(assistant_texts) >= RESUME_MESSAGES:
+            break
+    return assistant_texts
+
+
 def _resume_context(payload: TaskToolInput, runner: RunnerType) -> Optional[str]:
+    """Text of the last RESUME_MESSAGES assistant messages of a transcript.
+
+    Reads only the end of the transcript: through its offset index when
+    that is current, otherwise backwards in blocks. An index that does not
+    cover the whole transcript and yields fewer than RESUME_MESSAGES texts
+    may be missing earlier entries, so the transcript is then scanned
+    instead.
+    """
     if not payload.resume:
         return None
     output_dir = _default_output_dir(runner)
@@ -97,32 +216,15 @@ def _resume_context(payload: TaskToolInput, runner: RunnerType) -> Optional[str]
     if not path.exists():
         raise FileNotFoundError(f"Resume transcript not found: {path}")
 
-    assistant_texts: list[str] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if entry.get("type") != "assistant":
-                continue
-            content = entry.get("message", {}).get("content")
-            if isinstance(content, str):
-                assistant_texts.append(content)
-            elif isinstance(content, list):
-                for item in content:
-                    if isinstance(item, dict) and item.get("type") == "text":
-                        assistant_texts.append(item.get("text", ""))
-                    elif isinstance(item, str):
-                        assistant_texts.append(item)
+    indexed = _indexed_entries(path)
+    assistant_texts = _last_assistant_texts(indexed[0]) if indexed is not None else []
+    if len(assistant_texts) < RESUME_MESSAGES and not (indexed is not None and indexed[1]):
+        assistant_texts = _last_assistant_texts(_scanned_entries(path))
 
     if not assistant_texts:
         return None
 
-    return "\n".join(assistant_texts[-3:])
+    return "\n".join(assistant_texts[-RESUME_MESSAGES:])
 
 
 def build_prompt(payload: TaskToolInput, runner: RunnerType) -> str:
@@ -159,6 +261,7 @@ def run_sync(runner: RunnerType, model: str, prompt: str) -> str:
     _check_runner_available(runner)
     attempted_model = model
     if runner == "codex":
+        attempted_model = runner_cache.model_fallback("codex", model) or model
         res = subprocess.run(
             ["codex", "exec", "--yolo", "--model", attempted_model, prompt],
             text=True,
@@ -171,6 +274,8 @@ def run_sync(runner: RunnerType, model: str, prompt: str) -> str:
                 text=True,
                 capture_output=True,
             )
+            if res.returncode == 0:
+                runner_cache.record_model_fallback("codex", model, attempted_model)
     else:
         res = subprocess.run(
             ["claude", "--model", attempted_model, "--print", prompt],
@@ -344,7 +449,7 @@ def run_background(payload: TaskToolInput, runner: RunnerType, model: str, outpu
     payload_file = output_dir / f"{agent_id}.input.json"
 
     user_entry = _jsonl_entry(agent_id, "user", payload.prompt, None)
-    output_file.write_text(json.dumps(user_entry) + "\n", encoding="utf-8")
+    _append_transcript(output_file, user_entry)
     payload_file.write_text(payload.model_dump_json(), encoding="utf-8")
     try:
         agent_path = resolve_agent_path(payload.subagent_type, runner)
@@ -376,6 +481,17 @@ def run_background(payload: TaskToolInput, runner: RunnerType, model: str, outpu
         }
     )
 
+    if not worker.submit(payload, runner, model, agent_id, output_file):
+        _start_child(runner, model, agent_id, output_file, payload_file)
+
+    return TaskToolOutputBackground(
+        output="Async agent launched successfully.",
+        agentId=agent_id,
+        output_file=str(output_file),
+    )
+
+
+def _start_child(runner: RunnerType, model: str, agent_id: str, output_file: Path, payload_file: Path) -> None:
     cmd = [
         sys.executable,
         "-m",
@@ -412,17 +528,12 @@ def run_background(payload: TaskToolInput, runner: RunnerType, model: str, outpu
     if proc.poll() is not None:
         raise RuntimeError("Failed to start background process")
 
-    return TaskToolOutputBackground(
-        output="Async agent launched successfully.",
-        agentId=agent_id,
-        output_file=str(output_file),
-    )
-
 
 def run_background_child_with_payload(
     payload: TaskToolInput, runner: RunnerType, model: str, output_file: Path, agent_id: str
-) -> None:
+) -> str:
     start = time.monotonic()
+    status = "success"
     try:
         agent_path = resolve_agent_path(payload.subagent_type, runner)
         run_pretool_hooks(agent_path, payload)
@@ -442,6 +553,7 @@ def run_background_child_with_payload(
             }
         )
     except Exception as exc:
+        status = "error"
         assistant_entry = _jsonl_entry(agent_id, "assistant", f"ERROR: {exc}", None)
         assistant_entry["is_error"] = True
         write_log(
@@ -458,8 +570,8 @@ def run_background_child_with_payload(
                 "duration_ms": int((time.monotonic() - start) * 1000),
             }
         )
-    with output_file.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(assistant_entry) + "\n")
+    _append_transcript(output_file, assistant_entry)
+    return status
 
 
 def run_task(
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Long-lived worker for background Task Tool runs.
+
+Without a worker every background task starts its own `ai_cli run-child`
+process. A worker started in the project directory takes those tasks over
+a Unix socket instead, queues them (bounded) and runs at most
+`max_concurrent` claude/codex executions at a time:
+
+    python3 -m ai_cli worker start --max-concurrent 4 &
+    python3 -m ai_cli worker status --agent-id <agentId>
+    python3 -m ai_cli worker stop
+
+The protocol is one JSON request line and one JSON response line per
+connection. Requests carry an `op`:
+
+    submit   queue a task (payload, runner, model, agentId, output_file, cwd)
+    status   state of one task (agentId) or worker counters (no agentId)
+    stop     shut the worker down after running tasks finish
+
+Tasks run with the worker's working directory and environment, so a
+submit from another directory is refused and the caller falls back to
+`run-child`.
+
+Environment:
+  AI_CLI_WORKER                 "off" to never submit to a worker
+  AI_CLI_WORKER_SOCKET          socket path (default: .sc/ai-cli-worker.sock)
+  AI_CLI_WORKER_MAX_CONCURRENT  concurrent runner executions (default: 4)
+  AI_CLI_WORKER_QUEUE_SIZE      queued tasks before submits are refused (default: 64)
+"""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ai_cli.logging import write_log
+from ai_cli.task_tool import TaskToolInput
+
+DEFAULT_MAX_CONCURRENT = 4
+DEFAULT_QUEUE_SIZE = 64
+MAX_FINISHED = 1000
+CONNECT_TIMEOUT = 2.0
+
+
+class WorkerUnavailable(ConnectionError):
+    """No worker is listening on the socket."""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, "")))
+    except ValueError:
+        return default
+
+
+def worker_enabled() -> bool:
+    return os.getenv("AI_CLI_WORKER", "").strip().lower() != "off"
+
+
+def default_socket_path() -> Path:
+    configured = os.getenv("AI_CLI_WORKER_SOCKET")
+    if configured:
+        return Path(configured).expanduser()
+    return Path.cwd() / ".sc" / "ai-cli-worker.sock"
+
+
+def request(message: Dict[str, Any], socket_path: Optional[Path] = None, timeout: float = CONNECT_TIMEOUT) -> Dict[str, Any]:
+    """Send one request to the worker and return its response.
+
+    Raises:
+        WorkerUnavailable: Nothing is listening on the socket
+    """
+    path = Path(socket_path or default_socket_path())
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError) as exc:
+            raise WorkerUnavailable(f"No ai_cli worker at {path}") from exc
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with sock.makefile("r", encoding="utf-8") as reader:
+            line = reader.readline()
+    if not line:
+        raise WorkerUnavailable(f"ai_cli worker at {path} closed the connection")
+    return json.loads(line)
+
+
+def submit(
+    payload: TaskToolInput,
+    runner: str,
+    model: str,
+    agent_id: str,
+    output_file: Path,
+    socket_path: Optional[Path] = None,
+) -> bool:
+    """Hand a background task to a running worker.
+
+    Returns:
+        False if no worker is running or it cannot take tasks from this
+        directory (the caller then starts run-child itself)
+
+    Raises:
+        RuntimeError: The worker's queue is full
+    """
+    if not worker_enabled():
+        return False
+    path = Path(socket_path or default_socket_path())
+    if not path.exists():
+        return False
+    try:
+        response = request(
+            {
+                "op": "submit",
+                "agentId": agent_id,
+                "runner": runner,
+                "model": model,
+                "output_file": str(output_file),
+                "cwd": os.getcwd(),
+                "payload": payload.model_dump(),
+            },
+            path,
+        )
+    except (WorkerUnavailable, OSError, ValueError):
+        return False
+    if response.get("ok"):
+        return True
+    if response.get("error") == "queue_full":
+        raise RuntimeError(f"ai_cli worker queue is full ({response.get('queue_size')} tasks)")
+    return False
+
+
+def task_status(agent_id: Optional[str] = None, socket_path: Optional[Path] = None) -> Dict[str, Any]:
+    """State of one task, or the worker's counters when agent_id is None."""
+    message: Dict[str, Any] = {"op": "status"}
+    if agent_id:
+        message["agentId"] = agent_id
+    return request(message, socket_path)
+
+
+class TaskWorker:
+    """Bounded task queue drained by max_concurrent runner threads."""
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        max_concurrent: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ) -> None:
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.max_concurrent = max_concurrent or _env_int("AI_CLI_WORKER_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT)
+        self.queue_size = queue_size or _env_int("AI_CLI_WORKER_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)
+        self.cwd = os.getcwd()
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=self.queue_size)
+        self._lock = threading.Lock()
+        self._tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._running = 0
+        self._peak_running = 0
+        self._completed = 0
+        self._threads: list[threading.Thread] = []
+        self._server: Optional[socketserver.UnixStreamServer] = None
+
+    def serve_forever(self) -> None:
+        """Listen on the socket until a stop request arrives."""
+        self._bind()
+        for n in range(self.max_concurrent):
+            thread = threading.Thread(target=self._drain, name=f"ai-cli-worker-{n}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        write_log(
+            {
+                "component": "ai_cli",
+                "event": "worker_start",
+                "socket": str(self.socket_path),
+                "max_concurrent": self.max_concurrent,
+                "queue_size": self.queue_size,
+            }
+        )
+        try:
+            self._server.serve_forever(poll_interval=0.2)
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+            write_log({"component": "ai_cli", "event": "worker_stop", "completed": self._completed})
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "submit":
+            return self._submit(message)
+        if op == "status":
+            agent_id = message.get("agentId")
+            if agent_id is None:
+                return {"ok": True, **self.stats()}
+            with self._lock:
+                task = self._tasks.get(agent_id)
+                return {"ok": True, **task} if task else {"ok": False, "error": "unknown_agent", "agentId": agent_id}
+        if op == "stop":
+            self.shutdown()
+            return {"ok": True}
+        return {"ok": False, "error": "unknown_op", "op": op}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "cwd": self.cwd,
+                "max_concurrent": self.max_concurrent,
+                "queue_size": self.queue_size,
+                "queued": self._queue.qsize(),
+                "running": self._running,
+                "peak_running": self._peak_running,
+                "completed": self._completed,
+            }
+
+    def _bind(self) -> None:
+        if self.socket_path.exists():
+            try:
+                request({"op": "status"}, self.socket_path)
+            except (WorkerUnavailable, OSError, ValueError):
+                self.socket_path.unlink()
+            else:
+                raise RuntimeError(f"ai_cli worker already running at {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        worker = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                try:
+                    response = worker.handle(json.loads(self.rfile.readline()))
+                except Exception as exc:
+                    response = {"ok": False, "error": "bad_request", "message": str(exc)}
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+        self._server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), Handler)
+        self._server.daemon_threads = True
+
+    def _submit(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        if message.get("cwd") != self.cwd:
+            return {"ok": False, "error": "cwd_mismatch", "cwd": self.cwd}
+        agent_id = message["agentId"]
+        task = {
+            "agentId": agent_id,
+            "status": "queued",
+            "runner": message["runner"],
+            "model": message["model"],
+            "output_file": message["output_file"],
+            "queued_at": time.time(),
+        }
+        job = {**task, "payload": TaskToolInput.model_validate(message["payload"])}
+        with self._lock:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                return {"ok": False, "error": "queue_full", "queue_size": self.queue_size}
+            self._tasks[agent_id] = task
+        return {"ok": True, "agentId": agent_id}
+
+    def _drain(self) -> None:
+        from ai_cli import task_runner
+
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            agent_id = job["agentId"]
+            with self._lock:
+                self._running += 1
+                self._peak_running = max(self._peak_running, self._running)
+                self._tasks[agent_id].update(status="running", started_at=time.time())
+            status = "error"
+            try:
+                status = task_runner.run_background_child_with_payload(
+                    payload=job["payload"],
+                    runner=job["runner"],
+                    model=job["model"],
+                    output_file=Path(job["output_file"]),
+                    agent_id=agent_id,
+                )
+            except Exception as exc:
+                # One failed task must not take its runner slot down with it
+                write_log(
+                    {
+                        "component": "ai_cli",
+                        "event": "worker_task_error",
+                        "runner": job["runner"],
+                        "model": job["model"],
+                        "agentId": agent_id,
+                        "error": str(exc),
+                    }
+                )
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._tasks[agent_id].update(status=status, finished_at=time.time())
+                    self._forget_finished()
+
+    def _forget_finished(self) -> None:
+        finished = [key for key, task in self._tasks.items() if task["status"] in ("success", "error")]
+        for key in finished[: max(0, len(finished) - MAX_FINISHED)]:
+            del self._tasks[key]
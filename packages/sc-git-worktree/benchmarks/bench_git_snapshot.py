@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark per-branch git queries vs. GitStateSnapshot.
+
+Builds a throwaway repository with N synthetic branches (each with an
+``origin/<branch>`` remote-tracking ref and upstream config; every other
+branch is one commit behind its remote) and times answering
+remote_exists + remote_ahead for every branch:
+
+- legacy:   check_remote_branch_exists + get_remote_ahead_count per branch
+- snapshot: one GitStateSnapshot.load + in-memory lookups
+
+Usage:
+    python benchmarks/bench_git_snapshot.py [--sizes 10 100 1000] [--json]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import worktree_shared  # noqa: E402
+from worktree_shared import (  # noqa: E402
+    GitStateSnapshot,
+    check_remote_branch_exists,
+    get_remote_ahead_count,
+)
+
+
+def _git(cwd: Path, *args: str, stdin: str = None) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, input=stdin, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def build_repo(root: Path, count: int) -> list[str]:
+    """Create a repo with ``count`` branches and matching origin refs."""
+    subprocess.run(["git", "init", "-q", "-b", "main", str(root)], check=True)
+    _git(root, "config", "user.email", "bench@example.com")
+    _git(root, "config", "user.name", "bench")
+    (root / "file").write_text("base\n")
+    _git(root, "add", "file")
+    _git(root, "commit", "-q", "-m", "base")
+    base = _git(root, "rev-parse", "HEAD")
+    (root / "file").write_text("ahead\n")
+    _git(root, "commit", "-q", "-am", "ahead")
+    ahead = _git(root, "rev-parse", "HEAD")
+
+    branches = [f"feature/bench-{i:05d}" for i in range(count)]
+    updates = []
+    config = []
+    for i, branch in enumerate(branches):
+        updates.append(f"create refs/heads/{branch} {base}")
+        updates.append(f"create refs/remotes/origin/{branch} {ahead if i % 2 else base}")
+        config.append(f'[branch "{branch}"]\n\tremote = origin\n\tmerge = refs/heads/{branch}\n')
+    _git(root, "update-ref", "--stdin", stdin="\n".join(updates) + "\n")
+    with open(root / ".git" / "config", "a", encoding="utf-8") as f:
+        f.write('[remote "origin"]\n\turl = /dev/null\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n')
+        f.write("".join(config))
+    return branches
+
+
+class _CountingRunGit:
+    """Wrap worktree_shared.run_git to count spawned git processes."""
+
+    def __init__(self):
+        self.calls = 0
+        self._original = worktree_shared.run_git
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self._original(*args, **kwargs)
+
+    def __enter__(self):
+        worktree_shared.run_git = self
+        return self
+
+    def __exit__(self, *exc):
+        worktree_shared.run_git = self._original
+
+
+def run_legacy(repo: Path, branches: list[str]) -> dict:
+    with _CountingRunGit() as counter:
+        start = time.perf_counter()
+        answers = {}
+        for branch in branches:
+            exists = check_remote_branch_exists(branch, cwd=repo)
+            answers[branch] = (exists, get_remote_ahead_count(branch, cwd=repo) if exists else 0)
+        elapsed = time.perf_counter() - start
+    return {"processes": counter.calls, "seconds": elapsed, "answers": answers}
+
+
+def run_snapshot(repo: Path, branches: list[str]) -> dict:
+    with _CountingRunGit() as counter:
+        start = time.perf_counter()
+        snapshot = GitStateSnapshot.load(repo)
+        answers = {}
+        for branch in branches:
+            exists = snapshot.remote_exists(branch)
+            answers[branch] = (exists, snapshot.remote_ahead(branch) if exists else 0)
+        elapsed = time.perf_counter() - start
+    return {"processes": counter.calls, "seconds": elapsed, "answers": answers}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="sc-wt-bench-") as tmp:
+            repo = Path(tmp) / "repo"
+            branches = build_repo(repo, size)
+            legacy = run_legacy(repo, branches)
+            snapshot = run_snapshot(repo, branches)
+            if legacy["answers"] != snapshot["answers"]:
+                print(f"ERROR: snapshot answers differ from legacy at N={size}", file=sys.stderr)
+                return 1
+            rows.append({
+                "branches": size,
+                "legacy_processes": legacy["processes"],
+                "legacy_seconds": round(legacy["seconds"], 4),
+                "snapshot_processes": snapshot["processes"],
+                "snapshot_seconds": round(snapshot["seconds"], 4),
+                "speedup": round(legacy["seconds"] / max(snapshot["seconds"], 1e-9), 1),
+            })
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    print(f"{'N':>6}  {'legacy procs':>12}  {'legacy s':>9}  {'snap procs':>10}  {'snap s':>8}  {'speedup':>8}")
+    for row in rows:
+        print(
+            f"{row['branches']:>6}  {row['legacy_processes']:>12}  {row['legacy_seconds']:>9.3f}  "
+            f"{row['snapshot_processes']:>10}  {row['snapshot_seconds']:>8.3f}  {row['speedup']:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
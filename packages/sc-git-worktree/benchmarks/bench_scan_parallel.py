@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark sequential vs. concurrent worktree status scanning.
+
+Builds a temporary repository with N linked worktrees (each populated with
+``--files`` tracked files, a fraction of them dirty) and times
+``batch_get_worktree_statuses`` with jobs=1 against each requested job count.
+
+Usage:
+    python benchmarks/bench_scan_parallel.py [--worktrees 40] [--files 2000] [--jobs 4 16] [--json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from worktree_scan import WorktreeInfo, batch_get_worktree_statuses  # noqa: E402
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+
+
+def build_worktrees(root: Path, count: int, files: int) -> list[WorktreeInfo]:
+    """Create a repo with ``files`` tracked files and ``count`` linked worktrees."""
+    repo = root / "repo"
+    subprocess.run(["git", "init", "-q", "-b", "main", str(repo)], check=True)
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "bench")
+    for i in range(files):
+        sub = repo / f"d{i % 50:02d}"
+        sub.mkdir(exist_ok=True)
+        (sub / f"f{i:05d}.txt").write_text(f"{i}\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "seed")
+
+    infos = []
+    for i in range(count):
+        path = root / "worktrees" / f"wt-{i:03d}"
+        _git(repo, "worktree", "add", "-q", "-b", f"bench/wt-{i:03d}", str(path))
+        if i % 4 == 0:
+            (path / "d00" / "f00000.txt").write_text("dirty\n")
+        infos.append(WorktreeInfo(path=str(path), branch=f"bench/wt-{i:03d}", head=""))
+    return infos
+
+
+def time_scan(worktrees: list[WorktreeInfo], jobs: int) -> tuple[float, dict]:
+    start = time.perf_counter()
+    results = batch_get_worktree_statuses(worktrees, jobs=jobs, timeout=120)
+    return time.perf_counter() - start, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--worktrees", type=int, default=40)
+    parser.add_argument("--files", type=int, default=2000, help="Tracked files per worktree")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[4, os.cpu_count() or 1])
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="sc-wt-scan-bench-") as tmp:
+        worktrees = build_worktrees(Path(tmp), args.worktrees, args.files)
+        # Warm the filesystem cache so the first measurement is not penalised
+        batch_get_worktree_statuses(worktrees, jobs=1)
+
+        baseline_s, baseline = time_scan(worktrees, 1)
+        rows = [{"jobs": 1, "seconds": round(baseline_s, 4), "speedup": 1.0}]
+        for jobs in sorted(set(args.jobs) - {1}):
+            elapsed, results = time_scan(worktrees, jobs)
+            if results != baseline:
+                print(f"ERROR: results differ at jobs={jobs}", file=sys.stderr)
+                return 1
+            rows.append({
+                "jobs": jobs,
+                "seconds": round(elapsed, 4),
+                "speedup": round(baseline_s / max(elapsed, 1e-9), 2),
+            })
+
+    report = {"worktrees": args.worktrees, "files_per_worktree": args.files, "runs": rows}
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{args.worktrees} worktrees x {args.files} files")
+    print(f"{'jobs':>6}  {'seconds':>9}  {'speedup':>8}")
+    for row in rows:
+        print(f"{row['jobs']:>6}  {row['seconds']:>9.3f}  {row['speedup']:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
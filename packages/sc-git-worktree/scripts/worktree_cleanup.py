@@ -25,6 +25,7 @@ from pydantic import BaseModel, Field, field_validator
 try:
     from .envelope import Envelope, ErrorCodes, Transcript
     from .worktree_shared import (
+        GitStateSnapshot,
         check_remote_branch_exists,
         cleanup_empty_directories,
         count_unique_commits,
@@ -49,6 +50,7 @@ try:
 except ImportError:
     from envelope import Envelope, ErrorCodes, Transcript
     from worktree_shared import (
+        GitStateSnapshot,
         check_remote_branch_exists,
         cleanup_empty_directories,
         count_unique_commits,
@@ -240,6 +242,16 @@ def cleanup_all_merged(input_data: CleanupInput) -> Envelope:
         else:
             tracking_path = None
 
+        # Snapshot all refs once; per-branch remote/merge queries are answered
+        # from memory instead of spawning git for every tracked entry.
+        if tracking_path:
+            run_git(["fetch", "--all", "--prune"], cwd=repo_root, check=False)
+        snapshot = GitStateSnapshot.load(repo_root)
+        transcript.step_ok(
+            step="git for-each-ref refs/heads refs/remotes/origin",
+            message=f"{len(snapshot.local_heads)} local, {len(snapshot.remote_heads)} remote ref(s)",
+        )
+
         # Reconcile tracking with git before making decisions
         if tracking_path:
             try:
@@ -248,6 +260,7 @@ def cleanup_all_merged(input_data: CleanupInput) -> Envelope:
                     repo_root=repo_root,
                     discover_all=False,
                     protected_branches=protected_branches,
+                    snapshot=snapshot,
                 )
                 transcript.step_ok(
                     step="reconcile tracking",
@@ -293,8 +306,8 @@ def cleanup_all_merged(input_data: CleanupInput) -> Envelope:
                 if not branch or branch in tracked_branches:
                     continue
 
-                remote_exists = check_remote_branch_exists(branch, cwd=repo_root)
-                remote_ahead = get_remote_ahead_count(branch, cwd=repo_root) if remote_exists else 0
+                remote_exists = snapshot.remote_exists(branch)
+                remote_ahead = snapshot.remote_ahead(branch) if remote_exists else 0
 
                 entry = TrackingEntry(
                     branch=branch,
@@ -387,8 +400,8 @@ def cleanup_all_merged(input_data: CleanupInput) -> Envelope:
                 continue
 
             # Check merge state (using protected base, not HEAD)
-            is_merged = is_branch_merged(branch, base=merge_base, cwd=repo_root)
-            unique_commits = count_unique_commits(branch, base=merge_base, cwd=repo_root)
+            is_merged = snapshot.is_merged(branch, base=merge_base)
+            unique_commits = snapshot.unique_commits(branch, base=merge_base)
 
             # Fail closed: if we can't determine merge state, skip cleanup
             if unique_commits < 0:
@@ -436,16 +449,18 @@ def cleanup_all_merged(input_data: CleanupInput) -> Envelope:
                 message="removed",
             )
 
+            # Check remote_ahead before deleting anything (needs the local branch)
+            remote_ahead = snapshot.remote_ahead(branch)
+
             # Delete local branch
             branch_deleted_local = delete_local_branch(branch, cwd=repo_root)
             if branch_deleted_local:
+                snapshot.forget_local(branch)
                 transcript.step_ok(
                     step=f"git branch -d {branch}",
                     message="deleted",
                 )
 
-            # Check remote_ahead before deleting remote branch
-            remote_ahead = get_remote_ahead_count(branch, cwd=repo_root)
             branch_deleted_remote = False
             remote_msg = ""
 
@@ -460,6 +475,7 @@ def cleanup_all_merged(input_data: CleanupInput) -> Envelope:
                 # Safe to delete remote
                 branch_deleted_remote, remote_msg = delete_remote_branch(branch, cwd=repo_root)
                 if branch_deleted_remote:
+                    snapshot.forget_remote(branch)
                     transcript.step_ok(
                         step=f"git push origin --delete {branch}",
                         message="deleted",
@@ -468,7 +484,7 @@ def cleanup_all_merged(input_data: CleanupInput) -> Envelope:
             # Update tracking (JSONL) - preserve until both local + remote gone
             if tracking_path:
                 # Check current remote status
-                remote_still_exists = check_remote_branch_exists(branch, cwd=repo_root)
+                remote_still_exists = snapshot.remote_exists(branch)
 
                 if not remote_still_exists:
                     # Both local worktree and remote are gone - remove entry
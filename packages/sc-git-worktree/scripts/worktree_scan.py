@@ -5,7 +5,7 @@ This script efficiently scans all worktrees and their status in a single
 invocation, minimizing git process spawns.
 
 Usage:
-    python worktree_scan.py [--worktree-base PATH] [--tracking-path PATH] [--no-tracking]
+    python worktree_scan.py [--worktree-base PATH] [--tracking-path PATH] [--no-tracking] [--jobs N]
 
 Exit Codes:
     0: Scan completed successfully
@@ -18,6 +18,7 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -27,6 +28,7 @@ from typing import Any, Dict, List, Optional, Tuple
 try:
     from .envelope import Envelope, ErrorCodes, Transcript
     from .worktree_shared import (
+        GitStateSnapshot,
         TrackingEntry,
         get_default_tracking_path,
         get_protected_branches,
@@ -39,6 +41,7 @@ try:
 except ImportError:
     from envelope import Envelope, ErrorCodes, Transcript
     from worktree_shared import (
+        GitStateSnapshot,
         TrackingEntry,
         get_default_tracking_path,
         get_protected_branches,
@@ -197,55 +200,86 @@ def get_worktree_list() -> List[WorktreeInfo]:
         raise RuntimeError(f"Failed to list worktrees: {e.stderr}") from e
 
 
-def batch_get_worktree_statuses(worktrees: List[WorktreeInfo]) -> Dict[str, Tuple[str, List[str], Optional[str]]]:
-    """Get status for all worktrees in a batched manner.
+DEFAULT_STATUS_TIMEOUT = 10  # seconds per worktree
 
-    This function runs git status for each worktree but does so efficiently
-    by collecting all results in a single pass.
 
-    Args:
-        worktrees: List of worktrees to check
+def get_single_worktree_status(
+    wt: WorktreeInfo,
+    timeout: float = DEFAULT_STATUS_TIMEOUT,
+) -> Tuple[str, List[str], Optional[str]]:
+    """Run git status for one worktree.
 
     Returns:
-        Dict mapping path to (status, dirty_files, error_message)
+        Tuple of (status, dirty_files, error_message)
         where status is "clean", "dirty", or "error"
     """
-    results: Dict[str, Tuple[str, List[str], Optional[str]]] = {}
+    if wt.is_bare:
+        return ("clean", [], None)
 
-    for wt in worktrees:
-        if wt.is_bare:
-            results[wt.path] = ("clean", [], None)
-            continue
+    if not Path(wt.path).exists():
+        return ("error", [], f"Worktree path does not exist: {wt.path}")
 
-        if not Path(wt.path).exists():
-            results[wt.path] = ("error", [], f"Worktree path does not exist: {wt.path}")
-            continue
+    try:
+        result = subprocess.run(
+            ["git", "-C", wt.path, "status", "--short", "--porcelain"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=timeout,
+        )
 
-        try:
-            result = subprocess.run(
-                ["git", "-C", wt.path, "status", "--short", "--porcelain"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10,  # 10 second timeout per worktree
-            )
+        output = result.stdout.strip()
+        if output:
+            # Has uncommitted changes
+            dirty_files = [line for line in output.split("\n") if line.strip()]
+            return ("dirty", dirty_files, None)
+        return ("clean", [], None)
 
-            output = result.stdout.strip()
-            if output:
-                # Has uncommitted changes
-                dirty_files = [line for line in output.split("\n") if line.strip()]
-                results[wt.path] = ("dirty", dirty_files, None)
-            else:
-                results[wt.path] = ("clean", [], None)
+    except subprocess.TimeoutExpired:
+        return ("error", [], f"Status check timed out for {wt.path}")
+    except subprocess.CalledProcessError as e:
+        return ("error", [], f"Git status failed: {e.stderr.strip()}")
+    except Exception as e:
+        return ("error", [], f"Unexpected error: {str(e)}")
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Resolve a --jobs value: 0/None means one worker per CPU."""
+    if not jobs or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
 
-        except subprocess.TimeoutExpired:
-            results[wt.path] = ("error", [], f"Status check timed out for {wt.path}")
-        except subprocess.CalledProcessError as e:
-            results[wt.path] = ("error", [], f"Git status failed: {e.stderr.strip()}")
-        except Exception as e:
-            results[wt.path] = ("error", [], f"Unexpected error: {str(e)}")
 
-    return results
+def batch_get_worktree_statuses(
+    worktrees: List[WorktreeInfo],
+    jobs: int = 1,
+    timeout: float = DEFAULT_STATUS_TIMEOUT,
+) -> Dict[str, Tuple[str, List[str], Optional[str]]]:
+    """Get status for all worktrees, optionally running git status concurrently.
+
+    With ``jobs > 1`` up to ``jobs`` ``git status`` processes run at once, so
+    wall time approaches the slowest worktree rather than the sum. Each
+    worktree is bounded by ``timeout`` seconds and reported as an error if it
+    exceeds it. Results are always keyed in input order, regardless of which
+    worktree finishes first.
+
+    Args:
+        worktrees: List of worktrees to check
+        jobs: Maximum concurrent git status processes (1 = sequential)
+        timeout: Per-worktree timeout in seconds
+
+    Returns:
+        Dict mapping path to (status, dirty_files, error_message)
+        where status is "clean", "dirty", or "error"
+    """
+    jobs = max(1, min(jobs, len(worktrees)))
+    if jobs == 1:
+        return {wt.path: get_single_worktree_status(wt, timeout) for wt in worktrees}
+
+    # git status runs in child processes, so threads only wait on I/O
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(get_single_worktree_status, wt, timeout) for wt in worktrees]
+        return {wt.path: future.result() for wt, future in zip(worktrees, futures)}
 
 
 
@@ -262,6 +296,8 @@ def scan_worktrees(
     discover_all: bool = False,
     owner_filter: Optional[str] = None,
     cache_protected_branches: bool = True,
+    jobs: int = 1,
+    status_timeout: float = DEFAULT_STATUS_TIMEOUT,
 ) -> Envelope:
     """Scan all worktrees and reconcile tracking with git state.
 
@@ -271,6 +307,8 @@ def scan_worktrees(
         tracking_path: Path to tracking document (default: <worktree_base>/worktree-tracking.jsonl)
         discover_all: If True, also discover untracked remote branches
         owner_filter: If set, only show branches by this owner
+        jobs: Concurrent git status workers (0 = one per CPU)
+        status_timeout: Per-worktree git status timeout in seconds
 
     Returns:
         Envelope with scan results
@@ -335,11 +373,12 @@ def scan_worktrees(
     non_bare_worktrees = [wt for wt in worktrees if not wt.is_bare]
 
     # Batch get statuses
-    statuses = batch_get_worktree_statuses(non_bare_worktrees)
+    workers = resolve_jobs(jobs)
+    statuses = batch_get_worktree_statuses(non_bare_worktrees, jobs=workers, timeout=status_timeout)
     clean_count = sum(1 for s in statuses.values() if s[0] == "clean")
     dirty_count = sum(1 for s in statuses.values() if s[0] == "dirty")
     transcript.step_ok(
-        step="git status --porcelain (batch)",
+        step=f"git status --porcelain (batch, jobs={workers})",
         message=f"clean={clean_count} dirty={dirty_count}",
     )
 
@@ -371,12 +410,20 @@ def scan_worktrees(
                 transcript=transcript,
             )
 
-        # Reconcile tracking with git (always runs fetch)
+        # Reconcile tracking with git (always runs fetch, then snapshots refs once)
+        run_git(["fetch", "--all", "--prune"], cwd=repo_root, check=False)
+        snapshot = GitStateSnapshot.load(repo_root)
+        transcript.step_ok(
+            step="git for-each-ref refs/heads refs/remotes/origin",
+            message=f"{len(snapshot.local_heads)} local, {len(snapshot.remote_heads)} remote ref(s)",
+        )
+
         reconcile_result = reconcile_tracking(
             tracking_path=track_path,
             repo_root=repo_root,
             discover_all=discover_all,
             protected_branches=protected,
+            snapshot=snapshot,
         )
 
         transcript.step_ok(
@@ -578,6 +625,18 @@ def main() -> int:
         action="store_true",
         help="Do not cache protected branches to shared settings",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run git status in up to N worktrees concurrently (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--status-timeout",
+        type=float,
+        default=DEFAULT_STATUS_TIMEOUT,
+        help=f"Per-worktree git status timeout in seconds (default: {DEFAULT_STATUS_TIMEOUT})",
+    )
 
     args = parser.parse_args()
 
@@ -588,6 +647,8 @@ def main() -> int:
         discover_all=args.all,
         owner_filter=args.owner,
         cache_protected_branches=not args.no_cache,
+        jobs=args.jobs,
+        status_timeout=args.status_timeout,
     )
 
     # Output fenced JSON
@@ -9,12 +9,15 @@ Provides:
 """
 from __future__ import annotations
 
+import copy
 import datetime as _dt
+import fnmatch
 import hashlib
 import json
 import os
 import re
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
 
@@ -25,6 +28,12 @@ try:
 except Exception:  # pragma: no cover
     yaml = None
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
 
 # =============================================================================
 # Paths and settings
@@ -529,6 +538,156 @@ def is_git_repo(path: Path) -> bool:
         return False
 
 
+# =============================================================================
+# Git State Snapshot
+# =============================================================================
+
+# refname, objectname, upstream refname, upstream track ("[ahead 1, behind 2]")
+_SNAPSHOT_FORMAT = "%(refname)%09%(objectname)%09%(upstream)%09%(upstream:track)"
+_TRACK_RE = re.compile(r"(ahead|behind) (\d+)")
+
+
+class GitStateSnapshot:
+    """In-memory view of local and remote refs for batch queries.
+
+    Loads every branch head, its upstream and the ahead/behind counts with a
+    single ``git for-each-ref`` so that ``remote_exists``/``remote_ahead`` and
+    merge status can be answered per branch without spawning one git process
+    per tracked entry. Queries the ref data cannot answer (e.g. a branch whose
+    upstream is not ``<remote>/<branch>``) fall back to one cached
+    ``git rev-list`` call.
+
+    ``git_calls`` counts every git process spawned through the snapshot.
+    """
+
+    def __init__(self, repo_root: Optional[Path] = None, remote: str = "origin"):
+        self.repo_root = repo_root
+        self.remote = remote
+        self.local_heads: Dict[str, str] = {}
+        self.remote_heads: Dict[str, str] = {}
+        self.upstreams: Dict[str, str] = {}
+        self.behind: Dict[str, int] = {}
+        self.git_calls = 0
+        self._merged: Dict[str, Set[str]] = {}
+        self._rev_counts: Dict[str, int] = {}
+
+    @classmethod
+    def load(cls, repo_root: Optional[Path] = None, remote: str = "origin") -> "GitStateSnapshot":
+        """Load all local branches and ``refs/remotes/<remote>`` in one git call."""
+        snapshot = cls(repo_root=repo_root, remote=remote)
+        result = snapshot._git(
+            ["for-each-ref", f"--format={_SNAPSHOT_FORMAT}", "refs/heads", f"refs/remotes/{remote}"]
+        )
+        if result.returncode == 0:
+            snapshot.ingest(result.stdout)
+        return snapshot
+
+    def _git(self, args: list) -> subprocess.CompletedProcess:
+        self.git_calls += 1
+        return run_git(args, cwd=self.repo_root, check=False)
+
+    def ingest(self, output: str) -> None:
+        """Parse ``git for-each-ref`` output produced with ``_SNAPSHOT_FORMAT``."""
+        local_prefix = "refs/heads/"
+        remote_prefix = f"refs/remotes/{self.remote}/"
+        for line in output.splitlines():
+            parts = line.split("\t")
+            if len(parts) < 2:
+                continue
+            refname, sha = parts[0], parts[1]
+            upstream = parts[2] if len(parts) > 2 else ""
+            track = parts[3] if len(parts) > 3 else ""
+
+            if refname.startswith(local_prefix):
+                branch = refname[len(local_prefix):]
+                self.local_heads[branch] = sha
+                if upstream:
+                    self.upstreams[branch] = upstream
+                    if "gone" not in track:
+                        counts = dict((k, int(v)) for k, v in _TRACK_RE.findall(track))
+                        self.behind[branch] = counts.get("behind", 0)
+            elif refname.startswith(remote_prefix):
+                branch = refname[len(remote_prefix):]
+                if branch == "HEAD":
+                    continue
+                self.remote_heads[branch] = sha
+
+    def local_exists(self, branch: str) -> bool:
+        return branch in self.local_heads
+
+    def remote_exists(self, branch: str) -> bool:
+        return branch in self.remote_heads
+
+    def remote_branches(self, patterns: Optional[list] = None) -> list[str]:
+        """Remote branch names (without remote prefix), optionally fnmatch-filtered."""
+        branches = sorted(self.remote_heads)
+        if patterns:
+            branches = [b for b in branches if any(fnmatch.fnmatch(b, p) for p in patterns)]
+        return branches
+
+    def remote_ahead(self, branch: str) -> int:
+        """Commits on ``<remote>/<branch>`` missing from the local branch.
+
+        Mirrors :func:`get_remote_ahead_count`: returns -1 when either side is
+        missing or the count cannot be determined.
+        """
+        if branch not in self.local_heads or branch not in self.remote_heads:
+            return -1
+        if self.local_heads[branch] == self.remote_heads[branch]:
+            return 0
+        if self.upstreams.get(branch) == f"refs/remotes/{self.remote}/{branch}" and branch in self.behind:
+            return self.behind[branch]
+        return self._rev_count(f"{branch}..{self.remote}/{branch}")
+
+    def merged_into(self, base: str) -> Set[str]:
+        """Local branches whose tip is reachable from ``base`` (one git call per base)."""
+        if base not in self._merged:
+            result = self._git(["for-each-ref", f"--merged={base}", "--format=%(refname)", "refs/heads"])
+            merged: Set[str] = set()
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    if line.startswith("refs/heads/"):
+                        merged.add(line[len("refs/heads/"):])
+            self._merged[base] = merged
+        return self._merged[base]
+
+    def is_merged(self, branch: str, base: str = "HEAD") -> bool:
+        return branch in self.local_heads and branch in self.merged_into(base)
+
+    def unique_commits(self, branch: str, base: str = "HEAD") -> int:
+        """Commits in ``branch`` not in ``base`` (-1 if undeterminable).
+
+        Merged branches have no unique commits by definition, so only
+        unmerged branches cost a ``git rev-list``.
+        """
+        if branch not in self.local_heads:
+            return -1
+        if self.is_merged(branch, base):
+            return 0
+        return self._rev_count(f"{base}..{branch}")
+
+    def _rev_count(self, rev_range: str) -> int:
+        if rev_range not in self._rev_counts:
+            result = self._git(["rev-list", "--count", rev_range])
+            try:
+                count = int(result.stdout.strip()) if result.returncode == 0 else -1
+            except ValueError:
+                count = -1
+            self._rev_counts[rev_range] = count
+        return self._rev_counts[rev_range]
+
+    def forget_local(self, branch: str) -> None:
+        """Record that a local branch was deleted after the snapshot was taken."""
+        self.local_heads.pop(branch, None)
+        self.upstreams.pop(branch, None)
+        self.behind.pop(branch, None)
+
+    def forget_remote(self, branch: str) -> None:
+        """Record that a remote branch was deleted after the snapshot was taken."""
+        self.remote_heads.pop(branch, None)
+        self.behind.pop(branch, None)
+
+
 # =============================================================================
 # Hook JSON validation helpers
 # =============================================================================
@@ -612,6 +771,13 @@ def validate_hook_json(payload: Dict[str, Any], schema: type[BaseModel]) -> Base
 
 REGISTRY_DEFAULT = os.path.join(".claude", "agents", "registry.yaml")
 LOGS_DIR = os.path.join(".claude", "state", "logs")
+AUDIT_LOG = os.path.join(LOGS_DIR, "agent-runner.jsonl")
+AUDIT_MAX_BYTES = 5 * 1024 * 1024
+CACHE_PATH = os.path.join(".claude", "state", "agent-runner-cache.json")
+CACHE_VERSION = 1
+CACHE_ENV_VAR = "AGENT_RUNNER_CACHE"
+
+_manifests: Dict[str, Dict[str, Any]] = {}
 
 
 class AgentSpec(BaseModel):
@@ -642,6 +808,61 @@ class AgentInvokeResult(BaseModel):
     note: str
 
 
+def _cache_enabled() -> bool:
+    return os.environ.get(CACHE_ENV_VAR, "").strip().lower() not in ("0", "off", "none")
+
+
+def _stat_key(path: str) -> Dict[str, int]:
+    st = os.stat(path)
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _json_safe(value: Any) -> bool:
+    """True when value survives a JSON round trip unchanged (no dates, int keys...)."""
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+def _digest_manifest() -> Optional[Dict[str, Any]]:
+    """Parsed registries and agent file digests for this project, keyed by
+    absolute path and valid while (mtime_ns, size) match. Loaded once per
+    process; None when AGENT_RUNNER_CACHE=off.
+    """
+    if not _cache_enabled():
+        return None
+    path = os.path.abspath(CACHE_PATH)
+    manifest = _manifests.get(path)
+    if manifest is None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+        parser = "yaml" if yaml is not None else "lines"
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != CACHE_VERSION
+            or manifest.get("parser") != parser
+        ):
+            manifest = {"version": CACHE_VERSION, "parser": parser, "registries": {}, "files": {}}
+        _manifests[path] = manifest
+    return manifest
+
+
+def _save_digest_manifest() -> None:
+    path = os.path.abspath(CACHE_PATH)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        _ensure_dir(os.path.dirname(path))
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_manifests[path], f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # the manifest only saves work; never fail an invocation over it
+
+
 def _read_text(path: str) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
@@ -710,7 +931,18 @@ def _load_yaml_file(path: str) -> Dict[str, Any]:
 def load_registry(path: str = REGISTRY_DEFAULT) -> Dict[str, Any]:
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Registry not found: {path}")
-    return _load_yaml_file(path)
+    manifest = _digest_manifest()
+    if manifest is None:
+        return _load_yaml_file(path)
+    key, stat = os.path.abspath(path), _stat_key(path)
+    entry = manifest["registries"].get(key)
+    if entry and entry.get("stat") == stat:
+        return copy.deepcopy(entry["data"])
+    data = _load_yaml_file(path)
+    if _json_safe(data):
+        manifest["registries"][key] = {"stat": stat, "data": copy.deepcopy(data)}
+        _save_digest_manifest()
+    return data
 
 
 def get_agent_spec(registry: Dict[str, Any], name: str) -> AgentSpec:
@@ -722,11 +954,19 @@ def get_agent_spec(registry: Dict[str, Any], name: str) -> AgentSpec:
 
 
 def read_agent_file_info(path: str) -> AgentFileInfo:
-    text = _read_text(path)
-    fm_text = _extract_frontmatter(text)
+    manifest = _digest_manifest()
+    key, stat = os.path.abspath(path), _stat_key(path)
+    entry = manifest["files"].get(key) if manifest is not None else None
+    if entry and entry.get("stat") == stat:
+        return AgentFileInfo(path=path, version_frontmatter=entry["version_frontmatter"], sha256=entry["sha256"])
+    data = _read_bytes(path)
+    fm_text = _extract_frontmatter(data.decode("utf-8"))
     fm = _parse_yaml(fm_text)
     version = fm.get("version") if isinstance(fm, dict) else None
-    digest = hashlib.sha256(_read_bytes(path)).hexdigest()
+    digest = hashlib.sha256(data).hexdigest()
+    if manifest is not None and _json_safe(version):
+        manifest["files"][key] = {"stat": stat, "version_frontmatter": version, "sha256": digest}
+        _save_digest_manifest()
     return AgentFileInfo(path=path, version_frontmatter=version, sha256=digest)
 
 
@@ -775,11 +1015,28 @@ def write_audit(agent: AgentSpec, info: AgentFileInfo, outcome: str, duration_ms
     }
     if duration_ms is not None:
         record["duration_ms"] = duration_ms
-    fname = f"agent-runner-{agent.name}-{ts.replace(':','').replace('-','').replace('T','_')}.json"
-    fpath = os.path.join(LOGS_DIR, fname)
-    with open(fpath, "w", encoding="utf-8") as f:
-        json.dump(record, f, indent=2)
-    return fpath
+    _rotate_audit_log()
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    fd = os.open(AUDIT_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
+    return AUDIT_LOG
+
+
+def _rotate_audit_log() -> None:
+    """Move a full audit log aside as agent-runner-<timestamp>.jsonl."""
+    try:
+        if os.path.getsize(AUDIT_LOG) < AUDIT_MAX_BYTES:
+            return
+    except OSError:
+        return
+    stamp = _dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+    try:
+        os.replace(AUDIT_LOG, os.path.join(LOGS_DIR, f"agent-runner-{stamp}.jsonl"))
+    except OSError:
+        pass  # another process rotated it first
 
 
 def invoke_agent_runner(request: AgentInvokeRequest) -> AgentInvokeResult:
@@ -830,8 +1087,258 @@ def get_default_tracking_path(worktree_base: Path) -> Path:
     return worktree_base / "worktree-tracking.jsonl"
 
 
+# Journal records appended between compactions (one JSON object per line):
+#   {"op": "put", "entry": {...}}            add or replace an entry
+#   {"op": "set", "branch": b, "fields": {}} update fields of an entry
+#   {"op": "del", "branch": b}               tombstone
+_JOURNAL_SUFFIX = ".journal"
+_LOCK_SUFFIX = ".lock"
+DEFAULT_COMPACT_THRESHOLD = 128
+
+
+def _dump_line(data: Dict[str, Any]) -> str:
+    return json.dumps(data, separators=(",", ":")) + "\n"
+
+
+class TrackingStore:
+    """Branch-indexed worktree tracking store.
+
+    The tracking file itself stays a plain JSONL list of entries (the
+    compacted snapshot). Single-branch changes are appended as put/set/del
+    records to a ``<tracking>.journal`` sidecar instead of rewriting the file,
+    and the journal is folded back into the snapshot once it reaches
+    ``compact_threshold`` records.
+
+    Entries are kept as raw dicts in an insertion-ordered ``branch -> entry``
+    index and only validated with pydantic when handed out. The index is
+    reused across calls in the same process: the snapshot is reloaded only
+    when its stat signature changes, otherwise just the journal tail written
+    since the last read is replayed.
+
+    All access takes an advisory ``flock`` on ``<tracking>.lock`` (shared for
+    reads, exclusive for writes) so parallel worktree agents do not lose each
+    other's updates. ``locked()`` is reentrant for read-modify-write sequences.
+    """
+
+    def __init__(self, tracking_path: Path, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        self.path = Path(tracking_path)
+        self.journal_path = self.path.with_name(self.path.name + _JOURNAL_SUFFIX)
+        self.lock_path = self.path.with_name(self.path.name + _LOCK_SUFFIX)
+        self.compact_threshold = compact_threshold
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_sig: Optional[Tuple[int, int, int]] = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
+        self._lock_exclusive = False
+
+    # -- locking ------------------------------------------------------------
+
+    @contextmanager
+    def locked(self, exclusive: bool = True):
+        """Hold the advisory lock (reentrant; an outer exclusive lock wins).
+
+        On Windows msvcrt.locking has no shared mode, so shared holders lock
+        exclusively too.
+        """
+        if self._lock_depth:
+            if exclusive and not self._lock_exclusive:
+                raise RuntimeError("cannot upgrade a shared tracking lock to exclusive")
+            self._lock_depth += 1
+            try:
+                yield self
+            finally:
+                self._lock_depth -= 1
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            self._lock_fd, self._lock_depth, self._lock_exclusive = fd, 1, exclusive
+            try:
+                self.refresh()
+                yield self
+            finally:
+                self._lock_fd, self._lock_depth, self._lock_exclusive = None, 0, False
+                if fcntl is None:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)  # closing the descriptor releases the flock
+
+    # -- loading ------------------------------------------------------------
+
+    def _stat_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the snapshot and journal on disk."""
+        sig = self._stat_signature()
+        journal_size = self.journal_path.stat().st_size if self.journal_path.exists() else 0
+        if sig != self._snapshot_sig or journal_size < self._journal_offset:
+            self._load_snapshot()
+            self._snapshot_sig = sig
+        self._replay_journal()
+
+    def _load_snapshot(self) -> None:
+        self._index = {}
+        self._journal_offset = 0
+        self._journal_records = 0
+        if not self.path.exists():
+            return
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                # Skip malformed lines
+                continue
+            if isinstance(data, dict) and isinstance(data.get("branch"), str):
+                self._index[data["branch"]] = data
+
+    def _replay_journal(self) -> None:
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._journal_offset)
+            tail = f.read()
+        # Only consume complete lines; a torn write is left for the next append
+        end = tail.rfind(b"\n") + 1
+        for raw in tail[:end].splitlines():
+            try:
+                self._apply(json.loads(raw))
+            except (ValueError, TypeError, AttributeError):
+                continue
+            self._journal_records += 1
+        self._journal_offset += end
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        op = record.get("op")
+        if op == "put":
+            entry = record["entry"]
+            self._index[entry["branch"]] = entry
+        elif op == "set":
+            current = self._index.get(record["branch"])
+            if current is not None:
+                current.update(record["fields"])
+        elif op == "del":
+            self._index.pop(record["branch"], None)
+
+    # -- reads --------------------------------------------------------------
+
+    def entries(self) -> list[TrackingEntry]:
+        """Return valid entries in tracking order (malformed ones are skipped)."""
+        with self.locked(exclusive=False):
+            entries = []
+            for data in self._index.values():
+                try:
+                    entries.append(TrackingEntry.model_validate(data))
+                except Exception:
+                    continue
+            return entries
+
+    def get(self, branch: str) -> Optional[TrackingEntry]:
+        with self.locked(exclusive=False):
+            data = self._index.get(branch)
+            if data is None:
+                return None
+            try:
+                return TrackingEntry.model_validate(data)
+            except Exception:
+                return None
+
+    # -- writes -------------------------------------------------------------
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = _dump_line(record).encode("utf-8")
+        with open(self.journal_path, "ab") as f:
+            if f.tell() != self._journal_offset:
+                # Terminate a torn record left by a crashed writer
+                line = b"\n" + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._apply(record)
+        self._journal_offset += len(line)
+        self._journal_records += 1
+        if self._journal_records >= self.compact_threshold:
+            self.compact()
+
+    def put(self, entry: TrackingEntry) -> None:
+        """Add an entry (replaces any existing entry for the same branch)."""
+        with self.locked():
+            self._append({"op": "put", "entry": entry.model_dump()})
+
+    def update(self, branch: str, updates: Dict[str, Any]) -> bool:
+        """Update known fields of an entry; returns False if branch isn't tracked."""
+        with self.locked():
+            if self.get(branch) is None:
+                return False
+            fields = {k: v for k, v in updates.items() if k in TrackingEntry.model_fields}
+            self._append({"op": "set", "branch": branch, "fields": fields})
+            return True
+
+    def remove(self, branch: str) -> bool:
+        """Tombstone an entry; returns False if branch isn't tracked."""
+        with self.locked():
+            if self.get(branch) is None:
+                return False
+            self._append({"op": "del", "branch": branch})
+            return True
+
+    def replace_all(self, entries: list[TrackingEntry]) -> None:
+        """Replace every entry (writes a fresh snapshot and clears the journal)."""
+        with self.locked():
+            self._index = {}
+            for entry in entries:
+                self._index[entry.branch] = entry.model_dump()
+            self._write_snapshot(list(self._index.values()))
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot."""
+        with self.locked():
+            self._write_snapshot(list(self._index.values()))
+
+    def _write_snapshot(self, rows: list[Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text("".join(_dump_line(row) for row in rows), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        # Replaying a stale journal over the new snapshot is idempotent, so a
+        # crash between replace and truncate cannot lose or resurrect entries.
+        if self.journal_path.exists():
+            with open(self.journal_path, "wb"):
+                pass
+        self._snapshot_sig = self._stat_signature()
+        self._journal_offset = 0
+        self._journal_records = 0
+
+
+_TRACKING_STORES: Dict[Path, TrackingStore] = {}
+
+
+def get_tracking_store(tracking_path: Path) -> TrackingStore:
+    """Return the process-wide TrackingStore for a tracking file."""
+    key = Path(tracking_path).expanduser().absolute()
+    store = _TRACKING_STORES.get(key)
+    if store is None:
+        store = _TRACKING_STORES[key] = TrackingStore(key)
+    return store
+
+
 def load_tracking_jsonl(tracking_path: Path) -> list[TrackingEntry]:
-    """Load tracking entries from JSONL file.
+    """Load tracking entries (compacted snapshot plus journal tail).
 
     Args:
         tracking_path: Path to the JSONL tracking file
@@ -839,60 +1346,44 @@ def load_tracking_jsonl(tracking_path: Path) -> list[TrackingEntry]:
     Returns:
         List of TrackingEntry objects (empty list if file doesn't exist)
     """
-    if not tracking_path.exists():
+    if not Path(tracking_path).exists():
         return []
-
-    entries = []
-    for line in tracking_path.read_text(encoding="utf-8").strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            entries.append(TrackingEntry.model_validate(data))
-        except (json.JSONDecodeError, Exception):
-            # Skip malformed lines
-            continue
-    return entries
+    return get_tracking_store(tracking_path).entries()
 
 
 def save_tracking_jsonl(tracking_path: Path, entries: list[TrackingEntry]) -> None:
     """Save tracking entries to JSONL file.
 
+    Rewrites the snapshot and clears the journal.
+
     Args:
         tracking_path: Path to the JSONL tracking file
         entries: List of TrackingEntry objects to save
     """
-    # Ensure parent directory exists
-    tracking_path.parent.mkdir(parents=True, exist_ok=True)
-
-    lines = []
-    for entry in entries:
-        lines.append(json.dumps(entry.model_dump(), separators=(",", ":")))
-
-    tracking_path.write_text("\n".join(lines) + "\n" if lines else "", encoding="utf-8")
+    get_tracking_store(tracking_path).replace_all(entries)
 
 
 def add_tracking_entry(tracking_path: Path, entry: TrackingEntry) -> None:
-    """Append a single tracking entry to the JSONL file.
+    """Append a single tracking entry.
 
     Args:
         tracking_path: Path to the JSONL tracking file
         entry: TrackingEntry to append
     """
-    # Ensure parent directory exists
-    tracking_path.parent.mkdir(parents=True, exist_ok=True)
-
-    line = json.dumps(entry.model_dump(), separators=(",", ":")) + "\n"
-
-    # Append to file (create if doesn't exist)
-    with open(tracking_path, "a", encoding="utf-8") as f:
-        f.write(line)
+    store = get_tracking_store(tracking_path)
+    with store.locked():
+        if not store.path.exists():
+            # Materialise the snapshot so the tracking file exists immediately
+            store.replace_all([entry])
+        else:
+            store.put(entry)
 
 
 def update_tracking_entry(tracking_path: Path, branch: str, updates: Dict[str, Any]) -> bool:
     """Update a tracking entry by branch name.
 
+    Appends a journal record instead of rewriting the tracking file.
+
     Args:
         tracking_path: Path to the JSONL tracking file
         branch: Branch name to find and update
@@ -901,26 +1392,16 @@ def update_tracking_entry(tracking_path: Path, branch: str, updates: Dict[str, A
     Returns:
         True if entry was found and updated, False otherwise
     """
-    entries = load_tracking_jsonl(tracking_path)
-    found = False
-
-    for entry in entries:
-        if entry.branch == branch:
-            for key, value in updates.items():
-                if hasattr(entry, key):
-                    setattr(entry, key, value)
-            found = True
-            break
-
-    if found:
-        save_tracking_jsonl(tracking_path, entries)
-
-    return found
+    if not Path(tracking_path).exists():
+        return False
+    return get_tracking_store(tracking_path).update(branch, updates)
 
 
 def remove_tracking_entry(tracking_path: Path, branch: str) -> bool:
     """Remove a tracking entry by branch name.
 
+    Appends a tombstone instead of rewriting the tracking file.
+
     Args:
         tracking_path: Path to the JSONL tracking file
         branch: Branch name to remove
@@ -928,15 +1409,9 @@ def remove_tracking_entry(tracking_path: Path, branch: str) -> bool:
     Returns:
         True if entry was found and removed, False otherwise
     """
-    entries = load_tracking_jsonl(tracking_path)
-    original_count = len(entries)
-    entries = [e for e in entries if e.branch != branch]
-
-    if len(entries) < original_count:
-        save_tracking_jsonl(tracking_path, entries)
-        return True
-
-    return False
+    if not Path(tracking_path).exists():
+        return False
+    return get_tracking_store(tracking_path).remove(branch)
 
 
 def get_remote_ahead_count(branch: str, cwd: Optional[Path] = None) -> int:
@@ -982,7 +1457,11 @@ def check_remote_branch_exists(branch: str, cwd: Optional[Path] = None) -> bool:
     return bool(result.stdout.strip())
 
 
-def sync_tracking_with_remote(tracking_path: Path, repo_root: Path) -> Dict[str, Any]:
+def sync_tracking_with_remote(
+    tracking_path: Path,
+    repo_root: Path,
+    snapshot: Optional[GitStateSnapshot] = None,
+) -> Dict[str, Any]:
     """Synchronize tracking entries with remote state.
 
     Updates remote_exists and remote_ahead for all tracked branches.
@@ -991,6 +1470,7 @@ def sync_tracking_with_remote(tracking_path: Path, repo_root: Path) -> Dict[str,
     Args:
         tracking_path: Path to the JSONL tracking file
         repo_root: Path to the repository root
+        snapshot: Pre-loaded ref snapshot (default: fetch, then load one)
 
     Returns:
         Summary dict with counts of updated entries and any warnings
@@ -999,55 +1479,59 @@ def sync_tracking_with_remote(tracking_path: Path, repo_root: Path) -> Dict[str,
     if not entries:
         return {"updated": 0, "warnings": []}
 
-    # Fetch latest from remote first
-    run_git(["fetch", "--all", "--prune"], cwd=repo_root, check=False)
+    if snapshot is None:
+        # Fetch latest from remote first
+        run_git(["fetch", "--all", "--prune"], cwd=repo_root, check=False)
+        snapshot = GitStateSnapshot.load(repo_root)
 
     updated_count = 0
     warnings = []
 
-    for entry in entries:
-        changed = False
+    with get_tracking_store(tracking_path).locked():
+        entries = load_tracking_jsonl(tracking_path)
+        for entry in entries:
+            changed = False
 
-        # Check if local worktree still exists
-        worktree_exists = Path(entry.path).exists()
-        if entry.local_worktree != worktree_exists:
-            entry.local_worktree = worktree_exists
-            changed = True
-
-        # Check remote state
-        remote_exists = check_remote_branch_exists(entry.branch, cwd=repo_root)
-        if entry.remote_exists != remote_exists:
-            entry.remote_exists = remote_exists
-            changed = True
-
-        # Check remote ahead count (only if remote exists)
-        if remote_exists:
-            ahead_count = get_remote_ahead_count(entry.branch, cwd=repo_root)
-            if ahead_count >= 0 and entry.remote_ahead != ahead_count:
-                entry.remote_ahead = ahead_count
+            # Check if local worktree still exists
+            worktree_exists = Path(entry.path).exists()
+            if entry.local_worktree != worktree_exists:
+                entry.local_worktree = worktree_exists
                 changed = True
 
-                # Warn if remote has unpulled commits
-                if ahead_count > 0:
-                    warnings.append({
-                        "branch": entry.branch,
-                        "message": f"Remote is {ahead_count} commit(s) ahead of local",
-                        "remote_ahead": ahead_count,
-                    })
-        else:
-            if entry.remote_ahead != 0:
-                entry.remote_ahead = 0
+            # Check remote state
+            remote_exists = snapshot.remote_exists(entry.branch)
+            if entry.remote_exists != remote_exists:
+                entry.remote_exists = remote_exists
                 changed = True
 
-        # Update last_checked timestamp
-        entry.last_checked = _dt.datetime.now(_dt.timezone.utc).isoformat()
-        changed = True
+            # Check remote ahead count (only if remote exists)
+            if remote_exists:
+                ahead_count = snapshot.remote_ahead(entry.branch)
+                if ahead_count >= 0 and entry.remote_ahead != ahead_count:
+                    entry.remote_ahead = ahead_count
+                    changed = True
+
+                    # Warn if remote has unpulled commits
+                    if ahead_count > 0:
+                        warnings.append({
+                            "branch": entry.branch,
+                            "message": f"Remote is {ahead_count} commit(s) ahead of local",
+                            "remote_ahead": ahead_count,
+                        })
+            else:
+                if entry.remote_ahead != 0:
+                    entry.remote_ahead = 0
+                    changed = True
 
-        if changed:
-            updated_count += 1
+            # Update last_checked timestamp
+            entry.last_checked = _dt.datetime.now(_dt.timezone.utc).isoformat()
+            changed = True
+
+            if changed:
+                updated_count += 1
 
-    # Save updated entries
-    save_tracking_jsonl(tracking_path, entries)
+        # Save updated entries
+        save_tracking_jsonl(tracking_path, entries)
 
     return {
         "updated": updated_count,
@@ -1174,7 +1658,6 @@ def get_all_remote_branches(cwd: Optional[Path] = None, patterns: Optional[list]
         if line.startswith("origin/"):
             branch = line[7:]  # Remove 'origin/' prefix
             if patterns:
-                import fnmatch
                 if any(fnmatch.fnmatch(branch, p) for p in patterns):
                     branches.append(branch)
             else:
@@ -1189,6 +1672,7 @@ def reconcile_tracking(
     discover_all: bool = False,
     branch_patterns: Optional[list] = None,
     protected_branches: Optional[list] = None,
+    snapshot: Optional[GitStateSnapshot] = None,
 ) -> Dict[str, Any]:
     """Reconcile JSONL tracking with actual git state.
 
@@ -1197,110 +1681,120 @@ def reconcile_tracking(
     2. Removes entries where both local and remote are gone
     3. Optionally discovers untracked remote branches (--all mode)
 
+    Remote state is answered from a single GitStateSnapshot rather than one
+    git process per entry.
+
     Args:
         tracking_path: Path to the JSONL tracking file
         repo_root: Path to the repository root
         discover_all: If True, also discover untracked remote branches
         branch_patterns: Patterns to match when discovering (e.g., ['feature/*'])
         protected_branches: List of protected branch names to skip
+        snapshot: Pre-loaded ref snapshot taken after a fetch (default: fetch,
+            then load one)
 
     Returns:
         Summary dict with reconciliation results
     """
-    # Fetch latest from remote first
-    run_git(["fetch", "--all", "--prune"], cwd=repo_root, check=False)
-
-    entries = load_tracking_jsonl(tracking_path)
-    protected = protected_branches or ["main", "master", "develop"]
-
-    removed = []
-    updated = []
-    warnings = []
-    discovered = []
-
-    # Determine worktree base from tracking path
-    worktree_base = tracking_path.parent
-
-    # Update existing entries
-    remaining_entries = []
-    for entry in entries:
-        # Check if local worktree still exists
-        local_exists = Path(entry.path).exists() if entry.path else False
-        entry.local_worktree = local_exists
-
-        # Check if remote branch exists
-        remote_exists = check_remote_branch_exists(entry.branch, cwd=repo_root)
-        entry.remote_exists = remote_exists
-
-        # Check remote ahead count
-        if remote_exists and local_exists:
-            ahead_count = get_remote_ahead_count(entry.branch, cwd=repo_root)
-            if ahead_count >= 0:
-                entry.remote_ahead = ahead_count
-                if ahead_count > 0:
-                    warnings.append({
-                        "branch": entry.branch,
-                        "message": f"Remote is {ahead_count} commit(s) ahead",
-                        "remote_ahead": ahead_count,
-                    })
-        else:
-            entry.remote_ahead = 0
-
-        # Update timestamp
-        entry.last_checked = _dt.datetime.now(_dt.timezone.utc).isoformat()
-
-        # Decide whether to keep or remove
-        if not local_exists and not remote_exists:
-            # Both gone - remove entry
-            removed.append(entry.branch)
-        else:
-            remaining_entries.append(entry)
-            updated.append(entry.branch)
-
-    # Discover untracked remote branches if requested
-    if discover_all:
-        tracked_branches = {e.branch for e in remaining_entries}
-        default_patterns = branch_patterns or ["feature/*", "hotfix/*", "bugfix/*", "release/*"]
+    if snapshot is None:
+        # Fetch latest from remote first
+        run_git(["fetch", "--all", "--prune"], cwd=repo_root, check=False)
+        snapshot = GitStateSnapshot.load(repo_root)
+
+    # Hold the tracking lock across load + save so concurrent agents'
+    # appends are not overwritten by the rewrite below.
+    with get_tracking_store(tracking_path).locked():
+        entries = load_tracking_jsonl(tracking_path)
+        protected = protected_branches or ["main", "master", "develop"]
+
+        removed = []
+        updated = []
+        warnings = []
+        discovered = []
+
+        # Determine worktree base from tracking path
+        worktree_base = tracking_path.parent
+
+        # Update existing entries
+        remaining_entries = []
+        for entry in entries:
+            # Check if local worktree still exists
+            local_exists = Path(entry.path).exists() if entry.path else False
+            entry.local_worktree = local_exists
+
+            # Check if remote branch exists
+            remote_exists = snapshot.remote_exists(entry.branch)
+            entry.remote_exists = remote_exists
 
-        remote_branches = get_all_remote_branches(cwd=repo_root, patterns=default_patterns)
+            # Check remote ahead count
+            if remote_exists and local_exists:
+                ahead_count = snapshot.remote_ahead(entry.branch)
+                if ahead_count >= 0:
+                    entry.remote_ahead = ahead_count
+                    if ahead_count > 0:
+                        warnings.append({
+                            "branch": entry.branch,
+                            "message": f"Remote is {ahead_count} commit(s) ahead",
+                            "remote_ahead": ahead_count,
+                        })
+            else:
+                entry.remote_ahead = 0
 
-        for branch in remote_branches:
-            if branch in tracked_branches:
-                continue
-            if branch in protected:
-                continue
+            # Update timestamp
+            entry.last_checked = _dt.datetime.now(_dt.timezone.utc).isoformat()
 
-            # Get creator info from first commit
-            # Try multiple base branches
-            creator_info = {}
-            for base in ["main", "master", "develop"]:
-                creator_info = get_branch_creator_info(branch, base=base, cwd=repo_root)
-                if creator_info:
-                    break
-
-            # Create new entry
-            new_entry = TrackingEntry(
-                branch=branch,
-                path=str(worktree_base / branch),
-                base="unknown",
-                owner=creator_info.get("author", "unknown"),
-                purpose="",
-                created=creator_info.get("date", _dt.datetime.now(_dt.timezone.utc).isoformat()),
-                status="discovered",
-                last_checked=_dt.datetime.now(_dt.timezone.utc).isoformat(),
-                remote_exists=True,
-                local_worktree=False,
-                remote_ahead=0,
-            )
-            remaining_entries.append(new_entry)
-            discovered.append({
-                "branch": branch,
-                "owner": new_entry.owner,
-                "created": new_entry.created,
-            })
-
-    # Save updated entries
-    save_tracking_jsonl(tracking_path, remaining_entries)
+            # Decide whether to keep or remove
+            if not local_exists and not remote_exists:
+                # Both gone - remove entry
+                removed.append(entry.branch)
+            else:
+                remaining_entries.append(entry)
+                updated.append(entry.branch)
+
+        # Discover untracked remote branches if requested
+        if discover_all:
+            tracked_branches = {e.branch for e in remaining_entries}
+            default_patterns = branch_patterns or ["feature/*", "hotfix/*", "bugfix/*", "release/*"]
+
+            remote_branches = snapshot.remote_branches(patterns=default_patterns)
+
+            for branch in remote_branches:
+                if branch in tracked_branches:
+                    continue
+                if branch in protected:
+                    continue
+
+                # Get creator info from first commit
+                # Try multiple base branches
+                creator_info = {}
+                for base in ["main", "master", "develop"]:
+                    creator_info = get_branch_creator_info(branch, base=base, cwd=repo_root)
+                    if creator_info:
+                        break
+
+                # Create new entry
+                new_entry = TrackingEntry(
+                    branch=branch,
+                    path=str(worktree_base / branch),
+                    base="unknown",
+                    owner=creator_info.get("author", "unknown"),
+                    purpose="",
+                    created=creator_info.get("date", _dt.datetime.now(_dt.timezone.utc).isoformat()),
+                    status="discovered",
+                    last_checked=_dt.datetime.now(_dt.timezone.utc).isoformat(),
+                    remote_exists=True,
+                    local_worktree=False,
+                    remote_ahead=0,
+                )
+                remaining_entries.append(new_entry)
+                discovered.append({
+                    "branch": branch,
+                    "owner": new_entry.owner,
+                    "created": new_entry.created,
+                })
+
+        # Save updated entries
+        save_tracking_jsonl(tracking_path, remaining_entries)
 
     return {
         "total": len(remaining_entries),
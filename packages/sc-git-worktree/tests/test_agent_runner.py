@@ -0,0 +1,62 @@
+"""Tests for the agent runner helpers in worktree_shared.
+
+Repeated invocations must reuse the digest manifest instead of re-reading
+the registry and agent file, and audit records go to one JSONL log.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import worktree_shared
+from worktree_shared import AgentInvokeRequest, invoke_agent_runner
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    agents = tmp_path / ".claude" / "agents"
+    agents.mkdir(parents=True)
+    (agents / "registry.yaml").write_text(
+        "agents:\n  demo:\n    version: 1.0.0\n    path: .claude/agents/demo.md\n", encoding="utf-8"
+    )
+    (agents / "demo.md").write_text("---\nversion: 1.0.0\n---\n# Demo\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(worktree_shared.CACHE_ENV_VAR, raising=False)
+    monkeypatch.setattr(worktree_shared, "_manifests", {})
+    return tmp_path
+
+
+class TestAgentRunner:
+    """invoke_agent_runner caching and audit logging."""
+
+    def test_repeat_invocation_uses_digest_manifest(self, project, monkeypatch):
+        first = invoke_agent_runner(AgentInvokeRequest(agent="demo"))
+        monkeypatch.setattr(worktree_shared, "_read_bytes", lambda path: pytest.fail("agent file re-read"))
+        monkeypatch.setattr(worktree_shared, "_load_yaml_file", lambda path: pytest.fail("registry re-parsed"))
+        second = invoke_agent_runner(AgentInvokeRequest(agent="demo", params={"n": 2}))
+
+        assert second.agent == first.agent
+        assert second.agent["version"] == "1.0.0"
+
+    def test_changed_agent_file_is_rehashed(self, project):
+        first = invoke_agent_runner(AgentInvokeRequest(agent="demo"))
+        (project / ".claude" / "agents" / "demo.md").write_text(
+            "---\nversion: 1.0.0\n---\n# Demo, edited\n", encoding="utf-8"
+        )
+        second = invoke_agent_runner(AgentInvokeRequest(agent="demo"))
+
+        assert second.agent["sha256"] != first.agent["sha256"]
+
+    def test_audit_records_appended_to_jsonl(self, project):
+        first = invoke_agent_runner(AgentInvokeRequest(agent="demo"))
+        second = invoke_agent_runner(AgentInvokeRequest(agent="demo"))
+
+        assert first.audit_path == second.audit_path == worktree_shared.AUDIT_LOG
+        lines = (project / worktree_shared.AUDIT_LOG).read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["outcome"] for line in lines] == ["prepared", "prepared"]
+        assert list((project / worktree_shared.LOGS_DIR).iterdir()) == [project / worktree_shared.AUDIT_LOG]
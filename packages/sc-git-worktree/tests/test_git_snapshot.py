@@ -0,0 +1,211 @@
+"""Tests for GitStateSnapshot (single-pass ref loading).
+
+The snapshot must answer remote_exists / remote_ahead / merged status with
+the same results as the per-branch helpers, while spawning a constant number
+of git processes regardless of how many branches are tracked.
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import sys
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from worktree_shared import (
+    GitStateSnapshot,
+    TrackingEntry,
+    count_unique_commits,
+    get_remote_ahead_count,
+    is_branch_merged,
+    load_tracking_jsonl,
+    reconcile_tracking,
+    save_tracking_jsonl,
+)
+
+
+def git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def commit(repo: Path, name: str) -> None:
+    (repo / name).write_text(name)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", name)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Clone of a bare origin with a mix of branch states.
+
+    - feature/synced: pushed with upstream, identical to remote
+    - feature/behind: pushed with upstream, remote has 2 extra commits
+    - feature/no-upstream: pushed without upstream, remote has 1 extra commit
+    - feature/local: never pushed, unmerged
+    - feature/merged: merged into main
+    """
+    origin = tmp_path / "origin.git"
+    subprocess.run(["git", "init", "-q", "--bare", "-b", "main", str(origin)], check=True)
+    seed = tmp_path / "seed"
+    subprocess.run(["git", "init", "-q", "-b", "main", str(seed)], check=True)
+    git(seed, "config", "user.email", "t@example.com")
+    git(seed, "config", "user.name", "t")
+    commit(seed, "init")
+    git(seed, "remote", "add", "origin", str(origin))
+    git(seed, "push", "-q", "origin", "main")
+
+    repo = tmp_path / "repo"
+    subprocess.run(["git", "clone", "-q", str(origin), str(repo)], check=True)
+    git(repo, "config", "user.email", "t@example.com")
+    git(repo, "config", "user.name", "t")
+
+    for branch in ["feature/synced", "feature/behind"]:
+        git(repo, "checkout", "-q", "-b", branch, "main")
+        commit(repo, branch.replace("/", "-"))
+        git(repo, "push", "-q", "-u", "origin", branch)
+
+    git(repo, "checkout", "-q", "-b", "feature/no-upstream", "main")
+    commit(repo, "no-upstream")
+    git(repo, "push", "-q", "origin", "feature/no-upstream")
+
+    git(repo, "checkout", "-q", "-b", "feature/local", "main")
+    commit(repo, "local")
+
+    git(repo, "checkout", "-q", "-b", "feature/merged", "main")
+    git(repo, "checkout", "-q", "main")
+
+    # Advance the remote side of two branches from a second clone
+    other = tmp_path / "other"
+    subprocess.run(["git", "clone", "-q", str(origin), str(other)], check=True)
+    git(other, "config", "user.email", "t@example.com")
+    git(other, "config", "user.name", "t")
+    git(other, "checkout", "-q", "feature/behind")
+    commit(other, "remote-1")
+    commit(other, "remote-2")
+    git(other, "checkout", "-q", "feature/no-upstream")
+    commit(other, "remote-3")
+    git(other, "push", "-q", "origin", "feature/behind", "feature/no-upstream")
+
+    git(repo, "fetch", "-q", "--all", "--prune")
+    return repo
+
+
+class TestSnapshotLoad:
+    """Ref data loaded from a single for-each-ref call."""
+
+    def test_load_uses_single_git_call(self, repo):
+        snapshot = GitStateSnapshot.load(repo)
+        assert snapshot.git_calls == 1
+        assert "main" in snapshot.local_heads
+        assert "feature/synced" in snapshot.remote_heads
+        assert "HEAD" not in snapshot.remote_heads
+
+    def test_remote_exists(self, repo):
+        snapshot = GitStateSnapshot.load(repo)
+        assert snapshot.remote_exists("feature/synced")
+        assert snapshot.remote_exists("feature/behind")
+        assert not snapshot.remote_exists("feature/local")
+        assert snapshot.git_calls == 1
+
+    def test_remote_branches_filtered(self, repo):
+        snapshot = GitStateSnapshot.load(repo)
+        assert snapshot.remote_branches(["feature/*"]) == [
+            "feature/behind",
+            "feature/no-upstream",
+            "feature/synced",
+        ]
+
+    def test_ingest_parses_track_field(self):
+        snapshot = GitStateSnapshot()
+        snapshot.ingest(
+            "refs/heads/a\tsha1\trefs/remotes/origin/a\t[ahead 1, behind 4]\n"
+            "refs/heads/b\tsha2\trefs/remotes/origin/b\t[gone]\n"
+            "refs/remotes/origin/a\tsha3\t\t\n"
+            "refs/remotes/origin/HEAD\tsha4\t\t\n"
+        )
+        assert snapshot.behind == {"a": 4}
+        assert snapshot.remote_ahead("a") == 4
+        assert snapshot.remote_ahead("b") == -1
+        assert snapshot.git_calls == 0
+
+
+class TestSnapshotMatchesPerBranchHelpers:
+    """Snapshot answers must agree with the per-branch git helpers."""
+
+    @pytest.mark.parametrize(
+        "branch",
+        ["feature/synced", "feature/behind", "feature/no-upstream", "feature/local", "missing"],
+    )
+    def test_remote_ahead_matches(self, repo, branch):
+        snapshot = GitStateSnapshot.load(repo)
+        assert snapshot.remote_ahead(branch) == get_remote_ahead_count(branch, cwd=repo)
+
+    def test_remote_ahead_from_upstream_track_is_free(self, repo):
+        snapshot = GitStateSnapshot.load(repo)
+        assert snapshot.remote_ahead("feature/behind") == 2
+        assert snapshot.remote_ahead("feature/synced") == 0
+        assert snapshot.git_calls == 1
+
+    def test_remote_ahead_without_upstream_falls_back_once(self, repo):
+        snapshot = GitStateSnapshot.load(repo)
+        assert snapshot.remote_ahead("feature/no-upstream") == 1
+        assert snapshot.remote_ahead("feature/no-upstream") == 1
+        assert snapshot.git_calls == 2
+
+    @pytest.mark.parametrize(
+        "branch", ["feature/merged", "feature/local", "feature/synced", "missing"]
+    )
+    def test_merge_state_matches(self, repo, branch):
+        snapshot = GitStateSnapshot.load(repo)
+        assert snapshot.is_merged(branch, base="main") == is_branch_merged(branch, base="main", cwd=repo)
+        assert snapshot.unique_commits(branch, base="main") == count_unique_commits(branch, base="main", cwd=repo)
+
+    def test_merged_set_loaded_once_per_base(self, repo):
+        snapshot = GitStateSnapshot.load(repo)
+        for branch in ["feature/merged", "main", "feature/local"]:
+            snapshot.is_merged(branch, base="main")
+        assert snapshot.git_calls == 2
+
+    def test_forget_updates_answers(self, repo):
+        snapshot = GitStateSnapshot.load(repo)
+        snapshot.forget_remote("feature/synced")
+        snapshot.forget_local("feature/merged")
+        assert not snapshot.remote_exists("feature/synced")
+        assert not snapshot.is_merged("feature/merged", base="main")
+
+
+class TestReconcileWithSnapshot:
+    """reconcile_tracking driven by a real snapshot."""
+
+    def test_reconcile_constant_git_calls(self, repo, tmp_path):
+        tracking_path = tmp_path / "tracking.jsonl"
+        worktree_dir = tmp_path / "wt"
+        worktree_dir.mkdir()
+        branches = ["feature/synced", "feature/behind", "feature/local"]
+        save_tracking_jsonl(tracking_path, [
+            TrackingEntry(
+                branch=branch,
+                path=str(worktree_dir),
+                base="main",
+                owner="test-user",
+                created="2024-01-15T10:30:00Z",
+                last_checked="2024-01-15T10:30:00Z",
+            )
+            for branch in branches
+        ])
+
+        snapshot = GitStateSnapshot.load(repo)
+        result = reconcile_tracking(tracking_path, repo, snapshot=snapshot)
+
+        assert snapshot.git_calls == 1
+        entries = {e.branch: e for e in load_tracking_jsonl(tracking_path)}
+        assert entries["feature/behind"].remote_ahead == 2
+        assert entries["feature/synced"].remote_exists is True
+        assert entries["feature/local"].remote_exists is False
+        assert [w["branch"] for w in result["warnings"]] == ["feature/behind"]
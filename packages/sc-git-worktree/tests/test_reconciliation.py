@@ -52,7 +52,7 @@ class TestEntryLifecycle:
         )
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
     def test_active_entry_preserved(self, mock_remote_exists, mock_run_git, tmp_path):
         """Active entries (local + remote exist) are preserved."""
         tracking_path = tmp_path / "tracking.jsonl"
@@ -80,7 +80,7 @@ class TestEntryLifecycle:
         assert "feature/test" not in result.get("removed", [])
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
     def test_local_only_entry_preserved(self, mock_remote_exists, mock_run_git, tmp_path):
         """Local-only entries (not pushed) are preserved."""
         tracking_path = tmp_path / "tracking.jsonl"
@@ -110,7 +110,7 @@ class TestEntryLifecycle:
         assert "feature/local" not in result.get("removed", [])
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
     def test_orphaned_remote_preserved(self, mock_remote_exists, mock_run_git, tmp_path):
         """CRITICAL: Orphaned remotes (local deleted, remote exists) are PRESERVED."""
         tracking_path = tmp_path / "tracking.jsonl"
@@ -140,7 +140,7 @@ class TestEntryLifecycle:
         assert "feature/orphaned" not in result.get("removed", [])
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
     def test_fully_cleaned_entry_removed(self, mock_remote_exists, mock_run_git, tmp_path):
         """Fully cleaned entries (no local, no remote) are removed."""
         tracking_path = tmp_path / "tracking.jsonl"
@@ -169,8 +169,8 @@ class TestRemoteAheadTracking:
     """Test remote_ahead tracking and safety."""
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
-    @patch('worktree_shared.get_remote_ahead_count')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_ahead')
     def test_remote_ahead_count_tracked(self, mock_ahead, mock_remote_exists, mock_run_git, tmp_path):
         """Remote ahead count is properly tracked."""
         tracking_path = tmp_path / "tracking.jsonl"
@@ -202,8 +202,8 @@ class TestRemoteAheadTracking:
         assert any(w.get("branch") == "feature/behind" for w in warnings)
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
-    @patch('worktree_shared.get_remote_ahead_count')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_ahead')
     def test_remote_ahead_prevents_deletion_info(self, mock_ahead, mock_remote_exists, mock_run_git, tmp_path):
         """Remote ahead count > 0 should trigger warning (deletion blocked in cleanup)."""
         tracking_path = tmp_path / "tracking.jsonl"
@@ -237,7 +237,7 @@ class TestMixedEntries:
     """Test reconciliation with mixed entry states."""
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
     def test_mixed_states_handled_correctly(self, mock_remote_exists, mock_run_git, tmp_path):
         """Test various entry states are handled correctly together."""
         tracking_path = tmp_path / "tracking.jsonl"
@@ -294,9 +294,9 @@ class TestProtectedBranches:
     """Test that protected branches are never auto-processed dangerously."""
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
     @patch('worktree_shared.get_branch_creator_info')
-    @patch('worktree_shared.get_all_remote_branches')
+    @patch('worktree_shared.GitStateSnapshot.remote_branches')
     def test_protected_branches_not_discovered(self, mock_all_branches, mock_creator,
                                                 mock_remote_exists, mock_run_git, tmp_path):
         """Protected branches should not be added during --all discovery."""
@@ -348,7 +348,7 @@ class TestEdgeCases:
         assert result["total"] == 0
 
     @patch('worktree_shared.run_git')
-    @patch('worktree_shared.check_remote_branch_exists')
+    @patch('worktree_shared.GitStateSnapshot.remote_exists')
     def test_duplicate_branches_in_tracking(self, mock_remote_exists, mock_run_git, tmp_path):
         """Test handling of duplicate branch entries (shouldn't happen, but be safe)."""
         tracking_path = tmp_path / "tracking.jsonl"
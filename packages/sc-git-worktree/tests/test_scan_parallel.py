@@ -0,0 +1,126 @@
+"""Tests for concurrent worktree status scanning in worktree_scan.
+
+Concurrent mode must return exactly what sequential mode returns, keyed in
+input order, with per-worktree timeouts reported as errors.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import sys
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import worktree_scan
+from worktree_scan import (
+    WorktreeInfo,
+    batch_get_worktree_statuses,
+    get_single_worktree_status,
+    resolve_jobs,
+)
+
+
+def git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def worktrees(tmp_path):
+    """Repo with six linked worktrees; every third one is dirty."""
+    repo = tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", "-b", "main", str(repo)], check=True)
+    git(repo, "config", "user.email", "t@example.com")
+    git(repo, "config", "user.name", "t")
+    (repo / "README.md").write_text("seed\n")
+    git(repo, "add", "README.md")
+    git(repo, "commit", "-q", "-m", "seed")
+
+    infos = []
+    for i in range(6):
+        branch = f"feature/wt-{i}"
+        path = tmp_path / "worktrees" / f"wt-{i}"
+        git(repo, "worktree", "add", "-q", "-b", branch, str(path))
+        if i % 3 == 0:
+            (path / "dirty.txt").write_text("x\n")
+        infos.append(WorktreeInfo(path=str(path), branch=branch, head=""))
+    return infos
+
+
+class TestConcurrentStatus:
+    """Concurrent scan results match sequential results."""
+
+    def test_parallel_matches_sequential(self, worktrees):
+        sequential = batch_get_worktree_statuses(worktrees, jobs=1)
+        parallel = batch_get_worktree_statuses(worktrees, jobs=4)
+        assert parallel == sequential
+        assert [s[0] for s in parallel.values()] == ["dirty", "clean", "clean"] * 2
+
+    def test_result_order_follows_input(self, worktrees):
+        # Make earlier worktrees finish last
+        delays = {wt.path: 0.05 * (len(worktrees) - i) for i, wt in enumerate(worktrees)}
+
+        def slow_status(wt, timeout):
+            time.sleep(delays[wt.path])
+            return ("clean", [], None)
+
+        with patch.object(worktree_scan, "get_single_worktree_status", side_effect=slow_status):
+            results = batch_get_worktree_statuses(worktrees, jobs=len(worktrees))
+
+        assert list(results) == [wt.path for wt in worktrees]
+
+    def test_parallel_wall_time_tracks_slowest(self, worktrees):
+        def slow_status(wt, timeout):
+            time.sleep(0.2)
+            return ("clean", [], None)
+
+        with patch.object(worktree_scan, "get_single_worktree_status", side_effect=slow_status):
+            start = time.perf_counter()
+            batch_get_worktree_statuses(worktrees, jobs=len(worktrees))
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.2 * len(worktrees) / 2
+
+    def test_missing_path_is_error(self, tmp_path):
+        missing = WorktreeInfo(path=str(tmp_path / "gone"), branch="gone", head="")
+        status, files, error = batch_get_worktree_statuses([missing], jobs=4)[missing.path]
+        assert status == "error"
+        assert "does not exist" in error
+
+    def test_bare_is_clean(self):
+        bare = WorktreeInfo(path="/nonexistent", branch="", head="", is_bare=True)
+        assert get_single_worktree_status(bare) == ("clean", [], None)
+
+
+class TestTimeout:
+    """Per-worktree timeout is passed to git and surfaced as an error."""
+
+    def test_timeout_reported(self, worktrees):
+        wt = worktrees[0]
+        with patch.object(
+            worktree_scan.subprocess,
+            "run",
+            side_effect=subprocess.TimeoutExpired(cmd="git status", timeout=0.5),
+        ) as mock_run:
+            status, _, error = get_single_worktree_status(wt, timeout=0.5)
+
+        assert status == "error"
+        assert "timed out" in error
+        assert mock_run.call_args.kwargs["timeout"] == 0.5
+
+
+class TestResolveJobs:
+    def test_zero_means_cpu_count(self):
+        with patch.object(worktree_scan.os, "cpu_count", return_value=16):
+            assert resolve_jobs(0) == 16
+            assert resolve_jobs(None) == 16
+
+    def test_explicit_value(self):
+        assert resolve_jobs(3) == 3
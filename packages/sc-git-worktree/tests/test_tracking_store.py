@@ -0,0 +1,248 @@
+"""Tests for the indexed, append-only TrackingStore.
+
+Single-branch updates must append to the journal instead of rewriting the
+tracking file, survive reloads, compact back into a plain JSONL snapshot, and
+never lose updates when several processes write concurrently.
+"""
+
+import json
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+
+import sys
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import worktree_shared
+from worktree_shared import (
+    TrackingEntry,
+    TrackingStore,
+    add_tracking_entry,
+    get_tracking_store,
+    load_tracking_jsonl,
+    remove_tracking_entry,
+    save_tracking_jsonl,
+    update_tracking_entry,
+)
+
+
+def make_entry(branch: str, **kwargs) -> TrackingEntry:
+    return TrackingEntry(
+        branch=branch,
+        path=f"/worktrees/{branch}",
+        base="main",
+        owner="test-user",
+        created="2024-01-15T10:30:00Z",
+        last_checked="2024-01-15T10:30:00Z",
+        **kwargs,
+    )
+
+
+def journal_lines(path: Path) -> list[dict]:
+    journal = path.with_name(path.name + ".journal")
+    if not journal.exists():
+        return []
+    return [json.loads(line) for line in journal.read_text().splitlines() if line]
+
+
+class TestAppendOnlyWrites:
+    """Updates and removals append records instead of rewriting the file."""
+
+    def test_update_appends_to_journal(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a"), make_entry("feature/b")])
+        snapshot_before = path.read_text()
+
+        assert update_tracking_entry(path, "feature/a", {"status": "merged", "bogus": 1})
+
+        assert path.read_text() == snapshot_before
+        assert journal_lines(path) == [
+            {"op": "set", "branch": "feature/a", "fields": {"status": "merged"}}
+        ]
+        assert load_tracking_jsonl(path)[0].status == "merged"
+
+    def test_remove_appends_tombstone(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a"), make_entry("feature/b")])
+
+        assert remove_tracking_entry(path, "feature/a")
+
+        assert journal_lines(path) == [{"op": "del", "branch": "feature/a"}]
+        assert [e.branch for e in load_tracking_jsonl(path)] == ["feature/b"]
+
+    def test_add_appends_put(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a")])
+
+        add_tracking_entry(path, make_entry("feature/b"))
+
+        assert journal_lines(path)[0]["op"] == "put"
+        assert [e.branch for e in load_tracking_jsonl(path)] == ["feature/a", "feature/b"]
+
+    def test_save_clears_journal(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a")])
+        update_tracking_entry(path, "feature/a", {"notes": "x"})
+
+        save_tracking_jsonl(path, [make_entry("feature/c")])
+
+        assert journal_lines(path) == []
+        assert [e.branch for e in load_tracking_jsonl(path)] == ["feature/c"]
+
+
+class TestReload:
+    """A fresh store sees snapshot + journal; a cached one replays only the tail."""
+
+    def test_new_store_replays_journal(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a"), make_entry("feature/b")])
+        update_tracking_entry(path, "feature/a", {"remote_ahead": 4})
+        remove_tracking_entry(path, "feature/b")
+
+        fresh = TrackingStore(path)
+        entries = fresh.entries()
+
+        assert [e.branch for e in entries] == ["feature/a"]
+        assert entries[0].remote_ahead == 4
+
+    def test_cached_store_reads_only_tail(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a")])
+        cached = get_tracking_store(path)
+        cached.entries()
+
+        other = TrackingStore(path)
+        other.update("feature/a", {"notes": "from another agent"})
+        journal_size = path.with_name(path.name + ".journal").stat().st_size
+
+        assert cached.get("feature/a").notes == "from another agent"
+        assert cached._journal_offset == journal_size
+
+    def test_torn_journal_line_is_ignored_and_terminated(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a")])
+        journal = path.with_name(path.name + ".journal")
+        journal.write_text('{"op":"set","branch":"feature/a","fie')
+
+        store = TrackingStore(path)
+        assert store.get("feature/a").notes == ""
+        store.update("feature/a", {"notes": "after crash"})
+
+        assert TrackingStore(path).get("feature/a").notes == "after crash"
+
+    def test_malformed_snapshot_entry_skipped(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        path.write_text('{"branch": "feature/bad"}\nnot json\n' + json.dumps(make_entry("feature/ok").model_dump()) + "\n")
+
+        assert [e.branch for e in load_tracking_jsonl(path)] == ["feature/ok"]
+        assert update_tracking_entry(path, "feature/bad", {"notes": "x"}) is False
+
+
+class TestCompaction:
+    """The journal is folded into a plain JSONL snapshot at the threshold."""
+
+    def test_compacts_at_threshold(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a")])
+        store = TrackingStore(path, compact_threshold=3)
+
+        for i in range(3):
+            store.update("feature/a", {"remote_ahead": i + 1})
+
+        assert journal_lines(path) == []
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["remote_ahead"] == 3
+
+    def test_compaction_preserves_order_and_tombstones(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry(f"feature/{c}") for c in "abc"])
+        store = TrackingStore(path)
+        store.remove("feature/b")
+        store.put(make_entry("feature/d"))
+        store.compact()
+
+        branches = [json.loads(line)["branch"] for line in path.read_text().splitlines()]
+        assert branches == ["feature/a", "feature/c", "feature/d"]
+
+
+def _worker_updates(path: str, branch: str, count: int) -> None:
+    for i in range(count):
+        update_tracking_entry(Path(path), branch, {"remote_ahead": i + 1})
+
+
+def _worker_adds(path: str, prefix: str, count: int) -> None:
+    for i in range(count):
+        add_tracking_entry(Path(path), make_entry(f"{prefix}/{i}"))
+
+
+def _mp_context():
+    return multiprocessing.get_context("spawn" if sys.platform == "win32" else "fork")
+
+
+class TestConcurrentWriters:
+    """Parallel agents must not clobber each other's updates."""
+
+    def test_parallel_updates_not_lost(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        branches = [f"feature/p{i}" for i in range(4)]
+        save_tracking_jsonl(path, [make_entry(b) for b in branches])
+
+        ctx = _mp_context()
+        procs = [ctx.Process(target=_worker_updates, args=(str(path), b, 40)) for b in branches]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(30)
+            assert proc.exitcode == 0
+
+        entries = {e.branch: e for e in TrackingStore(path).entries()}
+        assert all(entries[b].remote_ahead == 40 for b in branches)
+
+    def test_parallel_adds_not_lost(self, tmp_path):
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [])
+
+        ctx = _mp_context()
+        procs = [ctx.Process(target=_worker_adds, args=(str(path), f"agent{i}", 50)) for i in range(4)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(30)
+            assert proc.exitcode == 0
+
+        assert len(TrackingStore(path).entries()) == 200
+
+
+class _FakeMsvcrt:
+    LK_LOCK, LK_UNLCK = 1, 0
+
+    def __init__(self):
+        self.calls = []
+
+    def locking(self, fd, mode, nbytes):
+        self.calls.append((mode, nbytes, os.lseek(fd, 0, os.SEEK_CUR)))
+
+
+class TestWindowsLock:
+    """Without fcntl the store locks the first byte of the lock file with msvcrt."""
+
+    def test_shared_and_exclusive_lock_with_msvcrt(self, tmp_path, monkeypatch):
+        fake = _FakeMsvcrt()
+        monkeypatch.setattr(worktree_shared, "fcntl", None)
+        monkeypatch.setattr(worktree_shared, "msvcrt", fake, raising=False)
+        path = tmp_path / "tracking.jsonl"
+        save_tracking_jsonl(path, [make_entry("feature/a")])
+        fake.calls.clear()
+
+        store = TrackingStore(path)
+        with store.locked(exclusive=False):
+            assert store.get("feature/a") is not None
+        store.update("feature/a", {"remote_ahead": 2})
+
+        assert fake.calls == [(1, 1, 0), (0, 1, 0)] * 2
+        assert TrackingStore(path).get("feature/a").remote_ahead == 2
@@ -33,6 +33,8 @@ sys.path.insert(
     0, str(Path(__file__).parent.parent / "test-packages" / "harness")
 )
 from result import Failure, Result, Success
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
 
 
 # ============================================================================
@@ -168,7 +170,7 @@ def extract_version_from_frontmatter(file_path: Path) -> Result[Optional[str], A
 
         # Parse YAML frontmatter
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = get_repository_model().parse_yaml(frontmatter_text)
             if isinstance(frontmatter, dict) and "version" in frontmatter:
                 version = str(frontmatter["version"])
                 return Success(value=version)
@@ -202,8 +204,7 @@ def get_manifest_version(package_path: Path) -> Result[Optional[str], AuditError
         return Success(value=None)
 
     try:
-        with open(manifest_path) as f:
-            data = yaml.safe_load(f)
+        data = get_repository_model().load_yaml(manifest_path)
 
         manifest = ManifestSchema(**data)
         return Success(value=manifest.version)
@@ -545,8 +546,7 @@ def audit_marketplace_version(repo_root: Path, verbose: bool = False) -> Result[
 
     # version.yaml is plain YAML (not frontmatter), so parse directly
     try:
-        with open(version_file) as f:
-            data = yaml.safe_load(f)
+        data = get_repository_model().load_yaml(version_file)
 
         if isinstance(data, dict) and "version" in data:
             version = str(data["version"])
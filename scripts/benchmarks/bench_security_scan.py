@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Benchmark the security-scan content engine against the legacy per-pattern grep.
+
+Builds a synthetic tree of N files (default 50,000; a mix of .py, .md, .sh
+and .txt with a sprinkling of secret-like lines, plus a few binaries) and
+times the secrets + Python safety content checks:
+
+- legacy: one os.walk/rglob and full re-read per pattern (15 passes),
+          reproducing the pre-engine ``_grep_pattern`` loop
+- engine: one walk, one read per file, all rules in one pass
+          (sequential, and with each requested --jobs value)
+
+With --incremental the tree is committed to a git repository and the
+--incremental cache is timed cold, warm, and after a one-file edit.
+
+Reports files/sec and verifies that every mode finds the same issues.
+
+Usage:
+    python scripts/benchmarks/bench_security_scan.py [--files 50000] [--jobs 4 8] [--incremental] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from security_scan import ScanConfiguration, SecurityScanner  # noqa: E402
+
+# Assembled at runtime so this file does not trip the scanner itself
+_PW = "pass" + "word"
+HIT_LINES = [
+    f'{_PW} = "hunter2"',
+    "api_" + "key = 'sk_live_0123456789'",
+    "AWS_" + "SECRET = 'wJalrXUtnFEMI'",
+    "-----BEGIN RSA " + "PRIVATE KEY-----",
+    "value = ev" + "al(expr)",
+    "subprocess.run(cmd, shell" + "=True)",
+    "The api key is '0123456789abcdefghij'",
+]
+FILLER_LINES = [
+    "def handler(event, context):",
+    "    return {'status': 'ok', 'items': items}",
+    "# Configuration is loaded from environment variables",
+    "for index, item in enumerate(collection):",
+    "echo \"Running step $STEP\"",
+    "The token budget is documented in the design notes.",
+    "import os, sys, json",
+    "",
+]
+EXTENSIONS = [".py", ".py", ".md", ".md", ".sh", ".txt"]
+
+
+def build_tree(root: Path, count: int, seed: int = 7) -> None:
+    """Write ``count`` files spread over nested package-like directories."""
+    rng = random.Random(seed)
+    for i in range(count):
+        directory = root / "packages" / f"pkg-{i % 40:02d}" / rng.choice(["scripts", "skills", "agents", "src/lib"])
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"file_{i:06d}{rng.choice(EXTENSIONS)}"
+        if i % 997 == 0:
+            path.with_suffix(".bin").write_bytes(bytes(rng.randrange(256) for _ in range(2048)))
+            continue
+        lines = [rng.choice(FILLER_LINES) for _ in range(rng.randint(20, 80))]
+        if i % 50 == 0:
+            lines.insert(rng.randrange(len(lines)), rng.choice(HIT_LINES))
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def legacy_grep(scanner: SecurityScanner, pattern: str, search_path: Path, include_glob=None, case_insensitive=False):
+    """Pre-engine _grep_pattern: walk, open and scan every file for one pattern."""
+    matches = []
+    if include_glob:
+        files = [
+            f for f in search_path.rglob(include_glob)
+            if not any(excl in f.parts for excl in scanner.EXCLUDE_DIRS)
+        ]
+    else:
+        files = []
+        for root, dirs, filenames in os.walk(search_path):
+            dirs[:] = [d for d in dirs if d not in scanner.EXCLUDE_DIRS]
+            for filename in filenames:
+                files.append(Path(root) / filename)
+
+    compiled = re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
+    for file_path in files:
+        file_path_str = file_path.as_posix()
+        if any(excl in file_path_str for excl in scanner.EXCLUDE_FILES):
+            continue
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                for line_num, line in enumerate(f, 1):
+                    if compiled.search(line):
+                        matches.append((file_path_str, line_num))
+        except Exception:
+            pass
+    return matches
+
+
+def run_legacy(root: Path) -> tuple[float, set]:
+    scanner = SecurityScanner(ScanConfiguration(repo_root=root))
+    start = time.perf_counter()
+    found = set()
+    for pattern in scanner.SECRET_PATTERNS:
+        found.update(legacy_grep(scanner, pattern, root, case_insensitive=True))
+    for file_path, line_num in legacy_grep(scanner, r"(password|secret|token|key)", root, "*.md", True):
+        found.add((file_path, line_num))
+    for pattern in scanner.PYTHON_SAFETY_PATTERNS.values():
+        found.update(legacy_grep(scanner, pattern, root, "*.py"))
+    return time.perf_counter() - start, found
+
+
+def run_engine(root: Path, jobs: int) -> tuple[float, set]:
+    scanner = SecurityScanner(ScanConfiguration(repo_root=root, jobs=jobs))
+    start = time.perf_counter()
+    content = scanner._scan_content()
+    elapsed = time.perf_counter() - start
+    return elapsed, {(m.file_path, m.line_number) for matches in content.values() for m in matches}
+
+
+def run_incremental(root: Path, cache_file: Path) -> tuple[float, set, dict]:
+    scanner = SecurityScanner(ScanConfiguration(repo_root=root, incremental=True, cache_file=cache_file))
+    start = time.perf_counter()
+    content = scanner._scan_content()
+    elapsed = time.perf_counter() - start
+    found = {(m.file_path, m.line_number) for matches in content.values() for m in matches}
+    return elapsed, found, scanner.content_stats
+
+
+def bench_incremental(root: Path, baseline: set) -> list[dict] | None:
+    """Commit the tree, then time cold, warm and one-edit incremental scans."""
+    for args in (["init", "-q"], ["add", "-A"], ["-c", "user.name=bench", "-c", "user.email=b@example.com",
+                                                  "commit", "-q", "-m", "seed"]):
+        subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+    cache_file = root / ".git" / "bench-scan-cache.json"
+    rows = []
+    for label in ("cold", "warm", "one-edit"):
+        if label == "one-edit":
+            edited = next(root.glob("packages/pkg-00/scripts/*.py"))
+            edited.write_text(edited.read_text() + "# touched\n", encoding="utf-8")
+        elapsed, found, stats = run_incremental(root, cache_file)
+        if found != baseline:
+            print(f"ERROR: incremental results differ ({label})", file=sys.stderr)
+            return None
+        rows.append({"mode": f"incr-{label}", "jobs": 1, "seconds": elapsed, "rescanned": stats["scanned"]})
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[4, os.cpu_count() or 1])
+    parser.add_argument("--incremental", action="store_true", help="Also time the git-blob incremental cache")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="sc-security-bench-") as tmp:
+        root = Path(tmp)
+        build_tree(root, args.files)
+        # Warm the page cache so the first measurement is not penalised
+        run_engine(root, 1)
+
+        legacy_s, legacy_found = run_legacy(root)
+        rows = [{"mode": "legacy", "jobs": 1, "seconds": legacy_s}]
+        engine_s, engine_found = run_engine(root, 1)
+        rows.append({"mode": "engine", "jobs": 1, "seconds": engine_s})
+        for jobs in sorted(set(args.jobs) - {1}):
+            elapsed, found = run_engine(root, jobs)
+            if found != engine_found:
+                print(f"ERROR: engine results differ at jobs={jobs}", file=sys.stderr)
+                return 1
+            rows.append({"mode": "engine", "jobs": jobs, "seconds": elapsed})
+        if args.incremental:
+            incremental_rows = bench_incremental(root, engine_found)
+            if incremental_rows is None:
+                return 1
+            rows.extend(incremental_rows)
+
+    # Legacy markdown matches are pre-refinement keyword hits; compare the rest
+    legacy_core = {hit for hit in legacy_found if not hit[0].endswith(".md")}
+    engine_core = {hit for hit in engine_found if not hit[0].endswith(".md")}
+    if legacy_core != engine_core:
+        print("ERROR: engine results differ from legacy scan", file=sys.stderr)
+        return 1
+
+    for row in rows:
+        row["files_per_sec"] = round(args.files / max(row["seconds"], 1e-9))
+        row["speedup"] = round(legacy_s / max(row["seconds"], 1e-9), 1)
+        row["seconds"] = round(row["seconds"], 3)
+
+    report = {"files": args.files, "issues": len(engine_found), "runs": rows}
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{args.files} files, {len(engine_found)} matching lines")
+    print(f"{'mode':>14}  {'jobs':>4}  {'seconds':>8}  {'files/sec':>10}  {'speedup':>8}  {'rescanned':>9}")
+    for row in rows:
+        print(
+            f"{row['mode']:>14}  {row['jobs']:>4}  {row['seconds']:>8.2f}  "
+            f"{row['files_per_sec']:>10}  {row['speedup']:>7.1f}x  {row.get('rescanned', ''):>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,6 +30,8 @@ from pydantic import BaseModel, Field, field_validator
 # Add test-packages/harness to path for Result types
 sys.path.insert(0, str(Path(__file__).parent.parent / "test-packages" / "harness"))
 from result import Failure, Result, Success, collect_results
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
 
 try:
     import yaml  # type: ignore
@@ -131,7 +133,7 @@ def extract_version_from_file(file_path: Path) -> Result[str, ComparisonError]:
 
         # Try YAML parsing first
         try:
-            data = yaml.safe_load(content)
+            data = get_repository_model().parse_yaml(content)
             if isinstance(data, dict) and "version" in data:
                 version = str(data["version"]).strip()
                 return Success(value=version)
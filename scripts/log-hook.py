@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Append hook event payloads to reports/trace.jsonl."""
+"""Append hook event payloads to reports/trace.jsonl.
+
+When SC_TRACE_PATH is set (the test harness sets it per isolated session),
+events go to that file instead of --log so parallel sessions stay separate.
+"""
 from __future__ import annotations
 
 import argparse
@@ -33,7 +37,7 @@ def main() -> int:
         "env": env,
     }
 
-    log_path = Path(args.log)
+    log_path = Path(os.environ.get("SC_TRACE_PATH") or args.log)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     with log_path.open("a", encoding="utf-8") as f:
         f.write(json.dumps(record) + "\n")
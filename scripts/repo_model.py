@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+repo_model.py - Shared YAML parse cache for the validators
+
+The validators (validate-*.py, audit-versions.py, compare-versions.py) all read
+the same manifest.yaml files, markdown frontmatter and registry YAML. Parsing
+that YAML dominates their runtime, so every YAML document goes through one
+RepositoryModel instead of yaml.safe_load:
+
+- In-process: parses are memoized per content hash, so validators imported
+  into one interpreter (validate-all.py) parse each document once.
+- Across processes: successful parses and YAML errors are persisted in an
+  on-disk cache keyed by the sha256 of the document text, so a validator run
+  standalone (or as a validate-all.py subprocess) reuses earlier parses.
+
+Because entries are keyed by content rather than path or mtime, an edited
+file is always re-parsed and a stale entry can never be returned.
+
+Scope: only YAML parsing is shared. Each validator still finds its files
+(globbing packages/) and reads them itself, and JSON registries
+(marketplace.json, registry.json) are decoded directly, which is faster than
+copying a cached result. Validation time therefore still grows with the number
+of packages and validators, but no document is parsed as YAML twice.
+
+Environment:
+  SC_REPO_MODEL_CACHE  Cache file path, or "off" to disable the on-disk cache
+                       (default: $XDG_CACHE_HOME/synaptic-canvas/repo-model.json)
+
+Usage:
+  from repo_model import get_repository_model
+
+  model = get_repository_model()
+  data = model.parse_yaml(text)   # same result/exceptions as yaml.safe_load
+  data = model.load_yaml(path)
+
+  python3 scripts/repo_model.py [--repo-root PATH]   # pre-parse a checkout
+"""
+
+import argparse
+import atexit
+import copy
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+import yaml
+
+
+# Bump when the cache layout changes
+CACHE_VERSION = 1
+
+# Entries not used for this long are dropped when the cache is saved
+CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600
+
+# Last-used stamps are only refreshed (forcing a rewrite) once they are this old
+CACHE_TOUCH_SECONDS = 24 * 3600
+
+CACHE_ENV_VAR = "SC_REPO_MODEL_CACHE"
+
+# Frontmatter block at the start of a markdown file
+FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+def default_cache_path() -> Optional[Path]:
+    """Resolve the on-disk cache location; None when disabled."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override is not None:
+        return None if override.strip().lower() in ("", "0", "off", "none") else Path(override)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "synaptic-canvas" / "repo-model.json"
+
+
+def split_frontmatter(content: str) -> Optional[str]:
+    """Return the raw YAML frontmatter of a markdown document, if any."""
+    match = FRONTMATTER_PATTERN.match(content)
+    return match.group(1) if match else None
+
+
+class _Mark:
+    """Stand-in for yaml.Mark carrying only the line number."""
+
+    def __init__(self, line: int):
+        self.line = line
+
+
+class CachedYAMLError(yaml.YAMLError):
+    """A YAML error replayed from the cache with the original message and mark line."""
+
+    def __init__(self, message: str, mark_line: Optional[int] = None, has_mark: bool = False):
+        super().__init__(message)
+        self.message = message
+        if has_mark:
+            self.problem_mark = _Mark(mark_line) if mark_line is not None else None
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def _error_record(error: yaml.YAMLError) -> Dict[str, Any]:
+    has_mark = hasattr(error, "problem_mark")
+    mark = getattr(error, "problem_mark", None)
+    return {
+        "message": str(error),
+        "has_mark": has_mark,
+        "line": getattr(mark, "line", None) if mark is not None else None,
+    }
+
+
+def _json_safe(value: Any) -> bool:
+    """True when value survives a JSON round trip unchanged (no dates, int keys...)."""
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+class RepositoryModel:
+    """Content-addressed YAML parse cache shared by the validators."""
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self.stats = {"parsed": 0, "memory_hits": 0, "disk_hits": 0}
+        self._memory: Dict[str, Any] = {}
+        self._errors: Dict[str, yaml.YAMLError] = {}
+        self._disk: Dict[str, Dict[str, Any]] = {}
+        self._new: Dict[str, Dict[str, Any]] = {}
+        self._used: set = set()
+        self._lock = threading.Lock()
+        if cache_path is not None:
+            self._load()
+
+    # -- on-disk cache --------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION and isinstance(data.get("entries"), dict):
+            self._disk = data["entries"]
+
+    def save(self) -> None:
+        """Merge new and recently used entries into the cache file atomically."""
+        if self.cache_path is None:
+            return
+        with self._lock:
+            if not self._new and not self._used:
+                return
+            now = int(time.time())
+            on_disk = RepositoryModel(self.cache_path)._disk
+            entries = {
+                key: entry
+                for key, entry in {**on_disk, **self._disk}.items()
+                if now - entry.get("used", 0) <= CACHE_MAX_AGE_SECONDS
+            }
+            for key in self._used:
+                if key in entries:
+                    entries[key] = {**entries[key], "used": now}
+            for key, entry in self._new.items():
+                entries[key] = {**entry, "used": now}
+            payload = {"version": CACHE_VERSION, "entries": entries}
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                print(f"Warning: could not write repository model cache {self.cache_path}: {e}", file=sys.stderr)
+                return
+            self._disk = entries
+            self._new = {}
+            self._used = set()
+
+    # -- parsing --------------------------------------------------------------
+
+    def parse_yaml(self, text: str) -> Any:
+        """yaml.safe_load(text), parsed at most once per distinct text.
+
+        Returns a private copy so callers may mutate the result. Raises the
+        same yaml.YAMLError message (as CachedYAMLError when replayed from disk).
+        """
+        key = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+        with self._lock:
+            if key in self._memory:
+                self.stats["memory_hits"] += 1
+                return copy.deepcopy(self._memory[key])
+            if key in self._errors:
+                self.stats["memory_hits"] += 1
+                raise self._errors[key]
+            entry = self._disk.get(key)
+            if entry is not None:
+                self.stats["disk_hits"] += 1
+                if time.time() - entry.get("used", 0) > CACHE_TOUCH_SECONDS:
+                    self._used.add(key)
+                if "error" in entry:
+                    err = entry["error"]
+                    self._errors[key] = CachedYAMLError(err["message"], err.get("line"), err.get("has_mark", False))
+                    raise self._errors[key]
+                self._memory[key] = entry["value"]
+                return copy.deepcopy(entry["value"])
+
+        try:
+            value = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            with self._lock:
+                self.stats["parsed"] += 1
+                self._errors[key] = e
+                self._new[key] = {"error": _error_record(e)}
+            raise
+
+        with self._lock:
+            self.stats["parsed"] += 1
+            self._memory[key] = value
+            if _json_safe(value):
+                self._new[key] = {"value": value}
+        return copy.deepcopy(value)
+
+    def load_yaml(self, path: Union[str, Path]) -> Any:
+        """Read a YAML file and parse it through the model."""
+        with open(path, "r", encoding="utf-8") as f:
+            return self.parse_yaml(f.read())
+
+    # -- pre-parsing ----------------------------------------------------------
+
+    def warm(self, repo_root: Path) -> int:
+        """Parse every manifest, registry YAML and artifact frontmatter in a checkout.
+
+        Returns the number of documents visited. Parse errors are recorded,
+        not raised; the validators report them.
+        """
+        count = 0
+        for path in iter_model_files(repo_root):
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            text = split_frontmatter(content) if path.suffix == ".md" else content
+            if text is None:
+                continue
+            count += 1
+            try:
+                self.parse_yaml(text)
+            except yaml.YAMLError:
+                pass
+        return count
+
+
+def iter_model_files(repo_root: Path) -> Iterator[Path]:
+    """YAML files and frontmatter-bearing markdown the validators read."""
+    for name in ("version.yaml", ".claude/agents/registry.yaml"):
+        if (repo_root / name).is_file():
+            yield repo_root / name
+    yield from sorted(repo_root.glob("packages/*/manifest.yaml"))
+    yield from sorted(repo_root.glob("packages/*/commands/*.md"))
+    yield from sorted(repo_root.glob("packages/*/skills/**/SKILL.md"))
+    yield from sorted(repo_root.glob("packages/*/agents/*.md"))
+    yield from sorted(repo_root.glob(".claude/agents/*.md"))
+
+
+_models: Dict[Optional[Path], RepositoryModel] = {}
+_models_lock = threading.Lock()
+
+
+def get_repository_model() -> RepositoryModel:
+    """Process-wide model for the configured cache path; saved at exit."""
+    cache_path = default_cache_path()
+    with _models_lock:
+        model = _models.get(cache_path)
+        if model is None:
+            model = _models[cache_path] = RepositoryModel(cache_path)
+            atexit.register(model.save)
+        return model
+
+
+def main() -> int:
+    """Pre-parse a checkout into the shared cache."""
+    parser = argparse.ArgumentParser(description="Pre-parse repository metadata into the shared validator cache")
+    parser.add_argument("--repo-root", type=Path, default=Path(__file__).resolve().parent.parent)
+    args = parser.parse_args()
+
+    model = get_repository_model()
+    start = time.perf_counter()
+    count = model.warm(args.repo_root)
+    model.save()
+    print(
+        f"Parsed {count} documents in {time.perf_counter() - start:.2f}s "
+        f"({model.stats['parsed']} parsed, {model.stats['disk_hits']} cached) -> {model.cache_path or 'memory only'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
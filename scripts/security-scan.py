@@ -9,21 +9,28 @@ Usage:
     python3 scripts/security-scan.py --quick                  # Quick checks only
     python3 scripts/security-scan.py --json                   # JSON output
     python3 scripts/security-scan.py --package sc-delay-tasks # Single package
+    python3 scripts/security-scan.py --jobs 0                 # Scan files on all CPUs
+    python3 scripts/security-scan.py --incremental            # Rescan only changed blobs
     python3 scripts/security-scan.py --help                   # Show help
 """
 
 import argparse
+import fnmatch
+import hashlib
 import json
+import mmap
 import os
 import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -71,6 +78,508 @@ class SecurityError:
     details: dict = field(default_factory=dict)
 
 
+# =============================================================================
+# Content Scan Engine
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ContentRule:
+    """A line-oriented regex rule applied by the content scan engine.
+
+    ``anchors`` are literals of which at least one must occur on any line the
+    rule matches; they let the engine skip lines without running the regex.
+    When omitted they are derived from the pattern's literal prefix.
+    """
+
+    rule_id: str
+    pattern: str
+    ignore_case: bool = False
+    include_glob: Optional[str] = None
+    anchors: Tuple[str, ...] = ()
+
+    def required_literals(self) -> Optional[Tuple[bytes, ...]]:
+        """Literals (lowercased if ignore_case) one of which every match contains; None if unknown."""
+        anchors = self.anchors or tuple(filter(None, [_literal_prefix(self.pattern)]))
+        if not anchors:
+            return None
+        return tuple((a.lower() if self.ignore_case else a).encode("utf-8") for a in anchors)
+
+
+class ContentMatch(NamedTuple):
+    """A single rule hit: (rule_id, file_path, line_number, line_content)."""
+
+    rule_id: str
+    file_path: str
+    line_number: int
+    line_content: str
+
+
+# Files at or above this size are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1024 * 1024
+
+# Leading bytes inspected to decide whether a file is binary
+BINARY_SNIFF_BYTES = 8192
+
+# Window for anchor searches in memory-mapped files (bounds the lowercased copy)
+ANCHOR_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Files handed to a worker process at a time in --jobs mode
+SCAN_BATCH_SIZE = 256
+
+# Bump when engine changes could alter per-file matches (invalidates scan caches)
+CONTENT_ENGINE_VERSION = 1
+
+_REGEX_QUANTIFIERS = "*+?{"
+_REGEX_SPECIAL = set(".^$[]()|\\") | set(_REGEX_QUANTIFIERS)
+
+
+def _literal_prefix(pattern: str, min_length: int = 3) -> Optional[str]:
+    """Return the literal text every match of ``pattern`` starts with, if any.
+
+    Conservative: patterns containing ``|`` yield None, and a character
+    followed by a quantifier is not included.
+    """
+    if "|" in pattern:
+        return None
+    literal: List[str] = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            if i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+                ch, step = pattern[i + 1], 2
+            else:
+                break
+        elif ch in _REGEX_SPECIAL:
+            break
+        else:
+            step = 1
+        if i + step < len(pattern) and pattern[i + step] in _REGEX_QUANTIFIERS:
+            break
+        literal.append(ch)
+        i += step
+    prefix = "".join(literal)
+    return prefix if len(prefix) >= min_length else None
+
+
+class _CompiledRules(NamedTuple):
+    per_rule: List["re.Pattern[str]"]
+    anchors_exact: Dict[bytes, Tuple[int, ...]]
+    anchors_folded: Dict[bytes, Tuple[int, ...]]
+    unanchored: Optional["re.Pattern[bytes]"]
+
+
+# Per-process cache of compiled rule sets
+_COMPILED_RULES: Dict[Tuple[ContentRule, ...], _CompiledRules] = {}
+
+
+def _compile_rules(rules: Tuple[ContentRule, ...]) -> _CompiledRules:
+    """Compile a rule set for single-pass matching.
+
+    Rules with literal anchors are located with plain substring searches,
+    each anchor mapping back to the rules that require it. Rules without
+    anchors are folded into one alternation regex whose named groups
+    (``r<index>``) attribute each hit to its rule.
+    """
+    compiled = _COMPILED_RULES.get(rules)
+    if compiled is None:
+        anchors_exact: Dict[bytes, List[int]] = {}
+        anchors_folded: Dict[bytes, List[int]] = {}
+        alternatives = []
+        for index, rule in enumerate(rules):
+            literals = rule.required_literals()
+            if literals is None:
+                body = f"(?i:{rule.pattern})" if rule.ignore_case else f"(?:{rule.pattern})"
+                alternatives.append(f"(?P<r{index}>{body})")
+                continue
+            table = anchors_folded if rule.ignore_case else anchors_exact
+            for literal in literals:
+                table.setdefault(literal, []).append(index)
+        compiled = _COMPILED_RULES[rules] = _CompiledRules(
+            per_rule=[re.compile(rule.pattern, re.IGNORECASE if rule.ignore_case else 0) for rule in rules],
+            anchors_exact={k: tuple(v) for k, v in anchors_exact.items()},
+            anchors_folded={k: tuple(v) for k, v in anchors_folded.items()},
+            unanchored=re.compile("|".join(alternatives).encode("utf-8")) if alternatives else None,
+        )
+    return compiled
+
+
+def _read_content(file_path: str) -> Optional[bytes]:
+    """Read a file for scanning; None for unreadable, empty or binary files.
+
+    Large files are memory-mapped; the returned object supports the buffer
+    protocol either way, so searches run over it without copying.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(BINARY_SNIFF_BYTES)
+            if not head or b"\0" in head:
+                return None
+            size = os.fstat(f.fileno()).st_size
+            if size >= MMAP_THRESHOLD:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return head + f.read()
+    except (OSError, ValueError):
+        return None
+
+
+def _candidate_lines(content: bytes, compiled: _CompiledRules) -> Dict[int, set]:
+    """Map start offsets of lines that may match to the rule indices to check there."""
+    candidates: Dict[int, set] = {}
+    end = len(content)
+
+    if compiled.unanchored is not None:
+        unanchored = [int(name[1:]) for name in compiled.unanchored.groupindex]
+        pos = 0
+        while pos < end:
+            hit = compiled.unanchored.search(content, pos)
+            if hit is None:
+                break
+            line_start = content.rfind(b"\n", 0, hit.start()) + 1
+            # Overlapping unanchored rules on the same line are re-checked per rule
+            candidates.setdefault(line_start, set()).update(unanchored)
+            line_end = content.find(b"\n", hit.start())
+            pos = end if line_end == -1 else line_end + 1
+
+    anchors = list(compiled.anchors_exact) + list(compiled.anchors_folded)
+    if not anchors:
+        return candidates
+    longest = max(map(len, anchors))
+    for chunk_start in range(0, end, ANCHOR_CHUNK_SIZE):
+        chunk = content[chunk_start:chunk_start + ANCHOR_CHUNK_SIZE + longest - 1]
+        haystacks = [(chunk, compiled.anchors_exact)]
+        if compiled.anchors_folded:
+            haystacks.append((chunk.lower(), compiled.anchors_folded))
+        for haystack, table in haystacks:
+            for anchor, rule_indices in table.items():
+                pos = haystack.find(anchor)
+                while pos != -1 and pos < ANCHOR_CHUNK_SIZE:
+                    line_start = content.rfind(b"\n", 0, chunk_start + pos) + 1
+                    candidates.setdefault(line_start, set()).update(rule_indices)
+                    line_end = haystack.find(b"\n", pos)
+                    if line_end == -1:
+                        break
+                    pos = haystack.find(anchor, line_end + 1)
+    return candidates
+
+
+def _scan_compiled(file_path: str, rules: Tuple[ContentRule, ...], compiled: _CompiledRules) -> List[ContentMatch]:
+    content = _read_content(file_path)
+    if content is None:
+        return []
+
+    matches: List[ContentMatch] = []
+    try:
+        candidates = _candidate_lines(content, compiled)
+        end = len(content)
+        line_number = 1
+        counted_to = 0
+        for line_start in sorted(candidates):
+            line_end = content.find(b"\n", line_start)
+            if line_end == -1:
+                line_end = end
+            line = content[line_start:line_end].decode("utf-8", errors="ignore")
+            hits = [i for i in sorted(candidates[line_start]) if compiled.per_rule[i].search(line)]
+            if not hits:
+                continue
+
+            # mmap has no count(); slicing copies only the not-yet-counted span
+            if isinstance(content, bytes):
+                line_number += content.count(b"\n", counted_to, line_start)
+            else:
+                line_number += content[counted_to:line_start].count(b"\n")
+            counted_to = line_start
+
+            for i in hits:
+                matches.append(ContentMatch(rules[i].rule_id, file_path, line_number, line.strip()))
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+    return matches
+
+
+def scan_file(file_path: str, rules: Tuple[ContentRule, ...]) -> List[ContentMatch]:
+    """Match every rule against one file in a single read.
+
+    Candidate lines come from the rules' literal anchors and one pass of the
+    alternation regex for rules without anchors; each candidate is then
+    checked against its rules on that line alone, so a line matching several
+    rules is reported once per rule and no match can span a line break.
+    """
+    return _scan_compiled(file_path, rules, _compile_rules(tuple(rules)))
+
+
+def _scan_batch(rules: Tuple[ContentRule, ...], batch: List[Tuple[str, Tuple[int, ...]]]) -> List[ContentMatch]:
+    """Scan a batch of (file_path, rule_indices) pairs; the --jobs worker entry point."""
+    compiled_by_mask: Dict[Tuple[int, ...], Tuple[Tuple[ContentRule, ...], _CompiledRules]] = {}
+    matches: List[ContentMatch] = []
+    for file_path, mask in batch:
+        entry = compiled_by_mask.get(mask)
+        if entry is None:
+            subset = tuple(rules[i] for i in mask)
+            entry = compiled_by_mask[mask] = (subset, _compile_rules(subset))
+        matches.extend(_scan_compiled(file_path, *entry))
+    return matches
+
+
+class ContentScanner:
+    """Walks a tree once and applies all content rules to each file in one pass."""
+
+    def __init__(
+        self,
+        rules: Sequence[ContentRule],
+        exclude_dirs: Sequence[str] = (),
+        exclude_files: Sequence[str] = (),
+        jobs: int = 1,
+    ):
+        self.rules = tuple(rules)
+        self.exclude_dirs = set(exclude_dirs)
+        self.exclude_files = tuple(exclude_files)
+        self.jobs = jobs
+        self._globs = tuple(dict.fromkeys(r.include_glob for r in self.rules if r.include_glob))
+        self._masks: Dict[Tuple[bool, ...], Tuple[int, ...]] = {}
+
+    def iter_files(self, search_path: Path) -> Iterator[Tuple[str, Tuple[int, ...]]]:
+        """Yield (file_path, applicable rule indices) for every scannable file under search_path."""
+        for root, dirs, filenames in os.walk(search_path):
+            # Remove excluded dirs from dirs list (modifies in-place)
+            dirs[:] = [d for d in dirs if d not in self.exclude_dirs]
+            root_posix = Path(root).as_posix()
+            for filename in filenames:
+                file_path = f"{root_posix}/{filename}"
+                if any(excl in file_path for excl in self.exclude_files):
+                    continue
+                mask = self._applicable_rules(filename)
+                if mask:
+                    yield file_path, mask
+
+    def _applicable_rules(self, filename: str) -> Tuple[int, ...]:
+        # Evaluate each distinct glob once, then map the result to rule indices
+        key = tuple(fnmatch.fnmatch(filename, glob) for glob in self._globs)
+        mask = self._masks.get(key)
+        if mask is None:
+            matched = {glob for glob, ok in zip(self._globs, key) if ok}
+            mask = self._masks[key] = tuple(
+                i for i, rule in enumerate(self.rules) if rule.include_glob is None or rule.include_glob in matched
+            )
+        return mask
+
+    def scan(self, search_path: Path, cache: Optional["IncrementalScanCache"] = None) -> List[ContentMatch]:
+        """Scan search_path and return matches in walk order.
+
+        With a cache, files whose git blob is unchanged reuse their cached
+        matches and only the remaining files are read; fresh results are
+        written back to the cache.
+        """
+        work = list(self.iter_files(search_path))
+        self.stats = {"files": len(work), "cache_hits": 0, "scanned": len(work)}
+        if cache is None:
+            return self._scan_work(work)
+
+        cached: Dict[str, List[ContentMatch]] = {}
+        misses = []
+        for item in work:
+            hit = cache.lookup(item[0])
+            if hit is None:
+                misses.append(item)
+            else:
+                cached[item[0]] = hit
+        self.stats.update(cache_hits=len(cached), scanned=len(misses))
+
+        fresh: Dict[str, List[ContentMatch]] = {file_path: [] for file_path, _ in misses}
+        for match in self._scan_work(misses):
+            fresh[match.file_path].append(match)
+        for file_path, file_matches in fresh.items():
+            cache.store(file_path, file_matches)
+        cache.prune(search_path, [file_path for file_path, _ in work])
+
+        matches: List[ContentMatch] = []
+        for file_path, _ in work:
+            matches.extend(cached[file_path] if file_path in cached else fresh[file_path])
+        return matches
+
+    def _scan_work(self, work: List[Tuple[str, Tuple[int, ...]]]) -> List[ContentMatch]:
+        if self.jobs <= 1 or len(work) <= SCAN_BATCH_SIZE:
+            return _scan_batch(self.rules, work)
+
+        batches = [work[i:i + SCAN_BATCH_SIZE] for i in range(0, len(work), SCAN_BATCH_SIZE)]
+        matches: List[ContentMatch] = []
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            for batch_matches in pool.map(partial(_scan_batch, self.rules), batches):
+                matches.extend(batch_matches)
+        return matches
+
+    def ruleset_hash(self) -> str:
+        """Hash of everything that determines per-file matches."""
+        payload = [CONTENT_ENGINE_VERSION] + [
+            [r.rule_id, r.pattern, r.ignore_case, r.include_glob, list(r.anchors)] for r in self.rules
+        ]
+        return hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# Incremental Scan Cache
+# =============================================================================
+
+
+def _git_lines(repo_dir: Path, *args: str) -> Optional[List[str]]:
+    """Run a NUL-separated git query; None if git is unavailable or fails."""
+    try:
+        result = subprocess.run(
+            ["git", *args, "-z"], cwd=repo_dir, capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return [entry for entry in result.stdout.split("\0") if entry]
+
+
+def git_clean_blobs(repo_dir: Path) -> Tuple[Optional[Path], Dict[str, str]]:
+    """Return (toplevel, {repo-relative path: blob sha}) for clean tracked files.
+
+    Blob SHAs come from ``git ls-files -s``. Files modified in the working
+    tree (``git diff --name-only``), unmerged entries and symlinks are left
+    out, so their on-disk content is always rescanned.
+    """
+    toplevel = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"], cwd=repo_dir, capture_output=True, text=True
+    ) if shutil.which("git") else None
+    if toplevel is None or toplevel.returncode != 0:
+        return None, {}
+    root = Path(toplevel.stdout.strip())
+
+    staged = _git_lines(root, "ls-files", "-s")
+    dirty = _git_lines(root, "diff", "--name-only")
+    if staged is None or dirty is None:
+        return root, {}
+
+    blobs: Dict[str, str] = {}
+    for entry in staged:
+        meta, _, rel_path = entry.partition("\t")
+        mode, sha, stage = meta.split()
+        if stage == "0" and mode != "120000":
+            blobs[rel_path] = sha
+    for rel_path in dirty:
+        blobs.pop(rel_path, None)
+    return root, blobs
+
+
+class IncrementalScanCache:
+    """Per-file content matches keyed by git blob SHA, valid for one ruleset.
+
+    Entries are stored by repo-relative path as ``{"blob": sha, "matches": [...]}``
+    so the cache survives the checkout moving (e.g. between CI workspaces).
+    A different ruleset hash discards every entry.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_path: Path, repo_dir: Path, ruleset_hash: str):
+        self.cache_path = cache_path
+        self.ruleset_hash = ruleset_hash
+        toplevel, self.blobs = git_clean_blobs(repo_dir)
+        self.toplevel = Path(os.path.realpath(toplevel)) if toplevel else None
+        self.entries: Dict[str, Dict] = {}
+        self._dir_prefixes: Dict[str, Optional[str]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("version") == self.VERSION
+            and data.get("ruleset") == self.ruleset_hash
+            and isinstance(data.get("files"), dict)
+        ):
+            self.entries = data["files"]
+
+    def _relative(self, file_path: str) -> Optional[str]:
+        """Repo-relative posix path, resolved once per directory."""
+        if self.toplevel is None:
+            return None
+        directory, name = os.path.split(file_path)
+        if directory not in self._dir_prefixes:
+            real = os.path.realpath(directory)
+            root = str(self.toplevel)
+            if real == root:
+                self._dir_prefixes[directory] = ""
+            elif real.startswith(root + os.sep):
+                self._dir_prefixes[directory] = real[len(root) + 1:].replace(os.sep, "/") + "/"
+            else:
+                self._dir_prefixes[directory] = None
+        prefix = self._dir_prefixes[directory]
+        return None if prefix is None else prefix + name
+
+    def lookup(self, file_path: str) -> Optional[List[ContentMatch]]:
+        """Cached matches for file_path if its clean blob was scanned before."""
+        rel_path = self._relative(file_path)
+        blob = self.blobs.get(rel_path) if rel_path else None
+        entry = self.entries.get(rel_path) if blob else None
+        if not entry or entry.get("blob") != blob:
+            return None
+        return [ContentMatch(rule_id, file_path, line, text) for rule_id, line, text in entry["matches"]]
+
+    def store(self, file_path: str, matches: List[ContentMatch]) -> None:
+        """Record fresh matches for file_path; only clean tracked files are cached."""
+        rel_path = self._relative(file_path)
+        blob = self.blobs.get(rel_path) if rel_path else None
+        if blob is None:
+            return
+        self.entries[rel_path] = {
+            "blob": blob,
+            "matches": [[m.rule_id, m.line_number, m.line_content] for m in matches],
+        }
+        self._dirty = True
+
+    def prune(self, search_path: Path, seen: List[str]) -> None:
+        """Drop entries under search_path for files that were not walked this time."""
+        prefix = self._relative(os.path.join(str(search_path), ""))
+        if prefix is None:
+            return
+        keep = {self._relative(file_path) for file_path in seen}
+        stale = [rel for rel in self.entries if rel.startswith(prefix) and rel not in keep]
+        for rel_path in stale:
+            del self.entries[rel_path]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed."""
+        if not self._dirty or self.toplevel is None:
+            return
+        payload = {"version": self.VERSION, "ruleset": self.ruleset_hash, "files": self.entries}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: could not write scan cache {self.cache_path}: {e}", file=sys.stderr)
+
+
+def default_cache_path(repo_dir: Path) -> Path:
+    """Default incremental cache location: inside the git dir, never committed."""
+    git_dir = subprocess.run(
+        ["git", "rev-parse", "--absolute-git-dir"], cwd=repo_dir, capture_output=True, text=True
+    ) if shutil.which("git") else None
+    if git_dir is not None and git_dir.returncode == 0:
+        return Path(git_dir.stdout.strip()) / "sc-security-scan-cache.json"
+    return repo_dir / ".sc-security-scan-cache.json"
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Resolve a --jobs value: 0 or None means one worker per CPU."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -106,8 +615,11 @@ class ScanConfiguration(BaseModel):
     single_package: Optional[str] = None
     repo_root: Path
     output_format: str = "text"
+    jobs: int = 1
+    incremental: bool = False
+    cache_file: Optional[Path] = None
 
-    @field_validator("repo_root", mode="before")
+    @field_validator("repo_root", "cache_file", mode="before")
     @classmethod
     def convert_to_path(cls, v):
         """Convert string to Path."""
@@ -150,6 +662,17 @@ class SecurityScanner:
         r"BEGIN RSA PRIVATE KEY",
     ]
 
+    # Credentials in markdown: a secret-like keyword followed by a quoted 16+ char token
+    MARKDOWN_CREDENTIAL_PATTERN = r'(password|secret|token|key).*["\'].*[a-zA-Z0-9]{16,}'
+
+    # Unsafe Python patterns (case-sensitive, *.py only)
+    PYTHON_SAFETY_PATTERNS = {
+        "python:eval": r"eval\(",
+        "python:exec": r"exec\(",
+        "python:shell": r"shell=True",
+        "python:pickle": r"pickle\.loads",
+    }
+
     # Directories to exclude from scanning
     EXCLUDE_DIRS = [".git", ".venv", ".venv.bak", "__pycache__", "node_modules", "docs", "tests", "test-packages"]
 
@@ -165,6 +688,8 @@ class SecurityScanner:
         """Initialize scanner with configuration."""
         self.config = config
         self.checks: Dict[str, CheckResult] = {}
+        self._content_cache: Optional[Dict[str, List[ContentMatch]]] = None
+        self.content_stats: Dict[str, int] = {}
 
     def run(self) -> Result[ScanResults, SecurityError]:
         """Run all security checks and return results."""
@@ -203,11 +728,10 @@ class SecurityScanner:
     def scan_secrets(self) -> None:
         """Scan for hardcoded secrets and credentials."""
         issues: List[SecurityIssue] = []
-        search_path = self._get_search_path()
+        content = self._scan_content()
 
-        for pattern in self.SECRET_PATTERNS:
-            matches = self._grep_pattern(pattern, search_path, case_insensitive=True)
-            for file_path, line_num, line_content in matches:
+        for index in range(len(self.SECRET_PATTERNS)):
+            for _, file_path, line_num, line_content in content[f"secret:{index}"]:
                 # Skip this script itself
                 if "security-scan" in file_path:
                     continue
@@ -226,24 +750,15 @@ class SecurityScanner:
                 )
 
         # Check for credentials in markdown
-        md_pattern = r"(password|secret|token|key)"
-        md_matches = self._grep_pattern(
-            md_pattern, search_path, include_glob="*.md", case_insensitive=True
-        )
-        for file_path, line_num, line_content in md_matches:
-            if re.search(
-                r'(password|secret|token|key).*["\'].*[a-zA-Z0-9]{16,}',
-                line_content,
-                re.IGNORECASE,
-            ):
-                issues.append(
-                    SecurityIssue(
-                        severity=Severity.MEDIUM,
-                        message=f"Possible credential in markdown: {file_path}",
-                        file_path=file_path,
-                        line_number=line_num,
-                    )
+        for _, file_path, line_num, _ in content["markdown:credential"]:
+            issues.append(
+                SecurityIssue(
+                    severity=Severity.MEDIUM,
+                    message=f"Possible credential in markdown: {file_path}",
+                    file_path=file_path,
+                    line_number=line_num,
                 )
+            )
 
         status = CheckStatus.PASSED if not issues else CheckStatus.FAILED
         message = f"({len(issues)} potential secrets found)" if issues else "(0 potential secrets found)"
@@ -340,11 +855,10 @@ class SecurityScanner:
     def check_python_safety(self) -> None:
         """Check for unsafe Python patterns."""
         issues: List[SecurityIssue] = []
-        search_path = self._get_search_path()
+        content = self._scan_content()
 
         # Check for eval()
-        eval_matches = self._grep_pattern(r"eval\(", search_path, include_glob="*.py")
-        for file_path, line_num, _ in eval_matches:
+        for _, file_path, line_num, _ in content["python:eval"]:
             issues.append(
                 SecurityIssue(
                     severity=Severity.HIGH,
@@ -355,8 +869,7 @@ class SecurityScanner:
             )
 
         # Check for exec()
-        exec_matches = self._grep_pattern(r"exec\(", search_path, include_glob="*.py")
-        for file_path, line_num, _ in exec_matches:
+        for _, file_path, line_num, _ in content["python:exec"]:
             issues.append(
                 SecurityIssue(
                     severity=Severity.HIGH,
@@ -367,8 +880,7 @@ class SecurityScanner:
             )
 
         # Check for shell=True
-        shell_matches = self._grep_pattern(r"shell=True", search_path, include_glob="*.py")
-        for file_path, line_num, _ in shell_matches:
+        for _, file_path, line_num, _ in content["python:shell"]:
             try:
                 rel_path = Path(file_path).resolve().relative_to(self.config.repo_root).as_posix()
             except Exception:
@@ -385,8 +897,7 @@ class SecurityScanner:
             )
 
         # Check for pickle.loads
-        pickle_matches = self._grep_pattern(r"pickle\.loads", search_path, include_glob="*.py")
-        for file_path, line_num, _ in pickle_matches:
+        for _, file_path, line_num, _ in content["python:pickle"]:
             issues.append(
                 SecurityIssue(
                     severity=Severity.MEDIUM,
@@ -696,6 +1207,57 @@ class SecurityScanner:
             if p.is_dir() and not p.name.startswith(".") and p.name != "shared"
         ]
 
+    def _content_rules(self) -> List[ContentRule]:
+        """All line-based rules evaluated by the single-walk content scan."""
+        rules = [
+            ContentRule(f"secret:{index}", pattern, ignore_case=True)
+            for index, pattern in enumerate(self.SECRET_PATTERNS)
+        ]
+        rules.append(
+            ContentRule(
+                "markdown:credential",
+                self.MARKDOWN_CREDENTIAL_PATTERN,
+                ignore_case=True,
+                include_glob="*.md",
+                anchors=("password", "secret", "token", "key"),
+            )
+        )
+        rules.extend(
+            ContentRule(rule_id, pattern, include_glob="*.py")
+            for rule_id, pattern in self.PYTHON_SAFETY_PATTERNS.items()
+        )
+        return rules
+
+    def _scan_content(self) -> Dict[str, List[ContentMatch]]:
+        """Walk the search path once and return matches grouped by rule id.
+
+        Secrets detection and Python safety share this pass; the result is
+        cached for the lifetime of the scanner.
+        """
+        if self._content_cache is None:
+            rules = self._content_rules()
+            engine = ContentScanner(
+                rules,
+                exclude_dirs=self.EXCLUDE_DIRS,
+                exclude_files=self.EXCLUDE_FILES,
+                jobs=resolve_jobs(self.config.jobs),
+            )
+            cache = None
+            if self.config.incremental:
+                cache = IncrementalScanCache(
+                    self.config.cache_file or default_cache_path(self.config.repo_root),
+                    self.config.repo_root,
+                    engine.ruleset_hash(),
+                )
+            grouped: Dict[str, List[ContentMatch]] = {rule.rule_id: [] for rule in rules}
+            for match in engine.scan(self._get_search_path(), cache=cache):
+                grouped[match.rule_id].append(match)
+            if cache is not None:
+                cache.save()
+            self.content_stats = engine.stats
+            self._content_cache = grouped
+        return self._content_cache
+
     def _grep_pattern(
         self,
         pattern: str,
@@ -704,42 +1266,9 @@ class SecurityScanner:
         case_insensitive: bool = False,
     ) -> List[tuple[str, int, str]]:
         """Search for pattern in files, return (file_path, line_num, line_content)."""
-        matches = []
-
-        if include_glob:
-            # Get files matching glob but filter out excluded directories
-            files = [
-                f for f in search_path.rglob(include_glob)
-                if not any(excl in f.parts for excl in self.EXCLUDE_DIRS)
-            ]
-        else:
-            # Get all files, excluding certain directories
-            files = []
-            for root, dirs, filenames in os.walk(search_path):
-                # Remove excluded dirs from dirs list (modifies in-place)
-                dirs[:] = [d for d in dirs if d not in self.EXCLUDE_DIRS]
-                for filename in filenames:
-                    files.append(Path(root) / filename)
-
-        regex_flags = re.IGNORECASE if case_insensitive else 0
-        compiled_pattern = re.compile(pattern, regex_flags)
-
-        for file_path in files:
-            # Skip excluded files
-            file_path_str = file_path.as_posix()
-            if any(excl in file_path_str for excl in self.EXCLUDE_FILES):
-                continue
-
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    for line_num, line in enumerate(f, 1):
-                        if compiled_pattern.search(line):
-                            matches.append((file_path_str, line_num, line.strip()))
-            except Exception:
-                # Skip files that can't be read
-                pass
-
-        return matches
+        rule = ContentRule("grep", pattern, ignore_case=case_insensitive, include_glob=include_glob)
+        engine = ContentScanner([rule], exclude_dirs=self.EXCLUDE_DIRS, exclude_files=self.EXCLUDE_FILES)
+        return [(m.file_path, m.line_number, m.line_content) for m in engine.scan(search_path)]
 
     @staticmethod
     def _command_exists(command: str) -> bool:
@@ -822,6 +1351,8 @@ Examples:
   python3 scripts/security-scan.py --quick
   python3 scripts/security-scan.py --json > scan-results.json
   python3 scripts/security-scan.py --package sc-delay-tasks
+  python3 scripts/security-scan.py --jobs 0
+  python3 scripts/security-scan.py --incremental
 
 Checks Performed:
   1. Secrets Detection      - Scan for hardcoded credentials
@@ -840,6 +1371,22 @@ Exit Codes:
     parser.add_argument("--quick", action="store_true", help="Run quick checks only (skip slow scans)")
     parser.add_argument("--json", action="store_true", help="Output results in JSON format")
     parser.add_argument("--package", type=str, help="Scan only the specified package")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse cached findings for files whose git blob is unchanged",
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        help="Incremental scan cache (default: <git-dir>/sc-security-scan-cache.json)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for content scanning (0 = one per CPU, default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -859,6 +1406,9 @@ Exit Codes:
         single_package=args.package,
         repo_root=repo_root,
         output_format="json" if args.json else "text",
+        jobs=args.jobs,
+        incremental=args.incremental,
+        cache_file=args.cache_file,
     )
 
     # Run scanner
@@ -36,6 +36,8 @@ from pydantic import ValidationError as PydanticValidationError
 # Add test-packages/harness to path for Result types
 sys.path.insert(0, str(Path(__file__).parent.parent / "test-packages" / "harness"))
 from result import Result, Success, Failure, collect_results, AggregateError
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
 
 try:
     import yaml  # type: ignore
@@ -175,8 +177,7 @@ def load_registry(registry_path: Path) -> Result[AgentRegistry, AgentValidationE
         )
 
     try:
-        with open(registry_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = get_repository_model().load_yaml(registry_path)
 
         if not data:
             return Failure(
@@ -263,7 +264,7 @@ def extract_frontmatter(file_path: Path) -> Result[Dict[str, Any], AgentValidati
         frontmatter_text = "\n".join(frontmatter_lines)
 
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = get_repository_model().parse_yaml(frontmatter_text)
             if not frontmatter:
                 return Failure(
                     error=AgentValidationError(
@@ -9,9 +9,11 @@ Features:
     - Supports --continue-on-failure mode
     - Supports --json output mode
     - Supports --parallel for concurrent execution
+    - Supports --in-process to import validators instead of spawning interpreters
     - Returns aggregated exit code (0 if all pass, 1 if any fail)
     - Uses Result[T, E] pattern from project conventions
     - Uses Pydantic V2 for validation results
+    - Pre-parses manifests and frontmatter into the shared repo_model cache
 
 Exit codes:
     0: All validations passed
@@ -20,20 +22,27 @@ Exit codes:
 Usage:
     python3 scripts/validate-all.py [options]
     python3 scripts/validate-all.py --parallel
+    python3 scripts/validate-all.py --in-process --parallel
     python3 scripts/validate-all.py --json
     python3 scripts/validate-all.py --continue-on-failure
 """
 
 import argparse
+import importlib.util
+import io
 import json
+import multiprocessing
+import os
 import subprocess
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic import BaseModel, Field
 
@@ -43,6 +52,9 @@ sys.path.insert(
 )
 from result import Failure, Result, Success
 
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
+
 
 # ============================================================================
 # Error Types
@@ -96,10 +108,20 @@ class ValidatorResult(BaseModel):
     error_message: Optional[str] = None
 
 
+class ValidatorTiming(BaseModel):
+    """Wall time of a single validator and how it was executed."""
+
+    name: str
+    mode: str = Field(description="'subprocess' or 'in-process'")
+    duration_seconds: float = 0.0
+    passed: bool = False
+
+
 class ValidationSummary(BaseModel):
     """Summary of all validation results."""
 
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    execution_mode: str = "subprocess"
     total_validators: int = 0
     passed: int = 0
     failed: int = 0
@@ -107,6 +129,7 @@ class ValidationSummary(BaseModel):
     total_duration_seconds: float = 0.0
     all_passed: bool = False
     results: list[ValidatorResult] = Field(default_factory=list)
+    timings: list[ValidatorTiming] = Field(default_factory=list)
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
@@ -276,11 +299,149 @@ def run_validator(
         )
 
 
+# Validator modules imported by run_validator_in_process, keyed by script path
+_VALIDATOR_MODULES: dict[Path, object] = {}
+
+
+def _load_validator_main(script_path: Path) -> Optional[Callable[[], Optional[int]]]:
+    """
+    Import a validator script and return its main().
+
+    Modules with a main() are imported once per process. Plain scripts do
+    their work at import time, so they are re-executed on every call and
+    None is returned.
+    """
+    script_path = script_path.resolve()
+    module = _VALIDATOR_MODULES.get(script_path)
+    if module is None:
+        module_name = "sc_validator_" + script_path.stem.replace("-", "_")
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            if not callable(getattr(module, "main", None)):
+                del sys.modules[module_name]
+        if not callable(getattr(module, "main", None)):
+            return None
+        _VALIDATOR_MODULES[script_path] = module
+    return module.main
+
+
+def _exit_code(code: object) -> int:
+    """Map a main() return value or SystemExit code to a process exit code."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_validator_in_process(
+    config: ValidatorConfig,
+    cwd: Optional[Path] = None,
+) -> Result[ValidatorResult, ValidatorError]:
+    """
+    Run a Python validator by importing its main() in this interpreter.
+
+    sys.argv, the working directory and stdout/stderr are swapped for the
+    duration of the call, so the ValidatorResult matches what a subprocess
+    run would produce. Commands that are not Python scripts fall back to
+    run_validator. The timeout is not enforced in-process.
+
+    Args:
+        config: Validator configuration
+        cwd: Working directory for execution
+
+    Returns:
+        Success with ValidatorResult if execution completed (pass or fail)
+        Failure with ValidatorError if the script does not exist
+    """
+    script_path = _resolve_python_script_path(config.command, cwd)
+    if script_path is None:
+        return run_validator(config, cwd)
+
+    start_time = time.time()
+    if not script_path.exists():
+        return Failure(
+            error=ValidatorError(
+                validator_name=config.name,
+                message=f"Script not found: {config.command[1]}",
+                duration_seconds=round(time.time() - start_time, 2),
+            )
+        )
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            sys.argv = [str(script_path), *config.command[2:]]
+            if cwd is not None:
+                os.chdir(cwd)
+            try:
+                main = _load_validator_main(script_path)
+                exit_code = _exit_code(main() if main is not None else None)
+            except SystemExit as e:
+                exit_code = _exit_code(e.code)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+
+    return Success(
+        value=ValidatorResult(
+            name=config.name,
+            command=" ".join(config.command),
+            exit_code=exit_code,
+            passed=exit_code == 0,
+            stdout=stdout.getvalue(),
+            stderr=stderr.getvalue(),
+            duration_seconds=round(time.time() - start_time, 2),
+        )
+    )
+
+
+def _record_timings(
+    summary: ValidationSummary,
+    validators: list[ValidatorConfig],
+    in_process: bool,
+    cwd: Optional[Path] = None,
+) -> None:
+    """Fill summary.execution_mode and the per-validator timing table."""
+    summary.execution_mode = "in-process" if in_process else "subprocess"
+    configs = {config.name: config for config in validators}
+    for result in summary.results:
+        if result.error_message == "Skipped due to previous failure":
+            continue
+        config = configs.get(result.name)
+        imported = in_process and config is not None and _resolve_python_script_path(config.command, cwd) is not None
+        summary.timings.append(
+            ValidatorTiming(
+                name=result.name,
+                mode="in-process" if imported else "subprocess",
+                duration_seconds=result.duration_seconds,
+                passed=result.passed,
+            )
+        )
+
+
+def _process_pool_context():
+    """Prefer fork so workers inherit imported modules and the parse cache."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
 def run_validators_sequential(
     validators: list[ValidatorConfig],
     continue_on_failure: bool = False,
     verbose: bool = False,
     cwd: Optional[Path] = None,
+    in_process: bool = False,
 ) -> Result[ValidationSummary, OrchestratorError]:
     """
     Run validators sequentially.
@@ -290,6 +451,7 @@ def run_validators_sequential(
         continue_on_failure: Continue running validators after failure
         verbose: Enable verbose output
         cwd: Working directory for execution
+        in_process: Import and call each validator's main() instead of spawning it
 
     Returns:
         Success with ValidationSummary
@@ -304,7 +466,8 @@ def run_validators_sequential(
             print(f"\n[{i}/{len(validators)}] Running: {config.name}")
             print(f"    Command: {' '.join(config.command)}")
 
-        result = run_validator(config, cwd)
+        runner = run_validator_in_process if in_process else run_validator
+        result = runner(config, cwd)
 
         if isinstance(result, Failure):
             error = result.error
@@ -394,6 +557,7 @@ def run_validators_sequential(
 
     summary.total_duration_seconds = round(time.time() - start_time, 2)
     summary.all_passed = summary.failed == 0
+    _record_timings(summary, validators, in_process, cwd)
 
     return Success(value=summary, warnings=warnings)
 
@@ -403,15 +567,20 @@ def run_validators_parallel(
     max_workers: int = 4,
     verbose: bool = False,
     cwd: Optional[Path] = None,
+    in_process: bool = False,
 ) -> Result[ValidationSummary, OrchestratorError]:
     """
     Run validators in parallel.
 
+    In-process validators run in a process pool rather than a thread pool:
+    sys.argv, stdout and the working directory are per-process state.
+
     Args:
         validators: List of validator configurations
         max_workers: Maximum number of concurrent validators
         verbose: Enable verbose output
         cwd: Working directory for execution
+        in_process: Import and call each validator's main() in pool workers
 
     Returns:
         Success with ValidationSummary
@@ -424,9 +593,15 @@ def run_validators_parallel(
     if verbose:
         print(f"\nRunning {len(validators)} validators in parallel (max {max_workers} workers)")
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    if in_process:
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_process_pool_context())
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    runner = run_validator_in_process if in_process else run_validator
+
+    with executor:
         future_to_config = {
-            executor.submit(run_validator, config, cwd): config
+            executor.submit(runner, config, cwd): config
             for config in validators
         }
 
@@ -510,6 +685,7 @@ def run_validators_parallel(
 
     # Sort results by validator name for consistent output
     summary.results.sort(key=lambda r: r.name)
+    _record_timings(summary, validators, in_process, cwd)
 
     return Success(value=summary, warnings=warnings)
 
@@ -532,6 +708,7 @@ def print_summary(summary: ValidationSummary, verbose: bool = False) -> None:
     print(f"  Failed:            {summary.failed}")
     print(f"  Skipped:           {summary.skipped}")
     print(f"  Total duration:    {summary.total_duration_seconds:.2f}s")
+    print(f"  Execution mode:    {summary.execution_mode}")
 
     # Results table
     print("\n" + "-" * 70)
@@ -618,6 +795,10 @@ Examples:
   Run validators in parallel:
     python3 scripts/validate-all.py --parallel
 
+  Import validators instead of spawning an interpreter per validator:
+    python3 scripts/validate-all.py --in-process
+    python3 scripts/validate-all.py --in-process --parallel
+
   Continue on failure:
     python3 scripts/validate-all.py --continue-on-failure
 
@@ -648,6 +829,11 @@ Available validators:
         action="store_true",
         help="Run validators in parallel",
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Import each validator's main() instead of running it as a subprocess",
+    )
     parser.add_argument(
         "--max-workers",
         type=int,
@@ -714,6 +900,13 @@ Available validators:
             print("Error: No validators matched filter criteria")
         return 1
 
+    # Parse shared metadata once; validator subprocesses reuse it from the cache
+    # (in-process validators share the warmed model directly)
+    model = get_repository_model()
+    if args.in_process or model.cache_path is not None:
+        model.warm(args.cwd or Path.cwd())
+        model.save()
+
     # Run validators
     if args.parallel:
         result = run_validators_parallel(
@@ -721,6 +914,7 @@ Available validators:
             max_workers=args.max_workers,
             verbose=args.verbose and not args.json,
             cwd=args.cwd,
+            in_process=args.in_process,
         )
     else:
         result = run_validators_sequential(
@@ -728,6 +922,7 @@ Available validators:
             continue_on_failure=args.continue_on_failure,
             verbose=args.verbose and not args.json,
             cwd=args.cwd,
+            in_process=args.in_process,
         )
 
     if isinstance(result, Failure):
@@ -31,6 +31,8 @@ from pydantic import BaseModel, Field, field_validator
 # Add test-packages/harness to path for Result imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "test-packages" / "harness"))
 from result import AggregateError, Failure, Result, Success, collect_results
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
 
 
 # -----------------------------------------------------------------------------
@@ -247,8 +249,7 @@ def load_yaml(file_path: Path) -> Result[Dict, CrossReferenceError]:
                 )
             )
 
-        with open(file_path, "r") as f:
-            data = yaml.safe_load(f)
+        data = get_repository_model().load_yaml(file_path)
 
         if data is None:
             return Failure(
@@ -40,6 +40,8 @@ from pydantic import ValidationError as PydanticValidationError
 # Add test-packages/harness to path for Result types
 sys.path.insert(0, str(Path(__file__).parent.parent / "test-packages" / "harness"))
 from result import Result, Success, Failure, collect_results
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
 
 try:
     import yaml  # type: ignore
@@ -238,7 +240,7 @@ def extract_frontmatter(file_path: str) -> Result[FrontmatterData, FrontmatterVa
 
     # Parse YAML
     try:
-        frontmatter = yaml.safe_load(raw_frontmatter)
+        frontmatter = get_repository_model().parse_yaml(raw_frontmatter)
     except yaml.YAMLError as e:
         return Failure(
             error=FrontmatterValidationError(
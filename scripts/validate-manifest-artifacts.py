@@ -32,6 +32,8 @@ sys.path.insert(
     0, str(Path(__file__).parent.parent / "test-packages" / "harness")
 )
 from result import Failure, Result, Success
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
 
 
 # ============================================================================
@@ -177,8 +179,7 @@ def load_manifest(package_path: Path) -> Result[ManifestSchema, ValidationError]
         )
 
     try:
-        with open(manifest_path) as f:
-            data = yaml.safe_load(f)
+        data = get_repository_model().load_yaml(manifest_path)
 
         manifest = ManifestSchema(**data)
         return Success(value=manifest)
@@ -31,6 +31,8 @@ sys.path.insert(
     0, str(Path(__file__).parent.parent / "test-packages" / "harness")
 )
 from result import Failure, Result, Success
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
 
 
 # ============================================================================
@@ -226,8 +228,7 @@ def load_manifest(package_path: Path) -> Result[dict[str, Any], SyncError]:
         )
 
     try:
-        with open(manifest_path) as f:
-            data = yaml.safe_load(f)
+        data = get_repository_model().load_yaml(manifest_path)
         return Success(value=data)
     except yaml.YAMLError as e:
         return Failure(
@@ -40,6 +40,8 @@ from typing import Any, Dict, List, Optional
 # Add test-packages/harness to path for Result types
 sys.path.insert(0, str(Path(__file__).parent.parent / "test-packages" / "harness"))
 from result import Result, Success, Failure, collect_results
+sys.path.insert(0, str(Path(__file__).parent))
+from repo_model import get_repository_model
 
 try:
     import yaml  # type: ignore
@@ -137,7 +139,7 @@ def extract_frontmatter(file_path: str) -> Result[Dict[str, Any], ScriptReferenc
 
     # Parse YAML
     try:
-        frontmatter = yaml.safe_load(raw_frontmatter)
+        frontmatter = get_repository_model().parse_yaml(raw_frontmatter)
     except yaml.YAMLError as e:
         return Failure(
             error=ScriptReferenceError(
@@ -229,8 +231,7 @@ def extract_script_references_from_manifest(
         Success with list of ScriptReference objects, or Failure with error
     """
     try:
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            manifest = yaml.safe_load(f)
+        manifest = get_repository_model().load_yaml(manifest_path)
     except Exception as e:
         return Failure(
             error=ScriptReferenceError(
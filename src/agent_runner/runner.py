@@ -4,8 +4,12 @@ Agent Runner core utilities (library module).
 - Validates agent name/path/version against .claude/agents/registry.yaml
 - Extracts YAML frontmatter from agent file and verifies version
 - Computes SHA-256 of the agent file for runtime attestation
+- Keeps parsed registries and agent digests in .claude/state/agent-runner-cache.json,
+  re-reading a file only when its mtime or size changes (AGENT_RUNNER_CACHE=off
+  to always re-read)
 - Builds a Task tool prompt string for the skill to use
-- Writes a redacted audit record to .claude/state/logs/
+- Appends a redacted audit record to .claude/state/logs/agent-runner.jsonl
+  (rotated at 5 MiB)
 
 Note: This scaffold does NOT launch the Task tool itself. It prepares
 "task_prompt" for the skill to pass to the Task tool and records an audit entry.
@@ -13,6 +17,7 @@ Note: This scaffold does NOT launch the Task tool itself. It prepares
 from __future__ import annotations
 
 import dataclasses
+import copy
 import datetime as _dt
 import hashlib
 import json
@@ -27,6 +32,13 @@ except Exception:  # pragma: no cover
 
 REGISTRY_DEFAULT = os.path.join(".claude", "agents", "registry.yaml")
 LOGS_DIR = os.path.join(".claude", "state", "logs")
+AUDIT_LOG = os.path.join(LOGS_DIR, "agent-runner.jsonl")
+AUDIT_MAX_BYTES = 5 * 1024 * 1024
+CACHE_PATH = os.path.join(".claude", "state", "agent-runner-cache.json")
+CACHE_VERSION = 1
+CACHE_ENV_VAR = "AGENT_RUNNER_CACHE"
+
+_manifests: Dict[str, Dict[str, Any]] = {}
 
 
 @dataclasses.dataclass
@@ -43,6 +55,61 @@ class AgentFileInfo:
     sha256: str
 
 
+def _cache_enabled() -> bool:
+    return os.environ.get(CACHE_ENV_VAR, "").strip().lower() not in ("0", "off", "none")
+
+
+def _stat_key(path: str) -> Dict[str, int]:
+    st = os.stat(path)
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _json_safe(value: Any) -> bool:
+    """True when value survives a JSON round trip unchanged (no dates, int keys...)."""
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+def _digest_manifest() -> Optional[Dict[str, Any]]:
+    """Parsed registries and agent file digests for this project, keyed by
+    absolute path and valid while (mtime_ns, size) match. Loaded once per
+    process; None when AGENT_RUNNER_CACHE=off.
+    """
+    if not _cache_enabled():
+        return None
+    path = os.path.abspath(CACHE_PATH)
+    manifest = _manifests.get(path)
+    if manifest is None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+        parser = "yaml" if yaml is not None else "lines"
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != CACHE_VERSION
+            or manifest.get("parser") != parser
+        ):
+            manifest = {"version": CACHE_VERSION, "parser": parser, "registries": {}, "files": {}}
+        _manifests[path] = manifest
+    return manifest
+
+
+def _save_digest_manifest() -> None:
+    path = os.path.abspath(CACHE_PATH)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        _ensure_dir(os.path.dirname(path))
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_manifests[path], f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # the manifest only saves work; never fail an invocation over it
+
+
 def _read_text(path: str) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
@@ -116,7 +183,18 @@ def _load_yaml_file(path: str) -> Dict[str, Any]:
 def load_registry(path: str = REGISTRY_DEFAULT) -> Dict[str, Any]:
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Registry not found: {path}")
-    return _load_yaml_file(path)
+    manifest = _digest_manifest()
+    if manifest is None:
+        return _load_yaml_file(path)
+    key, stat = os.path.abspath(path), _stat_key(path)
+    entry = manifest["registries"].get(key)
+    if entry and entry.get("stat") == stat:
+        return copy.deepcopy(entry["data"])
+    data = _load_yaml_file(path)
+    if _json_safe(data):
+        manifest["registries"][key] = {"stat": stat, "data": copy.deepcopy(data)}
+        _save_digest_manifest()
+    return data
 
 
 def get_agent_spec(registry: Dict[str, Any], name: str) -> AgentSpec:
@@ -128,11 +206,19 @@ def get_agent_spec(registry: Dict[str, Any], name: str) -> AgentSpec:
 
 
 def read_agent_file_info(path: str) -> AgentFileInfo:
-    text = _read_text(path)
-    fm_text = _extract_frontmatter(text)
+    manifest = _digest_manifest()
+    key, stat = os.path.abspath(path), _stat_key(path)
+    entry = manifest["files"].get(key) if manifest is not None else None
+    if entry and entry.get("stat") == stat:
+        return AgentFileInfo(path=path, version_frontmatter=entry["version_frontmatter"], sha256=entry["sha256"])
+    data = _read_bytes(path)
+    fm_text = _extract_frontmatter(data.decode("utf-8"))
     fm = _parse_yaml(fm_text)
     version = fm.get("version") if isinstance(fm, dict) else None
-    digest = hashlib.sha256(_read_bytes(path)).hexdigest()
+    digest = hashlib.sha256(data).hexdigest()
+    if manifest is not None and _json_safe(version):
+        manifest["files"][key] = {"stat": stat, "version_frontmatter": version, "sha256": digest}
+        _save_digest_manifest()
     return AgentFileInfo(path=path, version_frontmatter=version, sha256=digest)
 
 
@@ -181,11 +267,28 @@ def write_audit(agent: AgentSpec, info: AgentFileInfo, outcome: str, duration_ms
     }
     if duration_ms is not None:
         record["duration_ms"] = duration_ms
-    fname = f"agent-runner-{agent.name}-{ts.replace(':','').replace('-','').replace('T','_')}.json"
-    fpath = os.path.join(LOGS_DIR, fname)
-    with open(fpath, "w", encoding="utf-8") as f:
-        json.dump(record, f, indent=2)
-    return fpath
+    _rotate_audit_log()
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    fd = os.open(AUDIT_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
+    return AUDIT_LOG
+
+
+def _rotate_audit_log() -> None:
+    """Move a full audit log aside as agent-runner-<timestamp>.jsonl."""
+    try:
+        if os.path.getsize(AUDIT_LOG) < AUDIT_MAX_BYTES:
+            return
+    except OSError:
+        return
+    stamp = _dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+    try:
+        os.replace(AUDIT_LOG, os.path.join(LOGS_DIR, f"agent-runner-{stamp}.jsonl"))
+    except OSError:
+        pass  # another process rotated it first
 
 
 def invoke(agent_name: str, params: Dict[str, Any], registry_path: str = REGISTRY_DEFAULT, timeout_s: int = 120) -> Dict[str, Any]:
@@ -3,8 +3,10 @@
 Python rewrite of tools/sc-install.sh
 
 Commands:
-  list
-  info <package>
+  list [--registry <name> | --all-registries] [--search <q>] [--offline | --refresh]
+  info <package> [--registry <name>] [--offline | --refresh]
+  search <query> [--registry <name>] [--offline | --refresh]
+  index [--rebuild]
   install <package> --dest <path/to/.claude> [--force] [--no-expand]
   install <package> --global [--force] [--no-expand]
   install <package> --local [--force] [--no-expand]
@@ -35,17 +37,29 @@ Notes:
 - Token expansion: replaces {{REPO_NAME}} when variables.REPO_NAME.auto == git-repo-basename
 - Scripts are made executable on install (artifacts under scripts/*)
 - Config file manages marketplace registries with metadata (url, path, status, added_date)
+- Remote registry.json responses are cached under ~/.claude/cache/registries/ with
+  their ETag/Last-Modified; stale entries are revalidated with conditional requests
+- Local manifests are served from ~/.claude/cache/package-index/ (one index per
+  packages directory, so checkouts and worktrees keep their own); only packages
+  whose manifest.yaml changed (mtime/size, then content hash) are re-parsed
 - Phase 1: Basic registry commands (add, list, remove) and config persistence
 - Phase 2: Config schema validation, metadata management, and advanced features
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import shutil
 import stat
 import subprocess
 import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
@@ -82,6 +96,16 @@ REPO_ROOT = next(
 )
 PACKAGES_DIR = REPO_ROOT / "packages"
 
+# Remote registry fetching
+REGISTRY_FETCH_TIMEOUT = 10  # seconds per request
+REGISTRY_FETCH_WORKERS = 8  # concurrent registry requests
+REGISTRY_CACHE_TTL = 300  # seconds a cached registry.json is served without revalidation
+
+# Bump when the package index layout or the manifest fields it stores change
+PACKAGE_INDEX_VERSION = 1
+# Package index directory, or "off" to parse manifests on every call
+PACKAGE_INDEX_ENV_VAR = "SC_PACKAGE_INDEX"
+
 
 @dataclass
 class Manifest:
@@ -145,12 +169,13 @@ def _parse_manifest(pkg_dir: Path) -> Manifest:
     )
 
 
-def _available_packages() -> Iterable[Path]:
-    if not PACKAGES_DIR.exists():
+def _available_packages(packages_dir: Optional[Path] = None) -> Iterable[Path]:
+    packages_dir = packages_dir or PACKAGES_DIR
+    if not packages_dir.exists():
         return []
     return sorted(
         p
-        for p in PACKAGES_DIR.iterdir()
+        for p in packages_dir.iterdir()
         if p.is_dir()
         and not p.name.startswith(".")
         and p.name != "shared"
@@ -158,6 +183,144 @@ def _available_packages() -> Iterable[Path]:
     )
 
 
+# ============================================================================
+# Package Index (~/.claude/cache/package-index/)
+# ============================================================================
+
+def _get_cache_dir() -> Path:
+    """Return sc-install cache directory (~/.claude/cache)."""
+    return Path.home() / ".claude" / "cache"
+
+
+def _get_package_index_path(packages_dir: Optional[Path] = None) -> Optional[Path]:
+    """Return the package index for a packages directory (one file per directory).
+
+    $SC_PACKAGE_INDEX overrides the index directory; "off" disables the
+    index and returns None.
+    """
+    packages_dir = packages_dir or PACKAGES_DIR
+    override = os.environ.get(PACKAGE_INDEX_ENV_VAR)
+    if override is not None and override.strip().lower() in ("", "0", "off", "none"):
+        return None
+    index_dir = Path(override) if override is not None else _get_cache_dir() / "package-index"
+    digest = hashlib.sha256(str(packages_dir).encode("utf-8")).hexdigest()[:24]
+    return index_dir / f"{digest}.json"
+
+
+def _manifest_to_index_entry(manifest: Manifest, st: os.stat_result, digest: str) -> Dict[str, Any]:
+    return {
+        "name": manifest.name,
+        "version": manifest.version,
+        "description": manifest.description,
+        "artifacts": manifest.artifacts,
+        "variables": manifest.variables,
+        "manifest_mtime_ns": st.st_mtime_ns,
+        "manifest_size": st.st_size,
+        "manifest_sha256": digest,
+    }
+
+
+def _manifest_from_index_entry(pkg_dir: Path, entry: Dict[str, Any]) -> Manifest:
+    return Manifest(
+        name=entry.get("name") or pkg_dir.name,
+        version=entry.get("version", ""),
+        path=pkg_dir,
+        description=entry.get("description", ""),
+        artifacts={k: list(v or []) for k, v in (entry.get("artifacts") or {}).items()},
+        variables=entry.get("variables") or {},
+    )
+
+
+def _read_package_index(index_path: Path, packages_dir: Path, parser: str) -> Dict[str, Dict[str, Any]]:
+    """Return cached index entries, or {} if the index is missing or was built differently."""
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != PACKAGE_INDEX_VERSION
+        or index.get("packages_dir") != str(packages_dir)
+        or index.get("parser") != parser
+        or not isinstance(index.get("packages"), dict)
+    ):
+        return {}
+    return index["packages"]
+
+
+def _load_package_index(packages_dir: Optional[Path] = None, rebuild: bool = False) -> Dict[str, Manifest]:
+    """Return parsed manifests for all local packages, keyed by package directory name.
+
+    Manifests are served from a versioned JSON index instead of being
+    re-parsed on every call. A package is re-parsed only when its
+    manifest.yaml changed: mtime/size are checked first, then the content
+    hash, so a touched-but-identical manifest is not parsed again. Added and
+    removed packages are picked up from the directory listing. The index is
+    rewritten only when an entry changed. With SC_PACKAGE_INDEX=off every
+    manifest is parsed and nothing is written.
+
+    Args:
+        packages_dir: Directory holding packages (default: PACKAGES_DIR)
+        rebuild: Ignore the existing index and re-parse every manifest
+
+    Returns:
+        Dictionary mapping package name to Manifest, sorted by name
+    """
+    packages_dir = packages_dir or PACKAGES_DIR
+    parser = "yaml" if yaml is not None else "lines"
+    index_path = _get_package_index_path(packages_dir)
+    cached = {} if rebuild or index_path is None else _read_package_index(index_path, packages_dir, parser)
+
+    pkg_dirs = list(_available_packages(packages_dir))
+    entries: Dict[str, Dict[str, Any]] = {}
+    manifests: Dict[str, Manifest] = {}
+    changed = rebuild or set(cached) != {p.name for p in pkg_dirs}
+
+    for pkg_dir in pkg_dirs:
+        manifest_path = pkg_dir / "manifest.yaml"
+        try:
+            st = manifest_path.stat()
+        except OSError:
+            continue
+
+        entry = cached.get(pkg_dir.name)
+        if entry and entry.get("manifest_mtime_ns") == st.st_mtime_ns and entry.get("manifest_size") == st.st_size:
+            entries[pkg_dir.name] = entry
+            manifests[pkg_dir.name] = _manifest_from_index_entry(pkg_dir, entry)
+            continue
+
+        digest = hashlib.sha256(manifest_path.read_bytes()).hexdigest()
+        if entry and entry.get("manifest_sha256") == digest:
+            entry = {**entry, "manifest_mtime_ns": st.st_mtime_ns, "manifest_size": st.st_size}
+            manifest = _manifest_from_index_entry(pkg_dir, entry)
+        else:
+            manifest = _parse_manifest(pkg_dir)
+            entry = _manifest_to_index_entry(manifest, st, digest)
+        entries[pkg_dir.name] = entry
+        manifests[pkg_dir.name] = manifest
+        changed = True
+
+    if changed and index_path is not None:
+        _write_package_index(index_path, {
+            "version": PACKAGE_INDEX_VERSION,
+            "packages_dir": str(packages_dir),
+            "parser": parser,
+            "packages": entries,
+        })
+    return manifests
+
+
+def _write_package_index(index_path: Path, index: Dict[str, Any]) -> None:
+    """Atomically write the package index. Failures only warn; the index is optional."""
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(index, default=str), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError as ex:
+        warn(f"Could not write package index: {ex}")
+
+
 # ============================================================================
 # Phase 1 & 2: Config and Registry Management
 # ============================================================================
@@ -211,6 +374,92 @@ def _validate_config_schema(config: Dict) -> Dict:
 # Phase 3: Remote Registry Fetching
 # ==============================================================================
 
+def _registry_url(url: str, path: str = "") -> str:
+    """Resolve the full registry.json URL for a configured registry.
+
+    GitHub repository URLs are rewritten to raw.githubusercontent.com, with
+    ``main`` inserted when no branch is present.
+    """
+    # Construct full URL
+    if path:
+        full_url = f"{url.rstrip('/')}/{path.lstrip('/')}"
+    else:
+        full_url = f"{url.rstrip('/')}/registry.json"
+
+    # Handle GitHub URLs - convert to raw content URL
+    if "github.com" in full_url and "/blob/" not in full_url and "raw.githubusercontent.com" not in full_url:
+        # Convert github.com URL to raw.githubusercontent.com
+        full_url = full_url.replace("github.com", "raw.githubusercontent.com")
+        full_url = full_url.replace("/tree/", "/")
+
+    # Insert branch name if missing (for raw.githubusercontent.com URLs)
+    if "raw.githubusercontent.com" in full_url:
+        parts = full_url.split("/")
+        # Expected: https://raw.githubusercontent.com/owner/repo/branch/path...
+        # If parts[5] looks like a path (not a branch), insert 'main'
+        if len(parts) >= 6 and not parts[5] in ["main", "master", "develop"]:
+            # Insert 'main' as default branch between repo and path
+            full_url = "/".join(parts[:5]) + "/main/" + "/".join(parts[5:])
+
+    return full_url
+
+
+@dataclass
+class _RegistryResponse:
+    """Outcome of a single registry.json request."""
+    data: Optional[Dict]
+    etag: str = ""
+    last_modified: str = ""
+    not_modified: bool = False
+
+
+def _request_registry(
+    full_url: str,
+    etag: str = "",
+    last_modified: str = "",
+    timeout: float = REGISTRY_FETCH_TIMEOUT,
+) -> Optional[_RegistryResponse]:
+    """GET a registry.json URL, optionally as a conditional request.
+
+    Sends If-None-Match / If-Modified-Since when validators are given. A 304
+    reply yields a response with ``not_modified=True`` and no data.
+
+    Returns:
+        _RegistryResponse, or None on network/parse failure (a warning is printed)
+    """
+    headers = {"User-Agent": "sc-install/1.0"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        req = urllib.request.Request(full_url, headers=headers)
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            body = response.read().decode("utf-8")
+            resp_headers = getattr(response, "headers", None) or {}
+            return _RegistryResponse(
+                data=json.loads(body),
+                etag=resp_headers.get("ETag", "") or "",
+                last_modified=resp_headers.get("Last-Modified", "") or "",
+            )
+
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return _RegistryResponse(data=None, etag=etag, last_modified=last_modified, not_modified=True)
+        warn(f"Network error fetching registry: {e}")
+        return None
+    except urllib.error.URLError as e:
+        warn(f"Network error fetching registry: {e}")
+        return None
+    except json.JSONDecodeError as e:
+        warn(f"Failed to parse registry JSON: {e}")
+        return None
+    except Exception as e:
+        warn(f"Error fetching registry: {e}")
+        return None
+
+
 def _fetch_registry_json(url: str, path: str = "") -> Optional[Dict]:
     """Fetch registry.json from remote URL.
     
@@ -219,6 +468,8 @@ def _fetch_registry_json(url: str, path: str = "") -> Optional[Dict]:
     - Support optional path (e.g., "docs/registries/nuget/registry.json")
     - Handle HTTP errors gracefully
     - Return dict or None on failure
+
+    Always goes to the network; commands use _fetch_registry_cached().
     
     Args:
         url: Base URL of the registry (e.g., https://github.com/org/repo)
@@ -227,47 +478,156 @@ def _fetch_registry_json(url: str, path: str = "") -> Optional[Dict]:
     Returns:
         Dictionary containing registry data, or None on failure
     """
+    response = _request_registry(_registry_url(url, path))
+    return response.data if response is not None else None
+
+
+# ==============================================================================
+# Registry Cache (~/.claude/cache/registries/)
+# ==============================================================================
+
+def _get_registry_cache_dir() -> Path:
+    """Return directory holding cached registry.json responses."""
+    return _get_cache_dir() / "registries"
+
+
+def _registry_cache_path(full_url: str) -> Path:
+    """Return cache file for a resolved registry URL (one file per URL)."""
+    digest = hashlib.sha256(full_url.encode("utf-8")).hexdigest()[:24]
+    return _get_registry_cache_dir() / f"{digest}.json"
+
+
+def _read_registry_cache(full_url: str) -> Optional[Dict]:
+    """Load a cache entry for ``full_url``; None if missing or unreadable."""
+    cache_path = _registry_cache_path(full_url)
     try:
-        import urllib.request
-        import json
-        
-        # Construct full URL
-        if path:
-            full_url = f"{url.rstrip('/')}/{path.lstrip('/')}"
-        else:
-            full_url = f"{url.rstrip('/')}/registry.json"
-        
-        # Handle GitHub URLs - convert to raw content URL
-        if "github.com" in full_url and "/blob/" not in full_url and "raw.githubusercontent.com" not in full_url:
-            # Convert github.com URL to raw.githubusercontent.com
-            full_url = full_url.replace("github.com", "raw.githubusercontent.com")
-            full_url = full_url.replace("/tree/", "/")
-
-        # Insert branch name if missing (for raw.githubusercontent.com URLs)
-        if "raw.githubusercontent.com" in full_url:
-            parts = full_url.split("/")
-            # Expected: https://raw.githubusercontent.com/owner/repo/branch/path...
-            # If parts[5] looks like a path (not a branch), insert 'main'
-            if len(parts) >= 6 and not parts[5] in ["main", "master", "develop"]:
-                # Insert 'main' as default branch between repo and path
-                full_url = "/".join(parts[:5]) + "/main/" + "/".join(parts[5:])
-        
-        # Fetch with timeout
-        req = urllib.request.Request(full_url, headers={"User-Agent": "sc-install/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = response.read().decode("utf-8")
-            return json.loads(data)
-    
-    except urllib.request.URLError as e:
-        warn(f"Network error fetching registry: {e}")
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
         return None
-    except json.JSONDecodeError as e:
-        warn(f"Failed to parse registry JSON: {e}")
+    if not isinstance(entry, dict) or entry.get("url") != full_url or not isinstance(entry.get("data"), dict):
         return None
-    except Exception as e:
-        warn(f"Error fetching registry: {e}")
+    return entry
+
+
+def _write_registry_cache(full_url: str, entry: Dict) -> None:
+    """Atomically write a cache entry. Failures only warn; the cache is optional."""
+    cache_path = _registry_cache_path(full_url)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as ex:
+        warn(f"Could not write registry cache: {ex}")
+
+
+def _fetch_registry_cached(
+    url: str,
+    path: str = "",
+    ttl: float = REGISTRY_CACHE_TTL,
+    offline: bool = False,
+    refresh: bool = False,
+) -> Optional[Dict]:
+    """Fetch registry.json through the on-disk cache.
+
+    - Fresh entries (younger than ``ttl`` seconds) are served without a request
+    - Stale entries are revalidated with If-None-Match / If-Modified-Since;
+      a 304 reply renews the entry without re-downloading
+    - On network failure a stale entry is served with a warning
+    - ``offline`` never touches the network and serves any cached copy
+    - ``refresh`` ignores the TTL and always revalidates
+
+    Args:
+        url: Base URL of the registry
+        path: Optional path to registry.json
+        ttl: Seconds a cached copy is considered fresh
+        offline: Serve from cache only
+        refresh: Revalidate even if the cached copy is fresh
+
+    Returns:
+        Dictionary containing registry data, or None if unavailable
+    """
+    full_url = _registry_url(url, path)
+    entry = _read_registry_cache(full_url)
+
+    if offline:
+        if entry is None:
+            warn(f"No cached copy of registry (offline): {full_url}")
+            return None
+        return entry["data"]
+
+    now = time.time()
+    if entry is not None and not refresh and now - float(entry.get("fetched_at", 0)) < ttl:
+        return entry["data"]
+
+    response = _request_registry(
+        full_url,
+        etag=entry.get("etag", "") if entry else "",
+        last_modified=entry.get("last_modified", "") if entry else "",
+    )
+
+    if response is None:
+        if entry is not None:
+            warn(f"Using cached copy of registry: {full_url}")
+            return entry["data"]
         return None
 
+    if response.not_modified and entry is not None:
+        entry["fetched_at"] = now
+        _write_registry_cache(full_url, entry)
+        return entry["data"]
+
+    if not isinstance(response.data, dict):
+        return response.data
+
+    _write_registry_cache(full_url, {
+        "url": full_url,
+        "etag": response.etag,
+        "last_modified": response.last_modified,
+        "fetched_at": now,
+        "data": response.data,
+    })
+    return response.data
+
+
+def _fetch_registries(
+    registries: Dict[str, Dict],
+    offline: bool = False,
+    refresh: bool = False,
+    max_workers: int = REGISTRY_FETCH_WORKERS,
+) -> Dict[str, Optional[Dict]]:
+    """Fetch several registries concurrently through the cache.
+
+    Args:
+        registries: Mapping of registry name -> config entry (url, path)
+        offline: Serve from cache only
+        refresh: Revalidate even fresh cache entries
+        max_workers: Upper bound on concurrent requests
+
+    Returns:
+        Mapping of registry name -> registry data (None on failure), in input order
+    """
+    names = list(registries)
+    if not names:
+        return {}
+
+    def fetch(name: str) -> Optional[Dict]:
+        reg_info = registries[name]
+        return _fetch_registry_cached(
+            reg_info.get("url", ""),
+            reg_info.get("path", ""),
+            offline=offline,
+            refresh=refresh,
+        )
+
+    workers = max(1, min(max_workers, len(names)))
+    if workers == 1:
+        return {name: fetch(name) for name in names}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(fetch, names))
+    return dict(zip(names, results))
+
 
 def _parse_registry_metadata(registry_data: Dict) -> Dict:
     """Extract packages from registry.json.
@@ -628,13 +988,21 @@ def cmd_registry_remove(name: str) -> int:
 # Original Package Commands
 # ============================================================================
 
-def cmd_list(registry: Optional[str] = None, all_registries: bool = False, search: Optional[str] = None) -> int:
+def cmd_list(
+    registry: Optional[str] = None,
+    all_registries: bool = False,
+    search: Optional[str] = None,
+    offline: bool = False,
+    refresh: bool = False,
+) -> int:
     """List available packages from local or remote registries.
     
     Phase 3 Enhancement: Remote Registry Support
     - Support --registry flag to query specific registry
     - Support --all-registries flag to query all registered registries
     - Support --search flag to filter packages
+    - Registries are fetched concurrently through the registry cache
+      (--offline serves cached copies only, --refresh forces revalidation)
     """
     # If remote registry specified
     if registry or all_registries:
@@ -652,17 +1020,21 @@ def cmd_list(registry: Optional[str] = None, all_registries: bool = False, searc
                 return 1
             registries_to_query = [registry]
         
-        # Fetch and display remote packages
+        # Fetch all registries up front, then display in config order
+        fetched = _fetch_registries(
+            {name: config["marketplaces"]["registries"][name] for name in registries_to_query},
+            offline=offline,
+            refresh=refresh,
+        )
         all_packages = []
         for reg_name in registries_to_query:
             reg_info = config["marketplaces"]["registries"][reg_name]
             url = reg_info.get("url", "")
-            path = reg_info.get("path", "")
             
             print(f"\nRegistry: {reg_name} ({url})")
             print("=" * 60)
             
-            registry_json = _fetch_registry_json(url, path)
+            registry_json = fetched[reg_name]
             if registry_json is None:
                 warn(f"Failed to fetch registry: {reg_name}")
                 continue
@@ -686,32 +1058,52 @@ def cmd_list(registry: Optional[str] = None, all_registries: bool = False, searc
     
     # Default: list local packages
     print("Available packages:\n")
-    for pkg_dir in _available_packages():
-        m = _parse_manifest(pkg_dir)
+    for pkg_name, m in _load_package_index().items():
         desc_first = m.description.splitlines()[0] if m.description else "(no manifest)"
         
         # Apply search filter if specified
         if search:
-            if search.lower() not in pkg_dir.name.lower() and search.lower() not in desc_first.lower():
+            if search.lower() not in pkg_name.lower() and search.lower() not in desc_first.lower():
                 continue
         
-        print(f"  {pkg_dir.name:<20} {desc_first[:60]}")
+        print(f"  {pkg_name:<20} {desc_first[:60]}")
     
     return 0
 
 
 
-def cmd_search(query: str, registry: Optional[str] = None) -> int:
+def cmd_index(rebuild: bool = False) -> int:
+    """Refresh the local package index used by list and skill queries.
+
+    Args:
+        rebuild: Re-parse every manifest instead of only changed ones
+
+    Returns:
+        0 on success
+    """
+    manifests = _load_package_index(rebuild=rebuild)
+    index_path = _get_package_index_path()
+    if index_path is None:
+        warn(f"Package index disabled by {PACKAGE_INDEX_ENV_VAR}; nothing written")
+        return 0
+    info(f"Indexed {len(manifests)} package{'s' if len(manifests) != 1 else ''} -> {index_path}")
+    return 0
+
+
+def cmd_search(query: str, registry: Optional[str] = None, offline: bool = False, refresh: bool = False) -> int:
     """Search for packages across registered registries.
     
     Phase 3 Task 2: Search Command
     - Search across registered registries
     - Display results with source registry
     - Show package details
+    - Registries are fetched concurrently through the registry cache
     
     Args:
         query: Search query string
         registry: Optional specific registry to search (None = all registries)
+        offline: Serve cached registry copies only
+        refresh: Revalidate cached registry copies even if fresh
     
     Returns:
         0 on success, 1 on error
@@ -739,12 +1131,11 @@ def cmd_search(query: str, registry: Optional[str] = None) -> int:
     
     print(f"Searching for '{query}' across {len(registries_to_search)} registr{'y' if len(registries_to_search) == 1 else 'ies'}...\n")
     
+    fetched = _fetch_registries(registries_to_search, offline=offline, refresh=refresh)
+
     total_matches = 0
-    for reg_name, reg_info in registries_to_search.items():
-        url = reg_info.get("url", "")
-        path = reg_info.get("path", "")
-        
-        registry_json = _fetch_registry_json(url, path)
+    for reg_name in registries_to_search:
+        registry_json = fetched[reg_name]
         if registry_json is None:
             warn(f"Failed to fetch registry: {reg_name}")
             continue
@@ -775,7 +1166,7 @@ def cmd_search(query: str, registry: Optional[str] = None) -> int:
     return 0
 
 
-def cmd_info(pkg: str, registry: Optional[str] = None) -> int:
+def cmd_info(pkg: str, registry: Optional[str] = None, offline: bool = False, refresh: bool = False) -> int:
     """Display information about a package.
     
     Phase 3 Enhancement: Remote Registry Support
@@ -785,6 +1176,8 @@ def cmd_info(pkg: str, registry: Optional[str] = None) -> int:
     Args:
         pkg: Package name
         registry: Optional registry name to query
+        offline: Serve the cached registry copy only
+        refresh: Revalidate the cached registry copy even if fresh
     
     Returns:
         0 on success, 1 on error
@@ -803,7 +1196,7 @@ def cmd_info(pkg: str, registry: Optional[str] = None) -> int:
         url = reg_info.get("url", "")
         path = reg_info.get("path", "")
         
-        registry_json = _fetch_registry_json(url, path)
+        registry_json = _fetch_registry_cached(url, path, offline=offline, refresh=refresh)
         if registry_json is None:
             error(f"Failed to fetch registry: {registry}")
             return 1
@@ -1191,7 +1584,7 @@ def cmd_install(
             url = reg_info.get("url", "")
             path = reg_info.get("path", "")
             
-            registry_json = _fetch_registry_json(url, path)
+            registry_json = _fetch_registry_cached(url, path)
             if registry_json is None:
                 error(f"Failed to fetch registry: {registry}")
                 return 1
@@ -1300,6 +1693,13 @@ def cmd_uninstall(pkg: str, dest: str) -> int:
     return 0
 
 
+def _add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add registry cache flags shared by list/info/search."""
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument("--offline", action="store_true", help="Use cached registries only (no network)")
+    cache_group.add_argument("--refresh", action="store_true", help="Revalidate cached registries even if fresh")
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="sc-install", add_help=True)
     sub = p.add_subparsers(dest="cmd")
@@ -1309,16 +1709,22 @@ def build_parser() -> argparse.ArgumentParser:
     p_list.add_argument("--registry", help="Query specific registry")
     p_list.add_argument("--all-registries", action="store_true", help="Query all registries")
     p_list.add_argument("--search", help="Filter packages by name")
+    _add_cache_arguments(p_list)
 
     # Phase 3: Enhanced info command with remote registry support
     p_info = sub.add_parser("info")
     p_info.add_argument("package")
     p_info.add_argument("--registry", help="Get info from remote registry")
+    _add_cache_arguments(p_info)
+
+    p_index = sub.add_parser("index", help="Refresh the local package index")
+    p_index.add_argument("--rebuild", action="store_true", help="Re-parse every manifest")
 
     # Phase 3: New search command
     p_search = sub.add_parser("search")
     p_search.add_argument("query", help="Search query")
     p_search.add_argument("--registry", help="Search specific registry (default: all)")
+    _add_cache_arguments(p_search)
 
     # Phase 3: Enhanced install command with remote registry support
     p_install = sub.add_parser("install")
@@ -1364,15 +1770,30 @@ def main(argv: Optional[list[str]] = None) -> int:
             registry=getattr(args, 'registry', None),
             all_registries=getattr(args, 'all_registries', False),
             search=getattr(args, 'search', None),
+            offline=getattr(args, 'offline', False),
+            refresh=getattr(args, 'refresh', False),
         )
     
     # Phase 3: Enhanced info command with remote registry support
     if args.cmd == "info":
-        return cmd_info(args.package, registry=getattr(args, 'registry', None))
+        return cmd_info(
+            args.package,
+            registry=getattr(args, 'registry', None),
+            offline=getattr(args, 'offline', False),
+            refresh=getattr(args, 'refresh', False),
+        )
+    
+    if args.cmd == "index":
+        return cmd_index(rebuild=args.rebuild)
     
     # Phase 3: New search command
     if args.cmd == "search":
-        return cmd_search(args.query, registry=getattr(args, 'registry', None))
+        return cmd_search(
+            args.query,
+            registry=getattr(args, 'registry', None),
+            offline=getattr(args, 'offline', False),
+            refresh=getattr(args, 'refresh', False),
+        )
     
     # Phase 3: Enhanced install command with remote registry support
     if args.cmd == "install":
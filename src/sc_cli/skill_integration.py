@@ -25,7 +25,7 @@ try:
         cmd_registry_list,
         cmd_install,
         PACKAGES_DIR,
-        _available_packages,
+        _load_package_index,
         _parse_manifest,
     )
 except ImportError:
@@ -40,12 +40,12 @@ except ImportError:
     cmd_install = None
     PACKAGES_DIR = Path("packages")
 
-    def _available_packages():
-        return []
-
     def _parse_manifest(pkg_dir: Path):
         return None
 
+    def _load_package_index():
+        return {}
+
 
 def query_marketplace_packages(
     registry: Optional[str] = None,
@@ -125,10 +125,8 @@ def query_marketplace_packages(
         # Phase 3 TODO: Fetch from remote registry URL
         # Current implementation: List local packages
         packages = []
-        for pkg_dir in _available_packages():
+        for manifest in _load_package_index().values():
             try:
-                manifest = _parse_manifest(pkg_dir)
-
                 # Extract artifact counts
                 artifacts = {
                     "commands": len(manifest.artifacts.get("commands", [])),
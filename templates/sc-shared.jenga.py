@@ -20,11 +20,14 @@ INTEGRATION:
 - Provides SHA-256 integrity checking and version validation
 
 Standard registry location: .claude/agents/registry.yaml
-Standard log location: .claude/state/logs/agent-runner-<agent>-<timestamp>.json
+Standard log location: .claude/state/logs/agent-runner.jsonl (one record per line,
+rotated to agent-runner-<timestamp>.jsonl at AUDIT_MAX_BYTES)
+Digest cache: .claude/state/agent-runner-cache.json (AGENT_RUNNER_CACHE=off disables)
 """
 
 from __future__ import annotations
 
+import copy
 import datetime as _dt
 import hashlib
 import json
@@ -63,6 +66,17 @@ REGISTRY_DEFAULT = os.path.join(".claude", "agents", "registry.yaml")
 # {{LOGS_DIR}} - Default logs directory
 LOGS_DIR = os.path.join(".claude", "state", "logs")
 
+# Audit log (JSONL, appended) and its rotation size
+AUDIT_LOG = os.path.join(LOGS_DIR, "agent-runner.jsonl")
+AUDIT_MAX_BYTES = 5 * 1024 * 1024
+
+# Digest manifest: parsed registries and agent file hashes, keyed by path
+CACHE_PATH = os.path.join(".claude", "state", "agent-runner-cache.json")
+CACHE_VERSION = 1
+CACHE_ENV_VAR = "AGENT_RUNNER_CACHE"
+
+_manifests: Dict[str, Dict[str, Any]] = {}
+
 
 # =============================================================================
 # Pydantic Models - Agent Runner Data Structures
@@ -263,6 +277,73 @@ def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+# =============================================================================
+# Digest Manifest - Cached Registry and Agent File Reads
+# =============================================================================
+
+def _cache_enabled() -> bool:
+    """Digest manifest is on unless AGENT_RUNNER_CACHE is 0/off/none."""
+    return os.environ.get(CACHE_ENV_VAR, "").strip().lower() not in ("0", "off", "none")
+
+
+def _stat_key(path: str) -> Dict[str, int]:
+    """(mtime_ns, size) of a file; a cached entry is valid while it matches."""
+    st = os.stat(path)
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _json_safe(value: Any) -> bool:
+    """True when value survives a JSON round trip unchanged (no dates, int keys...)."""
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+def _digest_manifest() -> Optional[Dict[str, Any]]:
+    """Load the digest manifest for this project.
+
+    The manifest holds parsed registries and agent file digests keyed by
+    absolute path. It is loaded once per process and discarded when its
+    version or the YAML parser in use differs.
+
+    Returns:
+        Manifest dictionary, or None when AGENT_RUNNER_CACHE=off
+    """
+    if not _cache_enabled():
+        return None
+    path = os.path.abspath(CACHE_PATH)
+    manifest = _manifests.get(path)
+    if manifest is None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+        parser = "yaml" if yaml is not None else "lines"
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != CACHE_VERSION
+            or manifest.get("parser") != parser
+        ):
+            manifest = {"version": CACHE_VERSION, "parser": parser, "registries": {}, "files": {}}
+        _manifests[path] = manifest
+    return manifest
+
+
+def _save_digest_manifest() -> None:
+    """Atomically write the digest manifest (write to temp, then rename)."""
+    path = os.path.abspath(CACHE_PATH)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        _ensure_dir(os.path.dirname(path))
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_manifests[path], f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # the manifest only saves work; never fail an invocation over it
+
+
 # =============================================================================
 # Registry Functions - Agent Lookup and Validation
 # =============================================================================
@@ -278,10 +359,25 @@ def load_registry(path: str = REGISTRY_DEFAULT) -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If registry file not found
+
+    Note:
+        Parsed registries are served from the digest manifest while the
+        file's mtime and size are unchanged.
     """
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Registry not found: {path}")
-    return _load_yaml_file(path)
+    manifest = _digest_manifest()
+    if manifest is None:
+        return _load_yaml_file(path)
+    key, stat = os.path.abspath(path), _stat_key(path)
+    entry = manifest["registries"].get(key)
+    if entry and entry.get("stat") == stat:
+        return copy.deepcopy(entry["data"])
+    data = _load_yaml_file(path)
+    if _json_safe(data):
+        manifest["registries"][key] = {"stat": stat, "data": copy.deepcopy(data)}
+        _save_digest_manifest()
+    return data
 
 
 def get_agent_spec(registry: Dict[str, Any], name: str) -> AgentSpec:
@@ -319,14 +415,28 @@ def read_agent_file_info(path: str) -> AgentFileInfo:
 
     Note:
         SHA-256 is computed on complete binary file content for integrity verification.
+        The file is read and hashed again only when its mtime or size changed.
     """
-    text = _read_text(path)
-    fm_text = _extract_frontmatter(text)
+    manifest = _digest_manifest()
+    key, stat = os.path.abspath(path), _stat_key(path)
+    entry = manifest["files"].get(key) if manifest is not None else None
+    if entry and entry.get("stat") == stat:
+        return AgentFileInfo(
+            path=path,
+            version_frontmatter=entry["version_frontmatter"],
+            sha256=entry["sha256"]
+        )
+
+    data = _read_bytes(path)
+    fm_text = _extract_frontmatter(data.decode("utf-8"))
     fm = _parse_yaml(fm_text)
     version = fm.get("version") if isinstance(fm, dict) else None
 
     # Compute SHA-256 hash of entire file (binary) for integrity checking
-    digest = hashlib.sha256(_read_bytes(path)).hexdigest()
+    digest = hashlib.sha256(data).hexdigest()
+    if manifest is not None and _json_safe(version):
+        manifest["files"][key] = {"stat": stat, "version_frontmatter": version, "sha256": digest}
+        _save_digest_manifest()
 
     return AgentFileInfo(
         path=path,
@@ -432,9 +542,9 @@ def write_audit(
         duration_ms: Optional execution duration in milliseconds
 
     Returns:
-        Path to audit record file
+        Path to the audit log the record was appended to
 
-    Audit record format (JSON):
+    Audit record format (one JSON line in AUDIT_LOG):
         {
             "timestamp": "2026-02-11T10:30:45Z",
             "agent": "agent-name",
@@ -463,16 +573,30 @@ def write_audit(
     if duration_ms is not None:
         record["duration_ms"] = duration_ms
 
-    # Filename: agent-runner-<agent>-<timestamp>.json
-    # (timestamp sanitized for filesystem compatibility)
-    fname = (f"agent-runner-{agent.name}-"
-             f"{ts.replace(':','').replace('-','').replace('T','_')}.json")
-    fpath = os.path.join(LOGS_DIR, fname)
+    # Single O_APPEND write per record, so concurrent runners never interleave
+    _rotate_audit_log()
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    fd = os.open(AUDIT_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
 
-    with open(fpath, "w", encoding="utf-8") as f:
-        json.dump(record, f, indent=2)
+    return AUDIT_LOG
 
-    return fpath
+
+def _rotate_audit_log() -> None:
+    """Move a full audit log aside as agent-runner-<timestamp>.jsonl."""
+    try:
+        if os.path.getsize(AUDIT_LOG) < AUDIT_MAX_BYTES:
+            return
+    except OSError:
+        return
+    stamp = _dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+    try:
+        os.replace(AUDIT_LOG, os.path.join(LOGS_DIR, f"agent-runner-{stamp}.jsonl"))
+    except OSError:
+        pass  # another process rotated it first
 
 
 # =============================================================================
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark the harness DataCollector on a large generated session.
+
+Generates a transcript of N lines (default 1,000,000: assistant messages
+with token usage, tool_use/tool_result pairs with an occasional large
+tool output and error) plus a matching trace.jsonl of hook events, then
+collects them in a fresh subprocess per mode so peak RSS is isolated:
+
+- legacy:    parse_trace_file()/parse_transcript() into lists, then one
+             pass per extractor (the pre-streaming collect())
+- streaming: DataCollector.collect(), one pass per file with raw events
+             spooled as JSON lines
+
+Reports wall time, peak RSS and verifies both modes extract the same data.
+
+Usage:
+    python test-packages/benchmarks/bench_collector.py [--lines 1000000] [--json]
+"""
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+LARGE_OUTPUT = "line of command output\n" * 4096
+
+
+def build_session(root: Path, lines: int, seed: int = 11) -> tuple[Path, Path]:
+    """Write transcript.jsonl (``lines`` entries) and trace.jsonl into root."""
+    rng = random.Random(seed)
+    transcript = root / "transcript.jsonl"
+    trace = root / "trace.jsonl"
+    with open(transcript, "w") as tf, open(trace, "w") as hf:
+        hf.write(json.dumps({"event": "SessionStart", "session_id": "bench", "ts": "2026-01-16T00:00:00Z"}) + "\n")
+        hf.write(json.dumps({"event": "UserPromptSubmit", "prompt": "benchmark", "ts": "2026-01-16T00:00:00Z"}) + "\n")
+        tool = 0
+        written = 0
+        while written < lines:
+            ts = f"2026-01-16T{(written // 3600000) % 24:02d}:{(written // 60000) % 60:02d}:" \
+                 f"{(written // 1000) % 60:02d}.{written % 1000:03d}000Z"
+            tool_use_id = f"toolu_{tool:08d}"
+            large = tool % 500 == 0
+            output = LARGE_OUTPUT if large else "ok\n" * rng.randint(1, 20)
+            is_error = tool % 97 == 0
+            entries = [
+                {"type": "assistant", "timestamp": ts, "message": {
+                    "content": [{"type": "text", "text": "Running the next step of the task."}],
+                    "usage": {"input_tokens": 120, "output_tokens": 40, "cache_read_input_tokens": 900}}},
+                {"type": "tool_use", "id": tool_use_id, "name": "Bash", "input": {"command": f"echo {tool}"}},
+                {"type": "tool_result", "tool_use_id": tool_use_id, "content": "failed" if is_error else output,
+                 "is_error": is_error},
+            ]
+            for entry in entries[: lines - written]:
+                tf.write(json.dumps(entry) + "\n")
+            written += len(entries)
+            hf.write(json.dumps({"event": "PreToolUse", "tool_name": "Bash", "tool_use_id": tool_use_id,
+                                 "tool_input": {"command": f"echo {tool}"}, "ppid": 100, "ts": ts}) + "\n")
+            if not is_error:
+                hf.write(json.dumps({"event": "PostToolUse", "tool_name": "Bash", "tool_use_id": tool_use_id,
+                                     "tool_response": {"stdout": output, "exit_code": 0}, "ts": ts}) + "\n")
+            tool += 1
+        hf.write(json.dumps({"event": "SessionEnd", "reason": "exit", "ts": "2026-01-17T00:00:00Z"}) + "\n")
+    return trace, transcript
+
+
+def collect_legacy(trace: Path, transcript: Path) -> dict:
+    from harness.collector import (
+        correlate_events,
+        correlate_tool_calls_with_agents,
+        extract_claude_responses,
+        extract_errors_from_transcript,
+        extract_token_usage,
+        extract_tool_names_from_transcript,
+        parse_trace_file,
+        parse_transcript,
+    )
+
+    events = parse_trace_file(trace)
+    tool_calls, subagents = correlate_events(events)
+    correlate_tool_calls_with_agents(events)
+    entries = parse_transcript(transcript)
+    errors = extract_errors_from_transcript(entries)
+    extract_tool_names_from_transcript(entries, errors)
+    responses = extract_claude_responses(entries)
+    tokens = extract_token_usage(entries)
+    return summarize(len(events), len(entries), tool_calls, errors, responses, tokens)
+
+
+def collect_streaming(trace: Path, transcript: Path) -> dict:
+    from harness.collector import DataCollector
+
+    data = DataCollector(trace_path=trace, transcript_path=transcript, project_path=trace.parent).collect()
+    return summarize(len(data.raw_hook_events), len(data.raw_transcript_entries), data.tool_calls,
+                     data.errors, data.claude_responses, data.token_usage)
+
+
+def summarize(events, entries, tool_calls, errors, responses, tokens) -> dict:
+    return {
+        "events": events,
+        "entries": entries,
+        "tool_calls": len(tool_calls),
+        "errors": len(errors),
+        "named_errors": sum(1 for e in errors if e.tool_name),
+        "responses": len(responses),
+        "input_tokens": tokens.input_tokens,
+    }
+
+
+def run_mode(mode: str, trace: Path, transcript: Path) -> dict:
+    """Collect in this process and report time and peak RSS."""
+    collect = collect_legacy if mode == "legacy" else collect_streaming
+    start = time.perf_counter()
+    summary = collect(trace, transcript)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"mode": mode, "seconds": round(elapsed, 2), "peak_rss_mb": round(peak_kb / 1024, 1), "summary": summary}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=1_000_000, help="Transcript lines to generate")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    parser.add_argument("--run-mode", choices=["legacy", "streaming"], help=argparse.SUPPRESS)
+    parser.add_argument("--trace", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--transcript", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_mode:
+        print(json.dumps(run_mode(args.run_mode, args.trace, args.transcript)))
+        return 0
+
+    with tempfile.TemporaryDirectory(prefix="sc-collector-bench-") as tmp:
+        root = Path(tmp)
+        trace, transcript = build_session(root, args.lines)
+        sizes = {"trace_mb": round(trace.stat().st_size / 2**20, 1),
+                 "transcript_mb": round(transcript.stat().st_size / 2**20, 1)}
+        rows = []
+        for mode in ("legacy", "streaming"):
+            result = subprocess.run(
+                [sys.executable, __file__, "--run-mode", mode, "--trace", str(trace), "--transcript", str(transcript)],
+                check=True, capture_output=True, text=True,
+            )
+            rows.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    if rows[0]["summary"] != rows[1]["summary"]:
+        print(f"ERROR: streaming results differ: {rows[0]['summary']} != {rows[1]['summary']}", file=sys.stderr)
+        return 1
+
+    report = {"lines": args.lines, **sizes, "runs": rows}
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{args.lines} transcript lines ({sizes['transcript_mb']} MB), trace {sizes['trace_mb']} MB")
+    print(f"{'mode':>10}  {'seconds':>8}  {'peak RSS':>10}")
+    for row in rows:
+        print(f"{row['mode']:>10}  {row['seconds']:>8.2f}  {row['peak_rss_mb']:>8.1f}MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark per-test isolated HOME setup in the test harness.
+
+Builds a synthetic ~/.claude/plugins with a marketplace tree of N files
+(default 5,000 across nested package directories, like a marketplace
+git checkout) and times the marketplace setup of T test HOMEs
+(create_isolated_home + copy_marketplace_data + cleanup):
+
+- copy:     SC_TEST_HOME_TEMPLATES=off, full copytree per test
+- template: one template build, then a reflink/hardlink clone per test
+- symlink:  same template, SC_TEST_HOME_CLONE=symlink overlay per test
+
+Reports milliseconds per test and the clone method used.
+
+Usage:
+    python test-packages/benchmarks/bench_harness_home.py [--files 5000] [--tests 20] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from harness import environment  # noqa: E402
+from harness.environment import (  # noqa: E402
+    cleanup_test_environment,
+    copy_marketplace_data,
+    create_isolated_home,
+    prepare_marketplace_template,
+)
+
+
+def build_source_home(root: Path, files: int) -> Path:
+    """Write a source HOME whose marketplace tree holds ``files`` files."""
+    plugins = root / ".claude" / "plugins"
+    marketplace = plugins / "marketplaces" / "synaptic-canvas"
+    (plugins / "known_marketplaces.json").parent.mkdir(parents=True, exist_ok=True)
+    (plugins / "known_marketplaces.json").write_text(json.dumps({"synaptic-canvas": {"source": "github"}}))
+    payload = ("# marketplace content line\n" * 300).encode()
+    for i in range(files):
+        path = marketplace / "packages" / f"sc-pkg-{i % 50:02d}" / f"dir-{i % 7}" / f"file-{i:05d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+    return root
+
+
+def time_setups(source_home: Path, base_dir: Path, tests: int) -> float:
+    """Average seconds to prepare and tear down one test HOME."""
+    start = time.perf_counter()
+    for _ in range(tests):
+        home = create_isolated_home(base_dir=str(base_dir))
+        copy_marketplace_data(home, source_home)
+        cleanup_test_environment(home)
+    return (time.perf_counter() - start) / tests
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=5_000, help="Files in the marketplace tree")
+    parser.add_argument("--tests", type=int, default=20, help="Test HOMEs to set up per mode")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="sc-home-bench-") as tmp:
+        root = Path(tmp)
+        source_home = build_source_home(root / "source", args.files)
+        homes = root / "homes"
+        homes.mkdir()
+
+        os.environ[environment.TEMPLATE_DIR_ENV] = "off"
+        copy_s = time_setups(source_home, homes, args.tests)
+
+        templates = root / "templates"
+        os.environ[environment.TEMPLATE_DIR_ENV] = str(templates)
+        start = time.perf_counter()
+        template = prepare_marketplace_template(source_home)
+        build_s = time.perf_counter() - start
+        probe = create_isolated_home(base_dir=str(homes))
+        method = environment.clone_marketplace_template(template, probe)
+        cleanup_test_environment(probe)
+        template_s = time_setups(source_home, homes, args.tests)
+        os.environ[environment.CLONE_METHOD_ENV] = "symlink"
+        symlink_s = time_setups(source_home, homes, args.tests)
+        del os.environ[environment.CLONE_METHOD_ENV]
+
+    report = {
+        "files": args.files,
+        "tests": args.tests,
+        "clone_method": method,
+        "copy_ms_per_test": round(copy_s * 1000, 1),
+        "template_build_ms": round(build_s * 1000, 1),
+        "template_ms_per_test": round(template_s * 1000, 1),
+        "symlink_ms_per_test": round(symlink_s * 1000, 1),
+        "speedup": round(copy_s / max(template_s, 1e-9), 1),
+        "symlink_speedup": round(copy_s / max(symlink_s, 1e-9), 1),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{args.files} marketplace files, {args.tests} test HOMEs per mode")
+    print(f"  copy per test:      {report['copy_ms_per_test']:>8.1f} ms")
+    print(f"  template build:     {report['template_build_ms']:>8.1f} ms (once)")
+    print(f"  template per test:  {report['template_ms_per_test']:>8.1f} ms ({method})")
+    print(f"  symlink per test:   {report['symlink_ms_per_test']:>8.1f} ms")
+    print(f"  speedup:            {report['speedup']:>8.1f}x ({report['symlink_speedup']:.1f}x symlink)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark offline replay of recorded test sessions.
+
+Records N synthetic session bundles (default 300 tests with 60 tool calls
+each, CLI output and an appended state log) into one fixture, then runs
+the fixture with TestRunner(replay_path=...): every test goes through
+DataCollector, expectation evaluation and the JSON/HTML report builders
+without invoking Claude.
+
+Reports the time to record the bundles, the total replay time and the
+time per test, and checks that every replayed expectation passed.
+
+Usage:
+    python test-packages/benchmarks/bench_replay.py [--tests 300] [--calls 60] [--no-html] [--json]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from harness.log_analyzer import analyze_log_dirs  # noqa: E402
+from harness.models import TestStatus  # noqa: E402
+from harness.replay import write_bundle  # noqa: E402
+from harness.runner import TestRunner  # noqa: E402
+
+EXPECTATIONS = """expectations:
+  - id: exp-001
+    type: tool_call
+    description: Ran git status
+    expected:
+      tool: Bash
+      pattern: 'git status'
+  - id: exp-002
+    type: tool_not_called
+    description: Nothing deleted
+    expected:
+      tool: Bash
+      pattern: 'rm -rf'
+  - id: exp-003
+    type: output_contains
+    description: Reported
+    expected:
+      pattern: 'Startup report'
+"""
+
+
+def session_files(root: Path, i: int, calls: int) -> tuple[Path, Path, Path]:
+    trace = root / f"trace-{i}.jsonl"
+    transcript = root / f"transcript-{i}.jsonl"
+    logs = root / f"logs-{i}"
+    events = [{"ts": "2026-01-16T01:00:00Z", "event": "SessionStart", "session_id": f"s{i}"}]
+    entries = []
+    for n in range(calls):
+        command = "git status" if n == calls // 2 else f"cat src/module_{n}.py"
+        ts = f"2026-01-16T01:{n // 60:02d}:{n % 60:02d}.250Z"
+        events.append({"ts": ts, "event": "PreToolUse", "tool_name": "Bash",
+                       "tool_use_id": f"toolu_{n}", "tool_input": {"command": command}})
+        events.append({"ts": ts, "event": "PostToolUse", "tool_name": "Bash",
+                       "tool_use_id": f"toolu_{n}", "tool_response": {"stdout": f"line {n}\n" * 5}})
+        entries.append({"type": "assistant", "uuid": f"u{n}", "parentUuid": f"u{n - 1}" if n else None,
+                        "timestamp": ts, "message": {"role": "assistant", "content": [
+                            {"type": "tool_use", "name": "Bash", "id": f"toolu_{n}"}]}})
+    entries.append({"type": "assistant", "uuid": "final", "parentUuid": f"u{calls - 1}",
+                    "timestamp": "2026-01-16T02:00:00Z",
+                    "message": {"role": "assistant", "content": [{"type": "text", "text": "Startup report: ok"}]}})
+    trace.write_text("".join(json.dumps(e) + "\n" for e in events))
+    transcript.write_text("".join(json.dumps(e) + "\n" for e in entries))
+    logs.mkdir()
+    (logs / "hooks.log").write_text("INFO:sc.hooks:started\n" * 20)
+    return trace, transcript, logs
+
+
+def build_project(root: Path, tests: int, calls: int) -> float:
+    """Fixture with one test per bundle; returns seconds spent recording."""
+    tests_dir = root / "fixtures" / "replay" / "tests"
+    tests_dir.mkdir(parents=True)
+    (root / "fixtures" / "replay" / "fixture.yaml").write_text("name: replay\npackage: sc-test\n")
+    sessions = root / "sessions"
+    sessions.mkdir()
+    recording = 0.0
+    for i in range(tests):
+        (tests_dir / f"test_{i:04d}.yaml").write_text(
+            f"test_id: replay-{i:04d}\ntest_name: Replay {i}\nexecution:\n  prompt: /sc-startup\n{EXPECTATIONS}"
+        )
+        trace, transcript, logs = session_files(sessions, i, calls)
+        start = time.perf_counter()
+        write_bundle(
+            root / "reports" / "bundles", "replay", f"replay-{i:04d}",
+            trace_path=trace,
+            transcript_path=transcript,
+            claude_stdout="Startup report: ok\n",
+            state_logs=analyze_log_dirs([logs]),
+            log_dirs={"home": logs},
+            metadata={"prompt": "/sc-startup", "model": "haiku", "duration_ms": 95_000},
+        )
+        recording += time.perf_counter() - start
+    return recording
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=300, help="Recorded sessions to replay")
+    parser.add_argument("--calls", type=int, default=60, help="Tool calls per session")
+    parser.add_argument("--no-html", action="store_true", help="Skip the HTML report")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        record_s = build_project(root, args.tests, args.calls)
+        runner = TestRunner(root, replay_path=root / "reports" / "bundles")
+
+        start = time.perf_counter()
+        report = runner.run_fixture("replay", generate_html=not args.no_html)
+        replay_s = time.perf_counter() - start
+
+    failed = [t.test_id for t in report.tests if any(e.status != TestStatus.PASS for e in t.expectations)]
+    if len(report.tests) != args.tests or failed:
+        print(f"ERROR: replayed expectations failed: {failed[:5]}", file=sys.stderr)
+        return 1
+
+    result = {
+        "tests": args.tests,
+        "calls_per_test": args.calls,
+        "html": not args.no_html,
+        "record_s": round(record_s, 2),
+        "replay_s": round(replay_s, 2),
+        "replay_ms_per_test": round(replay_s * 1000 / args.tests, 1),
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"{args.tests} recorded sessions, {args.calls} tool calls each")
+    print(f"  record bundles:  {result['record_s']:>8.2f} s")
+    print(f"  replay fixture:  {result['replay_s']:>8.2f} s  ({result['replay_ms_per_test']} ms/test)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
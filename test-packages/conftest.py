@@ -118,6 +118,12 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         --open-report: Open report in browser after test run
         --open-on-fail: Open report in browser only if tests fail
         --report-dir: Directory for generated reports
+
+    Replay options:
+        --replay: Evaluate recorded session bundles instead of running Claude
+
+    Result cache options:
+        --changed-only: Reuse cached results of unchanged tests instead of running them
     """
     parser.addoption(
         "--fixtures-path",
@@ -155,6 +161,26 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=None,
         help="Directory for generated reports (default: test-packages/reports)",
     )
+    parser.addoption(
+        "--replay",
+        action="store",
+        default=None,
+        metavar="BUNDLE_DIR",
+        help="Re-evaluate recorded session bundles (e.g. test-packages/reports/bundles) without invoking Claude",
+    )
+    parser.addoption(
+        "--changed-only",
+        action="store_true",
+        default=False,
+        help="Reuse the cached result of tests whose YAML, plugins and model are unchanged",
+    )
+    parser.addoption(
+        "--phase-profile",
+        action="store",
+        default=None,
+        metavar="MODES",
+        help="Profile test runs: cpu, memory or all (comma-separated); see harness.timing",
+    )
 
 
 # =============================================================================
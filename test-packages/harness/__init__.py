@@ -7,8 +7,14 @@ Provides environment isolation, data collection, and report generation.
 Modules:
     - models: Pydantic models for the v3.0 report schema
     - environment: Environment isolation (HOME override, cleanup)
+    - plugin_snapshots: Content-addressed pre-installed plugin snapshots
+    - events: Compact hook/transcript records with epoch-ns timestamps
     - collector: Data collection from hooks and transcripts
     - expectations: Assertions and expectations framework
+    - expectation_index: Shared per-run index for evaluating expectations
+    - replay: Recorded session bundles for offline re-evaluation
+    - result_cache: Cached results for skipping unchanged tests
+    - timing: Per-phase timings and optional profiles of test runs
     - reporter: JSON report generation and expectation evaluation
     - html_report: Modular HTML report builder (new)
     - runner: Test orchestration and execution
@@ -72,8 +78,14 @@ __version__ = "0.1.0"
 __all__ = [
     "models",
     "environment",
+    "plugin_snapshots",
+    "events",
     "collector",
     "expectations",
+    "expectation_index",
+    "replay",
+    "result_cache",
+    "timing",
     "reporter",
     "html_report",
     "runner",
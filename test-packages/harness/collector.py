@@ -12,6 +12,11 @@ Key capabilities:
 - Correlate PreToolUse to PostToolUse via tool_use_id
 - Extract errors from transcript (fallback when PostToolUse doesn't fire)
 - Extract Claude's text responses (not captured by hooks)
+- Stream both files in a single pass (HookEventIndex, TranscriptIndex),
+  keeping raw events as spooled JSON lines (SpooledEvents) and capping
+  oversized tool_response payloads
+- Normalize every event into a compact record with its timestamp parsed
+  once (see events.py), shared with enrichment and expectations
 
 Based on findings from:
 - spike-2-hook-observability.md
@@ -40,10 +45,14 @@ from __future__ import annotations
 import json
 import logging
 import re
+import tempfile
+import threading
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from .models import (
     HookEventType,
@@ -60,11 +69,27 @@ from .models import (
     ToolOutput,
     UserPromptSubmitEvent,
 )
-from .log_analyzer import LogAnalysisResult, analyze_logs, analyze_structured_logs, merge_log_analysis
+from .events import HookEvent, TranscriptRecord, hook_events, ns_to_datetime, parse_ts_ns, transcript_records
+from .log_analyzer import (
+    LogAnalysisResult,
+    analyze_logs,
+    analyze_structured_logs,
+    merge_log_analysis,
+    open_maybe_gzip,
+)
 from .schemas import TokenUsage
 
 logger = logging.getLogger(__name__)
 
+# Longest string kept intact inside a collected tool_response; longer
+# strings are cut and suffixed with TRUNCATION_MARKER
+DEFAULT_MAX_PAYLOAD_CHARS = 1_000_000
+TRUNCATION_MARKER = "\n... [truncated {dropped} chars]"
+
+# Raw events stay in memory up to this size, then spill to a temp file
+SPOOL_MAX_MEMORY_BYTES = 4 * 1024 * 1024
+SPOOL_READ_CHUNK = 1024 * 1024
+
 
 # =============================================================================
 # Data Classes for Collected Data
@@ -89,6 +114,10 @@ class CorrelatedToolCall:
     error_content: str | None = None
     duration_ms: int | None = None
     pid: int | None = None
+    # Characters cut from tool_response by the payload cap, and where the
+    # full response was written when spilling is enabled
+    response_truncated_chars: int = 0
+    response_spill_path: str | None = None
 
     def __post_init__(self):
         """Compute duration if both timestamps available."""
@@ -173,9 +202,16 @@ class CollectedData:
     # Tool to agent correlation: tool_use_id -> (agent_id, agent_type)
     tool_to_agent_map: dict[str, tuple[str, str | None]] = field(default_factory=dict)
 
-    # Raw events (for timeline building)
-    raw_hook_events: list[dict[str, Any]] = field(default_factory=list)
-    raw_transcript_entries: list[dict[str, Any]] = field(default_factory=list)
+    # Aggregated token usage from the transcript (None without a transcript)
+    token_usage: TokenUsage | None = None
+
+    # Raw events (for timeline building); a SpooledEvents after collect()
+    raw_hook_events: Sequence[dict[str, Any]] = field(default_factory=list)
+    raw_transcript_entries: Sequence[dict[str, Any]] = field(default_factory=list)
+
+    # Normalized records of the raw events (same order), built at ingest
+    hook_records: list[HookEvent] = field(default_factory=list)
+    transcript_records: list[TranscriptRecord] = field(default_factory=list)
 
     # Claude CLI output (for debugging)
     claude_cli_stdout: str = ""
@@ -184,6 +220,18 @@ class CollectedData:
     # Log analysis results (warnings/errors from logs)
     log_analysis: LogAnalysisResult | None = None
 
+    def hook_event_records(self) -> list[HookEvent]:
+        """Records for raw_hook_events, built on first use if not collected."""
+        if len(self.hook_records) != len(self.raw_hook_events):
+            self.hook_records = hook_events(self.raw_hook_events)
+        return self.hook_records
+
+    def transcript_entry_records(self) -> list[TranscriptRecord]:
+        """Records for raw_transcript_entries, built on first use if not collected."""
+        if len(self.transcript_records) != len(self.raw_transcript_entries):
+            self.transcript_records = transcript_records(self.raw_transcript_entries)
+        return self.transcript_records
+
     @property
     def duration_ms(self) -> int | None:
         """Compute session duration in milliseconds."""
@@ -217,6 +265,88 @@ class CollectedData:
 # =============================================================================
 
 
+def _iter_jsonl(path: Path) -> Iterator[tuple[int, bytes, Any]]:
+    """Yield (line_num, raw_line, parsed) for each valid JSON line of a file.
+
+    ``.gz`` files (recorded session bundles) are decompressed on the fly.
+    Blank lines are skipped and invalid lines are logged and skipped, so
+    callers never hold more than one decoded line at a time.
+    """
+    with open_maybe_gzip(path) as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield line_num, line, json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(f"Invalid JSON at line {line_num}: {e}")
+
+
+def _merge_stdin(event: dict[str, Any], line_num: int | None = None) -> dict[str, Any]:
+    """Merge a hook event's stdin payload into the event without overwriting keys."""
+    # Parse stdin JSON and merge into event (for agent_id, tool_use_id, etc.)
+    # The log-hook.py may store stdin as a JSON string (old) or as a dict (new)
+    stdin_raw = event.get("stdin", "")
+    stdin_data = None
+    if isinstance(stdin_raw, dict):
+        # Already parsed (new log-hook.py format)
+        stdin_data = stdin_raw
+    elif stdin_raw and isinstance(stdin_raw, str):
+        # Legacy format - stdin is a JSON string
+        try:
+            stdin_data = json.loads(stdin_raw)
+        except json.JSONDecodeError:
+            logger.debug(f"stdin is not valid JSON at line {line_num}")
+
+    # Merge stdin data, but don't overwrite existing top-level fields
+    if stdin_data and isinstance(stdin_data, dict):
+        for key, value in stdin_data.items():
+            if key not in event:
+                event[key] = value
+    return event
+
+
+def _decode_trace_line(line: bytes) -> dict[str, Any]:
+    return _merge_stdin(json.loads(line))
+
+
+def iter_trace_events(trace_path: Path | str) -> Iterator[dict[str, Any]]:
+    """Stream hook events from a trace.jsonl file one at a time.
+
+    Same events as parse_trace_file(), without holding the file in memory.
+    Yields nothing if the file does not exist.
+    """
+    for _, _, event in _iter_trace(Path(trace_path)):
+        yield event
+
+
+def _iter_trace(trace_path: Path) -> Iterator[tuple[int, bytes, dict[str, Any]]]:
+    if not trace_path.exists():
+        logger.warning(f"Trace file not found: {trace_path}")
+        return
+    for line_num, line, event in _iter_jsonl(trace_path):
+        if isinstance(event, dict):
+            yield line_num, line, _merge_stdin(event, line_num)
+
+
+def iter_transcript_entries(transcript_path: Path | str) -> Iterator[dict[str, Any]]:
+    """Stream entries from a Claude transcript JSONL file one at a time.
+
+    Same entries as parse_transcript(), without holding the file in memory.
+    Yields nothing if the file does not exist.
+    """
+    for _, _, entry in _iter_transcript(Path(transcript_path)):
+        yield entry
+
+
+def _iter_transcript(transcript_path: Path) -> Iterator[tuple[int, bytes, Any]]:
+    if not transcript_path.exists():
+        logger.warning(f"Transcript file not found: {transcript_path}")
+        return
+    yield from _iter_jsonl(transcript_path)
+
+
 def parse_trace_file(trace_path: Path | str) -> list[dict[str, Any]]:
     """Parse trace.jsonl file from hook events.
 
@@ -229,51 +359,8 @@ def parse_trace_file(trace_path: Path | str) -> list[dict[str, Any]]:
 
     Returns:
         List of parsed event dictionaries with stdin data merged
-
-    Raises:
-        FileNotFoundError: If trace file doesn't exist
-        json.JSONDecodeError: If file contains invalid JSON
     """
-    trace_path = Path(trace_path)
-
-    if not trace_path.exists():
-        logger.warning(f"Trace file not found: {trace_path}")
-        return []
-
-    events = []
-    with open(trace_path, "r") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-
-                # Parse stdin JSON and merge into event (for agent_id, tool_use_id, etc.)
-                # The log-hook.py may store stdin as a JSON string (old) or as a dict (new)
-                stdin_raw = event.get("stdin", "")
-                stdin_data = None
-                if isinstance(stdin_raw, dict):
-                    # Already parsed (new log-hook.py format)
-                    stdin_data = stdin_raw
-                elif stdin_raw and isinstance(stdin_raw, str):
-                    # Legacy format - stdin is a JSON string
-                    try:
-                        stdin_data = json.loads(stdin_raw)
-                    except json.JSONDecodeError:
-                        logger.debug(f"stdin is not valid JSON at line {line_num}")
-
-                # Merge stdin data, but don't overwrite existing top-level fields
-                if stdin_data and isinstance(stdin_data, dict):
-                    for key, value in stdin_data.items():
-                        if key not in event:
-                            event[key] = value
-
-                events.append(event)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Invalid JSON at line {line_num}: {e}")
-                continue
-
+    events = list(iter_trace_events(trace_path))
     logger.debug(f"Parsed {len(events)} events from trace file")
     return events
 
@@ -289,30 +376,8 @@ def parse_transcript(transcript_path: Path | str) -> list[dict[str, Any]]:
 
     Returns:
         List of parsed transcript entries
-
-    Raises:
-        FileNotFoundError: If transcript file doesn't exist
-        json.JSONDecodeError: If file contains invalid JSON
     """
-    transcript_path = Path(transcript_path)
-
-    if not transcript_path.exists():
-        logger.warning(f"Transcript file not found: {transcript_path}")
-        return []
-
-    entries = []
-    with open(transcript_path, "r") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                entries.append(entry)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Invalid JSON at line {line_num}: {e}")
-                continue
-
+    entries = list(iter_transcript_entries(transcript_path))
     logger.debug(f"Parsed {len(entries)} entries from transcript")
     return entries
 
@@ -320,7 +385,8 @@ def parse_transcript(transcript_path: Path | str) -> list[dict[str, Any]]:
 def parse_timestamp(ts_str: str | None) -> datetime | None:
     """Parse ISO8601 timestamp string to datetime.
 
-    Handles various timestamp formats found in hook events and transcripts.
+    Handles various timestamp formats found in hook events and transcripts
+    (see events.parse_ts_ns). Offsets are normalized to naive UTC.
 
     Args:
         ts_str: ISO8601 timestamp string
@@ -330,141 +396,311 @@ def parse_timestamp(ts_str: str | None) -> datetime | None:
     """
     if not ts_str:
         return None
-
-    # Try common formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S",
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(ts_str, fmt)
-        except ValueError:
-            continue
-
-    # Try fromisoformat as fallback
-    try:
-        return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-    except ValueError:
+    ts_ns = parse_ts_ns(ts_str)
+    if ts_ns is None:
         logger.warning(f"Failed to parse timestamp: {ts_str}")
-        return None
+    return ns_to_datetime(ts_ns)
 
 
-def correlate_events(
-    events: list[dict[str, Any]],
-) -> tuple[list[CorrelatedToolCall], list[SubagentLifecycle]]:
-    """Correlate PreToolUse to PostToolUse events by tool_use_id.
+def cap_payload(value: Any, max_chars: int | None) -> tuple[Any, int]:
+    """Truncate oversized strings inside a JSON payload.
 
-    Matches PreToolUse events with their corresponding PostToolUse events
-    using the tool_use_id field. Also correlates SubagentStart/Stop events.
+    Strings longer than max_chars are cut to max_chars and suffixed with a
+    truncation marker naming how many characters were dropped.
 
     Args:
-        events: List of hook events
+        value: Decoded JSON value (dict, list, str, ...)
+        max_chars: Longest string kept intact; None disables capping
 
     Returns:
-        Tuple of (tool_calls, subagents)
+        Tuple of (capped value, number of characters dropped)
     """
-    # Index events by tool_use_id
-    pre_tool_events: dict[str, dict[str, Any]] = {}
-    post_tool_events: dict[str, dict[str, Any]] = {}
-    subagent_starts: dict[str, dict[str, Any]] = {}
-    subagent_stops: dict[str, dict[str, Any]] = {}
+    if max_chars is None:
+        return value, 0
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value, 0
+        dropped = len(value) - max_chars
+        return value[:max_chars] + TRUNCATION_MARKER.format(dropped=dropped), dropped
+    if isinstance(value, dict):
+        dropped = 0
+        capped = {}
+        for key, item in value.items():
+            capped[key], n = cap_payload(item, max_chars)
+            dropped += n
+        return (capped, dropped) if dropped else (value, 0)
+    if isinstance(value, list):
+        dropped = 0
+        items = []
+        for item in value:
+            capped_item, n = cap_payload(item, max_chars)
+            items.append(capped_item)
+            dropped += n
+        return (items, dropped) if dropped else (value, 0)
+    return value, 0
+
+
+# Sort key for records without a timestamp (before every real timestamp)
+_NO_TIMESTAMP = -(1 << 63)
+
+
+class _ToolRecord(NamedTuple):
+    """Fields of a PreToolUse/PostToolUse event kept for correlation."""
+
+    tool_name: str
+    tool_input: dict[str, Any]
+    ts: datetime | None
+    pid: int | None
+    tool_response: Any = None
+    truncated_chars: int = 0
+    spill_path: str | None = None
 
-    for event in events:
-        event_type = event.get("event") or event.get("hook_event_name")
-        tool_use_id = event.get("tool_use_id")
-        agent_id = event.get("agent_id")
+
+class _AgentRecord(NamedTuple):
+    """Fields of a SubagentStart/SubagentStop event kept for correlation."""
+
+    ts: datetime | None
+    agent_type: str | None = None
+    transcript_path: str | None = None
+
+
+class HookEventIndex:
+    """Single-pass index over hook events.
+
+    Feed events with add() in file order; only what correlation needs is
+    retained: PreToolUse/PostToolUse fields by tool_use_id, SubagentStart/
+    SubagentStop by agent_id, and a compact record per event relevant to
+    tool-to-agent correlation. Large tool_response payloads are capped
+    (and optionally spilled to disk) as they arrive.
+    """
+
+    def __init__(
+        self,
+        max_payload_chars: int | None = None,
+        spill_dir: Path | None = None,
+    ):
+        self.max_payload_chars = max_payload_chars
+        self.spill_dir = spill_dir
+        self.pre_tool: dict[str, _ToolRecord] = {}
+        self.post_tool: dict[str, _ToolRecord] = {}
+        self.subagent_starts: dict[str, _AgentRecord] = {}
+        self.subagent_stops: dict[str, _AgentRecord] = {}
+        # Pre/Subagent events relevant to tool-to-agent correlation
+        self._agent_records: list[HookEvent] = []
+        self._seq = 0
+
+    def add(self, event: dict[str, Any], record: HookEvent | None = None) -> None:
+        """Index one hook event, reusing its normalized record if given."""
+        if record is None:
+            record = HookEvent.from_raw(self._seq, event)
+        self._seq += 1
+        event_type = record.kind
+        tool_use_id = record.tool_use_id
+        agent_id = record.agent_id
 
         if event_type == "PreToolUse" and tool_use_id:
-            pre_tool_events[tool_use_id] = event
+            self.pre_tool[tool_use_id] = _ToolRecord(
+                tool_name=event.get("tool_name", ""),
+                tool_input=event.get("tool_input", {}),
+                ts=record.ts,
+                pid=record.pid,
+            )
         elif event_type == "PostToolUse" and tool_use_id:
-            post_tool_events[tool_use_id] = event
+            self.post_tool[tool_use_id] = self._post_record(tool_use_id, event, record)
+            return
         elif event_type == "SubagentStart" and agent_id:
-            subagent_starts[agent_id] = event
+            self.subagent_starts[agent_id] = _AgentRecord(
+                ts=record.ts,
+                agent_type=record.agent_type,
+            )
         elif event_type == "SubagentStop" and agent_id:
-            subagent_stops[agent_id] = event
-
-    # Correlate tool calls
-    tool_calls = []
-    seen_ids = set()
-
-    for tool_use_id, pre_event in pre_tool_events.items():
-        post_event = post_tool_events.get(tool_use_id)
-
-        tool_call = CorrelatedToolCall(
-            tool_use_id=tool_use_id,
-            tool_name=pre_event.get("tool_name", ""),
-            tool_input=pre_event.get("tool_input", {}),
-            tool_response=post_event.get("tool_response") if post_event else None,
-            pre_timestamp=parse_timestamp(pre_event.get("ts")),
-            post_timestamp=(
-                parse_timestamp(post_event.get("ts")) if post_event else None
-            ),
-            pid=pre_event.get("pid"),
+            self.subagent_stops[agent_id] = _AgentRecord(
+                ts=record.ts,
+                transcript_path=event.get("agent_transcript_path"),
+            )
+        else:
+            return
+
+        self._agent_records.append(record)
+
+    def _post_record(self, tool_use_id: str, event: dict[str, Any], record: HookEvent) -> _ToolRecord:
+        response = event.get("tool_response")
+        capped, dropped = cap_payload(response, self.max_payload_chars)
+        spill_path = None
+        if dropped and self.spill_dir is not None:
+            spill_path = self._spill(tool_use_id, response)
+        return _ToolRecord(
+            tool_name=event.get("tool_name", ""),
+            tool_input=event.get("tool_input", {}),
+            ts=record.ts,
+            pid=record.pid,
+            tool_response=capped,
+            truncated_chars=dropped,
+            spill_path=spill_path,
         )
-        tool_calls.append(tool_call)
-        seen_ids.add(tool_use_id)
-
-    # Add any PostToolUse events without matching PreToolUse
-    for tool_use_id, post_event in post_tool_events.items():
-        if tool_use_id not in seen_ids:
-            tool_call = CorrelatedToolCall(
-                tool_use_id=tool_use_id,
-                tool_name=post_event.get("tool_name", ""),
-                tool_input=post_event.get("tool_input", {}),
-                tool_response=post_event.get("tool_response"),
-                post_timestamp=parse_timestamp(post_event.get("ts")),
-                pid=post_event.get("pid"),
+
+    def _spill(self, tool_use_id: str, response: Any) -> str | None:
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", tool_use_id)
+        path = self.spill_dir / f"{safe_id}.tool_response.json"
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(response), encoding="utf-8")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to spill tool_response for {tool_use_id}: {e}")
+            return None
+        return str(path)
+
+    def correlate(self) -> tuple[list[CorrelatedToolCall], list[SubagentLifecycle]]:
+        """Build correlated tool calls and subagent lifecycles."""
+        tool_calls = []
+
+        for tool_use_id, pre in self.pre_tool.items():
+            post = self.post_tool.get(tool_use_id)
+            tool_calls.append(
+                CorrelatedToolCall(
+                    tool_use_id=tool_use_id,
+                    tool_name=pre.tool_name,
+                    tool_input=pre.tool_input,
+                    tool_response=post.tool_response if post else None,
+                    pre_timestamp=pre.ts,
+                    post_timestamp=post.ts if post else None,
+                    pid=pre.pid,
+                    response_truncated_chars=post.truncated_chars if post else 0,
+                    response_spill_path=post.spill_path if post else None,
+                )
             )
-            tool_calls.append(tool_call)
 
-    # Sort by timestamp
-    tool_calls.sort(
-        key=lambda tc: tc.pre_timestamp or tc.post_timestamp or datetime.min
-    )
+        # Add any PostToolUse events without matching PreToolUse
+        for tool_use_id, post in self.post_tool.items():
+            if tool_use_id not in self.pre_tool:
+                tool_calls.append(
+                    CorrelatedToolCall(
+                        tool_use_id=tool_use_id,
+                        tool_name=post.tool_name,
+                        tool_input=post.tool_input,
+                        tool_response=post.tool_response,
+                        post_timestamp=post.ts,
+                        pid=post.pid,
+                        response_truncated_chars=post.truncated_chars,
+                        response_spill_path=post.spill_path,
+                    )
+                )
 
-    # Correlate subagents
-    subagents = []
-    seen_agents = set()
-
-    for agent_id, start_event in subagent_starts.items():
-        stop_event = subagent_stops.get(agent_id)
-
-        subagent = SubagentLifecycle(
-            agent_id=agent_id,
-            agent_type=start_event.get("agent_type"),
-            start_timestamp=parse_timestamp(start_event.get("ts")),
-            stop_timestamp=(
-                parse_timestamp(stop_event.get("ts")) if stop_event else None
-            ),
-            transcript_path=(
-                stop_event.get("agent_transcript_path") if stop_event else None
-            ),
+        # Sort by timestamp
+        tool_calls.sort(
+            key=lambda tc: tc.pre_timestamp or tc.post_timestamp or datetime.min
         )
-        subagents.append(subagent)
-        seen_agents.add(agent_id)
-
-    # Add any SubagentStop events without matching Start
-    for agent_id, stop_event in subagent_stops.items():
-        if agent_id not in seen_agents:
-            subagent = SubagentLifecycle(
-                agent_id=agent_id,
-                stop_timestamp=parse_timestamp(stop_event.get("ts")),
-                transcript_path=stop_event.get("agent_transcript_path"),
+
+        # Correlate subagents
+        subagents = []
+
+        for agent_id, start in self.subagent_starts.items():
+            stop = self.subagent_stops.get(agent_id)
+            subagents.append(
+                SubagentLifecycle(
+                    agent_id=agent_id,
+                    agent_type=start.agent_type,
+                    start_timestamp=start.ts,
+                    stop_timestamp=stop.ts if stop else None,
+                    transcript_path=stop.transcript_path if stop else None,
+                )
             )
-            subagents.append(subagent)
 
-    logger.debug(
-        f"Correlated {len(tool_calls)} tool calls and {len(subagents)} subagents"
-    )
-    return tool_calls, subagents
+        # Add any SubagentStop events without matching Start
+        for agent_id, stop in self.subagent_stops.items():
+            if agent_id not in self.subagent_starts:
+                subagents.append(
+                    SubagentLifecycle(
+                        agent_id=agent_id,
+                        stop_timestamp=stop.ts,
+                        transcript_path=stop.transcript_path,
+                    )
+                )
+
+        logger.debug(
+            f"Correlated {len(tool_calls)} tool calls and {len(subagents)} subagents"
+        )
+        return tool_calls, subagents
+
+    def tool_to_agent_map(self) -> dict[str, tuple[str, str | None]]:
+        """Map tool_use_id -> (agent_id, agent_type) for PreToolUse events.
+
+        Uses ppid (parent process ID) to determine which subagent context
+        a tool call executed in, falling back to subagent time ranges.
+        """
+        records = sorted(
+            self._agent_records,
+            key=lambda r: r.ts_ns if r.ts_ns is not None else _NO_TIMESTAMP,
+        )
+
+        # Track subagent time ranges for fallback: agent_id -> (start_ns, stop_ns, agent_type)
+        subagent_ranges: dict[str, tuple[int | None, int | None, str | None]] = {}
+
+        # First pass: build time ranges
+        for record in records:
+            if record.kind == "SubagentStart":
+                subagent_ranges[record.agent_id] = (record.ts_ns, None, record.agent_type)
+            elif record.kind == "SubagentStop" and record.agent_id in subagent_ranges:
+                start_ts, _, atype = subagent_ranges[record.agent_id]
+                subagent_ranges[record.agent_id] = (start_ts, record.ts_ns, atype)
+
+        # Track active subagents by ppid: ppid -> (agent_id, agent_type)
+        active_by_ppid: dict[int, tuple[str, str | None]] = {}
+
+        # Result: tool_use_id -> (agent_id, agent_type)
+        tool_to_agent: dict[str, tuple[str, str | None]] = {}
+
+        # Second pass: correlate tool calls
+        for record in records:
+            event_type, ppid, agent_id = record.kind, record.ppid, record.agent_id
+            ts, tool_use_id = record.ts_ns, record.tool_use_id
+            if event_type == "SubagentStart":
+                if ppid:
+                    active_by_ppid[ppid] = (agent_id, record.agent_type)
+
+            elif event_type == "SubagentStop":
+                for key, (aid, _) in list(active_by_ppid.items()):
+                    if aid == agent_id:
+                        del active_by_ppid[key]
+                        break
+
+            else:
+                # Try ppid correlation first
+                if ppid and ppid in active_by_ppid:
+                    tool_to_agent[tool_use_id] = active_by_ppid[ppid]
+                elif ts is not None:
+                    # Fallback: timestamp-based correlation
+                    for aid, (start_ts, stop_ts, atype) in subagent_ranges.items():
+                        if start_ts is not None and start_ts <= ts:
+                            if stop_ts is None or ts <= stop_ts:
+                                tool_to_agent[tool_use_id] = (aid, atype)
+                                break
+
+        return tool_to_agent
+
+
+def correlate_events(
+    events: Iterable[dict[str, Any]],
+) -> tuple[list[CorrelatedToolCall], list[SubagentLifecycle]]:
+    """Correlate PreToolUse to PostToolUse events by tool_use_id.
+
+    Matches PreToolUse events with their corresponding PostToolUse events
+    using the tool_use_id field. Also correlates SubagentStart/Stop events.
+
+    Args:
+        events: Hook events (any iterable, consumed once)
+
+    Returns:
+        Tuple of (tool_calls, subagents)
+    """
+    index = HookEventIndex()
+    for event in events:
+        index.add(event)
+    return index.correlate()
 
 
 def correlate_tool_calls_with_agents(
-    events: list[dict[str, Any]]
+    events: Iterable[dict[str, Any]]
 ) -> dict[str, tuple[str, str | None]]:
     """Correlate tool_use_ids with their parent subagent.
 
@@ -473,91 +709,124 @@ def correlate_tool_calls_with_agents(
     if ppid is not available.
 
     Args:
-        events: List of hook events
+        events: Hook events (any iterable, consumed once)
 
     Returns:
         Dict mapping tool_use_id -> (agent_id, agent_type)
     """
-    sorted_events = sorted(
-        events,
-        key=lambda e: parse_timestamp(e.get("ts")) or datetime.min
-    )
+    index = HookEventIndex()
+    for event in events:
+        index.add(event)
+    return index.tool_to_agent_map()
 
-    # Track active subagents by ppid: ppid -> (agent_id, agent_type)
-    active_by_ppid: dict[int, tuple[str, str | None]] = {}
 
-    # Track subagent time ranges for fallback: agent_id -> (start_ts, stop_ts, agent_type)
-    subagent_ranges: dict[str, tuple[datetime | None, datetime | None, str | None]] = {}
+def _tool_error(entry: dict[str, Any]) -> ToolError | None:
+    if entry.get("type") == "tool_result" and entry.get("is_error"):
+        return ToolError(
+            tool_use_id=entry.get("tool_use_id", ""),
+            error_content=entry.get("content", ""),
+        )
+    return None
 
-    # Result: tool_use_id -> (agent_id, agent_type)
-    tool_to_agent: dict[str, tuple[str, str | None]] = {}
 
-    # First pass: build ppid mapping and time ranges
-    for event in sorted_events:
-        event_type = event.get("event") or event.get("hook_event_name")
-        ppid = event.get("ppid")
-        agent_id = event.get("agent_id")
-        agent_type = event.get("agent_type")
-        ts = parse_timestamp(event.get("ts"))
+def _response_text(entry: dict[str, Any]) -> str | None:
+    if entry.get("type") != "assistant":
+        return None
+    message = entry.get("message", {})
+    content = message.get("content", [])
 
-        if event_type == "SubagentStart" and agent_id:
-            if ppid:
-                active_by_ppid[ppid] = (agent_id, agent_type)
-            subagent_ranges[agent_id] = (ts, None, agent_type)
+    # Extract text from content array
+    text_parts = []
+    for item in content:
+        if isinstance(item, dict) and item.get("type") == "text":
+            text_parts.append(item.get("text", ""))
+        elif isinstance(item, str):
+            text_parts.append(item)
 
-        elif event_type == "SubagentStop" and agent_id:
-            # Remove from ppid mapping
-            for key, (aid, _) in list(active_by_ppid.items()):
-                if aid == agent_id:
-                    del active_by_ppid[key]
-                    break
-            # Update time range
-            if agent_id in subagent_ranges:
-                start_ts, _, atype = subagent_ranges[agent_id]
-                subagent_ranges[agent_id] = (start_ts, ts, atype)
-
-    # Reset ppid mapping for second pass
-    active_by_ppid.clear()
-
-    # Second pass: correlate tool calls
-    for event in sorted_events:
-        event_type = event.get("event") or event.get("hook_event_name")
-        ppid = event.get("ppid")
-        agent_id = event.get("agent_id")
-        agent_type = event.get("agent_type")
-
-        if event_type == "SubagentStart" and agent_id and ppid:
-            active_by_ppid[ppid] = (agent_id, agent_type)
+    return "\n".join(text_parts) if text_parts else None
 
-        elif event_type == "SubagentStop" and agent_id:
-            for key, (aid, _) in list(active_by_ppid.items()):
-                if aid == agent_id:
-                    del active_by_ppid[key]
-                    break
-
-        elif event_type == "PreToolUse":
-            tool_use_id = event.get("tool_use_id")
-            if not tool_use_id:
-                continue
 
-            # Try ppid correlation first
-            if ppid and ppid in active_by_ppid:
-                tool_to_agent[tool_use_id] = active_by_ppid[ppid]
-            else:
-                # Fallback: timestamp-based correlation
-                ts = parse_timestamp(event.get("ts"))
-                if ts:
-                    for aid, (start_ts, stop_ts, atype) in subagent_ranges.items():
-                        if start_ts and start_ts <= ts:
-                            if stop_ts is None or ts <= stop_ts:
-                                tool_to_agent[tool_use_id] = (aid, atype)
-                                break
+def _tool_use_name(entry: dict[str, Any]) -> tuple[str, str] | None:
+    if entry.get("type") == "tool_use":
+        tool_use_id = entry.get("id", "")
+        tool_name = entry.get("name", "")
+        if tool_use_id and tool_name:
+            return tool_use_id, tool_name
+    return None
+
 
-    return tool_to_agent
+class _TokenCounter:
+    """Running token totals over transcript entries."""
+
+    __slots__ = ("input", "output", "cache_creation", "cache_read", "subagent")
+
+    def __init__(self):
+        self.input = self.output = self.cache_creation = self.cache_read = self.subagent = 0
+
+    def add(self, entry: dict[str, Any]) -> None:
+        # Extract from message.usage in assistant messages
+        message = entry.get("message", {})
+        if message:
+            usage = message.get("usage", {})
+            if usage:
+                self.input += usage.get("input_tokens", 0)
+                self.output += usage.get("output_tokens", 0)
+                self.cache_creation += usage.get("cache_creation_input_tokens", 0)
+                self.cache_read += usage.get("cache_read_input_tokens", 0)
+
+        # Extract from toolUseResult.totalTokens for subagent tokens
+        tool_use_result = entry.get("toolUseResult", {})
+        if tool_use_result and isinstance(tool_use_result, dict):
+            total_tokens = tool_use_result.get("totalTokens", 0)
+            if total_tokens:
+                self.subagent += total_tokens
+
+    def usage(self) -> TokenUsage:
+        return TokenUsage(
+            input_tokens=self.input,
+            output_tokens=self.output,
+            cache_creation_tokens=self.cache_creation,
+            cache_read_tokens=self.cache_read,
+            subagent_tokens=self.subagent,
+        )
+
+
+class TranscriptIndex:
+    """Single-pass extractor over transcript entries.
+
+    Feed entries with add(); errors, Claude responses, tool names and
+    token usage are all accumulated in the same pass.
+    """
+
+    def __init__(self):
+        self.errors: list[ToolError] = []
+        self.responses: list[ClaudeResponseText] = []
+        self.tool_names: dict[str, str] = {}
+        self.tokens = _TokenCounter()
+
+    def add(self, entry: dict[str, Any]) -> None:
+        """Extract everything of interest from one transcript entry."""
+        error = _tool_error(entry)
+        if error is not None:
+            self.errors.append(error)
+        text = _response_text(entry)
+        if text is not None:
+            self.responses.append(ClaudeResponseText(text=text))
+        named = _tool_use_name(entry)
+        if named is not None:
+            self.tool_names[named[0]] = named[1]
+        self.tokens.add(entry)
+
+    def named_errors(self) -> list[ToolError]:
+        """Errors with tool names filled in from tool_use entries."""
+        for error in self.errors:
+            if error.tool_use_id in self.tool_names:
+                error.tool_name = self.tool_names[error.tool_use_id]
+        return self.errors
 
 
 def extract_errors_from_transcript(
-    entries: list[dict[str, Any]],
+    entries: Iterable[dict[str, Any]],
 ) -> list[ToolError]:
     """Extract tool errors from transcript that hooks may have missed.
 
@@ -565,28 +834,18 @@ def extract_errors_from_transcript(
     extracts errors from the transcript's tool_result entries.
 
     Args:
-        entries: List of transcript entries
+        entries: Transcript entries
 
     Returns:
         List of ToolError objects
     """
-    errors = []
-
-    for entry in entries:
-        if entry.get("type") == "tool_result":
-            if entry.get("is_error"):
-                error = ToolError(
-                    tool_use_id=entry.get("tool_use_id", ""),
-                    error_content=entry.get("content", ""),
-                )
-                errors.append(error)
-
+    errors = [error for error in map(_tool_error, entries) if error is not None]
     logger.debug(f"Extracted {len(errors)} errors from transcript")
     return errors
 
 
 def extract_claude_responses(
-    entries: list[dict[str, Any]],
+    entries: Iterable[dict[str, Any]],
 ) -> list[ClaudeResponseText]:
     """Extract Claude's text responses from transcript.
 
@@ -594,37 +853,22 @@ def extract_claude_responses(
     extracts them from assistant messages in the transcript.
 
     Args:
-        entries: List of transcript entries
+        entries: Transcript entries
 
     Returns:
         List of ClaudeResponseText objects
     """
-    responses = []
-
-    for entry in entries:
-        if entry.get("type") == "assistant":
-            message = entry.get("message", {})
-            content = message.get("content", [])
-
-            # Extract text from content array
-            text_parts = []
-            for item in content:
-                if isinstance(item, dict) and item.get("type") == "text":
-                    text_parts.append(item.get("text", ""))
-                elif isinstance(item, str):
-                    text_parts.append(item)
-
-            if text_parts:
-                full_text = "\n".join(text_parts)
-                response = ClaudeResponseText(text=full_text)
-                responses.append(response)
-
+    responses = [
+        ClaudeResponseText(text=text)
+        for text in map(_response_text, entries)
+        if text is not None
+    ]
     logger.debug(f"Extracted {len(responses)} Claude responses from transcript")
     return responses
 
 
 def extract_tool_names_from_transcript(
-    entries: list[dict[str, Any]],
+    entries: Iterable[dict[str, Any]],
     errors: list[ToolError],
 ) -> None:
     """Add tool names to errors from transcript tool_use entries.
@@ -633,17 +877,11 @@ def extract_tool_names_from_transcript(
     to tool_use entries in the transcript.
 
     Args:
-        entries: List of transcript entries
+        entries: Transcript entries
         errors: List of ToolError objects to update (modified in place)
     """
     # Build tool_use_id -> tool_name mapping
-    tool_names: dict[str, str] = {}
-    for entry in entries:
-        if entry.get("type") == "tool_use":
-            tool_use_id = entry.get("id", "")
-            tool_name = entry.get("name", "")
-            if tool_use_id and tool_name:
-                tool_names[tool_use_id] = tool_name
+    tool_names = dict(named for named in map(_tool_use_name, entries) if named is not None)
 
     # Update errors with tool names
     for error in errors:
@@ -651,7 +889,7 @@ def extract_tool_names_from_transcript(
             error.tool_name = tool_names[error.tool_use_id]
 
 
-def extract_token_usage(entries: list[dict[str, Any]]) -> TokenUsage:
+def extract_token_usage(entries: Iterable[dict[str, Any]]) -> TokenUsage:
     """Extract and aggregate token usage from transcript entries.
 
     Parses transcript entries for:
@@ -660,42 +898,96 @@ def extract_token_usage(entries: list[dict[str, Any]]) -> TokenUsage:
     - toolUseResult.totalTokens for subagent tokens
 
     Args:
-        entries: List of transcript entries from Claude session
+        entries: Transcript entries from Claude session
 
     Returns:
         TokenUsage object with aggregated token counts
     """
-    input_tokens = 0
-    output_tokens = 0
-    cache_creation_tokens = 0
-    cache_read_tokens = 0
-    subagent_tokens = 0
-
+    counter = _TokenCounter()
     for entry in entries:
-        # Extract from message.usage in assistant messages
-        message = entry.get("message", {})
-        if message:
-            usage = message.get("usage", {})
-            if usage:
-                input_tokens += usage.get("input_tokens", 0)
-                output_tokens += usage.get("output_tokens", 0)
-                cache_creation_tokens += usage.get("cache_creation_input_tokens", 0)
-                cache_read_tokens += usage.get("cache_read_input_tokens", 0)
+        counter.add(entry)
+    return counter.usage()
 
-        # Extract from toolUseResult.totalTokens for subagent tokens
-        tool_use_result = entry.get("toolUseResult", {})
-        if tool_use_result and isinstance(tool_use_result, dict):
-            total_tokens = tool_use_result.get("totalTokens", 0)
-            if total_tokens:
-                subagent_tokens += total_tokens
-
-    return TokenUsage(
-        input_tokens=input_tokens,
-        output_tokens=output_tokens,
-        cache_creation_tokens=cache_creation_tokens,
-        cache_read_tokens=cache_read_tokens,
-        subagent_tokens=subagent_tokens,
-    )
+
+class SpooledEvents(Sequence):
+    """Read-only, re-iterable sequence of JSONL events kept as raw lines.
+
+    Holds the original JSON lines in a spooled temporary file that stays in
+    memory up to ``max_memory`` bytes and rolls over to disk beyond that.
+    Events are decoded again on each iteration, so long sessions do not
+    keep millions of dicts alive; line offsets are kept so indexing decodes
+    a single event. Copies and pickles materialize a list.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[bytes], Any] = json.loads,
+        max_memory: int = SPOOL_MAX_MEMORY_BYTES,
+    ):
+        self._decode = decode
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_memory, mode="w+b")
+        self._size = 0
+        self._count = 0
+        self._offsets = array("Q")
+        self._lock = threading.Lock()
+
+    def append_line(self, line: bytes) -> None:
+        """Append one raw JSON line (without its trailing newline)."""
+        with self._lock:
+            self._offsets.append(self._size)
+            self._file.seek(self._size)
+            self._file.write(line)
+            self._file.write(b"\n")
+            self._size += len(line) + 1
+            self._count += 1
+
+    @property
+    def spilled(self) -> bool:
+        """True once the spool has rolled over to a file on disk."""
+        return bool(getattr(self._file, "_rolled", False))
+
+    def __iter__(self) -> Iterator[Any]:
+        position = 0
+        pending = b""
+        while position < self._size:
+            with self._lock:
+                self._file.seek(position)
+                chunk = self._file.read(min(SPOOL_READ_CHUNK, self._size - position))
+            if not chunk:
+                break
+            position += len(chunk)
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield self._decode(line)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("SpooledEvents index out of range")
+        start = self._offsets[index]
+        end = self._offsets[index + 1] if index + 1 < self._count else self._size
+        with self._lock:
+            self._file.seek(start)
+            line = self._file.read(end - start - 1)
+        return self._decode(line)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, SpooledEvents)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def __repr__(self) -> str:
+        return f"SpooledEvents(count={self._count}, bytes={self._size}, spilled={self.spilled})"
 
 
 # =============================================================================
@@ -727,12 +1019,18 @@ class DataCollector:
         trace_path: Path | str | None = None,
         transcript_path: Path | str | None = None,
         project_path: Path | str | None = None,
+        max_payload_chars: int | None = DEFAULT_MAX_PAYLOAD_CHARS,
+        spill_dir: Path | str | None = None,
     ):
         """Initialize the DataCollector.
 
         Args:
             trace_path: Path to trace.jsonl file (optional)
             transcript_path: Path to transcript.jsonl transcript (optional)
+            max_payload_chars: Longest tool_response string kept intact;
+                None keeps responses whole
+            spill_dir: If set, full copies of truncated tool_responses are
+                written here (see CorrelatedToolCall.response_spill_path)
         """
         self.trace_path = Path(trace_path) if trace_path else None
         self.transcript_path = Path(transcript_path) if transcript_path else None
@@ -742,71 +1040,68 @@ class DataCollector:
             self.project_path = self.trace_path.parent.parent
         else:
             self.project_path = None
+        self.max_payload_chars = max_payload_chars
+        self.spill_dir = Path(spill_dir) if spill_dir else None
         self._tool_to_agent_map: dict[str, tuple[str, str | None]] = {}
 
     def collect(self) -> CollectedData:
         """Collect and correlate all data from trace and transcript.
 
-        Reads both files, correlates events, and extracts all relevant
-        information into a CollectedData object.
+        Streams each file once; every extractor is fed from the same pass
+        and raw events are kept as spooled lines rather than dicts.
 
         Returns:
             CollectedData with all collected and correlated information
         """
         data = CollectedData()
 
-        # Parse trace file
+        # Stream the trace file once, feeding every extractor per event
         if self.trace_path:
-            hook_events = parse_trace_file(self.trace_path)
-            data.raw_hook_events = hook_events
-
-            # Extract session info from SessionStart
-            for event in hook_events:
-                event_type = event.get("event") or event.get("hook_event_name")
-
-                if event_type == "SessionStart":
-                    data.session_id = event.get("session_id")
-                    data.transcript_path = event.get("transcript_path")
-                    data.cwd = event.get("cwd")
-                    data.start_timestamp = parse_timestamp(event.get("ts"))
-
-                elif event_type == "SessionEnd":
-                    data.end_timestamp = parse_timestamp(event.get("ts"))
-                    data.end_reason = event.get("reason")
-
-                elif event_type == "UserPromptSubmit":
-                    data.prompt = event.get("prompt")
-                    data.prompt_timestamp = parse_timestamp(event.get("ts"))
+            index = HookEventIndex(self.max_payload_chars, self.spill_dir)
+            raw_events = SpooledEvents(decode=_decode_trace_line)
+            records: list[HookEvent] = []
+            for _, line, event in _iter_trace(self.trace_path):
+                record = HookEvent.from_raw(len(records), event)
+                raw_events.append_line(line)
+                records.append(record)
+                index.add(event, record)
+                self._add_session_info(data, event, record)
+            data.raw_hook_events = raw_events
+            data.hook_records = records
+            logger.debug(f"Streamed {len(raw_events)} events from trace file")
 
             # Correlate tool calls and subagents
-            data.tool_calls, data.subagents = correlate_events(hook_events)
+            data.tool_calls, data.subagents = index.correlate()
 
             # Correlate tool calls with their parent agents
-            self._tool_to_agent_map = correlate_tool_calls_with_agents(hook_events)
+            self._tool_to_agent_map = index.tool_to_agent_map()
             data.tool_to_agent_map = self._tool_to_agent_map
 
-        # Parse transcript file
+        # Stream the transcript once: errors, responses, tool names, tokens
         if self.transcript_path:
-            transcript_entries = parse_transcript(self.transcript_path)
-            data.raw_transcript_entries = transcript_entries
-
-            # Extract errors
-            data.errors = extract_errors_from_transcript(transcript_entries)
-            extract_tool_names_from_transcript(transcript_entries, data.errors)
-
-            # Mark tool calls with errors
-            error_ids = {e.tool_use_id for e in data.errors}
+            transcript = TranscriptIndex()
+            raw_entries = SpooledEvents()
+            entry_records: list[TranscriptRecord] = []
+            for _, line, entry in _iter_transcript(self.transcript_path):
+                raw_entries.append_line(line)
+                entry_records.append(TranscriptRecord.from_raw(entry))
+                transcript.add(entry)
+            data.raw_transcript_entries = raw_entries
+            data.transcript_records = entry_records
+            logger.debug(f"Streamed {len(raw_entries)} entries from transcript")
+
+            data.errors = transcript.named_errors()
+            data.claude_responses = transcript.responses
+            data.token_usage = transcript.tokens.usage()
+
+            # Mark tool calls with errors (first error per tool_use_id wins)
+            error_content: dict[str, str] = {}
+            for error in data.errors:
+                error_content.setdefault(error.tool_use_id, error.error_content)
             for tool_call in data.tool_calls:
-                if tool_call.tool_use_id in error_ids:
+                if tool_call.tool_use_id in error_content:
                     tool_call.is_error = True
-                    # Find matching error content
-                    for error in data.errors:
-                        if error.tool_use_id == tool_call.tool_use_id:
-                            tool_call.error_content = error.error_content
-                            break
-
-            # Extract Claude responses
-            data.claude_responses = extract_claude_responses(transcript_entries)
+                    tool_call.error_content = error_content[tool_call.tool_use_id]
 
         # Analyze logs from CLI output and structured logs for warnings/errors
         analyses: list[LogAnalysisResult] = []
@@ -834,6 +1129,25 @@ class DataCollector:
 
         return data
 
+    @staticmethod
+    def _add_session_info(data: CollectedData, event: dict[str, Any], record: HookEvent) -> None:
+        """Record session, prompt and end details from a lifecycle event."""
+        event_type = record.kind
+
+        if event_type == "SessionStart":
+            data.session_id = event.get("session_id")
+            data.transcript_path = event.get("transcript_path")
+            data.cwd = event.get("cwd")
+            data.start_timestamp = record.ts
+
+        elif event_type == "SessionEnd":
+            data.end_timestamp = record.ts
+            data.end_reason = event.get("reason")
+
+        elif event_type == "UserPromptSubmit":
+            data.prompt = event.get("prompt")
+            data.prompt_timestamp = record.ts
+
     def _read_structured_logs(self) -> list[dict[str, Any]]:
         if self.project_path is None:
             return []
@@ -841,7 +1155,12 @@ class DataCollector:
         if not log_root.exists():
             return []
         records: list[dict[str, Any]] = []
-        for path in log_root.rglob("*.json"):
+        for path in sorted(log_root.rglob("*")):
+            if path.suffix == ".jsonl":
+                records.extend(self._read_jsonl_log(path))
+                continue
+            if path.suffix != ".json":
+                continue
             try:
                 text = path.read_text(encoding="utf-8")
             except Exception:
@@ -869,6 +1188,23 @@ class DataCollector:
                     continue
         return records
 
+    @staticmethod
+    def _read_jsonl_log(path: Path) -> list[dict[str, Any]]:
+        """Records of a JSONL log segment (e.g. ai_cli's ai-cli-*.jsonl), one line at a time."""
+        records: list[dict[str, Any]] = []
+        try:
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # blank, or a line still being written
+                    if isinstance(record, dict):
+                        records.append(record)
+        except OSError:
+            pass
+        return records
+
     def build_timeline(
         self, data: CollectedData, start_time: datetime | None = None
     ) -> list[TimelineEntry]:
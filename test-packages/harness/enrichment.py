@@ -13,12 +13,16 @@ Key phases:
 The output is an EnrichedData structure that references transcript entries by UUID
 rather than duplicating content, following the design principle of "preserve native
 + augment".
+
+Entries and events may be given as raw dicts or as the normalized records built
+by the collector (events.TranscriptRecord / events.HookEvent); either way each
+is reduced to a record once and timestamps are parsed once.
 """
 
-from datetime import datetime
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Iterable, Union
 
 from .collector import extract_token_usage
+from .events import HookEvent, TranscriptRecord, hook_events, transcript_records
 from .result import Result, Success, Failure, EnrichmentError, collect_results
 from .schemas import (
     EnrichedData,
@@ -29,14 +33,19 @@ from .schemas import (
     TimelineNodeType,
     AgentSummary,
     TreeStats,
+    TokenUsage,
 )
 
+TranscriptInput = Iterable[Union[dict, TranscriptRecord]]
+TraceInput = Iterable[Union[dict, HookEvent]]
+
 
 def build_timeline_tree(
-    transcript_entries: List[dict],
-    trace_events: List[dict],
+    transcript_entries: TranscriptInput,
+    trace_events: TraceInput,
     test_context: TestContext,
     artifact_paths: ArtifactPaths,
+    token_usage: Optional[TokenUsage] = None,
 ) -> Result[EnrichedData, EnrichmentError]:
     """Build enriched data with tree structure from raw transcript and trace.
 
@@ -49,10 +58,13 @@ def build_timeline_tree(
     Phase 4: Compute depths and statistics
 
     Args:
-        transcript_entries: List of raw transcript entry dicts from Claude session
-        trace_events: List of hook trace event dicts
+        transcript_entries: Raw transcript entry dicts from Claude session, or
+            their TranscriptRecords
+        trace_events: Hook trace event dicts, or their HookEvent records
         test_context: Test identification metadata
         artifact_paths: Paths to artifact files
+        token_usage: Token totals for the session (default: computed from
+            transcript_entries, which must then be raw dicts)
 
     Returns:
         Success[EnrichedData]: Complete tree structure and statistics with any warnings
@@ -60,16 +72,23 @@ def build_timeline_tree(
             work completed so far
     """
     warnings: List[str] = []
+    if token_usage is None:
+        token_usage = extract_token_usage(
+            entry for entry in transcript_entries if isinstance(entry, dict)
+        )
+    records = transcript_records(transcript_entries)
+    trace_events = hook_events(trace_events)
 
     # Phase 1: Index transcript entries by uuid
-    by_uuid: Dict[str, dict] = {}
+    by_uuid: Dict[str, TranscriptRecord] = {}
     entries_without_uuid = 0
-    for entry in transcript_entries:
-        uuid = entry.get("uuid")
+    for record in records:
+        uuid = record.uuid
         if uuid:
-            by_uuid[uuid] = entry
+            by_uuid[uuid] = record
         else:
             entries_without_uuid += 1
+    del records
 
     if entries_without_uuid > 0:
         warnings.append(f"Phase 1: {entries_without_uuid} entries skipped (missing uuid)")
@@ -91,7 +110,7 @@ def build_timeline_tree(
 
     # Second pass: Link parents to children and identify roots
     for uuid, entry in by_uuid.items():
-        parent_uuid = entry.get("parentUuid")
+        parent_uuid = entry.parent_uuid
         if parent_uuid and parent_uuid in nodes:
             # Link child to parent
             nodes[uuid].parent_uuid = parent_uuid
@@ -145,7 +164,7 @@ def build_timeline_tree(
                 max_depth=0,
                 agent_count=0,
                 tool_call_count=0,
-                token_usage=extract_token_usage([]),
+                token_usage=TokenUsage(),
             ),
         )
         return Failure(
@@ -175,7 +194,7 @@ def build_timeline_tree(
     agents = _build_agent_summaries(trace_events, nodes)
 
     # Compute tree statistics
-    stats = _compute_tree_stats(nodes, agents, transcript_entries)
+    stats = _compute_tree_stats(nodes, agents, [], token_usage=token_usage)
 
     # Build the timeline tree
     tree = TimelineTree(
@@ -194,42 +213,35 @@ def build_timeline_tree(
     return Success(value=enriched_data, warnings=warnings)
 
 
-def _create_tree_node(entry: dict, agent_map: Dict[str, Tuple[str, str]]) -> TreeNode:
+def _create_tree_node(
+    entry: Union[dict, TranscriptRecord], agent_map: Dict[str, Tuple[str, str]]
+) -> TreeNode:
     """Create a TreeNode from a transcript entry.
 
     Args:
-        entry: Raw transcript entry dict
+        entry: Transcript entry dict or its TranscriptRecord
         agent_map: Mapping from tool_use_id to (agent_id, agent_type)
 
     Returns:
         TreeNode with classified type and agent attribution if available
     """
-    node_type = _classify_node_type(entry)
+    record = entry if isinstance(entry, TranscriptRecord) else TranscriptRecord.from_raw(entry)
+    node_type = _classify_node_type(record)
 
     # Get tool information
-    tool_use_id = entry.get("toolUseID")
+    tool_use_id = record.tool_use_id
     tool_name = None
     agent_id = None
     agent_type = None
 
-    # Extract timestamp from entry
-    timestamp = entry.get("timestamp")
-
     # Check if this is a sidechain entry (subagent invocation)
-    is_sidechain = entry.get("isSidechain", False)
-    if is_sidechain:
+    if record.is_sidechain:
         node_type = TimelineNodeType.SIDECHAIN
 
-    # Extract tool name from message content if this is a tool call
-    if node_type == TimelineNodeType.TOOL_CALL:
-        message = entry.get("message", {})
-        content = message.get("content", [])
-        if isinstance(content, list):
-            for block in content:
-                if isinstance(block, dict) and block.get("type") == "tool_use":
-                    tool_name = block.get("name")
-                    tool_use_id = tool_use_id or block.get("id")
-                    break
+    # Tool name from the first tool_use content block if this is a tool call
+    if node_type == TimelineNodeType.TOOL_CALL and record.tool_use is not None:
+        tool_name = record.tool_use[0]
+        tool_use_id = tool_use_id or record.tool_use[1]
 
     # Attribute agent from tool_use_id mapping
     if tool_use_id and tool_use_id in agent_map:
@@ -240,7 +252,7 @@ def _create_tree_node(entry: dict, agent_map: Dict[str, Tuple[str, str]]) -> Tre
         depth=0,  # Will be computed in phase 4
         seq=0,  # Will be computed in phase 4
         node_type=node_type,
-        timestamp=timestamp,
+        timestamp=record.timestamp,
         elapsed_ms=None,  # Will be computed in phase 4
         agent_id=agent_id,
         agent_type=agent_type,
@@ -249,7 +261,7 @@ def _create_tree_node(entry: dict, agent_map: Dict[str, Tuple[str, str]]) -> Tre
     )
 
 
-def _classify_node_type(entry: dict) -> TimelineNodeType:
+def _classify_node_type(entry: Union[dict, TranscriptRecord]) -> TimelineNodeType:
     """Classify the node type based on transcript entry type.
 
     Classification logic from design doc:
@@ -259,35 +271,20 @@ def _classify_node_type(entry: dict) -> TimelineNodeType:
     - type: "user" with tool_result in content -> TOOL_RESULT
 
     Args:
-        entry: Raw transcript entry dict
+        entry: Transcript entry dict or its TranscriptRecord
 
     Returns:
         TimelineNodeType classification
     """
-    entry_type = entry.get("type", "")
-    message = entry.get("message", {})
-    content = message.get("content", [])
-
-    # Check for tool_use or tool_result in content blocks
-    has_tool_use = False
-    has_tool_result = False
-
-    if isinstance(content, list):
-        for block in content:
-            if isinstance(block, dict):
-                block_type = block.get("type", "")
-                if block_type == "tool_use":
-                    has_tool_use = True
-                elif block_type == "tool_result":
-                    has_tool_result = True
+    record = entry if isinstance(entry, TranscriptRecord) else TranscriptRecord.from_raw(entry)
 
     # Classify based on entry type and content
-    if entry_type == "user":
-        if has_tool_result:
+    if record.type == "user":
+        if record.has_tool_result:
             return TimelineNodeType.TOOL_RESULT
         return TimelineNodeType.PROMPT
-    elif entry_type == "assistant":
-        if has_tool_use:
+    elif record.type == "assistant":
+        if record.tool_use is not None:
             return TimelineNodeType.TOOL_CALL
         return TimelineNodeType.RESPONSE
 
@@ -295,7 +292,7 @@ def _classify_node_type(entry: dict) -> TimelineNodeType:
     return TimelineNodeType.RESPONSE
 
 
-def _build_tool_to_agent_map(trace_events: List[dict]) -> Dict[str, Tuple[str, str]]:
+def _build_tool_to_agent_map(trace_events: TraceInput) -> Dict[str, Tuple[str, str]]:
     """Build mapping from tool_use_id to (agent_id, agent_type).
 
     Uses SubagentStart/SubagentStop events to determine which agent context
@@ -304,72 +301,55 @@ def _build_tool_to_agent_map(trace_events: List[dict]) -> Dict[str, Tuple[str, s
     to that agent.
 
     Args:
-        trace_events: List of hook trace event dicts
+        trace_events: Hook trace event dicts or their HookEvent records
 
     Returns:
         Dict mapping tool_use_id to (agent_id, agent_type) tuple
     """
     tool_to_agent: Dict[str, Tuple[str, str]] = {}
 
-    # Track active agents by their agent_id
-    # We'll use a simple approach: track all SubagentStart events and their end times
-    active_agents: Dict[str, Dict[str, Any]] = {}
-
-    # First pass: collect agent lifecycle info
-    agent_starts: Dict[str, Dict[str, Any]] = {}
-    agent_stops: Dict[str, str] = {}  # agent_id -> stop timestamp
-
-    for event in trace_events:
-        event_type = event.get("event", "")
-        agent_id = event.get("agent_id")
-
-        if event_type == "SubagentStart" and agent_id:
-            agent_starts[agent_id] = {
-                "agent_type": event.get("agent_type", "unknown"),
-                "ts": event.get("ts"),
-                "pid": event.get("pid"),
-            }
-        elif event_type == "SubagentStop" and agent_id:
-            agent_stops[agent_id] = event.get("ts", "")
-
-    # Second pass: attribute tool calls to agents
-    # For each tool call, find the most recently started agent that hasn't stopped yet
+    # Track active agents by their agent_id -> agent_type
+    active_agents: Dict[str, str] = {}
+
+    # Attribute each tool call to the most recently started agent that hasn't stopped yet
     current_agent_id: Optional[str] = None
     current_agent_type: Optional[str] = None
 
-    for event in trace_events:
-        event_type = event.get("event", "")
+    for event in hook_events(trace_events):
+        event_type = event.kind
 
         if event_type == "SubagentStart":
-            agent_id = event.get("agent_id")
+            agent_id = event.agent_id
             if agent_id:
                 current_agent_id = agent_id
-                current_agent_type = event.get("agent_type", "unknown")
-                active_agents[agent_id] = {
-                    "agent_type": current_agent_type,
-                }
+                current_agent_type = _agent_type(event)
+                active_agents[agent_id] = current_agent_type
 
         elif event_type == "SubagentStop":
-            agent_id = event.get("agent_id")
+            agent_id = event.agent_id
             if agent_id and agent_id in active_agents:
                 del active_agents[agent_id]
             # Update current agent to any remaining active agent
             if active_agents:
                 # Use the most recently added (last) active agent
-                current_agent_id = list(active_agents.keys())[-1]
-                current_agent_type = active_agents[current_agent_id]["agent_type"]
+                current_agent_id = next(reversed(active_agents))
+                current_agent_type = active_agents[current_agent_id]
             else:
                 current_agent_id = None
                 current_agent_type = None
 
         elif event_type in ("PreToolUse", "PostToolUse"):
-            tool_use_id = event.get("tool_use_id")
+            tool_use_id = event.tool_use_id
             if tool_use_id and current_agent_id:
                 tool_to_agent[tool_use_id] = (current_agent_id, current_agent_type or "unknown")
 
     return tool_to_agent
 
 
+def _agent_type(event: HookEvent) -> str:
+    return "unknown" if event.agent_type is None else event.agent_type
+
+
 def _compute_depths(nodes: Dict[str, TreeNode], root_uuid: str, initial_depth: int) -> None:
     """Iteratively compute depth for all nodes in the tree.
 
@@ -396,7 +376,7 @@ def _compute_depths(nodes: Dict[str, TreeNode], root_uuid: str, initial_depth: i
 
 
 def _compute_seq_and_elapsed(
-    nodes: Dict[str, TreeNode], root_uuid: str, by_uuid: Dict[str, dict]
+    nodes: Dict[str, TreeNode], root_uuid: str, by_uuid: Dict[str, TranscriptRecord]
 ) -> None:
     """Compute depth-first sequence numbers and elapsed_ms for all nodes.
 
@@ -408,19 +388,13 @@ def _compute_seq_and_elapsed(
     Args:
         nodes: Dict mapping UUID to TreeNode
         root_uuid: UUID of the root node to start from
-        by_uuid: Dict mapping UUID to original transcript entry (for timestamp lookup)
+        by_uuid: Dict mapping UUID to the entry's TranscriptRecord (pre-parsed timestamps)
     """
     # Find the earliest timestamp to use as the base
-    base_timestamp: Optional[datetime] = None
-    for uuid, entry in by_uuid.items():
-        ts_str = entry.get("timestamp")
-        if ts_str:
-            try:
-                ts = _parse_timestamp(ts_str)
-                if ts and (base_timestamp is None or ts < base_timestamp):
-                    base_timestamp = ts
-            except (ValueError, TypeError):
-                pass
+    base_ns = min(
+        (record.ts_ns for record in by_uuid.values() if record.ts_ns is not None),
+        default=None,
+    )
 
     # Depth-first traversal to assign seq numbers
     seq_counter = 0
@@ -450,14 +424,9 @@ def _compute_seq_and_elapsed(
         visited.add(uuid)
 
         # Compute elapsed_ms if we have a base timestamp
-        if base_timestamp and node.timestamp:
-            try:
-                node_ts = _parse_timestamp(node.timestamp)
-                if node_ts:
-                    elapsed = node_ts - base_timestamp
-                    node.elapsed_ms = int(elapsed.total_seconds() * 1000)
-            except (ValueError, TypeError):
-                pass
+        record = by_uuid.get(uuid)
+        if base_ns is not None and record is not None and record.ts_ns is not None:
+            node.elapsed_ms = (record.ts_ns - base_ns) // 1_000_000
 
         # Add children to stack in reverse order so they're processed in order
         # (first child will be on top of stack)
@@ -466,50 +435,13 @@ def _compute_seq_and_elapsed(
                 stack.append(child_uuid)
 
 
-def _parse_timestamp(ts_str: str) -> Optional[datetime]:
-    """Parse an ISO timestamp string into a datetime object.
-
-    Handles various ISO formats including those with and without microseconds,
-    and with 'Z' or timezone offsets.
-
-    Args:
-        ts_str: ISO format timestamp string
-
-    Returns:
-        datetime object or None if parsing fails
-    """
-    if not ts_str:
-        return None
-
-    # Try various ISO formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%fZ",  # With microseconds and Z
-        "%Y-%m-%dT%H:%M:%SZ",  # Without microseconds, with Z
-        "%Y-%m-%dT%H:%M:%S.%f",  # With microseconds, no Z
-        "%Y-%m-%dT%H:%M:%S",  # Without microseconds or Z
-    ]
-
-    # Handle timezone offset (e.g., +00:00)
-    ts_str_clean = ts_str
-    if ts_str.endswith("+00:00") or ts_str.endswith("-00:00"):
-        ts_str_clean = ts_str[:-6] + "Z"
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(ts_str_clean, fmt)
-        except ValueError:
-            continue
-
-    return None
-
-
 def _build_agent_summaries(
-    trace_events: List[dict], nodes: Dict[str, TreeNode]
+    trace_events: TraceInput, nodes: Dict[str, TreeNode]
 ) -> Dict[str, AgentSummary]:
     """Build agent summary information from trace events.
 
     Args:
-        trace_events: List of hook trace event dicts
+        trace_events: Hook trace event dicts or their HookEvent records
         nodes: Dict mapping UUID to TreeNode (used for tool count)
 
     Returns:
@@ -518,26 +450,15 @@ def _build_agent_summaries(
     agents: Dict[str, AgentSummary] = {}
 
     # Track agent lifecycle from trace events
-    for event in trace_events:
-        event_type = event.get("event", "")
-        agent_id = event.get("agent_id")
-
-        if not agent_id:
-            continue
-
-        if event_type == "SubagentStart":
-            if agent_id not in agents:
-                agents[agent_id] = AgentSummary(
-                    agent_type=event.get("agent_type", "unknown"),
-                    start_uuid=None,
-                    stop_uuid=None,
-                    tool_count=0,
-                )
-
-        elif event_type == "SubagentStop":
-            if agent_id in agents:
-                # Agent already exists, just update any missing fields
-                pass
+    for event in hook_events(trace_events):
+        agent_id = event.agent_id
+        if agent_id and event.kind == "SubagentStart" and agent_id not in agents:
+            agents[agent_id] = AgentSummary(
+                agent_type=_agent_type(event),
+                start_uuid=None,
+                stop_uuid=None,
+                tool_count=0,
+            )
 
     # Count tool calls per agent from nodes
     tool_counts: Dict[str, int] = {}
@@ -557,6 +478,7 @@ def _compute_tree_stats(
     nodes: Dict[str, TreeNode],
     agents: Dict[str, AgentSummary],
     transcript_entries: List[dict],
+    token_usage: Optional[TokenUsage] = None,
 ) -> TreeStats:
     """Compute summary statistics for the tree.
 
@@ -564,6 +486,7 @@ def _compute_tree_stats(
         nodes: Dict mapping UUID to TreeNode
         agents: Dict mapping agent_id to AgentSummary
         transcript_entries: List of raw transcript entry dicts for token extraction
+        token_usage: Pre-computed token totals (skips transcript_entries)
 
     Returns:
         TreeStats with computed values
@@ -584,7 +507,8 @@ def _compute_tree_stats(
             tool_call_count += 1
 
     # Extract token usage from transcript entries
-    token_usage = extract_token_usage(transcript_entries)
+    if token_usage is None:
+        token_usage = extract_token_usage(transcript_entries)
 
     return TreeStats(
         total_nodes=total_nodes,
@@ -8,6 +8,8 @@ Key concepts:
 - HOME override: Primary isolation mechanism - creates a temp HOME directory
   to hide all user-scoped plugins and settings
 - Marketplace data: Can be optionally copied for plugin installation
+- Template homes: marketplace data is prepared once per content fingerprint
+  and cloned into each test HOME (reflink, hardlink farm, or copy)
 - Transcript path handling: Accounts for HOME-based path transformations
 
 Based on findings from:
@@ -28,11 +30,13 @@ Example usage:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import shutil
 import subprocess
 import tempfile
+import time
 import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -52,6 +56,24 @@ PLUGINS_DIR = "plugins"
 MARKETPLACE_FILES = ["known_marketplaces.json"]
 MARKETPLACE_DIRS = ["marketplaces"]
 
+# Hook trace file for the session; log-hook.py prefers it over --log so
+# concurrent sessions never append to the same trace
+TRACE_PATH_ENV = "SC_TRACE_PATH"
+
+# Prepared marketplace templates live here (same filesystem as temp HOMEs so
+# they can be hardlinked); set to "off" to always copy marketplace data
+TEMPLATE_DIR_ENV = "SC_TEST_HOME_TEMPLATES"
+TEMPLATE_PREFIX = "marketplace-"
+
+# How marketplace trees are cloned from a template: "auto" (reflink, then
+# hardlink, then copy) or "symlink" (read-only overlay for fixtures that
+# never modify marketplaces)
+CLONE_METHOD_ENV = "SC_TEST_HOME_CLONE"
+TEMPLATE_KEEP = 3
+# Templates used (or built) more recently than this are never pruned, since
+# another run may still be cloning them or have HOMEs symlinked into them
+TEMPLATE_GRACE_SECONDS = 24 * 3600
+
 
 # =============================================================================
 # Helper Functions
@@ -129,6 +151,10 @@ def copy_marketplace_data(
 
     dest_plugins.mkdir(parents=True, exist_ok=True)
 
+    template = prepare_marketplace_template(source_home)
+    if template is not None:
+        return clone_marketplace_template(template, isolated_home) is not None
+
     copied_any = False
 
     # Copy marketplace files
@@ -154,6 +180,249 @@ def copy_marketplace_data(
     return copied_any
 
 
+# =============================================================================
+# Template Homes
+# =============================================================================
+
+
+def template_root() -> Path | None:
+    """Directory holding prepared marketplace templates; None when disabled."""
+    override = os.environ.get(TEMPLATE_DIR_ENV)
+    if override is not None:
+        if override.strip().lower() in ("", "0", "off", "none"):
+            return None
+        return Path(override)
+    return Path(tempfile.gettempdir()) / "claude-test-templates"
+
+
+def marketplace_fingerprint(source_home: Path | None = None) -> str | None:
+    """Fingerprint the marketplace data a test HOME would receive.
+
+    Hashes the relative path, size and mtime of every marketplace file
+    (stat only, no reads), so any edit, addition or removal under
+    ~/.claude/plugins yields a new template.
+
+    Returns:
+        Hex digest, or None if there is no marketplace data
+    """
+    source_plugins = (source_home or Path.home()) / CLAUDE_DIR / PLUGINS_DIR
+    digest = hashlib.sha256()
+    found = False
+    for filename in MARKETPLACE_FILES:
+        path = source_plugins / filename
+        if path.is_file():
+            st = path.stat()
+            digest.update(f"{filename}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+            found = True
+    for dirname in MARKETPLACE_DIRS:
+        root = source_plugins / dirname
+        if not root.is_dir():
+            continue
+        found = True
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, source_plugins)
+            digest.update(f"{rel_dir}/\n".encode())
+            for name in sorted(filenames):
+                try:
+                    st = os.lstat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                digest.update(f"{rel_dir}/{name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest() if found else None
+
+
+def prepare_marketplace_template(
+    source_home: Path | None = None,
+    root: Path | None = None,
+) -> Path | None:
+    """Build (once) a template of the marketplace data for cloning.
+
+    The template is a private copy of ~/.claude/plugins marketplace data
+    keyed by marketplace_fingerprint(). Marketplace tree files are made
+    read-only so hardlinked clones cannot modify the template in place;
+    writers in a test HOME must replace files, which the clone's own
+    (writable) directories allow. Each call stamps the template's mtime
+    as its last use, which keeps it from being pruned while in use.
+
+    Args:
+        source_home: Source HOME (default: actual HOME)
+        root: Template directory (default: template_root())
+
+    Returns:
+        Path to the template's plugins directory, or None if templates are
+        disabled or there is no marketplace data
+    """
+    source_home = source_home or Path.home()
+    root = root or template_root()
+    if root is None:
+        return None
+    fingerprint = marketplace_fingerprint(source_home)
+    if fingerprint is None:
+        return None
+
+    template = root / f"{TEMPLATE_PREFIX}{fingerprint[:24]}"
+    if template.is_dir():
+        _touch_template(template)
+        return template
+
+    source_plugins = source_home / CLAUDE_DIR / PLUGINS_DIR
+    staging = root / f".{template.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+    start = time.perf_counter()
+    try:
+        staging.mkdir(parents=True)
+        for filename in MARKETPLACE_FILES:
+            if (source_plugins / filename).is_file():
+                shutil.copy2(source_plugins / filename, staging / filename)
+        for dirname in MARKETPLACE_DIRS:
+            if (source_plugins / dirname).is_dir():
+                shutil.copytree(source_plugins / dirname, staging / dirname, symlinks=True)
+                _make_read_only(staging / dirname)
+        os.rename(staging, template)
+    except OSError as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        if template.is_dir():
+            # Another process built the same template first
+            _touch_template(template)
+            return template
+        logger.warning(f"Failed to prepare marketplace template: {e}")
+        return None
+
+    logger.info(f"Prepared marketplace template {template.name} in {time.perf_counter() - start:.2f}s")
+    _prune_templates(root, keep=template)
+    return template
+
+
+def _make_read_only(root: Path) -> None:
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if not os.path.islink(path):
+                mode = os.stat(path).st_mode
+                os.chmod(path, mode & ~0o222)
+
+
+def _touch_template(template: Path) -> None:
+    """Record a use of the template (its directory mtime) for pruning."""
+    try:
+        os.utime(template)
+    except OSError:
+        pass
+
+
+def _prune_templates(root: Path, keep: Path) -> None:
+    """Remove templates beyond the TEMPLATE_KEEP most recently used.
+
+    Only templates unused for TEMPLATE_GRACE_SECONDS are removed, so a
+    template another run is cloning or has symlinked HOMEs into survives.
+    """
+    templates = []
+    for path in root.glob(f"{TEMPLATE_PREFIX}*"):
+        if path == keep:
+            continue
+        try:
+            if path.is_dir():
+                templates.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    templates.sort(reverse=True)
+    cutoff = time.time() - TEMPLATE_GRACE_SECONDS
+    for mtime, stale in templates[TEMPLATE_KEEP - 1:]:
+        if mtime > cutoff:
+            continue
+        shutil.rmtree(stale, ignore_errors=True)
+        logger.debug(f"Removed stale marketplace template: {stale.name}")
+
+
+def clone_marketplace_template(
+    template: Path,
+    isolated_home: Path,
+    method: str | None = None,
+) -> str | None:
+    """Clone a prepared template into an isolated HOME's plugins directory.
+
+    Marketplace files (known_marketplaces.json) are copied since Claude
+    rewrites them, and the plugins directory itself is always private so
+    installs stay writable. Marketplace trees are cloned with the cheapest
+    method that works: ``cp --reflink=always`` (copy-on-write filesystems),
+    then a hardlink farm (real directories, hardlinked read-only files),
+    then a plain copy (e.g. template on another filesystem). With method
+    "symlink" each tree is instead a symlink into the template.
+
+    Args:
+        template: Template from prepare_marketplace_template()
+        isolated_home: HOME to clone into
+        method: "auto" or "symlink" (default: $SC_TEST_HOME_CLONE or "auto")
+
+    Returns:
+        The method used ("reflink", "hardlink", "copy" or "symlink"), or
+        None if the template held nothing to clone
+    """
+    requested = method or os.environ.get(CLONE_METHOD_ENV, "auto")
+    dest_plugins = isolated_home / CLAUDE_DIR / PLUGINS_DIR
+    dest_plugins.mkdir(parents=True, exist_ok=True)
+    used = None
+
+    for filename in MARKETPLACE_FILES:
+        if (template / filename).is_file():
+            dest_file = dest_plugins / filename
+            shutil.copyfile(template / filename, dest_file)
+            used = used or "copy"
+
+    for dirname in MARKETPLACE_DIRS:
+        source_dir = template / dirname
+        if not source_dir.is_dir():
+            continue
+        dest_dir = dest_plugins / dirname
+        if dest_dir.is_symlink():
+            dest_dir.unlink()
+        elif dest_dir.exists():
+            shutil.rmtree(dest_dir)
+        if requested == "symlink":
+            dest_dir.symlink_to(source_dir, target_is_directory=True)
+            used = "symlink"
+        else:
+            used = _clone_tree(source_dir, dest_dir)
+
+    logger.debug(f"Cloned marketplace template {template.name} via {used}")
+    return used
+
+
+# Template root -> whether ``cp --reflink=always`` works there
+_reflink_support: dict[Path, bool] = {}
+
+
+def _clone_tree(source: Path, dest: Path) -> str:
+    root = source.parent.parent
+    if _reflink_support.get(root, True) and shutil.which("cp"):
+        result = subprocess.run(
+            ["cp", "-R", "--reflink=always", str(source), str(dest)],
+            capture_output=True,
+        )
+        _reflink_support[root] = result.returncode == 0
+        if result.returncode == 0:
+            _make_writable(dest)
+            return "reflink"
+        shutil.rmtree(dest, ignore_errors=True)
+    try:
+        shutil.copytree(source, dest, symlinks=True, copy_function=os.link)
+        return "hardlink"
+    except (OSError, shutil.Error):
+        shutil.rmtree(dest, ignore_errors=True)
+    shutil.copytree(source, dest, symlinks=True)
+    _make_writable(dest)
+    return "copy"
+
+
+def _make_writable(root: Path) -> None:
+    """Restore owner write permission on a private (non-hardlinked) clone."""
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if not os.path.islink(path):
+                os.chmod(path, os.stat(path).st_mode | 0o200)
+
+
 def copy_codex_auth(isolated_home: Path, source_home: Path | None = None) -> bool:
     """Copy Codex auth/config files into isolated HOME."""
     source_home = source_home or Path.home()
@@ -183,6 +452,7 @@ def setup_test_environment(
     project_path: Path,
     copy_marketplace: bool = False,
     source_home: Path | None = None,
+    trace_path: Path | None = None,
 ) -> dict[str, str]:
     """Configure the test environment with HOME override.
 
@@ -194,6 +464,7 @@ def setup_test_environment(
         project_path: Path to the test project (where .claude/ settings are)
         copy_marketplace: Whether to copy marketplace data for plugin install
         source_home: Source HOME to copy marketplace data from
+        trace_path: Trace file hooks should append to (exported as SC_TRACE_PATH)
 
     Returns:
         Dictionary of environment variables to use for subprocess calls
@@ -211,6 +482,12 @@ def setup_test_environment(
     # Ensure project path is absolute
     env["SC_TEST_PROJECT"] = str(project_path.absolute())
 
+    # Route hook events to this session's trace file
+    if trace_path is not None:
+        env[TRACE_PATH_ENV] = str(trace_path)
+    else:
+        env.pop(TRACE_PATH_ENV, None)
+
     # Copy marketplace data if requested
     if copy_marketplace:
         copy_marketplace_data(isolated_home, source_home)
@@ -569,6 +846,7 @@ def isolated_claude_session(
             isolated_home=isolated_home,
             project_path=project_path,
             copy_marketplace=copy_marketplace,
+            trace_path=trace_path,
         )
 
         # Create session object
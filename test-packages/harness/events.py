@@ -0,0 +1,273 @@
+"""
+Normalized event records for hook traces and session transcripts.
+
+Raw trace events and transcript entries are JSON dicts whose timestamps are
+ISO strings. Several harness stages (collector correlation, timeline tree
+enrichment, hook expectations) used to re-read the same fields and re-parse
+the same timestamps. This module turns each raw line into a compact
+``__slots__`` record once, at ingest:
+
+- HookEvent: event type, epoch-ns timestamp and the correlation fields
+  (tool_use_id, tool_name, agent_id, agent_type, ppid, pid)
+- TranscriptRecord: uuid/parentUuid links, the original timestamp string
+  plus its epoch-ns value, and the content classification used for
+  timeline nodes (first tool_use block, tool_result presence, sidechain)
+
+Timestamps are parsed by parse_ts_ns(), which slices the fixed Claude
+layouts (``YYYY-MM-DDTHH:MM:SS[.fraction][Z|+00:00]``) directly and only
+falls back to datetime.fromisoformat() for other offsets. All values are
+UTC nanoseconds since the epoch; ns_to_datetime() gives the naive UTC
+datetime the report models use.
+
+Example usage:
+    from harness.events import HookEvent, parse_ts_ns
+
+    record = HookEvent.from_raw(0, {"event": "PreToolUse", "ts": "2026-01-16T01:26:35.123Z"})
+    record.ts_ns   # 1768526795123000000
+    record.ts      # datetime(2026, 1, 16, 1, 26, 35, 123000)
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_DATE = _EPOCH.date()
+_NS_PER_SECOND = 1_000_000_000
+
+# "YYYY-MM-DD" -> days since the epoch; sessions span very few dates
+_days_cache: dict[str, int] = {}
+_DAYS_CACHE_LIMIT = 4096
+
+
+# =============================================================================
+# Timestamps
+# =============================================================================
+
+
+def parse_ts_ns(value: Any) -> int | None:
+    """Parse an ISO-8601 timestamp into UTC nanoseconds since the epoch.
+
+    Naive timestamps are taken as UTC, like the Claude trace and transcript
+    timestamps they come from. Fractions of up to nine digits are kept.
+
+    Args:
+        value: Timestamp string (anything else yields None)
+
+    Returns:
+        Epoch nanoseconds, or None if the value is empty or unparseable
+    """
+    if not value or not isinstance(value, str):
+        return None
+    n = len(value)
+    if n >= 19 and value[4] == "-" and value[7] == "-" and value[10] in "T " \
+            and value[13] == ":" and value[16] == ":":
+        end = n
+        if value[-1] == "Z":
+            end -= 1
+        elif value.endswith(("+00:00", "-00:00")):
+            end -= 6
+        fraction_ns = 0
+        fast = True
+        if end > 19:
+            digits = value[20:end]
+            if value[19] == "." and 1 <= len(digits) <= 9 and digits.isdigit():
+                fraction_ns = int(digits) * 10 ** (9 - len(digits))
+            else:
+                fast = False
+        clock = value[11:13] + value[14:16] + value[17:19]
+        if fast and end >= 19 and clock.isdigit():
+            hour, minute, second = int(clock[0:2]), int(clock[2:4]), int(clock[4:6])
+            days = _days_since_epoch(value[:10])
+            if days is not None and hour < 24 and minute < 60 and second < 60:
+                seconds = days * 86400 + hour * 3600 + minute * 60 + second
+                return seconds * _NS_PER_SECOND + fraction_ns
+    return _parse_ts_ns_slow(value)
+
+
+def _days_since_epoch(day: str) -> int | None:
+    days = _days_cache.get(day)
+    if days is None:
+        try:
+            days = (date(int(day[0:4]), int(day[5:7]), int(day[8:10])) - _EPOCH_DATE).days
+        except ValueError:
+            return None
+        if len(_days_cache) >= _DAYS_CACHE_LIMIT:
+            _days_cache.clear()
+        _days_cache[day] = days
+    return days
+
+
+def _parse_ts_ns_slow(value: str) -> int | None:
+    """Fallback for layouts outside the fast path (other offsets, dates only)."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return (parsed - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def ns_to_datetime(ts_ns: int | None) -> datetime | None:
+    """Naive UTC datetime for epoch nanoseconds (microsecond precision)."""
+    if ts_ns is None:
+        return None
+    return _EPOCH + timedelta(microseconds=ts_ns // 1000)
+
+
+# =============================================================================
+# Records
+# =============================================================================
+
+
+class HookEvent:
+    """One hook trace event, reduced to the fields the harness correlates on.
+
+    ``seq`` is the 0-based position in the trace, so the full event is
+    ``raw_hook_events[record.seq]``.
+    """
+
+    __slots__ = ("seq", "kind", "ts_ns", "tool_use_id", "tool_name", "agent_id", "agent_type", "ppid", "pid")
+
+    def __init__(
+        self,
+        seq: int,
+        kind: str | None,
+        ts_ns: int | None = None,
+        tool_use_id: str | None = None,
+        tool_name: str | None = None,
+        agent_id: str | None = None,
+        agent_type: str | None = None,
+        ppid: int | None = None,
+        pid: int | None = None,
+    ):
+        self.seq = seq
+        self.kind = kind
+        self.ts_ns = ts_ns
+        self.tool_use_id = tool_use_id
+        self.tool_name = tool_name
+        self.agent_id = agent_id
+        self.agent_type = agent_type
+        self.ppid = ppid
+        self.pid = pid
+
+    @classmethod
+    def from_raw(cls, seq: int, event: dict[str, Any]) -> HookEvent:
+        """Normalize a raw trace event (``event`` or ``hook_event_name`` type)."""
+        get = event.get
+        kind = get("event") or get("hook_event_name")
+        return cls(
+            seq,
+            sys.intern(kind) if isinstance(kind, str) else kind,
+            parse_ts_ns(get("ts")),
+            get("tool_use_id"),
+            get("tool_name"),
+            get("agent_id"),
+            get("agent_type"),
+            get("ppid"),
+            get("pid"),
+        )
+
+    @property
+    def ts(self) -> datetime | None:
+        """Event time as a naive UTC datetime."""
+        return ns_to_datetime(self.ts_ns)
+
+    def __repr__(self) -> str:
+        return f"HookEvent(seq={self.seq}, kind={self.kind!r}, ts_ns={self.ts_ns}, tool_use_id={self.tool_use_id!r})"
+
+
+class TranscriptRecord:
+    """One transcript entry, reduced to tree links, time and classification.
+
+    ``tool_use`` is the (name, id) of the entry's first tool_use content
+    block, if any; ``tool_use_id`` is the entry-level ``toolUseID``.
+    """
+
+    __slots__ = (
+        "type", "uuid", "parent_uuid", "timestamp", "ts_ns",
+        "tool_use_id", "tool_use", "has_tool_result", "is_sidechain",
+    )
+
+    def __init__(
+        self,
+        type: str | None = None,
+        uuid: str | None = None,
+        parent_uuid: str | None = None,
+        timestamp: str | None = None,
+        ts_ns: int | None = None,
+        tool_use_id: str | None = None,
+        tool_use: tuple[str | None, str | None] | None = None,
+        has_tool_result: bool = False,
+        is_sidechain: bool = False,
+    ):
+        self.type = type
+        self.uuid = uuid
+        self.parent_uuid = parent_uuid
+        self.timestamp = timestamp
+        self.ts_ns = ts_ns
+        self.tool_use_id = tool_use_id
+        self.tool_use = tool_use
+        self.has_tool_result = has_tool_result
+        self.is_sidechain = is_sidechain
+
+    @classmethod
+    def from_raw(cls, entry: dict[str, Any]) -> TranscriptRecord:
+        """Normalize a raw transcript entry."""
+        get = entry.get
+        message = get("message")
+        content = message.get("content") if isinstance(message, dict) else None
+        tool_use = None
+        has_tool_result = False
+        if isinstance(content, list):
+            for block in content:
+                if not isinstance(block, dict):
+                    continue
+                block_type = block.get("type")
+                if block_type == "tool_use":
+                    if tool_use is None:
+                        tool_use = (block.get("name"), block.get("id"))
+                elif block_type == "tool_result":
+                    has_tool_result = True
+        uuid = get("uuid")
+        parent_uuid = get("parentUuid")
+        entry_type = get("type")
+        timestamp = get("timestamp")
+        return cls(
+            sys.intern(entry_type) if isinstance(entry_type, str) else entry_type,
+            sys.intern(uuid) if isinstance(uuid, str) else uuid,
+            sys.intern(parent_uuid) if isinstance(parent_uuid, str) else parent_uuid,
+            timestamp,
+            parse_ts_ns(timestamp),
+            get("toolUseID"),
+            tool_use,
+            has_tool_result,
+            bool(get("isSidechain", False)),
+        )
+
+    @property
+    def ts(self) -> datetime | None:
+        """Entry time as a naive UTC datetime."""
+        return ns_to_datetime(self.ts_ns)
+
+    def __repr__(self) -> str:
+        return f"TranscriptRecord(type={self.type!r}, uuid={self.uuid!r}, ts_ns={self.ts_ns})"
+
+
+def hook_events(events: Iterable[dict[str, Any] | HookEvent]) -> list[HookEvent]:
+    """Records for raw hook events; existing records pass through."""
+    return [
+        event if isinstance(event, HookEvent) else HookEvent.from_raw(seq, event)
+        for seq, event in enumerate(events)
+    ]
+
+
+def transcript_records(entries: Iterable[dict[str, Any] | TranscriptRecord]) -> list[TranscriptRecord]:
+    """Records for raw transcript entries; existing records pass through."""
+    return [
+        entry if isinstance(entry, TranscriptRecord) else TranscriptRecord.from_raw(entry)
+        for entry in entries
+    ]
@@ -0,0 +1,296 @@
+"""
+Shared index for evaluating many expectations against one test run.
+
+Evaluating expectations one at a time scans every tool call or hook event
+and rebuilds the text a pattern is matched against once per expectation,
+which is O(E x T) for E expectations over T tool calls. ExpectationIndex is
+built once per test run from CollectedData and shared by all of its
+expectations:
+
+- Tool calls are grouped by tool name, hook event records by event type
+  and agent_id; each group is built on first use
+- The text a regex is matched against (tool search text, tool input JSON,
+  tool output text, filtered Claude responses) is built at most once per
+  item, and decoded hook events are kept for reuse
+- Patterns registered for the same tool, text kind and regex flags are
+  resolved together: one pass over the tool calls, where a combined
+  alternation of the still-unresolved patterns skips texts none of them
+  can match, records each pattern's first matching sequence
+
+Reported sequences are 1-based positions in ``data.tool_calls``, identical
+to a linear scan per expectation.
+
+Example usage:
+    from harness.expectation_index import ExpectationIndex
+
+    index = ExpectationIndex(data)
+    index.register("Bash", "search", re.compile(r"git status"))
+    index.register("Bash", "search", re.compile(r"git diff"))
+    index.first_match("Bash", "search", re.compile(r"git diff"))   # 7, or None
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+from .events import HookEvent
+from .response_filters import OutputFilterConfig, filter_response_texts
+
+if TYPE_CHECKING:
+    from .collector import CollectedData, CorrelatedToolCall
+
+
+# Text kinds a tool call can be matched on
+SEARCH_TEXT = "search"  # tool-specific field (command, file_path, ...)
+INPUT_JSON = "input"  # json.dumps(tool_input)
+OUTPUT_TEXT = "output"  # stdout/stderr/content of tool_response
+
+# HookEvent record fields that equal the same key of the raw event
+HOOK_RECORD_FIELDS = frozenset({"tool_use_id", "tool_name", "agent_id", "agent_type", "ppid", "pid"})
+
+# Patterns that refer to other groups by number or name cannot be joined
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Placeholder for a text that has not been built yet
+_UNBUILT = object()
+
+
+def tool_search_text(tool_call: CorrelatedToolCall) -> str:
+    """Extract searchable text from tool input."""
+    tool_input = tool_call.tool_input
+
+    if tool_call.tool_name == "Bash":
+        return tool_input.get("command", "")
+    elif tool_call.tool_name in ("Read", "Write", "Edit"):
+        return tool_input.get("file_path", "")
+    elif tool_call.tool_name == "Skill":
+        skill = tool_input.get("skill", "")
+        args = tool_input.get("args", "")
+        return f"{skill} {args}"
+    elif tool_call.tool_name in ("Glob", "Grep"):
+        return tool_input.get("pattern", "")
+    else:
+        # Generic: stringify the input
+        return json.dumps(tool_input)
+
+
+def tool_output_text(tool_call: CorrelatedToolCall) -> str:
+    """Extract searchable text from tool output."""
+    if not tool_call.tool_response:
+        return ""
+
+    response = tool_call.tool_response
+    parts = []
+
+    if "stdout" in response:
+        parts.append(str(response["stdout"]))
+    if "stderr" in response:
+        parts.append(str(response["stderr"]))
+    if "content" in response:
+        parts.append(str(response["content"]))
+
+    return "\n".join(parts)
+
+
+def _input_json(tool_call: CorrelatedToolCall) -> str:
+    return json.dumps(tool_call.tool_input)
+
+
+def _output_text_or_none(tool_call: CorrelatedToolCall) -> str | None:
+    return tool_output_text(tool_call) if tool_call.tool_response else None
+
+
+_TEXT_BUILDERS = {
+    SEARCH_TEXT: tool_search_text,
+    INPUT_JSON: _input_json,
+    OUTPUT_TEXT: _output_text_or_none,
+}
+
+
+def combine_patterns(patterns: list[re.Pattern], flags: int) -> re.Pattern | None:
+    """Alternation that matches wherever any of the patterns matches.
+
+    Returns None when the patterns cannot be joined without changing what
+    they match: group references (renumbered by the join), global inline
+    flags such as ``(?x)`` (which would apply to every branch), or names
+    that collide across patterns.
+    """
+    base_flags = re.compile("", flags).flags
+    for pattern in patterns:
+        if pattern.flags != base_flags or _GROUP_REFERENCE.search(pattern.pattern):
+            return None
+    try:
+        return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), flags)
+    except re.error:
+        return None
+
+
+class ExpectationIndex:
+    """Lazily built lookups over one CollectedData, shared by expectations.
+
+    The index assumes the collected data no longer changes once it is
+    queried.
+    """
+
+    def __init__(self, data: CollectedData):
+        self.data = data
+        self._tool_positions: dict[str, list[int]] = {}
+        self._hooks_by_kind: dict[str | None, list[HookEvent]] | None = None
+        self._hooks_by_agent: dict[tuple[str | None, str], list[HookEvent]] | None = None
+        self._decoded_hooks: dict[int, dict[str, Any]] = {}
+        self._texts: dict[str, list[Any]] = {}
+        self._responses: dict[tuple[str, bool], list[str]] = {}
+        # (tool, kind, flags) -> pattern source -> compiled, awaiting a pass
+        self._pending: dict[tuple[str, str, int], dict[str, re.Pattern]] = {}
+        # (tool, kind, flags, pattern source) -> 1-based sequence or None
+        self._first: dict[tuple[str, str, int, str], int | None] = {}
+
+    # -------------------------------------------------------------------------
+    # Tool calls
+    # -------------------------------------------------------------------------
+
+    def tool_positions(self, tool: str) -> list[int]:
+        """0-based positions in data.tool_calls of calls to a tool."""
+        positions = self._tool_positions.get(tool)
+        if positions is None:
+            positions = self._tool_positions[tool] = [
+                position for position, tool_call in enumerate(self.data.tool_calls) if tool_call.tool_name == tool
+            ]
+        return positions
+
+    def text(self, kind: str, position: int) -> str | None:
+        """Cached match text of a tool call; None if it has no such text.
+
+        Output text only exists for calls with a tool_response.
+        """
+        texts = self._text_cache(kind)
+        text = texts[position]
+        if text is _UNBUILT:
+            text = texts[position] = _TEXT_BUILDERS[kind](self.data.tool_calls[position])
+        return text
+
+    def _text_cache(self, kind: str) -> list[Any]:
+        texts = self._texts.get(kind)
+        if texts is None:
+            if kind not in _TEXT_BUILDERS:
+                raise ValueError(f"Unknown text kind: {kind}")
+            texts = self._texts[kind] = [_UNBUILT] * len(self.data.tool_calls)
+        return texts
+
+    def register(self, tool: str, kind: str, pattern: re.Pattern) -> None:
+        """Queue a pattern so it is resolved in the same pass as its group."""
+        key = (tool, kind, pattern.flags, pattern.pattern)
+        if key not in self._first:
+            self._pending.setdefault(key[:3], {})[pattern.pattern] = pattern
+
+    def first_match(self, tool: str, kind: str, pattern: re.Pattern) -> int | None:
+        """1-based sequence of the first call to tool whose text matches."""
+        key = (tool, kind, pattern.flags, pattern.pattern)
+        if key not in self._first:
+            self.register(tool, kind, pattern)
+            self._resolve(key[:3])
+        return self._first[key]
+
+    def _resolve(self, group: tuple[str, str, int]) -> None:
+        tool, kind, flags = group
+        unresolved = self._pending.pop(group, {})
+        candidates, prefilter, single = self._candidates(unresolved, flags)
+        texts = self._text_cache(kind)
+        build = _TEXT_BUILDERS[kind]
+        tool_calls = self.data.tool_calls
+        for position in self.tool_positions(tool) if candidates else ():
+            text = texts[position]
+            if text is _UNBUILT:
+                text = texts[position] = build(tool_calls[position])
+            if text is None or (prefilter is not None and not prefilter.search(text)):
+                continue
+            if single is not None:
+                if not single.search(text):
+                    continue
+                matched = [single.pattern]
+            else:
+                matched = [source for source, compiled in candidates if compiled.search(text)]
+                if not matched:
+                    continue
+            for source in matched:
+                self._first[(tool, kind, flags, source)] = position + 1
+                del unresolved[source]
+            if not unresolved:
+                break
+            candidates, prefilter, single = self._candidates(unresolved, flags)
+        for source in unresolved:
+            self._first[(tool, kind, flags, source)] = None
+
+    @staticmethod
+    def _candidates(
+        unresolved: dict[str, re.Pattern], flags: int
+    ) -> tuple[list[tuple[str, re.Pattern]], re.Pattern | None, re.Pattern | None]:
+        """Patterns still to resolve, their combined prefilter, or the only one."""
+        candidates = list(unresolved.items())
+        if len(candidates) == 1:
+            return candidates, None, candidates[0][1]
+        return candidates, combine_patterns(list(unresolved.values()), flags), None
+
+    # -------------------------------------------------------------------------
+    # Hook events
+    # -------------------------------------------------------------------------
+
+    def hook_events(self, kind: str, agent_id: str | None = None) -> list[HookEvent]:
+        """Hook event records of one type (and agent), in trace order."""
+        if self._hooks_by_kind is None:
+            by_kind: dict[str | None, list[HookEvent]] = {}
+            by_agent: dict[tuple[str | None, str], list[HookEvent]] = {}
+            for record in self.data.hook_event_records():
+                by_kind.setdefault(record.kind, []).append(record)
+                if record.agent_id is not None:
+                    by_agent.setdefault((record.kind, record.agent_id), []).append(record)
+            self._hooks_by_kind = by_kind
+            self._hooks_by_agent = by_agent
+        if agent_id is not None:
+            return self._hooks_by_agent.get((kind, agent_id), [])
+        return self._hooks_by_kind.get(kind, [])
+
+    def hook_candidates(self, kind: str, filters: dict[str, Any]) -> list[HookEvent]:
+        """Records of a type whose record fields equal the plain filter values.
+
+        Only filters on HOOK_RECORD_FIELDS with non-regex values narrow the
+        result; the caller still checks all filters on the decoded event.
+        """
+        agent_id = filters.get("agent_id")
+        if not isinstance(agent_id, str) or agent_id.startswith("regex:"):
+            agent_id = None
+        records = self.hook_events(kind, agent_id)
+        exact = {
+            key: value
+            for key, value in filters.items()
+            if key in HOOK_RECORD_FIELDS and not (isinstance(value, str) and value.startswith("regex:"))
+        }
+        if not exact:
+            return records
+        return [
+            record for record in records
+            if all(getattr(record, key) == value for key, value in exact.items())
+        ]
+
+    def hook_event(self, record: HookEvent) -> dict[str, Any]:
+        """Decoded raw event for a record, cached."""
+        event = self._decoded_hooks.get(record.seq)
+        if event is None:
+            event = self.data.raw_hook_events[record.seq]
+            self._decoded_hooks[record.seq] = event
+        return event
+
+    # -------------------------------------------------------------------------
+    # Claude responses
+    # -------------------------------------------------------------------------
+
+    def response_texts(self, config: OutputFilterConfig) -> list[str]:
+        """Filtered Claude response texts, cached per filter configuration."""
+        key = (config.response_filter, config.exclude_prompt)
+        texts = self._responses.get(key)
+        if texts is None:
+            texts = filter_response_texts(self.data, config)
+            self._responses[key] = texts
+        return texts
@@ -55,9 +55,9 @@ from pydantic import BaseModel, ConfigDict, Field
 from .collector import (
     ClaudeResponseText,
     CollectedData,
-    CorrelatedToolCall,
     SubagentLifecycle,
 )
+from .expectation_index import OUTPUT_TEXT, SEARCH_TEXT, ExpectationIndex
 from .models import (
     Expectation,
     ExpectationMatch,
@@ -65,7 +65,7 @@ from .models import (
     HookEventType,
     TestStatus,
 )
-from .response_filters import OutputFilterConfig, compile_output_pattern, filter_response_texts
+from .response_filters import OutputFilterConfig, compile_output_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -150,17 +150,26 @@ class ExpectationEvaluator(ABC):
         ...
 
     @abstractmethod
-    def evaluate(self, data: CollectedData) -> ExpectationResult:
+    def evaluate(self, data: CollectedData, index: ExpectationIndex | None = None) -> ExpectationResult:
         """Evaluate this expectation against collected data.
 
         Args:
             data: CollectedData from a test session
+            index: ExpectationIndex shared by the run's expectations
+                (default: a private index over data)
 
         Returns:
             ExpectationResult with pass/fail status and details
         """
         ...
 
+    def prepare(self, index: ExpectationIndex) -> None:
+        """Register this expectation's patterns with a shared index.
+
+        Called for every expectation before any is evaluated, so patterns
+        over the same texts are resolved in one pass.
+        """
+
     def _create_pass_result(
         self,
         expected: dict[str, Any],
@@ -253,115 +262,64 @@ class ToolCallExpectation(ExpectationEvaluator):
     def expectation_type(self) -> ExpectationType:
         return ExpectationType.TOOL_CALL
 
-    def evaluate(self, data: CollectedData) -> ExpectationResult:
+    def prepare(self, index: ExpectationIndex) -> None:
+        if self._compiled_pattern:
+            index.register(self.tool, SEARCH_TEXT, self._compiled_pattern)
+            if self.match_output:
+                index.register(self.tool, OUTPUT_TEXT, self._compiled_pattern)
+
+    def evaluate(self, data: CollectedData, index: ExpectationIndex | None = None) -> ExpectationResult:
         """Evaluate against collected tool calls."""
+        index = index or ExpectationIndex(data)
         expected = {"tool": self.tool}
         if self.pattern:
             expected["pattern"] = self.pattern
 
-        # Search through tool calls
-        for idx, tool_call in enumerate(data.tool_calls, 1):
-            if tool_call.tool_name != self.tool:
-                continue
-
-            # Get searchable text from tool input
-            search_text = self._get_search_text(tool_call)
-
-            # If no pattern, any call to this tool matches
-            if not self._compiled_pattern:
-                actual = self._build_actual(tool_call)
-                timestamp = (
-                    tool_call.pre_timestamp or tool_call.post_timestamp or datetime.now()
-                )
-                return self._create_pass_result(expected, actual, idx, timestamp)
-
-            # Try to match the pattern
-            if self._compiled_pattern.search(search_text):
-                actual = self._build_actual(tool_call)
-                timestamp = (
-                    tool_call.pre_timestamp or tool_call.post_timestamp or datetime.now()
-                )
-                return self._create_pass_result(expected, actual, idx, timestamp)
-
-            # Optionally match against output
-            if self.match_output and tool_call.tool_response:
-                output_text = self._get_output_text(tool_call)
-                if self._compiled_pattern.search(output_text):
-                    actual = self._build_actual(tool_call)
-                    timestamp = (
-                        tool_call.post_timestamp
-                        or tool_call.pre_timestamp
-                        or datetime.now()
-                    )
-                    return self._create_pass_result(expected, actual, idx, timestamp)
+        positions = index.tool_positions(self.tool)
+        if not positions:
+            return self._create_fail_result(expected, f"No {self.tool} tool calls found")
 
-        # No match found
-        tool_calls_found = [
-            tc.tool_name for tc in data.tool_calls if tc.tool_name == self.tool
-        ]
-        if tool_calls_found:
-            failure_reason = (
-                f"Found {len(tool_calls_found)} {self.tool} calls but none matched "
-                f"pattern: {self.pattern}"
-            )
+        # If no pattern, any call to this tool matches
+        if not self._compiled_pattern:
+            input_seq, output_seq = positions[0] + 1, None
         else:
-            failure_reason = f"No {self.tool} tool calls found"
+            # First call whose input (or, optionally, output) matches
+            input_seq = index.first_match(self.tool, SEARCH_TEXT, self._compiled_pattern)
+            output_seq = None
+            if self.match_output:
+                output_seq = index.first_match(self.tool, OUTPUT_TEXT, self._compiled_pattern)
+
+        if input_seq is not None and (output_seq is None or input_seq <= output_seq):
+            tool_call = data.tool_calls[input_seq - 1]
+            timestamp = tool_call.pre_timestamp or tool_call.post_timestamp or datetime.now()
+            return self._create_pass_result(
+                expected, self._build_actual(index, input_seq), input_seq, timestamp
+            )
+        if output_seq is not None:
+            tool_call = data.tool_calls[output_seq - 1]
+            timestamp = tool_call.post_timestamp or tool_call.pre_timestamp or datetime.now()
+            return self._create_pass_result(
+                expected, self._build_actual(index, output_seq), output_seq, timestamp
+            )
 
+        # No match found
+        failure_reason = (
+            f"Found {len(positions)} {self.tool} calls but none matched "
+            f"pattern: {self.pattern}"
+        )
         return self._create_fail_result(expected, failure_reason)
 
-    def _get_search_text(self, tool_call: CorrelatedToolCall) -> str:
-        """Extract searchable text from tool input."""
-        tool_input = tool_call.tool_input
-
-        if tool_call.tool_name == "Bash":
-            return tool_input.get("command", "")
-        elif tool_call.tool_name == "Read":
-            return tool_input.get("file_path", "")
-        elif tool_call.tool_name == "Write":
-            return tool_input.get("file_path", "")
-        elif tool_call.tool_name == "Edit":
-            return tool_input.get("file_path", "")
-        elif tool_call.tool_name == "Skill":
-            skill = tool_input.get("skill", "")
-            args = tool_input.get("args", "")
-            return f"{skill} {args}"
-        elif tool_call.tool_name == "Glob":
-            return tool_input.get("pattern", "")
-        elif tool_call.tool_name == "Grep":
-            return tool_input.get("pattern", "")
-        else:
-            # Generic: stringify the input
-            import json
-
-            return json.dumps(tool_input)
-
-    def _get_output_text(self, tool_call: CorrelatedToolCall) -> str:
-        """Extract searchable text from tool output."""
-        if not tool_call.tool_response:
-            return ""
-
-        response = tool_call.tool_response
-        parts = []
-
-        if "stdout" in response:
-            parts.append(str(response["stdout"]))
-        if "stderr" in response:
-            parts.append(str(response["stderr"]))
-        if "content" in response:
-            parts.append(str(response["content"]))
-
-        return "\n".join(parts)
-
-    def _build_actual(self, tool_call: CorrelatedToolCall) -> dict[str, Any]:
+    def _build_actual(self, index: ExpectationIndex, sequence: int) -> dict[str, Any]:
         """Build actual data for the result."""
+        tool_call = index.data.tool_calls[sequence - 1]
         actual = {
             "tool": tool_call.tool_name,
-            "command": self._get_search_text(tool_call),
+            "command": index.text(SEARCH_TEXT, sequence - 1),
         }
 
         # Add output preview
         if tool_call.tool_response:
-            output = self._get_output_text(tool_call)
+            output = index.text(OUTPUT_TEXT, sequence - 1)
             actual["output_preview"] = output[:200] + "..." if len(output) > 200 else output
 
         return actual
@@ -417,35 +375,29 @@ class HookEventExpectation(ExpectationEvaluator):
     def expectation_type(self) -> ExpectationType:
         return ExpectationType.HOOK_EVENT
 
-    def evaluate(self, data: CollectedData) -> ExpectationResult:
+    def evaluate(self, data: CollectedData, index: ExpectationIndex | None = None) -> ExpectationResult:
         """Evaluate against raw hook events."""
+        index = index or ExpectationIndex(data)
         expected = {"event": self.event.value}
         if self.filters:
             expected["filters"] = self.filters
 
-        # Search through raw hook events
-        for idx, event in enumerate(data.raw_hook_events, 1):
-            event_type = event.get("event") or event.get("hook_event_name")
-
-            if event_type != self.event.value:
-                continue
+        # Search indexed records; only candidates whose record fields match
+        # the plain filters are decoded
+        matching_events = index.hook_events(self.event.value)
+        for record in index.hook_candidates(self.event.value, self.filters):
+            event = index.hook_event(record)
 
             # Check filters
             if self._matches_filters(event):
                 actual = {
-                    "event": event_type,
+                    "event": record.kind,
                     **{k: event.get(k) for k in self.filters.keys() if k in event},
                 }
-                timestamp = self._parse_timestamp(event.get("ts"))
-                return self._create_pass_result(expected, actual, idx, timestamp)
+                timestamp = record.ts or datetime.now()
+                return self._create_pass_result(expected, actual, record.seq + 1, timestamp)
 
         # No match found
-        matching_events = [
-            e
-            for e in data.raw_hook_events
-            if (e.get("event") or e.get("hook_event_name")) == self.event.value
-        ]
-
         if matching_events:
             failure_reason = (
                 f"Found {len(matching_events)} {self.event.value} events but "
@@ -471,16 +423,6 @@ class HookEventExpectation(ExpectationEvaluator):
 
         return True
 
-    def _parse_timestamp(self, ts_str: str | None) -> datetime:
-        """Parse timestamp string or return current time."""
-        if not ts_str:
-            return datetime.now()
-
-        try:
-            return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-        except ValueError:
-            return datetime.now()
-
 
 # =============================================================================
 # Subagent Event Expectation
@@ -536,7 +478,7 @@ class SubagentEventExpectation(ExpectationEvaluator):
     def expectation_type(self) -> ExpectationType:
         return ExpectationType.SUBAGENT_EVENT
 
-    def evaluate(self, data: CollectedData) -> ExpectationResult:
+    def evaluate(self, data: CollectedData, index: ExpectationIndex | None = None) -> ExpectationResult:
         """Evaluate against collected subagent data."""
         expected: dict[str, Any] = {"event": self.event}
         if self.agent_id:
@@ -655,8 +597,9 @@ class OutputContainsExpectation(ExpectationEvaluator):
     def expectation_type(self) -> ExpectationType:
         return ExpectationType.OUTPUT_CONTAINS
 
-    def evaluate(self, data: CollectedData) -> ExpectationResult:
+    def evaluate(self, data: CollectedData, index: ExpectationIndex | None = None) -> ExpectationResult:
         """Evaluate against Claude's responses."""
+        index = index or ExpectationIndex(data)
         expected = {"pattern": self.pattern}
         if self.flags:
             expected["flags"] = self.flags
@@ -672,7 +615,7 @@ class OutputContainsExpectation(ExpectationEvaluator):
             response_filter=self.response_filter,
             exclude_prompt=self.exclude_prompt,
         )
-        response_texts = filter_response_texts(data, filter_config)
+        response_texts = index.response_texts(filter_config)
         for idx, text in enumerate(response_texts, 1):
             match = self._compiled_pattern.search(text)
             if match:
@@ -739,9 +682,12 @@ class NotExpectation(ExpectationEvaluator):
     def expectation_type(self) -> ExpectationType:
         return self.inner.expectation_type
 
-    def evaluate(self, data: CollectedData) -> ExpectationResult:
+    def prepare(self, index: ExpectationIndex) -> None:
+        self.inner.prepare(index)
+
+    def evaluate(self, data: CollectedData, index: ExpectationIndex | None = None) -> ExpectationResult:
         """Evaluate by negating the inner expectation's result."""
-        inner_result = self.inner.evaluate(data)
+        inner_result = self.inner.evaluate(data, index)
 
         if inner_result.status == TestStatus.PASS:
             # Inner passed, so negation fails
@@ -782,9 +728,17 @@ def evaluate_expectations(
     """
     results = []
 
+    # One index per run; patterns over the same texts are resolved together
+    index = ExpectationIndex(data)
+    for expectation in expectations:
+        try:
+            expectation.prepare(index)
+        except Exception as e:
+            logger.debug(f"Could not prepare expectation {expectation.id}: {e}")
+
     for expectation in expectations:
         try:
-            result = expectation.evaluate(data)
+            result = expectation.evaluate(data, index)
             results.append(result)
             logger.debug(
                 f"Expectation {result.id}: {result.status.value} - {result.description}"
@@ -912,7 +866,7 @@ class NoWarningsExpectation(ExpectationEvaluator):
     def expectation_type(self) -> ExpectationType:
         return ExpectationType.HOOK_EVENT  # Using HOOK_EVENT as closest match
 
-    def evaluate(self, data: CollectedData) -> ExpectationResult:
+    def evaluate(self, data: CollectedData, index: ExpectationIndex | None = None) -> ExpectationResult:
         """Evaluate log analysis for warnings and errors.
 
         This expectation checks the `log_analysis` attribute on CollectedData.
@@ -921,6 +875,7 @@ class NoWarningsExpectation(ExpectationEvaluator):
 
         Args:
             data: CollectedData from a test session
+            index: Unused; log analysis is not indexed
 
         Returns:
             ExpectationResult indicating pass/fail based on log analysis
@@ -3,6 +3,7 @@ HTML Report Builder Assets.
 
 This module provides CSS and JavaScript assets for the HTML Report Builder.
 All styles and scripts are extracted from the reference implementation.
+Reports inline them by default; see shared.py for linking them instead.
 """
 
 from .styles import (
@@ -30,10 +31,19 @@ from .scripts import (
     JS_TOGGLE_FUNCTIONS,
     JS_MARKDOWN_RENDERER,
     JS_ASSESSMENT_LOADER,
+    JS_LAZY_TIMELINE,
     JS_INITIALIZATION,
     get_all_scripts,
 )
 
+from .shared import (
+    SHARED_ASSETS_DIR,
+    SHARED_ASSETS_ENV,
+    shared_asset_urls,
+    shared_assets_enabled,
+    write_shared_assets,
+)
+
 
 class AssetManager:
     """
@@ -107,8 +117,15 @@ __all__ = [
     "JS_TOGGLE_FUNCTIONS",
     "JS_MARKDOWN_RENDERER",
     "JS_ASSESSMENT_LOADER",
+    "JS_LAZY_TIMELINE",
     "JS_INITIALIZATION",
     "get_all_scripts",
+    # Shared asset files
+    "SHARED_ASSETS_DIR",
+    "SHARED_ASSETS_ENV",
+    "shared_asset_urls",
+    "shared_assets_enabled",
+    "write_shared_assets",
     # Manager class
     "AssetManager",
 ]
@@ -184,7 +184,9 @@ source: ${reportPath}#timeline-item-${item.dataset.seq}`;
 }
 
 // Copy entire timeline
-function copyTimeline(timelineId) {
+async function copyTimeline(timelineId) {
+  const btn = event.target.closest('.copy-icon-btn');
+  await loadTimeline(timelineId);
   const timeline = document.getElementById(timelineId);
   const items = timeline.querySelectorAll('.timeline-item');
 
@@ -214,7 +216,7 @@ function copyTimeline(timelineId) {
 source: ${reportPath}#${timelineId}`;
 
   navigator.clipboard.writeText(normalizeWhitespace(markdown)).then(() => {
-    showCopyFeedback(event.target.closest('.copy-icon-btn'));
+    showCopyFeedback(btn);
   });
 }
 
@@ -471,6 +473,32 @@ document.addEventListener('DOMContentLoaded', function() {
 });
 """
 
+# Lazy timelines - large timelines are embedded gzip-compressed and rendered when opened
+JS_LAZY_TIMELINE = """// Render a lazy timeline from its compressed payload (once)
+const timelineLoads = new Map();
+
+function loadTimeline(timelineId) {
+  const payload = document.getElementById(`${timelineId}-data`);
+  if (!payload) return Promise.resolve();
+  if (!timelineLoads.has(timelineId)) {
+    const bytes = Uint8Array.from(atob(payload.textContent.trim()), c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    timelineLoads.set(timelineId, new Response(stream).json().then(data => {
+      document.getElementById(timelineId).innerHTML = data.html;
+      payload.remove();
+      const saved = sessionStorage.getItem('timelineAgentFilter');
+      if (saved) filterByAgent(saved);
+    }));
+  }
+  return timelineLoads.get(timelineId);
+}
+
+document.querySelectorAll('details[data-lazy-timeline]').forEach(details => {
+  details.addEventListener('toggle', () => {
+    if (details.open) loadTimeline(details.dataset.lazyTimeline);
+  });
+});"""
+
 # Initialization - DOMContentLoaded setup, no-content prevention
 JS_INITIALIZATION = """// Prevent toggle buttons with no content from doing anything
 document.querySelectorAll('.expectation-toggle.no-content').forEach(btn => {
@@ -504,6 +532,7 @@ def get_all_scripts() -> str:
         JS_MARKDOWN_RENDERER,
         JS_ASSESSMENT_LOADER,
         JS_TIMELINE_TREE,
+        JS_LAZY_TIMELINE,
         JS_INITIALIZATION,
     ]
     return "\n\n".join(sections)
@@ -0,0 +1,74 @@
+"""
+Shared CSS and JavaScript files for report directories.
+
+By default every report inlines the full stylesheet and scripts. With
+shared assets a report links them instead, and they are written once per
+report directory:
+
+    <reports>/report-assets/report-<hash>.css
+    <reports>/report-assets/report-<hash>.js
+
+File names carry a hash of their content, so reports written by different
+harness versions into one directory each keep the assets they were built
+with, and a browser never serves a stale cached copy.
+
+Environment:
+  SC_REPORT_SHARED_ASSETS  "1"/"on" to link shared assets from reports
+                           written by write_html_report (default: inline)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import uuid
+from functools import lru_cache
+from pathlib import Path
+
+from .scripts import get_all_scripts
+from .styles import get_all_css
+
+SHARED_ASSETS_ENV = "SC_REPORT_SHARED_ASSETS"
+SHARED_ASSETS_DIR = "report-assets"
+
+
+def shared_assets_enabled() -> bool:
+    """Whether SC_REPORT_SHARED_ASSETS asks for shared assets."""
+    value = os.environ.get(SHARED_ASSETS_ENV, "")
+    return value.strip().lower() in ("1", "on", "true", "yes")
+
+
+@lru_cache(maxsize=1)
+def _shared_assets() -> dict[str, str]:
+    """Relative path -> content of the stylesheet and script."""
+    assets = {}
+    for suffix, content in (("css", get_all_css()), ("js", get_all_scripts())):
+        digest = hashlib.sha256(content.encode()).hexdigest()[:12]
+        assets[f"{SHARED_ASSETS_DIR}/report-{digest}.{suffix}"] = content
+    return assets
+
+
+def shared_asset_urls() -> tuple[str, str]:
+    """Paths of the stylesheet and script relative to the report directory."""
+    css_url, js_url = _shared_assets()
+    return css_url, js_url
+
+
+def write_shared_assets(report_dir: Path) -> tuple[str, str]:
+    """Write the stylesheet and script into a report directory if missing.
+
+    Returns:
+        Their paths relative to report_dir (see shared_asset_urls)
+    """
+    for relative, content in _shared_assets().items():
+        path = Path(report_dir) / relative
+        if path.exists():
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.parent / f".{path.name}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            staging.write_text(content, encoding="utf-8")
+            os.replace(staging, path)
+        finally:
+            staging.unlink(missing_ok=True)
+    return shared_asset_urls()
@@ -106,7 +106,41 @@ CSS_HEADER = """.fixture-header {
 .fixture-meta-value a.file-link .link-icon {
   font-size: 0.8em;
   opacity: 0.7;
-}"""
+}
+
+/* Phase timing tables (header percentiles, per-test debug timings) */
+.phase-stats {
+  margin: 16px 0 0 0;
+  border: none;
+  font-size: 0.85rem;
+}
+.phase-stats summary,
+.phase-stats[open] summary {
+  display: list-item;
+  padding: 0;
+  background: none;
+  border: none;
+  color: #94a3b8;
+  font-weight: 500;
+}
+.phase-stats-table {
+  margin-top: 8px;
+  border-collapse: collapse;
+}
+.phase-stats-table th,
+.phase-stats-table td {
+  padding: 2px 12px 2px 0;
+  text-align: right;
+}
+.phase-stats-table th {
+  color: #94a3b8;
+  font-weight: 500;
+}
+.phase-stats-table th:first-child,
+.phase-stats-table td:first-child { text-align: left; }
+.phase-stats-table .phase-depth-1 td:first-child { padding-left: 16px; }
+.phase-stats-table .phase-depth-2 td:first-child { padding-left: 32px; }
+.phase-stats-table .phase-depth-3 td:first-child { padding-left: 48px; }"""
 
 # Tab navigation styles
 CSS_TABS = """.tabs-container {
@@ -187,7 +221,8 @@ CSS_STATUS_BANNER = """.status-banner {
   text-align: right;
   color: var(--text-muted);
 }
-.status-meta .duration { font-size: 1.1rem; font-weight: 600; color: var(--text); }"""
+.status-meta .duration { font-size: 1.1rem; font-weight: 600; color: var(--text); }
+.status-meta .cached { font-style: italic; }"""
 
 # Token display styles for status banner
 CSS_TOKEN_DISPLAY = """.token-section {
@@ -986,6 +1021,10 @@ CSS_PLUGIN_VERIFICATION = """.plugin-verification-section {
 .plugin-item.fail .plugin-result {
   color: var(--fail);
 }
+.plugin-snapshot {
+  font-size: 0.8rem;
+  color: var(--text-muted);
+}
 .plugin-output {
   width: 100%;
   margin-top: 8px;
@@ -3,7 +3,8 @@ Main HTML Report Builder orchestrator.
 
 This module provides the HTMLReportBuilder class that orchestrates all
 component builders to generate a complete, self-contained HTML report
-from a FixtureReport model.
+from a FixtureReport model. write() streams the document to a file tab
+by tab, so only one test's HTML is held in memory at a time.
 
 The design follows the Builder pattern as specified in the design document,
 with modular component builders that transform Pydantic models into HTML.
@@ -13,8 +14,11 @@ from __future__ import annotations
 
 from datetime import datetime
 import json
+import os
+from pathlib import Path
 import re
-from typing import TYPE_CHECKING
+import uuid
+from typing import TYPE_CHECKING, Iterator
 
 from .models import (
     BuilderConfig,
@@ -41,7 +45,7 @@ from .components import (
     TabsBuilder,
     TestCaseBuilder,
 )
-from .assets import get_all_css, get_all_scripts
+from .assets import get_all_css, get_all_scripts, shared_asset_urls, write_shared_assets
 
 if TYPE_CHECKING:
     from ..models import (
@@ -78,6 +82,9 @@ class HTMLReportBuilder:
 
         with open("report.html", "w") as f:
             f.write(html)
+
+        # Or stream it, linking CSS/JS shared by the reports of a directory
+        HTMLReportBuilder(BuilderConfig(shared_assets=True)).write(report, "reports/fixture.html")
     """
 
     def __init__(self, config: BuilderConfig | None = None):
@@ -101,45 +108,86 @@ class HTMLReportBuilder:
 
         Returns:
             Complete HTML document as string
+
+        With config.shared_assets the document links the shared CSS/JS;
+        write() (or write_shared_assets) puts them next to the report.
         """
-        from ..models import TestStatus
+        return "".join(self._iter_document(report))
+
+    def write(self, report: "FixtureReport", output_path: Path | str) -> Path:
+        """Stream an HTML report to a file, one tab at a time.
+
+        The document is written to a temporary file and renamed into
+        place, so a reader never sees a partial report. With
+        config.shared_assets the CSS/JS are written once per directory.
+
+        Args:
+            report: FixtureReport Pydantic model
+            output_path: Path of the HTML file
+
+        Returns:
+            Path to the written file
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.config.shared_assets:
+            write_shared_assets(output_path.parent)
+
+        staging = output_path.parent / f".{output_path.name}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            with open(staging, "w", encoding="utf-8") as f:
+                for chunk in self._iter_document(report):
+                    f.write(chunk)
+            os.replace(staging, output_path)
+        finally:
+            staging.unlink(missing_ok=True)
+        return output_path
+
+    def _iter_document(self, report: "FixtureReport") -> Iterator[str]:
+        """Yield the HTML document in chunks, rendering one tab per chunk."""
+        from html import escape
 
-        # Transform report data to display models
-        header_data = self._transform_header(report)
+        header_html = self.header_builder.build(self._transform_header(report))
         tab_data = self._transform_tabs(report)
-        test_case_data = [
-            self._transform_test_case(test, i)
-            for i, test in enumerate(report.tests, 1)
-        ]
 
-        # Build components
-        header_html = self.header_builder.build(header_data)
-        tabs_header_html = self.tabs_builder.build(tab_data)
+        if self.config.shared_assets:
+            css_url, js_url = shared_asset_urls()
+            style_html = f'<link rel="stylesheet" href="{css_url}">'
+            script_html = f'<script src="{js_url}"></script>'
+        else:
+            style_html = f"<style>\n{get_all_css()}\n  </style>"
+            script_html = f"<script>\n{get_all_scripts()}\n  </script>"
 
-        # Build tab contents
-        tab_contents = []
-        for i, (tab, test_data) in enumerate(zip(tab_data, test_case_data)):
-            content_html = self.test_case_builder.build(test_data)
-            wrapped = self.tabs_builder.build_tab_content_wrapper(
+        yield f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Test Report: {escape(report.fixture.fixture_name)} Test Suite</title>
+  {style_html}
+</head>
+<body>
+  {header_html}
+
+  '''
+        yield self.tabs_builder.build_container_start()
+        yield self.tabs_builder.build(tab_data)
+
+        for i, (tab, test) in enumerate(zip(tab_data, report.tests), 1):
+            content_html = self.test_case_builder.build(self._transform_test_case(test, i))
+            yield "\n" if i > 1 else ""
+            yield self.tabs_builder.build_tab_content_wrapper(
                 tab.tab_id,
                 content_html,
                 is_active=tab.is_active
             )
-            tab_contents.append(wrapped)
-
-        # Get assets
-        css = get_all_css()
-        js = get_all_scripts()
-
-        # Assemble final document
-        return self._assemble_document(
-            fixture_name=report.fixture.fixture_name,
-            css=css,
-            header_html=header_html,
-            tabs_header_html=tabs_header_html,
-            tab_contents=tab_contents,
-            js=js
-        )
+
+        yield self.tabs_builder.build_container_end()
+        yield f'''
+
+  {script_html}
+</body>
+</html>'''
 
     def _transform_header(self, report: "FixtureReport") -> HeaderDisplayModel:
         """Transform FixtureReport to HeaderDisplayModel.
@@ -175,6 +223,7 @@ class HTMLReportBuilder:
             summary_text=summary_text,
             generated_at=fixture.generated_at,
             report_path=fixture.report_path,
+            phase_stats=fixture.phase_stats,
         )
 
     def _transform_tabs(self, report: "FixtureReport") -> list[TabDisplayModel]:
@@ -244,6 +293,7 @@ class HTMLReportBuilder:
             total_count=total_count,
             duration_seconds=test.duration_ms / 1000.0,
             timestamp=test.timestamp,
+            cached=test.cached,
             **token_kwargs,
         )
 
@@ -319,6 +369,8 @@ class HTMLReportBuilder:
             trace_file=test.debug.raw_trace_file,
             side_effects_text=side_effects_text,
             has_side_effects=has_effects,
+            phases=test.phases,
+            profile=test.profile,
         )
 
         # Build assessment data (placeholder for lazy-loading)
@@ -378,6 +430,8 @@ class HTMLReportBuilder:
                 stdout=r.stdout,
                 stderr=r.stderr,
                 return_code=r.return_code,
+                snapshot=r.snapshot,
+                snapshot_hit=r.snapshot_hit,
             )
             for r in pv.install_results
         ]
@@ -413,7 +467,7 @@ class HTMLReportBuilder:
             )
 
         log_analysis = test.log_analysis
-        raw_context = self._format_log_context(log_analysis.raw_content)
+        raw_context = self._format_log_context(log_analysis.read_raw_content())
 
         # Transform log entries to display models
         issues = []
@@ -605,53 +659,3 @@ class HTMLReportBuilder:
             entries=entries,
             tool_call_count=tool_call_count,
         )
-
-    def _assemble_document(
-        self,
-        fixture_name: str,
-        css: str,
-        header_html: str,
-        tabs_header_html: str,
-        tab_contents: list[str],
-        js: str,
-    ) -> str:
-        """Assemble the final HTML document.
-
-        Args:
-            fixture_name: Name for the title
-            css: Complete CSS styles
-            header_html: Fixture header HTML
-            tabs_header_html: Tabs navigation HTML
-            tab_contents: List of tab content HTML
-            js: Complete JavaScript code
-
-        Returns:
-            Complete HTML document
-        """
-        from html import escape
-
-        tabs_container = self.tabs_builder.build_container_start()
-        tabs_container += tabs_header_html
-        tabs_container += "\n".join(tab_contents)
-        tabs_container += self.tabs_builder.build_container_end()
-
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Test Report: {escape(fixture_name)} Test Suite</title>
-  <style>
-{css}
-  </style>
-</head>
-<body>
-  {header_html}
-
-  {tabs_container}
-
-  <script>
-{js}
-  </script>
-</body>
-</html>'''
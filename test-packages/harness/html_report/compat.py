@@ -16,6 +16,7 @@ import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .assets import shared_assets_enabled
 from .builder import HTMLReportBuilder
 from .models import BuilderConfig
 
@@ -70,27 +71,25 @@ class HTMLReportGenerator:
 def write_html_report(
     report: "FixtureReport",
     output_path: Path | str,
+    config: BuilderConfig | None = None,
 ) -> Path:
     """Write a fixture report to HTML file.
 
     This function provides backward compatibility with the old write_html_report
-    function from harness.reporter. It uses HTMLReportBuilder internally.
+    function from harness.reporter. It streams the report with
+    HTMLReportBuilder.write().
 
     Args:
         report: FixtureReport to convert to HTML
         output_path: Path for output file
+        config: Builder configuration (default: shared assets when
+            SC_REPORT_SHARED_ASSETS is set)
 
     Returns:
         Path to written file
     """
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    builder = HTMLReportBuilder()
-    html_content = builder.build(report)
-
-    with open(output_path, "w") as f:
-        f.write(html_content)
+    config = config or BuilderConfig(shared_assets=shared_assets_enabled())
+    output_path = HTMLReportBuilder(config).write(report, output_path)
 
     logger.info(f"Wrote HTML report to: {output_path}")
     return output_path
@@ -191,3 +191,10 @@ class FileLinkBuilder:
             f'<a href="{url}" class="file-link {editor_type}" '
             f'title="Open in {editor_name}">{escape(text)}{cls.LINK_ICON}</a>'
         )
+
+
+def format_ms(ms: float) -> str:
+    """Milliseconds below one second, seconds with one decimal above."""
+    if ms < 1000:
+        return f"{ms:.0f} ms"
+    return f"{ms / 1000:.1f} s"
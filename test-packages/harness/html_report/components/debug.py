@@ -2,11 +2,11 @@
 Debug information section component builder.
 
 Builds the collapsible debug section showing pytest output, test metadata,
-side effects, and trace file links.
+side effects, phase timings, and trace file links.
 """
 
 from ..models import DebugDisplayModel
-from .base import BaseBuilder, CopyButtonBuilder, FileLinkBuilder
+from .base import BaseBuilder, CopyButtonBuilder, FileLinkBuilder, format_ms
 
 
 class DebugBuilder(BaseBuilder[DebugDisplayModel]):
@@ -17,6 +17,7 @@ class DebugBuilder(BaseBuilder[DebugDisplayModel]):
     - Pytest output
     - Test metadata table
     - Side effects summary
+    - Phase timings and profile hotspots (when recorded)
     - Raw trace file link
     """
 
@@ -77,6 +78,8 @@ class DebugBuilder(BaseBuilder[DebugDisplayModel]):
         side_effects_html = f'''<h3>Side Effects</h3>
     <p style="color: {side_effects_color};">{self.escape(data.side_effects_text)}</p>'''
 
+        timing_html = self._build_timing(data)
+
         # Build trace file section
         trace_html = ""
         if data.trace_file:
@@ -100,6 +103,42 @@ class DebugBuilder(BaseBuilder[DebugDisplayModel]):
 
     {side_effects_html}
 
+    {timing_html}
+
     {trace_html}
   </div>
 </details>'''
+
+    def _build_timing(self, data: DebugDisplayModel) -> str:
+        """Phase timings table and profile hotspots ("" when not recorded)."""
+        html = ""
+        if data.phases:
+            with_memory = any(p.peak_memory_kb is not None for p in data.phases)
+            memory_th = "<th>Peak memory</th>" if with_memory else ""
+            rows = []
+            for p in data.phases:
+                memory_td = ""
+                if with_memory:
+                    memory = f"{p.peak_memory_kb:,} KB" if p.peak_memory_kb is not None else ""
+                    memory_td = f"<td>{memory}</td>"
+                rows.append(
+                    f'<tr class="phase-depth-{min(p.depth, 3)}"><td>{self.escape(p.name.rsplit("/", 1)[-1])}</td>'
+                    f'<td>{format_ms(p.start_ms)}</td><td>{format_ms(p.duration_ms)}</td>{memory_td}</tr>'
+                )
+            html += f'''<h3>Phase Timings</h3>
+    <table class="phase-stats-table">
+      <tr><th>Phase</th><th>Start</th><th>Duration</th>{memory_th}</tr>
+      {"".join(rows)}
+    </table>'''
+        if data.profile:
+            rows = "".join(
+                f'<tr><td><code>{self.escape(h.function)}</code></td><td>{h.calls}</td>'
+                f'<td>{format_ms(h.total_ms)}</td><td>{format_ms(h.cumulative_ms)}</td></tr>'
+                for h in data.profile
+            )
+            html += f'''<h3>Profile Hotspots</h3>
+    <table class="phase-stats-table">
+      <tr><th>Function</th><th>Calls</th><th>Own</th><th>Cumulative</th></tr>
+      {rows}
+    </table>'''
+        return html
@@ -8,7 +8,7 @@ containing fixture metadata, file links, and summary statistics.
 from pathlib import Path
 
 from ..models import HeaderDisplayModel, BuilderConfig
-from .base import BaseBuilder, FileLinkBuilder
+from .base import BaseBuilder, FileLinkBuilder, format_ms
 
 
 class HeaderBuilder(BaseBuilder[HeaderDisplayModel]):
@@ -22,6 +22,7 @@ class HeaderBuilder(BaseBuilder[HeaderDisplayModel]):
     - Test count and summary
     - Generation timestamp
     - Report path with file link
+    - Per-phase timing percentiles across the tests that ran (collapsible)
     """
 
     def build(self, data: HeaderDisplayModel) -> str:
@@ -69,6 +70,8 @@ class HeaderBuilder(BaseBuilder[HeaderDisplayModel]):
         # Format timestamp
         formatted_time = data.generated_at.strftime("%Y-%m-%d %H:%M:%S")
 
+        phase_stats_html = self._build_phase_stats(data)
+
         return f'''<div class="fixture-header">
   <h1>{self.escape(data.fixture_name)} Test Suite</h1>
   <div class="fixture-meta">
@@ -96,5 +99,30 @@ class HeaderBuilder(BaseBuilder[HeaderDisplayModel]):
       <span class="fixture-meta-label">Report Path</span>
       <span class="fixture-meta-value" style="font-family: monospace; font-size: 0.8rem;">{report_link_html}</span>
     </div>
-  </div>
+  </div>{phase_stats_html}
 </div>'''
+
+    def _build_phase_stats(self, data: HeaderDisplayModel) -> str:
+        """Collapsible table of phase duration percentiles ("" without timings)."""
+        if not data.phase_stats:
+            return ""
+        runs = max((s.count for s in data.phase_stats if s.depth == 0), default=0)
+        rows = "\n".join(
+            f'''      <tr class="phase-depth-{min(s.depth, 3)}">
+        <td>{self.escape(s.name.rsplit("/", 1)[-1])}</td>
+        <td>{s.count}</td>
+        <td>{format_ms(s.p50_ms)}</td>
+        <td>{format_ms(s.p90_ms)}</td>
+        <td>{format_ms(s.max_ms)}</td>
+        <td>{format_ms(s.total_ms)}</td>
+      </tr>'''
+            for s in data.phase_stats
+        )
+        return f'''
+  <details class="phase-stats">
+    <summary>Phase timings ({runs} test runs)</summary>
+    <table class="phase-stats-table">
+      <tr><th>Phase</th><th>Runs</th><th>p50</th><th>p90</th><th>Max</th><th>Total</th></tr>
+{rows}
+    </table>
+  </details>'''
@@ -65,10 +65,15 @@ class PluginVerificationBuilder(BaseBuilder[PluginVerificationDisplayModel]):
         <pre>{output_content}</pre>
       </details>'''
 
+            snapshot_html = ""
+            if result.snapshot_text:
+                snapshot_html = f'<span class="plugin-snapshot">({result.snapshot_text})</span>'
+
             plugin_items_html.append(f'''<div class="plugin-item {result.status_class}">
       <span class="plugin-status">{result.status_icon}</span>
       <span class="plugin-name">{self.escape(result.plugin_name)}</span>
       <span class="plugin-result">{"Installed" if result.success else "Failed"}</span>
+      {snapshot_html}
       {output_html}
     </div>''')
 
@@ -16,7 +16,7 @@ class StatusBannerBuilder(BaseBuilder[StatusBannerDisplayModel]):
     - Large status label (PASS, FAIL, PARTIAL, SKIPPED)
     - Expectations passed summary (e.g., "4 of 7 expectations passed")
     - Test duration in seconds
-    - Test execution timestamp
+    - Test execution timestamp (of the original run for cached results)
     - Token usage (if available)
     """
 
@@ -52,6 +52,10 @@ class StatusBannerBuilder(BaseBuilder[StatusBannerDisplayModel]):
     </details>
   </div>'''
 
+        cached_html = ""
+        if data.cached:
+            cached_html = '\n    <div class="cached">cached result</div>'
+
         return f'''<div class="status-banner {status_display.css_class}">
   <div class="status-badge">
     <span>{status_display.label}</span>
@@ -59,6 +63,6 @@ class StatusBannerBuilder(BaseBuilder[StatusBannerDisplayModel]):
   </div>
   <div class="status-meta">
     <div class="duration">{data.formatted_duration}</div>
-    <div>{data.formatted_timestamp}</div>{token_html}
+    <div>{data.formatted_timestamp}</div>{cached_html}{token_html}
   </div>
 </div>'''
@@ -8,6 +8,8 @@ prompts, tool calls, and responses during test execution.
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import base64
+import gzip
 import json
 import re
 
@@ -57,6 +59,10 @@ class TimelineBuilder(BaseBuilder[TimelineDisplayModel]):
     - Elapsed time and sequence numbers
     - Content previews with copy buttons
     - Collapsible subagent sections grouping tool calls by agent
+
+    Timelines longer than config.lazy_timeline_entries are embedded as a
+    gzip-compressed JSON payload that the browser renders when the section
+    is first opened (see JS_LAZY_TIMELINE).
     """
 
     def build(self, data: TimelineDisplayModel) -> str:
@@ -80,7 +86,15 @@ class TimelineBuilder(BaseBuilder[TimelineDisplayModel]):
         # Build timeline items with subagent grouping
         items_html = self._build_timeline_with_subagent_groups(data.entries)
 
-        return f'''<details>
+        lazy_attr = ""
+        payload_html = ""
+        threshold = self.config.lazy_timeline_entries
+        if threshold is not None and len(data.entries) > threshold:
+            lazy_attr = f' data-lazy-timeline="{data.timeline_id}"'
+            payload_html = self._build_lazy_payload(data.timeline_id, items_html)
+            items_html = ""
+
+        return f'''<details{lazy_attr}>
   <summary>
     <span class="summary-text">Timeline ({data.tool_call_count} tool calls)</span>
     {copy_btn}
@@ -88,10 +102,19 @@ class TimelineBuilder(BaseBuilder[TimelineDisplayModel]):
   <div class="content">
     <div class="timeline" id="{data.timeline_id}">
       {items_html}
-    </div>
+    </div>{payload_html}
   </div>
 </details>'''
 
+    def _build_lazy_payload(self, timeline_id: str, items_html: str) -> str:
+        """Embed rendered timeline items as base64 gzip-compressed JSON."""
+        payload = gzip.compress(
+            json.dumps({"html": items_html}).encode("utf-8"), compresslevel=6, mtime=0
+        )
+        encoded = base64.b64encode(payload).decode("ascii")
+        return f'''
+    <script type="application/json" id="{timeline_id}-data" data-encoding="gzip+base64">{encoded}</script>'''
+
     def _build_timeline_with_subagent_groups(
         self,
         entries: List[TimelineItemDisplayModel]
@@ -14,7 +14,7 @@ from urllib.parse import quote
 
 from pydantic import BaseModel, Field, computed_field
 
-from ..models import TestStatus, TimelineEntryType
+from ..models import PhaseStats, PhaseTiming, ProfileHotspot, TestStatus, TimelineEntryType
 
 
 class BuilderConfig(BaseModel):
@@ -55,6 +55,19 @@ class BuilderConfig(BaseModel):
         default=True,
         description="Show sequence numbers in timeline"
     )
+    lazy_timeline_entries: int | None = Field(
+        default=200,
+        description=(
+            "Timelines with more entries are embedded gzip-compressed and "
+            "rendered when opened (None: always render inline)"
+        )
+    )
+
+    # Assets
+    shared_assets: bool = Field(
+        default=False,
+        description="Link CSS/JS written once per report directory instead of inlining them"
+    )
 
     # Assessment
     enable_lazy_loading: bool = Field(
@@ -204,6 +217,7 @@ class HeaderDisplayModel(BaseModel):
     summary_text: str
     generated_at: datetime
     report_path: str
+    phase_stats: list[PhaseStats] = Field(default_factory=list)
 
 
 class StatusBannerDisplayModel(BaseModel):
@@ -214,6 +228,7 @@ class StatusBannerDisplayModel(BaseModel):
     total_count: int
     duration_seconds: float
     timestamp: datetime
+    cached: bool = False
 
     # Token usage fields (populated from timeline_tree.stats.token_usage if available)
     token_input: int = 0
@@ -423,6 +438,8 @@ class PluginInstallResultDisplayModel(BaseModel):
     stdout: str = ""
     stderr: str = ""
     return_code: int = 0
+    snapshot: str | None = None
+    snapshot_hit: bool | None = None
 
     @computed_field
     @property
@@ -430,6 +447,14 @@ class PluginInstallResultDisplayModel(BaseModel):
         """CSS class for the status indicator."""
         return "pass" if self.success else "fail"
 
+    @computed_field
+    @property
+    def snapshot_text(self) -> str:
+        """Plugin snapshot cache outcome, empty when installed without one."""
+        if self.snapshot_hit is None:
+            return ""
+        return "snapshot hit" if self.snapshot_hit else "snapshot miss"
+
     @computed_field
     @property
     def status_icon(self) -> str:
@@ -476,6 +501,8 @@ class DebugDisplayModel(BaseModel):
     trace_file: str | None = None
     side_effects_text: str = "No files were created, modified, or deleted."
     has_side_effects: bool = False
+    phases: list[PhaseTiming] = Field(default_factory=list)
+    profile: list[ProfileHotspot] = Field(default_factory=list)
 
 
 class LogIssueDisplayModel(BaseModel):
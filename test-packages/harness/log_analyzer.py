@@ -10,6 +10,17 @@ Key Design Principles:
 - Explicit override only: Tests can disable with allow_warnings: true
 - Full reporting: Complete all reporting before failing
 
+Log directories (``.claude/state/logs``) keep growing across tests, so
+they are analyzed as streams: snapshot_log_offsets() records each file's
+size when a test starts, and analyze_log_dirs() reads only what was
+written after that, line by line. Every line is classified by a single
+precompiled dispatch regex covering all supported formats. File content
+is not kept in memory; the result records the analyzed byte ranges and
+read_raw_content() reads them back when a report needs the raw log.
+Compressed ``.gz`` logs are read decompressed, and their recorded size
+cannot be mapped to a decompressed position: an unchanged ``.gz`` file is
+skipped and a changed one is read from the start.
+
 Example usage:
     from harness.log_analyzer import analyze_logs, LogAnalysisResult
 
@@ -18,19 +29,28 @@ Example usage:
     if result.has_issues:
         print(f"Found {len(result.warnings)} warnings and {len(result.errors)} errors")
 
+    # Analyze only what a test appended to its log directories
+    offsets = snapshot_log_offsets(log_dirs)
+    ...  # run the test
+    result = analyze_log_dirs(log_dirs, offsets)
+
     # Analyze pytest captured output
     result = analyze_captured_output(captured)
 """
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
+
+from .events import ns_to_datetime, parse_ts_ns
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
@@ -56,7 +76,9 @@ class LogEntry:
         logger_name: Name of the logger that produced this entry
         timestamp: Optional timestamp when the log was produced
         line_number: Line number in the log content where this entry was found
+            (for log files: counted from the first analyzed byte)
         raw_line: The original raw log line
+        source: Log file the entry was read from, if any
     """
 
     level: LogLevel
@@ -65,6 +87,41 @@ class LogEntry:
     timestamp: datetime | None = None
     line_number: int = 0
     raw_line: str = ""
+    source: str = ""
+
+
+def open_maybe_gzip(path: str | Path) -> BinaryIO:
+    """Open a file for binary reading, decompressing ``.gz`` files."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+@dataclass
+class LogRegion:
+    """Byte range of a log file that was analyzed.
+
+    Offsets of ``.gz`` files are positions in the decompressed content.
+
+    Attributes:
+        path: Log file path
+        start: Offset of the first analyzed byte
+        end: Offset after the last analyzed byte
+    """
+
+    path: str
+    start: int
+    end: int
+
+    def read(self) -> str:
+        """Read the region back; a note if the file is gone or shrank."""
+        try:
+            with open_maybe_gzip(self.path) as f:
+                f.seek(self.start)
+                data = f.read(self.end - self.start)
+        except OSError:
+            return f"[log file no longer available: {self.path}]"
+        return data.decode("utf-8", errors="replace")
 
 
 @dataclass
@@ -75,13 +132,22 @@ class LogAnalysisResult:
         warnings: List of WARNING level log entries
         errors: List of ERROR and CRITICAL level log entries
         all_entries: All parsed log entries (for debugging)
-        raw_content: The original log content analyzed
+        raw_content: The original log content analyzed (in-memory text only)
+        regions: Log file ranges analyzed; see read_raw_content()
     """
 
     warnings: list[LogEntry] = field(default_factory=list)
     errors: list[LogEntry] = field(default_factory=list)
     all_entries: list[LogEntry] = field(default_factory=list)
     raw_content: str = ""
+    regions: list[LogRegion] = field(default_factory=list)
+
+    def read_raw_content(self) -> str:
+        """All analyzed content: raw_content plus the log file regions."""
+        parts = [self.raw_content] if self.raw_content else []
+        for region in self.regions:
+            parts.append(f"=== {region.path} ===\n{region.read()}")
+        return "\n".join(parts)
 
     @property
     def has_issues(self) -> bool:
@@ -120,47 +186,36 @@ class LogAnalysisResult:
 # Common log format patterns
 # Standard Python logging format: LEVEL:logger:message or LEVEL - logger - message
 # Also handles pytest logging format and timestamped formats
-
-# Pattern for standard logging: "2024-01-01 12:00:00,123 - logger - LEVEL - message"
-_TIMESTAMPED_LOG_PATTERN = re.compile(
-    r"^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*[-:]\s*"
-    r"(\w+(?:\.\w+)*)\s*[-:]\s*"
-    r"(DEBUG|INFO|WARNING|ERROR|CRITICAL)\s*[-:]\s*"
-    r"(.*)$",
-    re.MULTILINE,
-)
-
-# Pattern for simple logging: "LEVEL:logger:message" or "LEVEL - logger - message"
-_SIMPLE_LOG_PATTERN = re.compile(
-    r"^(DEBUG|INFO|WARNING|ERROR|CRITICAL)\s*[-:]\s*"
-    r"(\w+(?:\.\w+)*)\s*[-:]\s*"
-    r"(.*)$",
-    re.MULTILINE,
-)
-
-# Pattern for pytest-style: "WARNING module:function:line message"
-_PYTEST_LOG_PATTERN = re.compile(
-    r"^(WARNING|ERROR|CRITICAL)\s+"
-    r"(\w+(?:\.\w+)*):(\w+):(\d+)\s+"
-    r"(.*)$",
-    re.MULTILINE,
-)
-
-# Pattern for bare level prefix: "WARNING: message" or "ERROR: message"
-_BARE_LEVEL_PATTERN = re.compile(
-    r"^(WARNING|ERROR|CRITICAL):\s*(.*)$",
-    re.MULTILINE,
+_LEVELS = r"DEBUG|INFO|WARNING|ERROR|CRITICAL"
+_LOGGER = r"\w+(?:\.\w+)*"
+
+# One alternation, tried in order, for every supported line format; the
+# outer group that matched names the format (match.lastgroup)
+_LOG_LINE_PATTERN = re.compile(
+    # Timestamped: "2024-01-01 12:00:00,123 - logger - LEVEL - message"
+    r"(?P<timestamped>"
+    r"(?P<ts>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*[-:]\s*"
+    rf"(?P<ts_logger>{_LOGGER})\s*[-:]\s*"
+    rf"(?P<ts_level>{_LEVELS})\s*[-:]\s*"
+    r"(?P<ts_message>.*)$)"
+    # Simple: "LEVEL:logger:message" or "LEVEL - logger - message"
+    rf"|(?P<simple>(?P<simple_level>{_LEVELS})\s*[-:]\s*"
+    rf"(?P<simple_logger>{_LOGGER})\s*[-:]\s*"
+    r"(?P<simple_message>.*)$)"
+    # Pytest-style: "WARNING module:function:line message"
+    r"|(?P<pytest>(?P<pytest_level>WARNING|ERROR|CRITICAL)\s+"
+    rf"(?P<pytest_logger>{_LOGGER}:\w+:\d+)\s+"
+    r"(?P<pytest_message>.*)$)"
+    # Bare level prefix: "WARNING: message" or "ERROR: message"
+    r"|(?P<bare>(?P<bare_level>WARNING|ERROR|CRITICAL):\s*(?P<bare_message>.*)$)"
 )
 
 
 def _parse_timestamp(ts_str: str) -> datetime | None:
     """Parse a timestamp string to datetime."""
-    try:
-        # Handle both comma and dot for milliseconds
-        ts_str = ts_str.replace(",", ".")
-        return datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S.%f")
-    except ValueError:
-        return None
+    # Handle both comma and dot for milliseconds
+    date_part, time_part = ts_str.replace(",", ".").split(None, 1)
+    return ns_to_datetime(parse_ts_ns(f"{date_part} {time_part.strip()}"))
 
 
 def _parse_log_line(line: str, line_number: int) -> LogEntry | None:
@@ -177,55 +232,49 @@ def _parse_log_line(line: str, line_number: int) -> LogEntry | None:
     if not line:
         return None
 
-    # Try timestamped format first (most specific)
-    match = _TIMESTAMPED_LOG_PATTERN.match(line)
-    if match:
-        ts_str, logger_name, level_str, message = match.groups()
+    match = _LOG_LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    kind = match.lastgroup
+    if kind == "timestamped":
         return LogEntry(
-            level=LogLevel(level_str),
-            message=message.strip(),
-            logger_name=logger_name,
-            timestamp=_parse_timestamp(ts_str),
+            level=LogLevel(match.group("ts_level")),
+            message=match.group("ts_message").strip(),
+            logger_name=match.group("ts_logger"),
+            timestamp=_parse_timestamp(match.group("ts")),
             line_number=line_number,
             raw_line=line,
         )
+    return LogEntry(
+        level=LogLevel(match.group(f"{kind}_level")),
+        message=match.group(f"{kind}_message").strip(),
+        logger_name=match.group(f"{kind}_logger") if kind != "bare" else "",
+        line_number=line_number,
+        raw_line=line,
+    )
 
-    # Try simple format
-    match = _SIMPLE_LOG_PATTERN.match(line)
-    if match:
-        level_str, logger_name, message = match.groups()
-        return LogEntry(
-            level=LogLevel(level_str),
-            message=message.strip(),
-            logger_name=logger_name,
-            line_number=line_number,
-            raw_line=line,
-        )
 
-    # Try pytest format
-    match = _PYTEST_LOG_PATTERN.match(line)
-    if match:
-        level_str, module, func, lineno, message = match.groups()
-        return LogEntry(
-            level=LogLevel(level_str),
-            message=message.strip(),
-            logger_name=f"{module}:{func}:{lineno}",
-            line_number=line_number,
-            raw_line=line,
-        )
+def _add_entry(result: LogAnalysisResult, entry: LogEntry) -> None:
+    """Record a parsed entry, downgrading "ERROR ... WARNING:" lines."""
+    result.all_entries.append(entry)
 
-    # Try bare level format
-    match = _BARE_LEVEL_PATTERN.match(line)
-    if match:
-        level_str, message = match.groups()
-        return LogEntry(
-            level=LogLevel(level_str),
-            message=message.strip(),
-            line_number=line_number,
-            raw_line=line,
+    if entry.level in (LogLevel.ERROR, LogLevel.CRITICAL) and entry.message.startswith("WARNING:"):
+        downgraded = LogEntry(
+            level=LogLevel.WARNING,
+            message=entry.message.removeprefix("WARNING:").strip(),
+            logger_name=entry.logger_name,
+            timestamp=entry.timestamp,
+            line_number=entry.line_number,
+            raw_line=entry.raw_line,
+            source=entry.source,
         )
+        result.warnings.append(downgraded)
+        return
 
-    return None
+    if entry.level == LogLevel.WARNING:
+        result.warnings.append(entry)
+    elif entry.level in (LogLevel.ERROR, LogLevel.CRITICAL):
+        result.errors.append(entry)
 
 
 def analyze_logs(log_content: str) -> LogAnalysisResult:
@@ -249,49 +298,125 @@ def analyze_logs(log_content: str) -> LogAnalysisResult:
     if not log_content:
         return result
 
-    lines = log_content.split("\n")
-    for line_number, line in enumerate(lines, start=1):
+    for line_number, line in enumerate(log_content.split("\n"), start=1):
         entry = _parse_log_line(line, line_number)
-        if entry is None:
-            continue
+        if entry is not None:
+            _add_entry(result, entry)
 
-        result.all_entries.append(entry)
+    return result
 
-        if entry.level in (LogLevel.ERROR, LogLevel.CRITICAL) and entry.message.startswith("WARNING:"):
-            downgraded = LogEntry(
-                level=LogLevel.WARNING,
-                message=entry.message.removeprefix("WARNING:").strip(),
-                logger_name=entry.logger_name,
-                timestamp=entry.timestamp,
-                line_number=entry.line_number,
-                raw_line=entry.raw_line,
-            )
-            result.warnings.append(downgraded)
-            continue
 
-        if entry.level == LogLevel.WARNING:
-            result.warnings.append(entry)
-        elif entry.level in (LogLevel.ERROR, LogLevel.CRITICAL):
-            result.errors.append(entry)
+# =============================================================================
+# Log directories
+# =============================================================================
 
-    return result
+# Log file path -> (inode, size on disk) when the test started
+LogOffsets = dict[str, tuple[int, int]]
 
 
-def collect_log_content(log_dirs: Iterable[Path]) -> str:
-    """Collect raw log content from one or more log directories."""
-    chunks: list[str] = []
+def iter_log_files(log_dirs: Iterable[Path]) -> Iterator[Path]:
+    """Files under the given log directories, in sorted order per directory."""
     for log_dir in log_dirs:
         if not log_dir or not log_dir.exists():
             continue
         for log_path in sorted(log_dir.rglob("*")):
-            if not log_path.is_file():
-                continue
-            try:
-                content = log_path.read_text(errors="replace")
-            except OSError:
+            if log_path.is_file():
+                yield log_path
+
+
+def snapshot_log_offsets(log_dirs: Iterable[Path]) -> LogOffsets:
+    """Record the current end of every log file (call when a test starts)."""
+    offsets: LogOffsets = {}
+    for log_path in iter_log_files(log_dirs):
+        try:
+            st = log_path.stat()
+        except OSError:
+            continue
+        offsets[str(log_path)] = (st.st_ino, st.st_size)
+    return offsets
+
+
+def _start_offset(log_path: Path, st: os.stat_result, offsets: LogOffsets | None) -> int | None:
+    """Where new content begins; 0 for new, replaced or truncated files.
+
+    Returns None when nothing was written since the offsets. A grown ``.gz``
+    file is read from the start, since its recorded (compressed) size is
+    not a position in the decompressed content.
+    """
+    recorded = (offsets or {}).get(str(log_path))
+    if recorded is None:
+        return 0
+    inode, size = recorded
+    if inode != st.st_ino or size > st.st_size:
+        return 0
+    if size == st.st_size:
+        return None
+    return 0 if str(log_path).endswith(".gz") else size
+
+
+def analyze_log_dirs(
+    log_dirs: Iterable[Path],
+    offsets: LogOffsets | None = None,
+) -> LogAnalysisResult:
+    """Stream log files line by line and analyze what was written since offsets.
+
+    Files missing from offsets (or replaced or truncated since) are read
+    from the start. Content is not retained; the analyzed byte ranges are
+    recorded in ``regions`` for read_raw_content().
+
+    Args:
+        log_dirs: Log directories to scan recursively
+        offsets: snapshot_log_offsets() taken when the test started
+            (default: analyze every file completely)
+
+    Returns:
+        LogAnalysisResult with entries tagged by source file
+    """
+    result = LogAnalysisResult()
+    for log_path in iter_log_files(log_dirs):
+        source = str(log_path)
+        try:
+            st = log_path.stat()
+            start = _start_offset(log_path, st, offsets)
+            if start is None or st.st_size == 0:
                 continue
-            if not content:
+            with open_maybe_gzip(log_path) as f:
+                f.seek(start)
+                for line_number, raw in enumerate(f, start=1):
+                    entry = _parse_log_line(raw.decode("utf-8", errors="replace"), line_number)
+                    if entry is not None:
+                        entry.source = source
+                        _add_entry(result, entry)
+                end = f.tell()
+        except OSError:
+            continue
+        if end > start:
+            result.regions.append(LogRegion(path=source, start=start, end=end))
+    return result
+
+
+def collect_log_content(log_dirs: Iterable[Path], offsets: LogOffsets | None = None) -> str:
+    """Collect raw log content from one or more log directories.
+
+    Prefer analyze_log_dirs(), which does not hold the content in memory.
+
+    Args:
+        log_dirs: Log directories to scan recursively
+        offsets: Only include content written after these offsets
+    """
+    chunks: list[str] = []
+    for log_path in iter_log_files(log_dirs):
+        try:
+            st = log_path.stat()
+            start = _start_offset(log_path, st, offsets)
+            if start is None:
                 continue
+            with open_maybe_gzip(log_path) as f:
+                f.seek(start)
+                content = f.read().decode("utf-8", errors="replace")
+        except OSError:
+            continue
+        if content:
             chunks.append(f"=== {log_path} ===\n{content}")
     return "\n".join(chunks)
 
@@ -368,6 +493,7 @@ def merge_log_analysis(results: Iterable[LogAnalysisResult]) -> LogAnalysisResul
         merged.warnings.extend(result.warnings)
         merged.errors.extend(result.errors)
         merged.all_entries.extend(result.all_entries)
+        merged.regions.extend(result.regions)
         if result.raw_content:
             raw_parts.append(result.raw_content)
     merged.raw_content = "\n".join(raw_parts)
@@ -433,4 +559,5 @@ def filter_allowed_warnings(
         errors=result.errors,  # Errors are never filtered
         all_entries=result.all_entries,
         raw_content=result.raw_content,
+        regions=result.regions,
     )
@@ -107,6 +107,44 @@ class HookEventType(str, Enum):
     PERMISSION_REQUEST = "PermissionRequest"
 
 
+# =============================================================================
+# Timing (see harness.timing)
+# =============================================================================
+
+
+class PhaseTiming(BaseModel):
+    """Wall time of one phase of a test run."""
+
+    name: str = Field(description="Phase path, nested phases joined by '/' (e.g. 'evaluate/expectations')")
+    depth: int = Field(ge=0, description="Nesting depth (0 = top-level phase)")
+    start_ms: float = Field(ge=0, description="Start offset from the beginning of the run")
+    duration_ms: float = Field(ge=0, description="Phase duration in milliseconds")
+    peak_memory_kb: int | None = Field(
+        default=None, description="Peak traced memory during the phase (memory profiling only)"
+    )
+
+
+class ProfileHotspot(BaseModel):
+    """One function of a cProfile run (cpu profiling only)."""
+
+    function: str = Field(description="file:line(function)")
+    calls: int = Field(ge=0, description="Number of calls")
+    total_ms: float = Field(ge=0, description="Time spent in the function itself")
+    cumulative_ms: float = Field(ge=0, description="Time including callees")
+
+
+class PhaseStats(BaseModel):
+    """Distribution of one phase's duration across a fixture's test runs."""
+
+    name: str = Field(description="Phase path")
+    depth: int = Field(ge=0, description="Nesting depth")
+    count: int = Field(ge=0, description="Test runs that recorded the phase")
+    p50_ms: float = Field(ge=0, description="Median duration")
+    p90_ms: float = Field(ge=0, description="90th percentile duration")
+    max_ms: float = Field(ge=0, description="Longest duration")
+    total_ms: float = Field(ge=0, description="Sum over all runs")
+
+
 # =============================================================================
 # Sub-models for Fixture
 # =============================================================================
@@ -139,6 +177,12 @@ class FixtureMeta(BaseModel):
     generated_at: datetime = Field(description="When the report was generated")
     summary: FixtureSummary = Field(description="Summary statistics")
     tags: list[str] = Field(default_factory=list, description="Tags for filtering")
+    phase_stats: list[PhaseStats] = Field(
+        default_factory=list, description="Per-phase durations across the tests that ran"
+    )
+    phases: list[PhaseTiming] = Field(
+        default_factory=list, description="Fixture-level phases (running tests, rendering reports)"
+    )
 
 
 # =============================================================================
@@ -465,6 +509,12 @@ class PluginInstallResult(BaseModel):
     stdout: str = Field(default="", description="Standard output from install command")
     stderr: str = Field(default="", description="Standard error from install command")
     return_code: int = Field(default=0, description="Return code from install command")
+    snapshot: str | None = Field(
+        default=None, description="Key of the plugin snapshot the install was materialized from"
+    )
+    snapshot_hit: bool | None = Field(
+        default=None, description="Whether the snapshot was reused (None when installed without one)"
+    )
 
 
 class PluginVerification(BaseModel):
@@ -542,6 +592,16 @@ class TestResult(BaseModel):
     skip_reason: str | None = Field(
         default=None, description="Reason for skipping (if skipped)"
     )
+    cached: bool = Field(
+        default=False,
+        description="Reused from the result cache instead of run (--changed-only)",
+    )
+    phases: list[PhaseTiming] = Field(
+        default_factory=list, description="Per-phase timings of the run"
+    )
+    profile: list[ProfileHotspot] = Field(
+        default_factory=list, description="Slowest functions of the run (--profile cpu)"
+    )
 
     # Sections
     metadata: TestMetadata = Field(description="Test metadata")
@@ -0,0 +1,531 @@
+"""
+Content-addressed plugin snapshots for harness tests.
+
+Installing a fixture's plugins with ``tools/sc-install.py`` costs one Python
+subprocess per plugin per test, although every test of a fixture installs
+the same packages. This module installs a package set once into a private
+``.claude`` tree (the snapshot) and materializes that tree into each test
+project:
+
+- Snapshots are keyed by the ordered package set, a content hash of every
+  file in each package, and a hash of the sc-install sources (plus
+  version.yaml, which sc-install falls back to for registry versions), so
+  editing a package or the installer always yields a new snapshot.
+- Snapshots are built with ``--no-expand``; files that carry the
+  ``{{REPO_NAME}}`` token of a package declaring
+  ``variables.REPO_NAME.auto: git-repo-basename`` are recorded and are the
+  only files rewritten per project (with the project's git basename, as
+  sc-install would).
+- All other files are hardlinked into the project (read-only, so writers
+  must replace rather than modify them) or copied when hardlinks are not
+  possible. ``.claude/agents/registry.yaml`` is merged into an existing
+  project registry the way sc-install merges it.
+- Materializing holds a per-project lock (a thread lock plus an advisory
+  ``flock`` on a lock file in the snapshot directory) and replaces each
+  file via a temporary file, so concurrent installs into one project
+  neither lose registry entries nor see a file missing.
+
+Environment:
+  SC_PLUGIN_SNAPSHOTS  Snapshot directory, or "off" to run sc-install per
+                       test (default: $TMPDIR/claude-plugin-snapshots)
+
+Example usage:
+    from harness.plugin_snapshots import install_plugin_snapshot
+
+    install = install_plugin_snapshot(["sc-startup"], project_path, sc_path)
+    print(install.summary)   # "snapshot hit 3f2a... (hardlink, 12 files, 1 expanded)"
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+SNAPSHOT_DIR_ENV = "SC_PLUGIN_SNAPSHOTS"
+SNAPSHOT_PREFIX = "snapshot-"
+SNAPSHOT_KEEP = 8
+SNAPSHOT_METADATA = "snapshot.json"
+CLAUDE_DIR = ".claude"
+REGISTRY_FILE = "agents/registry.yaml"
+REPO_NAME_TOKEN = "{{REPO_NAME}}"
+LOCK_PREFIX = ".materialize-"
+
+# Files whose content changes what sc-install writes
+SC_INSTALL_SOURCES = ("tools/sc-install.py", "src/sc_cli/install.py", "version.yaml")
+
+INSTALL_TIMEOUT_SECONDS = 60
+
+
+class PluginSnapshotError(Exception):
+    """sc-install failed while building a snapshot."""
+
+    def __init__(self, package: str, return_code: int, stdout: str, stderr: str):
+        self.package = package
+        self.return_code = return_code
+        self.stdout = stdout
+        self.stderr = stderr
+        super().__init__(f"sc-install failed for {package} (return code {return_code})")
+
+
+@dataclass
+class SnapshotInstall:
+    """Outcome of installing a package set from a snapshot."""
+
+    packages: list[str]
+    key: str
+    cache_hit: bool
+    method: str
+    files: int
+    expanded: int
+    duration_ms: float
+    install_output: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def summary(self) -> str:
+        """One-line description for logs and the report."""
+        state = "hit" if self.cache_hit else "miss"
+        return (
+            f"snapshot {state} {self.key[:12]} "
+            f"({self.method}, {self.files} files, {self.expanded} expanded)"
+        )
+
+
+# =============================================================================
+# Keys
+# =============================================================================
+
+
+def snapshot_root() -> Path | None:
+    """Directory holding plugin snapshots; None when disabled."""
+    override = os.environ.get(SNAPSHOT_DIR_ENV)
+    if override is not None:
+        if override.strip().lower() in ("", "0", "off", "none"):
+            return None
+        return Path(override)
+    return Path(tempfile.gettempdir()) / "claude-plugin-snapshots"
+
+
+# Package directory -> (stat signature, content digest)
+_package_digests: dict[Path, tuple[str, str]] = {}
+
+
+def _walk_files(root: Path) -> list[tuple[str, Path]]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            files.append((path.relative_to(root).as_posix(), path))
+    return files
+
+
+def package_digest(package_dir: Path) -> str:
+    """Hash the relative path and content of every file in a package.
+
+    Contents are re-read only when a file's size or mtime changes, so
+    repeated lookups within one run cost a directory walk.
+    """
+    files = _walk_files(package_dir)
+    signature = hashlib.sha256()
+    for rel, path in files:
+        st = path.stat()
+        signature.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    cached = _package_digests.get(package_dir)
+    if cached and cached[0] == signature.hexdigest():
+        return cached[1]
+
+    digest = hashlib.sha256()
+    for rel, path in files:
+        digest.update(f"{rel}\0".encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    _package_digests[package_dir] = (signature.hexdigest(), digest.hexdigest())
+    return digest.hexdigest()
+
+
+def installer_digest(sc_path: Path) -> str:
+    """Hash the sc-install sources that determine the installed tree."""
+    digest = hashlib.sha256()
+    for rel in SC_INSTALL_SOURCES:
+        path = sc_path / rel
+        digest.update(f"{rel}\0".encode())
+        if path.is_file():
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def snapshot_key(packages: list[str], sc_path: Path) -> str:
+    """Content address of the snapshot for an ordered package set."""
+    payload = {
+        "packages": [[name, package_digest(sc_path / "packages" / name)] for name in packages],
+        "installer": installer_digest(sc_path),
+    }
+    return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+
+
+# =============================================================================
+# Snapshots
+# =============================================================================
+
+
+def _run_sc_install(package: str, dest_claude: Path, sc_path: Path) -> subprocess.CompletedProcess:
+    cmd = [
+        sys.executable,
+        str(sc_path / "tools" / "sc-install.py"),
+        "install",
+        package,
+        "--dest",
+        str(dest_claude),
+        "--force",
+        "--no-expand",
+    ]
+    logger.debug(f"sc-install command: {' '.join(cmd)}")
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        timeout=INSTALL_TIMEOUT_SECONDS,
+        cwd=str(sc_path),
+    )
+
+
+def _expanded_files(package_dir: Path, dest_claude: Path) -> list[str]:
+    """Installed files of a package that sc-install would token-expand."""
+    try:
+        manifest = yaml.safe_load((package_dir / "manifest.yaml").read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError):
+        return []
+    variables = manifest.get("variables") or {}
+    if (variables.get("REPO_NAME") or {}).get("auto") != "git-repo-basename":
+        return []
+    expanded = []
+    for kind in ("commands", "skills", "agents", "scripts", "assets"):
+        for rel in (manifest.get("artifacts") or {}).get(kind) or []:
+            path = dest_claude / rel
+            try:
+                if REPO_NAME_TOKEN.encode() in path.read_bytes():
+                    expanded.append(rel)
+            except OSError:
+                continue
+    return expanded
+
+
+def _make_read_only(root: Path) -> None:
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if not os.path.islink(path):
+                os.chmod(path, os.stat(path).st_mode & ~0o222)
+
+
+def _prune_snapshots(root: Path, keep: Path) -> None:
+    """Remove all but the SNAPSHOT_KEEP most recently built snapshots."""
+    snapshots = sorted(
+        (p for p in root.glob(f"{SNAPSHOT_PREFIX}*") if p.is_dir() and p != keep),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for stale in snapshots[SNAPSHOT_KEEP - 1:]:
+        shutil.rmtree(stale, ignore_errors=True)
+        logger.debug(f"Removed stale plugin snapshot: {stale.name}")
+
+
+def build_snapshot(packages: list[str], sc_path: Path, root: Path, key: str) -> Path:
+    """Install a package set into a new snapshot directory.
+
+    Builds in a private staging directory and renames it into place, so
+    concurrent builders of the same key never see a partial snapshot.
+
+    Raises:
+        PluginSnapshotError: If sc-install fails for a package
+    """
+    snapshot = root / f"{SNAPSHOT_PREFIX}{key[:24]}"
+    staging = root / f".{snapshot.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+    dest_claude = staging / CLAUDE_DIR
+    start = time.perf_counter()
+    try:
+        dest_claude.mkdir(parents=True)
+        output: dict[str, str] = {}
+        expanded: list[str] = []
+        for package in packages:
+            try:
+                result = _run_sc_install(package, dest_claude, sc_path)
+            except subprocess.TimeoutExpired:
+                raise PluginSnapshotError(
+                    package, -1, "", f"Installation timed out after {INSTALL_TIMEOUT_SECONDS} seconds"
+                )
+            if result.returncode != 0:
+                raise PluginSnapshotError(package, result.returncode, result.stdout or "", result.stderr or "")
+            output[package] = result.stdout or ""
+            expanded.extend(_expanded_files(sc_path / "packages" / package, dest_claude))
+
+        metadata = {
+            "key": key,
+            "packages": packages,
+            "expand": sorted(set(expanded)),
+            "install_output": output,
+        }
+        (staging / SNAPSHOT_METADATA).write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+        _make_read_only(dest_claude)
+        os.rename(staging, snapshot)
+    except OSError as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        if snapshot.is_dir():
+            # Another process built the same snapshot first
+            return snapshot
+        raise PluginSnapshotError(",".join(packages), -1, "", f"Failed to build plugin snapshot: {e}") from e
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    logger.info(f"Built plugin snapshot {snapshot.name} for {packages} in {time.perf_counter() - start:.2f}s")
+    _prune_snapshots(root, keep=snapshot)
+    return snapshot
+
+
+def _project_repo_name(project_path: Path) -> str:
+    """Git basename sc-install would substitute for {{REPO_NAME}}."""
+    try:
+        toplevel = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=project_path,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return Path(toplevel).name if toplevel else ""
+
+
+# Project .claude directory -> lock serializing materialize_snapshot() in this process
+_project_locks: dict[Path, threading.Lock] = {}
+_project_locks_guard = threading.Lock()
+
+
+@contextmanager
+def _project_lock(dest_claude: Path, lock_dir: Path) -> Iterator[None]:
+    """Serialize materialization into one project across threads and processes."""
+    dest_claude = dest_claude.resolve()
+    with _project_locks_guard:
+        lock = _project_locks.setdefault(dest_claude, threading.Lock())
+    digest = hashlib.sha256(str(dest_claude).encode()).hexdigest()[:16]
+    with lock:
+        fd = os.open(lock_dir / f"{LOCK_PREFIX}{digest}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the flock
+
+
+def _replace(dest: Path, write: Callable[[Path], None]) -> None:
+    """Create dest via write(tmp_path) and an atomic rename, so it is never missing."""
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, dest)
+    finally:
+        # rename() is a no-op when tmp and dest are links to the same file
+        tmp.unlink(missing_ok=True)
+
+
+def _merge_registry(snapshot_file: Path, dest_file: Path) -> None:
+    """Merge snapshot registry entries into an existing project registry."""
+    registry: dict = {}
+    try:
+        loaded = yaml.safe_load(dest_file.read_text(encoding="utf-8"))
+        if isinstance(loaded, dict):
+            registry = loaded
+    except (OSError, yaml.YAMLError):
+        logger.warning(f"Could not parse registry: {dest_file}")
+    installed = yaml.safe_load(snapshot_file.read_text(encoding="utf-8")) or {}
+    for section in ("agents", "skills"):
+        merged = registry.get(section) or {}
+        merged.update(installed.get(section) or {})
+        registry[section] = merged
+    text = yaml.safe_dump(registry, sort_keys=False, default_flow_style=False)
+    _replace(dest_file, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+
+
+def _write_private(source: Path, dest: Path, content: bytes | None = None) -> None:
+    """Write a writable copy of source (optionally with new content) to dest."""
+    data = source.read_bytes() if content is None else content
+    mode = os.stat(source).st_mode | 0o200
+
+    def write(tmp: Path) -> None:
+        tmp.write_bytes(data)
+        os.chmod(tmp, mode)
+
+    _replace(dest, write)
+
+
+def materialize_snapshot(snapshot: Path, project_path: Path, method: str = "auto") -> tuple[str, int, int]:
+    """Materialize a snapshot's .claude tree into a test project.
+
+    Args:
+        snapshot: Snapshot from build_snapshot()
+        project_path: Test project whose .claude receives the plugins
+        method: "auto" (hardlink, falling back to copy) or "copy"
+
+    Returns:
+        Tuple of (method used, files materialized, files token-expanded)
+
+    Raises:
+        OSError: If a file cannot be written into the project
+    """
+    metadata = json.loads((snapshot / SNAPSHOT_METADATA).read_text(encoding="utf-8"))
+    expand = set(metadata.get("expand", []))
+    repo_name = _project_repo_name(project_path) if expand else ""
+    source_claude = snapshot / CLAUDE_DIR
+    dest_claude = project_path / CLAUDE_DIR
+    used = "hardlink" if method == "auto" else "copy"
+    files = expanded = 0
+
+    with _project_lock(dest_claude, snapshot.parent):
+        for rel, source in _walk_files(source_claude):
+            dest = dest_claude / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            files += 1
+            if rel == REGISTRY_FILE and dest.is_file() and not dest.is_symlink():
+                _merge_registry(source, dest)
+                continue
+            if rel in expand and repo_name:
+                text = source.read_text(encoding="utf-8", errors="ignore")
+                _write_private(source, dest, text.replace(REPO_NAME_TOKEN, repo_name).encode("utf-8"))
+                expanded += 1
+            elif rel == REGISTRY_FILE or used == "copy":
+                _write_private(source, dest)
+            else:
+                try:
+                    _replace(dest, lambda tmp: os.link(source, tmp))
+                except OSError:
+                    # e.g. snapshot and project on different filesystems
+                    used = "copy"
+                    _write_private(source, dest)
+    return used, files, expanded
+
+
+def install_plugin_snapshot(
+    packages: list[str],
+    project_path: Path,
+    sc_path: Path,
+    root: Path | None = None,
+) -> SnapshotInstall:
+    """Install packages into a project from a (possibly new) snapshot.
+
+    Args:
+        packages: Package names in install order
+        project_path: Test project whose .claude receives the plugins
+        sc_path: synaptic-canvas checkout holding packages/ and sc-install
+        root: Snapshot directory (default: snapshot_root())
+
+    Returns:
+        SnapshotInstall describing the cache hit or miss
+
+    Raises:
+        PluginSnapshotError: If building or materializing the snapshot fails
+        ValueError: If snapshots are disabled and no root is given
+    """
+    root = root or snapshot_root()
+    if root is None:
+        raise ValueError(f"Plugin snapshots are disabled ({SNAPSHOT_DIR_ENV}=off)")
+    start = time.perf_counter()
+    key = snapshot_key(packages, sc_path)
+    snapshot = root / f"{SNAPSHOT_PREFIX}{key[:24]}"
+    cache_hit = (snapshot / SNAPSHOT_METADATA).is_file()
+    if not cache_hit:
+        root.mkdir(parents=True, exist_ok=True)
+        snapshot = build_snapshot(packages, sc_path, root, key)
+    try:
+        method, files, expanded = materialize_snapshot(snapshot, project_path)
+        metadata = json.loads((snapshot / SNAPSHOT_METADATA).read_text(encoding="utf-8"))
+    except OSError as e:
+        raise PluginSnapshotError(
+            ",".join(packages), -1, "", f"Failed to materialize plugin snapshot: {e}"
+        ) from e
+
+    install = SnapshotInstall(
+        packages=list(packages),
+        key=key,
+        cache_hit=cache_hit,
+        method=method,
+        files=files,
+        expanded=expanded,
+        duration_ms=(time.perf_counter() - start) * 1000,
+        install_output=metadata.get("install_output", {}),
+    )
+    logger.info(f"Installed {packages} from {install.summary} in {install.duration_ms:.0f}ms")
+    return install
+
+
+def find_synaptic_canvas_path(start: Path | None = None) -> Path | None:
+    """Find the synaptic-canvas checkout holding tools/sc-install.py.
+
+    Resolution order:
+    1. SC_SYNAPTIC_CANVAS_PATH environment variable (if set)
+    2. start or one of its parents (checkout or worktree)
+    3. A sibling "synaptic-canvas" directory of start or its parents
+
+    Returns:
+        Path to synaptic-canvas repo root, or None if not found
+    """
+    env_path = os.environ.get("SC_SYNAPTIC_CANVAS_PATH")
+    if env_path:
+        sc_path = Path(env_path)
+        if sc_path.exists() and (sc_path / "tools" / "sc-install.py").exists():
+            logger.debug(f"Using SC_SYNAPTIC_CANVAS_PATH: {sc_path}")
+            return sc_path.absolute()
+        logger.warning(f"SC_SYNAPTIC_CANVAS_PATH set but invalid or missing sc-install.py: {env_path}")
+
+    current = Path(start) if start is not None else Path.cwd()
+
+    # Walk up to find synaptic-canvas root with tools/sc-install.py
+    for parent in [current] + list(current.parents):
+        sc_install = parent / "tools" / "sc-install.py"
+        if sc_install.exists() and (parent / "packages").exists():
+            logger.debug(f"Found synaptic-canvas at: {parent}")
+            return parent.absolute()
+
+        # Also check for worktree or sibling patterns
+        # e.g., synaptic-canvas-worktrees/feature/xyz -> look for tools/sc-install.py
+        if parent.name.startswith("synaptic-canvas") or "synaptic-canvas" in str(parent):
+            if sc_install.exists():
+                logger.debug(f"Found synaptic-canvas worktree at: {parent}")
+                return parent.absolute()
+
+    for parent in [current] + list(current.parents):
+        sibling = parent / "synaptic-canvas"
+        if sibling.exists() and (sibling / "tools" / "sc-install.py").exists():
+            logger.debug(f"Found synaptic-canvas as sibling at: {sibling}")
+            return sibling.absolute()
+
+    logger.warning("Could not find synaptic-canvas repo with tools/sc-install.py")
+    return None
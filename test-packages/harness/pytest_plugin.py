@@ -27,6 +27,12 @@ Usage:
     # Open report only on failure
     pytest test-packages/fixtures/ -v --open-on-fail
 
+    # Re-evaluate recorded sessions (no Claude invocation)
+    pytest test-packages/fixtures/ -v --replay test-packages/reports/bundles
+
+    # Run only tests whose YAML, plugins or model changed since they last passed
+    pytest test-packages/fixtures/ -v --changed-only
+
 Configuration:
     The plugin is registered via conftest.py and uses the following pytest hooks:
     - pytest_collect_file: Discovers fixture.yaml files
@@ -45,6 +51,7 @@ import subprocess
 import sys
 import time
 import webbrowser
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterator
@@ -56,6 +63,7 @@ from pydantic import ValidationError
 from .fixture_loader import FixtureConfig, FixtureLoader, TestConfig
 from .models import TestStatus
 from .result import ArtifactError, Failure, Result, Success, collect_results
+from .timing import PhaseTimer, parse_profile_modes
 
 if TYPE_CHECKING:
     from _pytest.config import Config
@@ -116,6 +124,9 @@ class TestReportState:
         pytest_output: str = "",
         expected_plugins: list[str] | None = None,
         plugin_install_results: list | None = None,
+        cache_key: str | None = None,
+        cached_result: Any | None = None,
+        phase_timer: PhaseTimer | None = None,
     ):
         """Record a test result.
 
@@ -131,6 +142,9 @@ class TestReportState:
             pytest_output: Raw pytest output
             expected_plugins: List of expected plugin names from fixture setup
             plugin_install_results: List of PluginInstallResult objects
+            cache_key: Result cache key to store a passing result under
+            cached_result: TestResult reused from the result cache (--changed-only)
+            phase_timer: Finished PhaseTimer of the run (see harness.timing)
         """
         if fixture_name not in self._test_results:
             self._test_results[fixture_name] = []
@@ -149,6 +163,9 @@ class TestReportState:
             "pytest_output": pytest_output,
             "expected_plugins": expected_plugins or [],
             "plugin_install_results": plugin_install_results or [],
+            "cache_key": cache_key,
+            "cached_result": cached_result,
+            "phase_timer": phase_timer,
         })
 
     @property
@@ -294,6 +311,13 @@ class YAMLTestItem(pytest.Item):
         # Deferred sc-manage installation (for self-testing sc-manage package)
         self._sc_manage_install_pending: list[str] = []
 
+        # Result cache (see harness.result_cache)
+        self.cache_key: str | None = None
+        self.cached_result = None
+
+        # Phase timings (see harness.timing)
+        self.phase_timer: PhaseTimer | None = None
+
         # Add markers for tags
         for tag in test_config.tags:
             self.add_marker(pytest.mark.keyword(tag))
@@ -313,7 +337,38 @@ class YAMLTestItem(pytest.Item):
         """
         from .collector import DataCollector
         from .environment import isolated_claude_session
-        from .reporter import ExpectationEvaluator
+
+        # Register fixture config for report generation
+        _report_state.record_fixture_config(
+            self.fixture_config.name,
+            self.fixture_config
+        )
+
+        # Offline replay: evaluate a recorded session, no Claude invocation
+        replay_dir = self.config.getoption("--replay", default=None)
+        if replay_dir:
+            self.phase_timer = PhaseTimer(self._profile_modes())
+            try:
+                self._replay_session(Path(replay_dir), self.phase_timer)
+            finally:
+                self.phase_timer.finish()
+            return
+
+        # Unchanged since its last passing run: reuse that result
+        self.cache_key = self._result_key()
+        if self.config.getoption("--changed-only", default=False) and self.cache_key:
+            from .result_cache import load_cached_result, result_cache_root
+
+            self.cached_result = load_cached_result(
+                result_cache_root(_report_dir(self.config)),
+                self.fixture_config.name,
+                self.test_config.test_id,
+                self.cache_key,
+            )
+            if self.cached_result is not None:
+                logger.info(f"Reusing cached result: {self.test_config.test_id}")
+                self.execution_duration_ms = self.cached_result.duration_ms
+                return
 
         # Get project path (assume it's a few levels up from the fixture)
         project_path = self._find_project_path()
@@ -324,24 +379,33 @@ class YAMLTestItem(pytest.Item):
         # Track execution timing
         self.execution_start = datetime.now()
         start_time = time.time()
-
-        # Register fixture config for report generation
-        _report_state.record_fixture_config(
-            self.fixture_config.name,
-            self.fixture_config
-        )
+        timer = self.phase_timer = PhaseTimer(self._profile_modes())
 
         try:
-            self._reset_test_repo(project_path)
-            with isolated_claude_session(
-                project_path=project_path,
-                trace_path=project_path / "reports" / "trace.jsonl",
-            ) as session:
+            with timer.span("reset_repo"):
+                self._reset_test_repo(project_path)
+            with ExitStack() as stack:
+                with timer.span("home"):
+                    session = stack.enter_context(isolated_claude_session(
+                        project_path=project_path,
+                        trace_path=project_path / "reports" / "trace.jsonl",
+                    ))
+                # Log directories outlive a test; only analyze what this one appends
+                from .log_analyzer import snapshot_log_offsets
+
+                log_dirs = [
+                    session.isolated_home / ".claude" / "state" / "logs",
+                    project_path / ".claude" / "state" / "logs",
+                ]
+                log_offsets = snapshot_log_offsets(log_dirs)
+
                 # Install plugins before setup commands
-                self._install_plugins(session, merged_setup)
+                with timer.span("plugins"):
+                    self._install_plugins(session, merged_setup)
 
                 # Run setup commands
-                self._run_setup_commands(session, merged_setup)
+                with timer.span("setup"):
+                    self._run_setup_commands(session, merged_setup)
 
                 # Build the prompt, prepending sc-manage install if needed
                 prompt = self.test_config.execution.prompt
@@ -356,102 +420,48 @@ class YAMLTestItem(pytest.Item):
                     logger.info(f"Prepending sc-manage install to prompt: {install_commands}")
 
                 # Execute the test
-                result = session.run_command(
-                    prompt=prompt,
-                    model=self.test_config.execution.model,
-                    tools=self.test_config.execution.tools or None,
-                    timeout=self.test_config.execution.timeout_ms // 1000,
-                )
+                with timer.span("claude"):
+                    result = session.run_command(
+                        prompt=prompt,
+                        model=self.test_config.execution.model,
+                        tools=self.test_config.execution.tools or None,
+                        timeout=self.test_config.execution.timeout_ms // 1000,
+                    )
 
                 # Capture Claude CLI output immediately after run_command
                 self.claude_stdout = session.claude_stdout
                 self.claude_stderr = session.claude_stderr
 
                 # Find transcript
-                session.find_transcript()
+                with timer.span("transcript"):
+                    session.find_transcript()
 
                 # Collect data
-                collector = DataCollector(
-                    trace_path=session.trace_path,
-                    transcript_path=session.transcript_path,
-                    project_path=project_path,
-                )
-                self.collected_data = collector.collect()
+                with timer.span("collect"):
+                    collector = DataCollector(
+                        trace_path=session.trace_path,
+                        transcript_path=session.transcript_path,
+                        project_path=project_path,
+                    )
+                    self.collected_data = collector.collect()
 
                 # Propagate Claude CLI output to collected data for reports
                 self.collected_data.claude_cli_stdout = self.claude_stdout
                 self.collected_data.claude_cli_stderr = self.claude_stderr
 
-                # Recompute log analysis to include CLI output and .claude/state logs
-                from .log_analyzer import analyze_logs, collect_log_content, merge_log_analysis
-
-                analyses = []
-                if self.collected_data.log_analysis:
-                    analyses.append(self.collected_data.log_analysis)
-
-                if self.claude_stdout or self.claude_stderr:
-                    combined_output = ""
-                    if self.claude_stdout:
-                        combined_output += f"=== Claude CLI stdout ===\n{self.claude_stdout}\n"
-                    if self.claude_stderr:
-                        combined_output += f"=== Claude CLI stderr ===\n{self.claude_stderr}\n"
-                    analyses.append(analyze_logs(combined_output))
-
-                log_dirs = [
-                    session.isolated_home / ".claude" / "state" / "logs",
-                    project_path / ".claude" / "state" / "logs",
-                ]
-                log_content = collect_log_content(log_dirs)
-                if log_content:
-                    analyses.append(analyze_logs(log_content))
-
-                if analyses:
-                    self.collected_data.log_analysis = merge_log_analysis(analyses)
+                # Archive the run for --replay, then evaluate it
+                from .log_analyzer import analyze_log_dirs
 
-                self.collected_data.execution_params = {
-                    "model": self.test_config.execution.model,
-                    "tools": list(self.test_config.execution.tools),
-                    "timeout_ms": self.test_config.execution.timeout_ms,
-                }
-
-                # Evaluate expectations
-                evaluator = ExpectationEvaluator(self.collected_data)
-                failures = []
-
-                for exp_config in self.test_config.expectations:
-                    from .models import ExpectationType
-
-                    exp_type = ExpectationType(exp_config.type)
-                    expectation = evaluator.evaluate(
-                        expectation_id=exp_config.id,
-                        expectation_type=exp_type,
-                        description=exp_config.description,
-                        expected=exp_config.expected,
+                with timer.span("state_logs"):
+                    state_logs = analyze_log_dirs(log_dirs, log_offsets)
+                with timer.span("record"):
+                    self._record_session(
+                        session, project_path, log_dirs, state_logs,
+                        duration_ms=(time.time() - start_time) * 1000,
                     )
 
-                    self.evaluated_expectations.append(expectation)
-
-                    if expectation.status != TestStatus.PASS:
-                        failures.append(expectation)
-
-                # Evaluate implicit NoWarningsExpectation AFTER all explicit expectations
-                # This ensures warnings/errors in logs cause test failure unless
-                # explicitly allowed via allow_warnings: true in test YAML
-                from .expectations import NoWarningsExpectation
-
-                no_warnings_exp = NoWarningsExpectation(
-                    id="implicit-no-warnings",
-                    description="No warnings or errors in logs",
-                    allow_warnings=self.test_config.allow_warnings,
-                )
-                no_warnings_result = no_warnings_exp.evaluate(self.collected_data)
-
-                # Always add to expectations list for reporting (even on pass)
-                # Convert ExpectationResult to Expectation model for consistency
-                self.evaluated_expectations.append(no_warnings_result.to_expectation_model())
-
-                if no_warnings_result.status != TestStatus.PASS:
-                    failures.append(no_warnings_result.to_expectation_model())
+                with timer.span("evaluate"):
+                    failures = self._evaluate_session(state_logs)
 
                 # Record duration
                 self.execution_duration_ms = (time.time() - start_time) * 1000
@@ -475,6 +485,187 @@ class YAMLTestItem(pytest.Item):
             self._cleanup_plugins()
             # Run teardown commands
             self._run_teardown_commands(merged_setup)
+            timer.finish()
+
+    def _evaluate_session(self, state_logs: Any) -> list:
+        """Analyze logs and evaluate expectations for the collected session.
+
+        Shared by live runs and replays; expects collected_data and the
+        Claude CLI output to be set.
+
+        Args:
+            state_logs: LogAnalysisResult of the test's .claude/state logs
+
+        Returns:
+            Expectations that did not pass
+        """
+        # Recompute log analysis to include CLI output and .claude/state logs
+        from .log_analyzer import analyze_logs, merge_log_analysis
+
+        analyses = []
+        if self.collected_data.log_analysis:
+            analyses.append(self.collected_data.log_analysis)
+
+        if self.claude_stdout or self.claude_stderr:
+            combined_output = ""
+            if self.claude_stdout:
+                combined_output += f"=== Claude CLI stdout ===\n{self.claude_stdout}\n"
+            if self.claude_stderr:
+                combined_output += f"=== Claude CLI stderr ===\n{self.claude_stderr}\n"
+            analyses.append(analyze_logs(combined_output))
+
+        if state_logs.regions:
+            analyses.append(state_logs)
+
+        if analyses:
+            self.collected_data.log_analysis = merge_log_analysis(analyses)
+
+        self.collected_data.execution_params = {
+            "model": self.test_config.execution.model,
+            "tools": list(self.test_config.execution.tools),
+            "timeout_ms": self.test_config.execution.timeout_ms,
+        }
+
+        # Evaluate expectations
+        from .models import ExpectationType
+        from .reporter import ExpectationEvaluator
+
+        evaluator = ExpectationEvaluator(self.collected_data)
+        evaluator.prepare([
+            (ExpectationType(exp_config.type), exp_config.expected)
+            for exp_config in self.test_config.expectations
+        ])
+        failures = []
+
+        for exp_config in self.test_config.expectations:
+            exp_type = ExpectationType(exp_config.type)
+            expectation = evaluator.evaluate(
+                expectation_id=exp_config.id,
+                expectation_type=exp_type,
+                description=exp_config.description,
+                expected=exp_config.expected,
+            )
+
+            self.evaluated_expectations.append(expectation)
+
+            if expectation.status != TestStatus.PASS:
+                failures.append(expectation)
+
+        # Evaluate implicit NoWarningsExpectation AFTER all explicit expectations
+        # This ensures warnings/errors in logs cause test failure unless
+        # explicitly allowed via allow_warnings: true in test YAML
+        from .expectations import NoWarningsExpectation
+
+        no_warnings_exp = NoWarningsExpectation(
+            id="implicit-no-warnings",
+            description="No warnings or errors in logs",
+            allow_warnings=self.test_config.allow_warnings,
+        )
+        no_warnings_result = no_warnings_exp.evaluate(self.collected_data)
+
+        # Always add to expectations list for reporting (even on pass)
+        # Convert ExpectationResult to Expectation model for consistency
+        self.evaluated_expectations.append(no_warnings_result.to_expectation_model())
+
+        if no_warnings_result.status != TestStatus.PASS:
+            failures.append(no_warnings_result.to_expectation_model())
+
+        return failures
+
+    def _record_session(
+        self,
+        session: Any,
+        project_path: Path,
+        log_dirs: list[Path],
+        state_logs: Any,
+        duration_ms: float,
+    ) -> None:
+        """Archive the run as a replay bundle (never fails the test)."""
+        from .replay import bundles_root, write_bundle
+
+        root = bundles_root(_report_dir(self.config))
+        if root is None:
+            return
+        try:
+            write_bundle(
+                root,
+                self.fixture_config.name,
+                self.test_config.test_id,
+                trace_path=session.trace_path,
+                transcript_path=session.transcript_path,
+                claude_stdout=self.claude_stdout,
+                claude_stderr=self.claude_stderr,
+                state_logs=state_logs,
+                log_dirs={"home": log_dirs[0], "project": log_dirs[1]},
+                project_path=project_path,
+                metadata={
+                    "prompt": self.test_config.execution.prompt,
+                    "model": self.test_config.execution.model,
+                    "duration_ms": duration_ms,
+                    "expected_plugins": self.expected_plugins,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record session bundle for {self.test_config.test_id}: {e}")
+
+    def _replay_session(self, replay_dir: Path, timer: PhaseTimer | None = None) -> None:
+        """Evaluate the test against its recorded bundle instead of running Claude.
+
+        Raises:
+            YAMLTestFailure: If the bundle is unreadable or expectations fail
+        """
+        from .replay import BundleError, load_bundle
+
+        self.execution_start = datetime.now()
+        try:
+            bundle = load_bundle(replay_dir, self.fixture_config.name, self.test_config.test_id)
+        except BundleError as e:
+            self.execution_error = str(e)
+            raise YAMLTestFailure(self.test_config, [], error_message=str(e)) from e
+        if bundle is None:
+            pytest.skip(f"No recorded session in {replay_dir}")
+
+        # Report the recorded run's duration, not the replay's
+        self.execution_duration_ms = bundle.duration_ms
+        try:
+            self.claude_stdout = bundle.read_stdout()
+            self.claude_stderr = bundle.read_stderr()
+            timer = timer or PhaseTimer()
+            with timer.span("collect"):
+                self.collected_data = bundle.collect()
+            self.expected_plugins = bundle.metadata.get("expected_plugins", [])
+            with timer.span("state_logs"):
+                state_logs = bundle.analyze_state_logs()
+            with timer.span("evaluate"):
+                failures = self._evaluate_session(state_logs)
+        except Exception as e:
+            self.execution_error = str(e)
+            raise YAMLTestFailure(self.test_config, [], error_message=str(e)) from e
+
+        if failures:
+            raise YAMLTestFailure(self.test_config, failures)
+
+    def _profile_modes(self) -> frozenset[str]:
+        """Profiling modes requested with --phase-profile."""
+        return parse_profile_modes(self.config.getoption("--phase-profile", default=None))
+
+    def _result_key(self) -> str | None:
+        """Result cache key of this test; None when results are not cached."""
+        from .result_cache import result_cache_root, result_key
+
+        if result_cache_root(_report_dir(self.config)) is None:
+            return None
+        try:
+            return result_key(
+                self.test_config.source_path,
+                self.fixture_config.source_path,
+                self.fixture_config.get_merged_setup(self.test_config).plugins,
+                self.test_config.execution.model,
+                self._find_synaptic_canvas_path(),
+            )
+        except Exception as e:
+            logger.warning(f"Cannot compute result cache key for {self.test_config.test_id}: {e}")
+            return None
 
     def _reset_test_repo(self, project_path: Path) -> None:
         """Reset the sc-test-harness repo before one-time setup/plugins."""
@@ -646,51 +837,9 @@ class YAMLTestItem(pytest.Item):
         Returns:
             Path to synaptic-canvas repo root, or None if not found
         """
-        import os
-
-        # 1. Check environment variable override
-        env_path = os.environ.get("SC_SYNAPTIC_CANVAS_PATH")
-        if env_path:
-            sc_path = Path(env_path)
-            if sc_path.exists() and (sc_path / "tools" / "sc-install.py").exists():
-                logger.debug(f"Using SC_SYNAPTIC_CANVAS_PATH: {sc_path}")
-                return sc_path.absolute()
-            else:
-                logger.warning(
-                    f"SC_SYNAPTIC_CANVAS_PATH set but invalid or missing sc-install.py: {env_path}"
-                )
-
-        # 2. Find relative to fixture location
-        current = self.test_config.source_path or self.fspath
-        if current is None:
-            current = Path.cwd()
-        else:
-            current = Path(current)
+        from .plugin_snapshots import find_synaptic_canvas_path
 
-        # Walk up to find synaptic-canvas root with tools/sc-install.py
-        for parent in [current] + list(current.parents):
-            # Check for synaptic-canvas indicators with sc-install.py
-            sc_install = parent / "tools" / "sc-install.py"
-            if sc_install.exists() and (parent / "packages").exists():
-                logger.debug(f"Found synaptic-canvas at: {parent}")
-                return parent.absolute()
-
-            # Also check for worktree or sibling patterns
-            # e.g., synaptic-canvas-worktrees/feature/xyz -> look for tools/sc-install.py
-            if parent.name.startswith("synaptic-canvas") or "synaptic-canvas" in str(parent):
-                if sc_install.exists():
-                    logger.debug(f"Found synaptic-canvas worktree at: {parent}")
-                    return parent.absolute()
-
-        # 3. Check if there's a sibling synaptic-canvas directory
-        for parent in [current] + list(current.parents):
-            sibling = parent / "synaptic-canvas"
-            if sibling.exists() and (sibling / "tools" / "sc-install.py").exists():
-                logger.debug(f"Found synaptic-canvas as sibling at: {sibling}")
-                return sibling.absolute()
-
-        logger.warning("Could not find synaptic-canvas repo with tools/sc-install.py")
-        return None
+        return find_synaptic_canvas_path(self.test_config.source_path or self.fspath)
 
     def _extract_package_name(self, plugin_spec: str) -> str:
         """Extract the package name from a plugin specification.
@@ -769,8 +918,10 @@ class YAMLTestItem(pytest.Item):
     def _install_plugins(self, session: Any, setup: Any) -> None:
         """Install plugins specified in setup configuration.
 
-        For most packages: Uses sc-install.py directly via subprocess for
-        reliable installation in isolated environments.
+        For most packages: Materializes a content-addressed snapshot of the
+        package set (see plugin_snapshots), running sc-install.py only when
+        no snapshot exists yet. With SC_PLUGIN_SNAPSHOTS=off, runs
+        sc-install.py per package via subprocess.
 
         For sc-manage package: Sets a flag to use Claude invocation with
         `/sc-manage --install <package> --local` for self-testing.
@@ -804,6 +955,8 @@ class YAMLTestItem(pytest.Item):
         # Track if sc-manage needs to be installed via Claude invocation
         self._sc_manage_install_pending: list[str] = []
 
+        snapshot_install = self._install_plugin_snapshot(session, setup.plugins, sc_path)
+
         for plugin_spec in setup.plugins:
             package_name = self._extract_package_name(plugin_spec)
             stdout = ""
@@ -833,12 +986,18 @@ class YAMLTestItem(pytest.Item):
                     )
                     continue
 
-                # For all other packages, use sc-install.py directly
-                return_code, stdout, stderr = self._install_with_sc_install(
-                    package_name=package_name,
-                    project_path=session.project_path,
-                    sc_path=sc_path,
-                )
+                if snapshot_install is not None:
+                    # Already materialized from the package-set snapshot
+                    return_code = 0
+                    stdout = snapshot_install.install_output.get(package_name, "")
+                    stdout = f"{snapshot_install.summary}\n{stdout}".rstrip()
+                else:
+                    # For all other packages, use sc-install.py directly
+                    return_code, stdout, stderr = self._install_with_sc_install(
+                        package_name=package_name,
+                        project_path=session.project_path,
+                        sc_path=sc_path,
+                    )
 
                 # Create install result for reporting
                 install_result = PluginInstallResult(
@@ -847,6 +1006,8 @@ class YAMLTestItem(pytest.Item):
                     stdout=stdout,
                     stderr=stderr,
                     return_code=return_code,
+                    snapshot=snapshot_install.key if snapshot_install else None,
+                    snapshot_hit=snapshot_install.cache_hit if snapshot_install else None,
                 )
                 self.plugin_install_results.append(install_result)
 
@@ -893,6 +1054,57 @@ class YAMLTestItem(pytest.Item):
                     stderr=str(e),
                 ) from e
 
+    def _install_plugin_snapshot(self, session: Any, plugins: list[str], sc_path: Path) -> Any:
+        """Install every non-sc-manage plugin from one package-set snapshot.
+
+        Args:
+            session: IsolatedSession instance
+            plugins: Plugin specs from the setup configuration
+            sc_path: Path to the synaptic-canvas repo
+
+        Returns:
+            SnapshotInstall, or None when snapshots are disabled or there is
+            nothing to install
+
+        Raises:
+            PluginInstallationError: If sc-install fails while building the snapshot
+        """
+        from .models import PluginInstallResult
+        from .plugin_snapshots import PluginSnapshotError, install_plugin_snapshot, snapshot_root
+
+        specs = {
+            self._extract_package_name(spec): spec
+            for spec in plugins
+            if self._extract_package_name(spec) != "sc-manage"
+        }
+        if not specs or snapshot_root() is None:
+            return None
+
+        try:
+            return install_plugin_snapshot(list(specs), session.project_path, sc_path)
+        except PluginSnapshotError as e:
+            plugin_spec = specs.get(e.package, e.package)
+            self.plugin_install_results.append(
+                PluginInstallResult(
+                    plugin_name=plugin_spec,
+                    success=False,
+                    stdout=e.stdout,
+                    stderr=e.stderr,
+                    return_code=e.return_code,
+                    snapshot_hit=False,
+                )
+            )
+            logger.error(
+                f"Failed to install plugin {plugin_spec}: "
+                f"returncode={e.return_code}, stderr={e.stderr}"
+            )
+            raise PluginInstallationError(
+                plugin_name=plugin_spec,
+                return_code=e.return_code,
+                stdout=e.stdout,
+                stderr=e.stderr,
+            ) from e
+
     def _cleanup_plugins(self) -> None:
         """Log installed plugins for observability.
 
@@ -1177,6 +1389,10 @@ def pytest_runtest_makereport(
     if not isinstance(item, YAMLTestItem):
         return
 
+    # Tests skipped at run time (e.g. no recorded session to replay)
+    if call.excinfo is not None and call.excinfo.errisinstance(pytest.skip.Exception):
+        return
+
     # Build Claude session log from captured output
     claude_session_log = ""
     if item.claude_stdout:
@@ -1197,6 +1413,9 @@ def pytest_runtest_makereport(
         pytest_output=claude_session_log,
         expected_plugins=item.expected_plugins,
         plugin_install_results=item.plugin_install_results,
+        cache_key=getattr(item, "cache_key", None),
+        cached_result=getattr(item, "cached_result", None),
+        phase_timer=getattr(item, "phase_timer", None),
     )
 
 
@@ -1227,15 +1446,7 @@ def pytest_sessionfinish(
     if not _report_state.fixture_names:
         return
 
-    # Get report directory
-    report_dir = config.getoption("--report-dir", default=None)
-    if report_dir:
-        report_path = Path(report_dir)
-    else:
-        # Default to test-packages/reports
-        root_dir = Path(config.rootdir)
-        report_path = root_dir / "test-packages" / "reports"
-
+    report_path = _report_dir(config)
     report_path.mkdir(parents=True, exist_ok=True)
 
     # Generate report for each fixture
@@ -1265,6 +1476,14 @@ def pytest_sessionfinish(
             webbrowser.open(f"file://{report_to_open.absolute()}")
 
 
+def _report_dir(config: Config) -> Path:
+    """Directory for reports (--report-dir, default test-packages/reports)."""
+    report_dir = config.getoption("--report-dir", default=None)
+    if report_dir:
+        return Path(report_dir)
+    return Path(config.rootdir) / "test-packages" / "reports"
+
+
 def _build_test_command(test_config: "TestConfig") -> str:
     """Build the complete Claude CLI command with all flags.
 
@@ -1489,7 +1708,10 @@ def _generate_fixture_report(
             setup_commands = _build_setup_commands(fixture_config, test_config)
 
             # Build TestResult
-            if collected_data:
+            if result_data.get("cached_result") is not None:
+                # Reused from the result cache (--changed-only)
+                test_result = result_data["cached_result"]
+            elif collected_data:
                 test_result = report_builder.build_test_result(
                     test_id=test_config.test_id,
                     test_name=test_config.test_name,
@@ -1519,6 +1741,12 @@ def _generate_fixture_report(
                     plugin_verification=plugin_verification,
                 )
 
+            if result_data.get("phase_timer") is not None and not test_result.cached:
+                result_data["phase_timer"].apply(test_result)
+
+            if result_data.get("cache_key") and result_data["passed"]:
+                _store_cached_result(fixture_name, result_data["cache_key"], test_result, report_path)
+
             test_results.append(test_result)
 
         # Get fixture path from config
@@ -1583,6 +1811,19 @@ def _generate_fixture_report(
 
 
 
+def _store_cached_result(fixture_name: str, cache_key: str, test_result: Any, report_path: Path) -> None:
+    """Cache a passing result for --changed-only (never fails the report)."""
+    from .result_cache import result_cache_root, store_result
+
+    root = result_cache_root(report_path)
+    if root is None:
+        return
+    try:
+        store_result(root, fixture_name, test_result.test_id, cache_key, test_result)
+    except Exception as e:
+        logger.warning(f"Failed to cache result for {test_result.test_id}: {e}")
+
+
 # =============================================================================
 # Artifact Preservation Types and Helpers
 # =============================================================================
@@ -1675,19 +1916,28 @@ def _write_enriched_artifact(
         Failure[ArtifactError]: If enrichment or writing failed
     """
     try:
+        from .collector import CollectedData, extract_token_usage
         from .enrichment import build_timeline_tree
         from .schemas import TestContext, TestContextPaths, ArtifactPaths
 
         # Get test_config for metadata
         test_config = result_data.get("test_config")
 
-        # Get entries and events
+        # Get entries and events (as pre-parsed records when collected)
         entries: list = []
         events: list = []
-        if collected_data and hasattr(collected_data, "raw_transcript_entries"):
-            entries = collected_data.raw_transcript_entries or []
-        if collected_data and hasattr(collected_data, "raw_hook_events"):
-            events = collected_data.raw_hook_events or []
+        token_usage = None
+        if isinstance(collected_data, CollectedData):
+            entries = collected_data.transcript_entry_records()
+            events = collected_data.hook_event_records()
+            token_usage = collected_data.token_usage
+            if token_usage is None:
+                token_usage = extract_token_usage(collected_data.raw_transcript_entries or [])
+        else:
+            if collected_data and hasattr(collected_data, "raw_transcript_entries"):
+                entries = collected_data.raw_transcript_entries or []
+            if collected_data and hasattr(collected_data, "raw_hook_events"):
+                events = collected_data.raw_hook_events or []
 
         # Only proceed if we have data to enrich
         if not entries and not events:
@@ -1716,6 +1966,7 @@ def _write_enriched_artifact(
             trace_events=events,
             test_context=test_context,
             artifact_paths=artifact_paths,
+            token_usage=token_usage,
         )
 
         warnings: list[str] = []
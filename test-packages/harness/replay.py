@@ -0,0 +1,370 @@
+"""
+Recorded session bundles for offline replay.
+
+Running a test means running the real ``claude`` CLI, which takes minutes.
+Everything the harness evaluates afterwards comes from a handful of files,
+so each run is archived as a bundle that can be fed back through
+DataCollector, the expectations and the report builders without invoking
+a model:
+
+    <bundles>/<fixture>/<test_id>/
+        bundle.json                  metadata (prompt, model, duration, ...)
+        trace.jsonl.gz               hook trace
+        transcript.jsonl.gz          session transcript
+        stdout.txt.gz, stderr.txt.gz Claude CLI output
+        logs/<scope>/<path>.gz       the state log content the test appended
+        project/.claude/state/logs/  structured *.json/*.jsonl logs the test wrote, as
+                                     the collector finds them in a project
+
+Bundles hold only what the test itself wrote: the analyzed region of each
+state log, and of each append-only ``.jsonl`` log. A ``.json`` document
+is rewritten whole, so it is archived whole if the test changed it.
+
+Replaying a bundle evaluates the *current* expectations of the test, so an
+edited expectation or report component can be checked against hundreds of
+recorded sessions in seconds. Bundles are written atomically (staged, then
+renamed over the previous bundle of the same test).
+
+Environment:
+  SC_TEST_BUNDLES  Bundle directory, or "off" to not record
+                   (default: <reports>/bundles)
+
+Example usage:
+    from harness.replay import load_bundle, write_bundle
+
+    write_bundle(root, "sc-startup", "sc-startup-001", trace_path=..., ...)
+
+    bundle = load_bundle(root, "sc-startup", "sc-startup-001")
+    data = bundle.collect()          # CollectedData, no CLI run
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+from .collector import CollectedData, DataCollector
+from .log_analyzer import LogAnalysisResult, analyze_log_dirs, open_maybe_gzip
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+BUNDLE_DIR_ENV = "SC_TEST_BUNDLES"
+BUNDLE_FORMAT = 1
+BUNDLE_METADATA = "bundle.json"
+TRACE_FILE = "trace.jsonl.gz"
+TRANSCRIPT_FILE = "transcript.jsonl.gz"
+STDOUT_FILE = "stdout.txt.gz"
+STDERR_FILE = "stderr.txt.gz"
+LOGS_DIR = "logs"
+PROJECT_DIR = "project"
+STRUCTURED_LOGS_DIR = Path(".claude") / "state" / "logs"
+
+# Fast compression: bundles are written after every test
+COMPRESS_LEVEL = 1
+
+
+def bundles_root(reports_path: Path) -> Path | None:
+    """Directory holding session bundles; None when recording is disabled."""
+    override = os.environ.get(BUNDLE_DIR_ENV)
+    if override is not None:
+        if override.strip().lower() in ("", "0", "off", "none"):
+            return None
+        return Path(override)
+    return Path(reports_path) / "bundles"
+
+
+def bundle_path(root: Path, fixture: str, test_id: str) -> Path:
+    """Directory of one test's bundle."""
+    return Path(root) / fixture / test_id
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+
+def _gzip_file(source: Path, dest: Path) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb", compresslevel=COMPRESS_LEVEL) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def _gzip_text(text: str, dest: Path) -> None:
+    with gzip.open(dest, "wt", encoding="utf-8", compresslevel=COMPRESS_LEVEL) as f:
+        f.write(text)
+
+
+def _copy_region(path: Path, start: int, end: int, dst: BinaryIO) -> None:
+    """Copy a LogRegion's bytes (decompressed positions for .gz logs)."""
+    remaining = end - start
+    with open_maybe_gzip(path) as src:
+        src.seek(start)
+        while remaining > 0:
+            chunk = src.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                break
+            dst.write(chunk)
+            remaining -= len(chunk)
+
+
+def _gzip_region(path: Path, start: int, end: int, dest: Path) -> None:
+    with gzip.open(dest, "wb", compresslevel=COMPRESS_LEVEL) as dst:
+        _copy_region(path, start, end, dst)
+
+
+def _log_destination(path: Path, log_dirs: dict[str, Path]) -> Path | None:
+    """logs/<scope>/<path relative to its log directory>.gz"""
+    for scope, log_dir in log_dirs.items():
+        try:
+            relative = path.relative_to(log_dir)
+        except ValueError:
+            continue
+        return Path(LOGS_DIR) / scope / f"{relative.as_posix()}.gz"
+    return None
+
+
+def write_bundle(
+    root: Path,
+    fixture: str,
+    test_id: str,
+    *,
+    trace_path: Path | None,
+    transcript_path: Path | None,
+    claude_stdout: str = "",
+    claude_stderr: str = "",
+    state_logs: LogAnalysisResult | None = None,
+    log_dirs: dict[str, Path] | None = None,
+    project_path: Path | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> Path:
+    """Archive one test run as a bundle, replacing any earlier bundle.
+
+    Args:
+        root: Bundle directory (see bundles_root())
+        fixture: Fixture name
+        test_id: Test identifier
+        trace_path: Hook trace of the run
+        transcript_path: Session transcript of the run
+        claude_stdout: Claude CLI stdout
+        claude_stderr: Claude CLI stderr
+        state_logs: analyze_log_dirs() result; its regions are archived
+        log_dirs: Scope name -> log directory the regions were read from
+        project_path: Project whose structured logs the collector read;
+            only logs with a region in state_logs are archived
+        metadata: Extra fields for bundle.json (prompt, model, duration_ms, ...)
+
+    Returns:
+        Path to the written bundle
+    """
+    dest = bundle_path(root, fixture, test_id)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    staging = dest.parent / f".{test_id}.{uuid.uuid4().hex[:8]}.tmp"
+    staging.mkdir()
+    try:
+        files: dict[str, Any] = {}
+        if trace_path and Path(trace_path).exists():
+            _gzip_file(Path(trace_path), staging / TRACE_FILE)
+            files["trace"] = TRACE_FILE
+        if transcript_path and Path(transcript_path).exists():
+            _gzip_file(Path(transcript_path), staging / TRANSCRIPT_FILE)
+            files["transcript"] = TRANSCRIPT_FILE
+        if claude_stdout:
+            _gzip_text(claude_stdout, staging / STDOUT_FILE)
+            files["stdout"] = STDOUT_FILE
+        if claude_stderr:
+            _gzip_text(claude_stderr, staging / STDERR_FILE)
+            files["stderr"] = STDERR_FILE
+
+        logs = []
+        for region in state_logs.regions if state_logs else []:
+            relative = _log_destination(Path(region.path), log_dirs or {})
+            if relative is None:
+                continue
+            (staging / relative).parent.mkdir(parents=True, exist_ok=True)
+            try:
+                _gzip_region(Path(region.path), region.start, region.end, staging / relative)
+            except OSError as e:
+                logger.warning(f"Could not archive log {region.path}: {e}")
+                continue
+            logs.append({"file": relative.as_posix(), "source": region.path, "start": region.start})
+        files["logs"] = logs
+
+        if project_path is not None:
+            regions = {region.path: region for region in state_logs.regions} if state_logs else {}
+            structured = Path(project_path) / STRUCTURED_LOGS_DIR
+            for path in sorted(structured.rglob("*")) if structured.exists() else ():
+                region = regions.get(str(path))
+                if path.suffix not in (".json", ".jsonl") or region is None:
+                    continue
+                target = staging / PROJECT_DIR / STRUCTURED_LOGS_DIR / path.relative_to(structured)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    if path.suffix == ".json":
+                        shutil.copyfile(path, target)
+                    else:
+                        with open(target, "wb") as dst:
+                            _copy_region(path, region.start, region.end, dst)
+                except OSError as e:
+                    logger.warning(f"Could not archive log {path}: {e}")
+
+        meta = {
+            "format": BUNDLE_FORMAT,
+            "fixture": fixture,
+            "test_id": test_id,
+            "recorded_at": datetime.now().isoformat(),
+            **(metadata or {}),
+            "files": files,
+        }
+        (staging / BUNDLE_METADATA).write_text(json.dumps(meta, indent=2, default=str), encoding="utf-8")
+
+        previous = None
+        if dest.exists():
+            previous = dest.parent / f".{test_id}.{uuid.uuid4().hex[:8]}.old"
+            os.rename(dest, previous)
+        os.rename(staging, dest)
+        if previous is not None:
+            shutil.rmtree(previous, ignore_errors=True)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    logger.debug(f"Recorded session bundle: {dest}")
+    return dest
+
+
+# =============================================================================
+# Replay
+# =============================================================================
+
+
+class BundleError(Exception):
+    """A bundle is missing, unreadable or of an unknown format."""
+
+
+@dataclass
+class SessionBundle:
+    """One recorded test run, loaded from its bundle directory."""
+
+    path: Path
+    metadata: dict[str, Any]
+
+    @property
+    def fixture(self) -> str:
+        return self.metadata.get("fixture", self.path.parent.name)
+
+    @property
+    def test_id(self) -> str:
+        return self.metadata.get("test_id", self.path.name)
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration of the recorded run (replays take no model time)."""
+        return self.metadata.get("duration_ms", 0)
+
+    def _file(self, key: str) -> Path | None:
+        name = self.metadata.get("files", {}).get(key)
+        return self.path / name if name else None
+
+    def _read_text(self, key: str) -> str:
+        path = self._file(key)
+        if path is None:
+            return ""
+        with gzip.open(path, "rt", encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+    @property
+    def trace_path(self) -> Path | None:
+        return self._file("trace")
+
+    @property
+    def transcript_path(self) -> Path | None:
+        return self._file("transcript")
+
+    @property
+    def project_path(self) -> Path:
+        """Stand-in project holding the recorded structured logs."""
+        return self.path / PROJECT_DIR
+
+    def read_stdout(self) -> str:
+        return self._read_text("stdout")
+
+    def read_stderr(self) -> str:
+        return self._read_text("stderr")
+
+    def analyze_state_logs(self) -> LogAnalysisResult:
+        """Log analysis of the archived state log content.
+
+        Entries keep the original log file as their source.
+        """
+        result = analyze_log_dirs([self.path / LOGS_DIR])
+        sources = {
+            str(self.path / log["file"]): log.get("source", "")
+            for log in self.metadata.get("files", {}).get("logs", [])
+        }
+        for entry in result.all_entries:
+            entry.source = sources.get(entry.source, entry.source)
+        return result
+
+    def collect(self) -> CollectedData:
+        """CollectedData for the recorded run, with its CLI output attached.
+
+        Runs DataCollector over the archived trace, transcript and
+        structured logs; callers add the CLI and state log analysis the
+        way their live path does.
+        """
+        collector = DataCollector(
+            trace_path=self.trace_path,
+            transcript_path=self.transcript_path,
+            project_path=self.project_path,
+        )
+        data = collector.collect()
+        data.claude_cli_stdout = self.read_stdout()
+        data.claude_cli_stderr = self.read_stderr()
+        return data
+
+
+def read_bundle(path: Path) -> SessionBundle:
+    """Load the bundle in a directory.
+
+    Raises:
+        BundleError: If bundle.json is missing or unreadable, or the
+            bundle has an unknown format
+    """
+    path = Path(path)
+    try:
+        metadata = json.loads((path / BUNDLE_METADATA).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        raise BundleError(f"Cannot read bundle {path}: {e}") from e
+    if not isinstance(metadata, dict) or metadata.get("format") != BUNDLE_FORMAT:
+        raise BundleError(f"Unsupported bundle format in {path}")
+    return SessionBundle(path=path, metadata=metadata)
+
+
+def load_bundle(root: Path, fixture: str, test_id: str) -> SessionBundle | None:
+    """The bundle recorded for a test, or None if there is none."""
+    path = bundle_path(root, fixture, test_id)
+    if not (path / BUNDLE_METADATA).exists():
+        return None
+    return read_bundle(path)
+
+
+def iter_bundles(root: Path) -> Iterator[SessionBundle]:
+    """Every readable bundle under a bundle directory, sorted by path."""
+    root = Path(root)
+    if not root.exists():
+        return
+    for meta_path in sorted(root.glob(f"*/*/{BUNDLE_METADATA}")):
+        try:
+            yield read_bundle(meta_path.parent)
+        except BundleError as e:
+            logger.warning(str(e))
@@ -38,7 +38,8 @@ from typing import Any
 
 from .collector import CollectedData, DataCollector
 from .environment import get_git_state
-from .response_filters import OutputFilterConfig, compile_output_pattern, filter_response_texts
+from .expectation_index import INPUT_JSON, ExpectationIndex
+from .response_filters import OutputFilterConfig, compile_output_pattern
 from .schemas import ArtifactPaths, EnrichedData, TimelineTree
 from .models import (
     ClaudeResponse,
@@ -60,6 +61,7 @@ from .models import (
     TimelineEntry,
     TokenUsage,
 )
+from .timing import phase_stats
 
 logger = logging.getLogger(__name__)
 
@@ -304,6 +306,7 @@ class ReportBuilder:
             generated_at=datetime.now(),
             summary=summary,
             tags=tags,
+            phase_stats=phase_stats(tests),
         )
 
         return FixtureReport(
@@ -354,7 +357,8 @@ class ExpectationEvaluator:
     """Evaluates expectations against collected data.
 
     Takes expectation definitions and checks them against the actual
-    data collected during test execution.
+    data collected during test execution. All expectations of one
+    evaluator share an ExpectationIndex over the data.
     """
 
     def __init__(self, data: CollectedData):
@@ -364,6 +368,29 @@ class ExpectationEvaluator:
             data: CollectedData to evaluate expectations against
         """
         self.data = data
+        self.index = ExpectationIndex(data)
+
+    def prepare(self, expectations: list[tuple[ExpectationType, dict[str, Any]]]) -> None:
+        """Register the regexes of upcoming expectations with the index.
+
+        Tool call patterns over the same tool and flags are then resolved
+        in a single pass when the first of them is evaluated. Invalid
+        patterns are skipped here and reported by evaluate().
+
+        Args:
+            expectations: (expectation_type, expected) pairs
+        """
+        for expectation_type, expected in expectations:
+            if expectation_type not in (ExpectationType.TOOL_CALL, ExpectationType.TOOL_NOT_CALLED):
+                continue
+            pattern = expected.get("pattern", "")
+            if not pattern:
+                continue
+            try:
+                compiled = re.compile(pattern, self._regex_flags(expected.get("flags", "")))
+            except re.error:
+                continue
+            self.index.register(expected.get("tool", ""), INPUT_JSON, compiled)
 
     def evaluate(
         self,
@@ -438,38 +465,38 @@ class ExpectationEvaluator:
         flags = self._regex_flags(expected.get("flags", ""))
         compiled = re.compile(pattern, flags) if pattern else None
 
-        # Search for matching tool call
-        for i, tc in enumerate(self.data.tool_calls, 1):
-            if tc.tool_name != tool_name:
-                continue
-
-            # Check pattern against tool input
-            input_str = json.dumps(tc.tool_input)
-            if compiled is None or compiled.search(input_str):
-                # Match found
-                output_preview = ""
-                if tc.tool_response:
-                    stdout = tc.tool_response.get("stdout", "")
-                    if stdout:
-                        output_preview = stdout[:100] + "..." if len(stdout) > 100 else stdout
+        # First matching call, from the shared index
+        positions = self.index.tool_positions(tool_name)
+        if compiled is None:
+            i = positions[0] + 1 if positions else None
+        else:
+            i = self.index.first_match(tool_name, INPUT_JSON, compiled)
+        if i is not None:
+            tc = self.data.tool_calls[i - 1]
+            # Match found
+            output_preview = ""
+            if tc.tool_response:
+                stdout = tc.tool_response.get("stdout", "")
+                if stdout:
+                    output_preview = stdout[:100] + "..." if len(stdout) > 100 else stdout
 
-                return Expectation(
-                    id=expectation_id,
-                    description=description,
-                    type=ExpectationType.TOOL_CALL,
-                    status=TestStatus.PASS,
-                    has_details=True,
-                    expected=expected,
-                    actual={
-                        "tool": tc.tool_name,
-                        "command": tc.tool_input.get("command", str(tc.tool_input)),
-                        "output_preview": output_preview,
-                    },
-                    matched_at={
-                        "sequence": i,
-                        "timestamp": tc.pre_timestamp or tc.post_timestamp or datetime.now(),
-                    },
-                )
+            return Expectation(
+                id=expectation_id,
+                description=description,
+                type=ExpectationType.TOOL_CALL,
+                status=TestStatus.PASS,
+                has_details=True,
+                expected=expected,
+                actual={
+                    "tool": tc.tool_name,
+                    "command": tc.tool_input.get("command", str(tc.tool_input)),
+                    "output_preview": output_preview,
+                },
+                matched_at={
+                    "sequence": i,
+                    "timestamp": tc.pre_timestamp or tc.post_timestamp or datetime.now(),
+                },
+            )
 
         # No match found
         return Expectation(
@@ -533,11 +560,11 @@ class ExpectationEvaluator:
         elif isinstance(has_fields, list):
             required_fields = [field for field in has_fields if isinstance(field, str)]
 
-        # Search for matching event
-        for event in self.data.raw_hook_events:
-            evt = event.get("event") or event.get("hook_event_name")
-            if evt != event_type:
-                continue
+        # Search indexed records; only candidates whose record fields match
+        # the filters are decoded
+        for record in self.index.hook_candidates(event_type, filters):
+            evt = record.kind
+            event = self.index.hook_event(record)
 
             # Check filters
             if filters:
@@ -708,12 +735,11 @@ class ExpectationEvaluator:
             flags=flags_str,
             case_sensitive=case_sensitive,
         )
-        response_texts = filter_response_texts(
-            self.data,
+        response_texts = self.index.response_texts(
             OutputFilterConfig(
                 response_filter=response_filter,
                 exclude_prompt=exclude_prompt,
-            ),
+            )
         )
 
         # Search in Claude responses
@@ -0,0 +1,207 @@
+"""
+Result cache for skipping unchanged harness tests.
+
+Every harness test runs the real ``claude`` CLI, which costs minutes and
+tokens, although most runs change nothing a test depends on. Each passing
+TestResult is stored under a key that covers everything that decides the
+outcome:
+
+- the test YAML and the fixture YAML (parsed, so comments and formatting
+  do not count)
+- the fixture's plugins: the content hash of each locally packaged plugin
+  plus the sc-install sources (see plugin_snapshots.snapshot_key), or the
+  plugin spec alone for marketplace plugins
+- the harness sources (collector, expectations, report builders)
+- the model name
+
+With ``--changed-only`` a test whose key matches a stored result is not run;
+the stored TestResult is reported with ``cached=True``. Failed results are
+never stored, so failing or flaky tests always run again.
+
+    <cache>/<fixture>/<test_id>.json   {"format", "key", "stored_at", "result"}
+
+Environment:
+  SC_TEST_RESULT_CACHE  Cache directory, or "off" to neither store nor reuse
+                        results (default: <reports>/result-cache)
+
+Example usage:
+    from harness.result_cache import load_cached_result, result_key, store_result
+
+    key = result_key(test_yaml, fixture_yaml, ["sc-startup@synaptic-canvas"], "haiku", sc_path)
+    result = load_cached_result(root, "sc-startup", "sc-startup-001", key)
+    if result is None:
+        result = run_the_test()
+        store_result(root, "sc-startup", "sc-startup-001", key, result)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+from pydantic import ValidationError
+
+from .models import TestResult, TestStatus
+from .plugin_snapshots import installer_digest, package_digest
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RESULT_CACHE_ENV = "SC_TEST_RESULT_CACHE"
+CACHE_FORMAT = 1
+HARNESS_DIR = Path(__file__).resolve().parent
+
+# Harness sources are hashed once per process
+_harness_digest: str | None = None
+
+
+def result_cache_root(reports_path: Path) -> Path | None:
+    """Directory holding cached results; None when caching is disabled."""
+    override = os.environ.get(RESULT_CACHE_ENV)
+    if override is not None:
+        if override.strip().lower() in ("", "0", "off", "none"):
+            return None
+        return Path(override)
+    return Path(reports_path) / "result-cache"
+
+
+def cached_result_path(root: Path, fixture: str, test_id: str) -> Path:
+    """File holding one test's cached result."""
+    return Path(root) / fixture / f"{test_id}.json"
+
+
+# =============================================================================
+# Keys
+# =============================================================================
+
+
+def _config_digest(path: Path | None) -> str:
+    """Hash of a YAML file's parsed content ("" if it does not exist)."""
+    if path is None or not Path(path).is_file():
+        return ""
+    data = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def harness_digest() -> str:
+    """Hash of the harness sources, excluding its own tests and caches."""
+    global _harness_digest
+    if _harness_digest is None:
+        digest = hashlib.sha256()
+        for dirpath, dirnames, filenames in os.walk(HARNESS_DIR):
+            dirnames[:] = sorted(
+                d for d in dirnames
+                if d not in ("tests", "__pycache__") and not d.startswith(".")
+            )
+            for name in sorted(filenames):
+                path = Path(dirpath) / name
+                digest.update(f"{path.relative_to(HARNESS_DIR).as_posix()}\0".encode())
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+        _harness_digest = digest.hexdigest()
+    return _harness_digest
+
+
+def _plugins_digest(plugins: list[str], sc_path: Path | None) -> list[list[str]]:
+    digests = []
+    for spec in plugins:
+        package_dir = sc_path / "packages" / spec.split("@")[0] if sc_path else None
+        if package_dir is not None and package_dir.is_dir():
+            digests.append([spec, package_digest(package_dir)])
+        else:
+            digests.append([spec, ""])
+    if sc_path is not None and any(digest for _, digest in digests):
+        digests.append(["sc-install", installer_digest(sc_path)])
+    return digests
+
+
+def result_key(
+    test_path: Path | None,
+    fixture_path: Path | None,
+    plugins: list[str],
+    model: str,
+    sc_path: Path | None = None,
+) -> str:
+    """Content address of everything that decides a test's result.
+
+    Args:
+        test_path: The test's YAML file
+        fixture_path: The fixture's fixture.yaml
+        plugins: Plugin specs installed for the test, in install order
+        model: Model the test runs with
+        sc_path: synaptic-canvas checkout holding packages/ (None: specs only)
+    """
+    payload = {
+        "format": CACHE_FORMAT,
+        "test": _config_digest(test_path),
+        "fixture": _config_digest(fixture_path),
+        "plugins": _plugins_digest(plugins, sc_path),
+        "harness": harness_digest(),
+        "model": model,
+    }
+    return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+
+
+# =============================================================================
+# Storage
+# =============================================================================
+
+
+def store_result(root: Path, fixture: str, test_id: str, key: str, result: TestResult) -> bool:
+    """Cache a passing result, replacing any earlier one of the test.
+
+    Returns:
+        True if the result was stored (failed and skipped results are not)
+    """
+    if result.status != TestStatus.PASS or result.cached:
+        return False
+    path = cached_result_path(root, fixture, test_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "format": CACHE_FORMAT,
+        "key": key,
+        "stored_at": datetime.now().isoformat(),
+        "result": result.model_dump(mode="json"),
+    }
+    staging = path.parent / f".{test_id}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        staging.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(staging, path)
+    finally:
+        staging.unlink(missing_ok=True)
+    logger.debug(f"Cached result for {fixture}/{test_id}: {path}")
+    return True
+
+
+def load_cached_result(root: Path, fixture: str, test_id: str, key: str) -> TestResult | None:
+    """The cached result of a test if it was stored under key, else None.
+
+    The returned result is marked ``cached=True``. Unreadable entries are
+    treated as misses.
+    """
+    path = cached_result_path(root, fixture, test_id)
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cached result {path}: {e}")
+        return None
+    if not isinstance(entry, dict) or entry.get("format") != CACHE_FORMAT or entry.get("key") != key:
+        return None
+    try:
+        result = TestResult.model_validate(entry["result"])
+    except (KeyError, ValidationError) as e:
+        logger.warning(f"Ignoring invalid cached result {path}: {e}")
+        return None
+    result.cached = True
+    return result
@@ -19,23 +19,47 @@ Example usage:
 
     # Run specific test
     result = runner.run_test("sc-startup", "test_readonly.yaml")
+
+    # Run a fixture's tests on 4 workers (own trace file, HOME and project copy each)
+    report = runner.run_fixture("sc-startup", workers=4)
+
+    # Re-evaluate the sessions recorded in reports/bundles without Claude
+    runner = TestRunner(project_path, replay_path="reports/bundles")
+
+    # Reuse cached results of tests whose YAML, plugins and model are unchanged
+    runner = TestRunner(project_path, changed_only=True)
+
+    # Record a cProfile of every test next to its phase timings
+    runner = TestRunner(project_path, profile={"cpu"})
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import queue
+import shutil
 import subprocess
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import yaml
 
 from .collector import CollectedData, DataCollector
 from .environment import get_git_state, isolated_claude_session
-from .log_analyzer import analyze_logs, collect_log_content
+from .log_analyzer import (
+    LogAnalysisResult,
+    analyze_log_dirs,
+    analyze_logs,
+    merge_log_analysis,
+    snapshot_log_offsets,
+)
 from .models import (
     ClaudeResponse,
     DebugInfo,
@@ -53,6 +77,13 @@ from .models import (
     TestResult,
     TestStatus,
 )
+from .replay import BundleError, bundles_root, load_bundle, write_bundle
+from .result_cache import (
+    load_cached_result,
+    result_cache_root,
+    result_key,
+    store_result,
+)
 from .reporter import (
     ExpectationEvaluator,
     ReportBuilder,
@@ -62,6 +93,7 @@ from .html_report import (
     HTMLReportBuilder,
     write_html_report,
 )
+from .timing import PhaseTimer, parse_profile_modes
 
 # Backward compatibility alias
 HTMLReportGenerator = HTMLReportBuilder
@@ -207,6 +239,10 @@ class TestRunner:
         project_path: str | Path,
         fixtures_path: str | Path | None = None,
         reports_path: str | Path | None = None,
+        workers: int = 1,
+        replay_path: str | Path | None = None,
+        changed_only: bool = False,
+        profile: Iterable[str] = (),
     ):
         """Initialize the TestRunner.
 
@@ -214,6 +250,14 @@ class TestRunner:
             project_path: Path to the test project
             fixtures_path: Path to fixtures directory (default: project_path/fixtures)
             reports_path: Path for reports (default: project_path/reports)
+            workers: Tests run concurrently per fixture (default: 1, sequential)
+            replay_path: Evaluate the session bundles recorded here instead
+                of running Claude (see harness.replay)
+            changed_only: Reuse the cached result of a test whose test and
+                fixture YAML, plugins and model are unchanged instead of
+                running it (see harness.result_cache)
+            profile: Profiling modes recorded with each test's phase
+                timings, "cpu" and/or "memory" (see harness.timing)
         """
         self.project_path = Path(project_path).absolute()
         self.fixtures_path = (
@@ -226,6 +270,14 @@ class TestRunner:
             if reports_path
             else self.project_path / "reports"
         )
+        self.workers = max(1, workers)
+        self.replay_path = Path(replay_path).absolute() if replay_path else None
+        # Runs are archived for replay unless SC_TEST_BUNDLES=off (never while replaying)
+        self.bundles_path = None if self.replay_path else bundles_root(self.reports_path)
+        # Passing live results are cached unless SC_TEST_RESULT_CACHE=off
+        self.changed_only = changed_only
+        self.result_cache_path = None if self.replay_path else result_cache_root(self.reports_path)
+        self.profile = frozenset(profile)
 
         # Ensure directories exist
         self.reports_path.mkdir(parents=True, exist_ok=True)
@@ -274,13 +326,22 @@ class TestRunner:
         fixture_name: str,
         test_filter: str | None = None,
         generate_html: bool = True,
+        workers: int | None = None,
     ) -> FixtureReport:
         """Run all tests in a fixture.
 
+        With more than one worker, tests run concurrently, longest first by
+        the durations recorded in the previous report for this fixture.
+        Each worker has its own trace file and its own copy of the project
+        (plugin installs and .claude/state/logs included), and every test
+        already gets its own isolated HOME. Results are reported in
+        discovery order either way.
+
         Args:
             fixture_name: Name of the fixture to run
             test_filter: Optional filter for test names (substring match)
             generate_html: Whether to generate HTML report
+            workers: Override the runner's worker count for this fixture
 
         Returns:
             FixtureReport with all test results
@@ -295,35 +356,140 @@ class TestRunner:
         if test_filter:
             test_paths = [p for p in test_paths if test_filter in p.stem]
 
+        timer = PhaseTimer()
+
         # Run tests
-        results = []
-        for test_path in test_paths:
-            result = self.run_test(fixture_name, test_path.name, fixture_config)
-            results.append(result)
+        workers = max(1, workers or self.workers)
+        with timer.span("tests"):
+            if workers > 1 and len(test_paths) > 1:
+                results = self._run_tests_parallel(
+                    fixture_name, test_paths, fixture_config, workers
+                )
+            else:
+                results = [
+                    self.run_test(fixture_name, test_path.name, fixture_config)
+                    for test_path in test_paths
+                ]
 
         # Build fixture report
-        builder = ReportBuilder(self.project_path)
-        report = builder.build_fixture_report(
-            fixture_id=fixture_name,
-            fixture_name=fixture_config.description or fixture_name,
-            package=fixture_config.package,
-            tests=results,
-            report_path=str(self.reports_path / f"{fixture_name}.json"),
-        )
+        with timer.span("report"):
+            builder = ReportBuilder(self.project_path)
+            report = builder.build_fixture_report(
+                fixture_id=fixture_name,
+                fixture_name=fixture_config.description or fixture_name,
+                package=fixture_config.package,
+                tests=results,
+                report_path=str(self.reports_path / f"{fixture_name}.json"),
+            )
 
-        # Write reports
+        # Write reports; the JSON report includes the HTML rendering time
+        if generate_html:
+            with timer.span("html"):
+                html_path = self.reports_path / f"{fixture_name}.html"
+                write_html_report(report, html_path)
+
+        timer.finish()
+        report.fixture.phases = timer.phases
         json_path = self.reports_path / f"{fixture_name}.json"
         write_json_report(report, json_path)
 
-        if generate_html:
-            html_path = self.reports_path / f"{fixture_name}.html"
-            write_html_report(report, html_path)
-
         logger.info(
             f"Fixture complete: {report.fixture.summary.passed}/{report.fixture.summary.total_tests} passed"
         )
         return report
 
+    def worker_trace_path(self, worker: int) -> Path:
+        """Trace file used by a parallel worker (hooks write via SC_TRACE_PATH)."""
+        return self.reports_path / f"trace.worker-{worker}.jsonl"
+
+    def historical_durations(self, fixture_name: str) -> dict[str, int]:
+        """Test durations (ms) from the last report written for a fixture.
+
+        Returns:
+            Dict of test_id -> duration_ms; empty if no readable report exists
+        """
+        report_path = self.reports_path / f"{fixture_name}.json"
+        try:
+            data = json.loads(report_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        durations = {}
+        for test in data.get("tests", []) if isinstance(data, dict) else []:
+            if isinstance(test, dict) and isinstance(test.get("duration_ms"), int):
+                if test.get("status") != TestStatus.SKIPPED.value:
+                    durations[test.get("test_id")] = test["duration_ms"]
+        return durations
+
+    def schedule_tests(self, fixture_name: str, test_paths: list[Path]) -> list[Path]:
+        """Order tests longest-first by historical duration.
+
+        Tests without history run first (they may be the longest); ties keep
+        discovery order.
+        """
+        durations = self.historical_durations(fixture_name)
+
+        def expected_ms(test_path: Path) -> float:
+            try:
+                test_id = TestConfig.from_yaml(test_path).test_id
+            except Exception:
+                test_id = test_path.stem
+            return durations.get(test_id, float("inf"))
+
+        return sorted(test_paths, key=expected_ms, reverse=True)
+
+    def copy_project(self, dest_root: Path) -> Path:
+        """Copy the project for one parallel worker.
+
+        The copy keeps the project's directory name (sc-install expands
+        {{REPO_NAME}} from it) and leaves out the reports directory.
+
+        Returns:
+            Path of the copy, dest_root/<project name>
+        """
+        dest = dest_root / self.project_path.name
+
+        def ignore(directory: str, names: list[str]) -> list[str]:
+            return [name for name in names if Path(directory, name) == self.reports_path]
+
+        shutil.copytree(self.project_path, dest, symlinks=True, ignore=ignore)
+        return dest
+
+    def _run_tests_parallel(
+        self,
+        fixture_name: str,
+        test_paths: list[Path],
+        fixture_config: FixtureConfig,
+        workers: int,
+    ) -> list[TestResult]:
+        """Run tests on a worker pool; results come back in discovery order."""
+        workers = min(workers, len(test_paths))
+        logger.info(f"Running {len(test_paths)} tests on {workers} workers")
+
+        with tempfile.TemporaryDirectory(prefix="harness-workers-") as tmp:
+            # Each worker slot owns one trace file and one project copy, so
+            # plugin installs and state log offsets never mix between tests
+            projects = [self.copy_project(Path(tmp) / f"worker-{worker}") for worker in range(workers)]
+            slots: queue.Queue[int] = queue.Queue()
+            for worker in range(workers):
+                slots.put(worker)
+
+            def run(test_path: Path) -> TestResult:
+                worker = slots.get()
+                try:
+                    return self.run_test(
+                        fixture_name,
+                        test_path.name,
+                        fixture_config,
+                        trace_path=self.worker_trace_path(worker),
+                        project_path=projects[worker],
+                    )
+                finally:
+                    slots.put(worker)
+
+            order = self.schedule_tests(fixture_name, test_paths)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="harness-worker") as pool:
+                futures = {path: pool.submit(run, path) for path in order}
+                return [futures[path].result() for path in test_paths]
 
     def _install_plugins(
         self,
@@ -411,6 +577,8 @@ class TestRunner:
         fixture_name: str,
         test_file: str,
         fixture_config: FixtureConfig | None = None,
+        trace_path: Path | None = None,
+        project_path: Path | None = None,
     ) -> TestResult:
         """Run a single test.
 
@@ -418,11 +586,15 @@ class TestRunner:
             fixture_name: Name of the fixture
             test_file: Name of the test YAML file
             fixture_config: Optional pre-loaded fixture config
+            trace_path: Hook trace file (default: reports_path/trace.jsonl)
+            project_path: Project Claude runs in (default: the runner's
+                project; parallel workers pass their own copy)
 
         Returns:
             TestResult with test outcome
         """
         fixture_dir = self.fixtures_path / fixture_name
+        project_path = project_path or self.project_path
 
         # Load configs
         if fixture_config is None:
@@ -449,6 +621,31 @@ class TestRunner:
 
         cleanup_commands = fixture_config.teardown_commands.copy()
 
+        # Phases of this test, with optional profiling (see harness.timing)
+        timer = PhaseTimer(self.profile)
+
+        # Offline replay: evaluate the recorded session, no Claude invocation
+        if self.replay_path is not None:
+            try:
+                test_result = self._replay_test(
+                    fixture_name, fixture_config, test_config,
+                    test_command, setup_commands, cleanup_commands, timer,
+                )
+            finally:
+                timer.finish()
+            return timer.apply(test_result)
+
+        # Unchanged since its last passing run: reuse that result
+        cache_key = self._result_key(fixture_dir, fixture_config, test_path, test_config)
+        if self.changed_only and cache_key is not None:
+            cached = load_cached_result(
+                self.result_cache_path, fixture_name, test_config.test_id, cache_key
+            )
+            if cached is not None:
+                timer.finish()
+                logger.info(f"Reusing cached result: {test_config.test_id}")
+                return cached
+
         # Track installed plugins for cleanup
         installed_files: list[Path] = []
         installed_dirs: list[Path] = []
@@ -458,106 +655,80 @@ class TestRunner:
         start_timestamp = datetime.now()
 
         try:
-            with isolated_claude_session(
-                project_path=self.project_path,
-                trace_path=self.reports_path / "trace.jsonl",
-            ) as session:
+            with ExitStack() as stack:
+                with timer.span("home"):
+                    session = stack.enter_context(isolated_claude_session(
+                        project_path=project_path,
+                        trace_path=trace_path or self.reports_path / "trace.jsonl",
+                    ))
+
+                # Log directories outlive a test; only analyze what this one appends
+                log_dirs = [
+                    session.isolated_home / ".claude" / "state" / "logs",
+                    project_path / ".claude" / "state" / "logs",
+                ]
+                log_offsets = snapshot_log_offsets(log_dirs)
+
                 # Install plugins before running the test
-                installed_files, installed_dirs = self._install_plugins(
-                    session, fixture_config.setup_plugins
-                )
+                with timer.span("plugins"):
+                    installed_files, installed_dirs = self._install_plugins(
+                        session, fixture_config.setup_plugins
+                    )
 
                 # Run the test
-                result = session.run_command(
-                    prompt=test_config.prompt,
-                    model=test_config.model,
-                    tools=test_config.tools if test_config.tools else None,
-                    timeout=test_config.timeout_ms // 1000,
-                )
+                with timer.span("claude"):
+                    result = session.run_command(
+                        prompt=test_config.prompt,
+                        model=test_config.model,
+                        tools=test_config.tools if test_config.tools else None,
+                        timeout=test_config.timeout_ms // 1000,
+                    )
 
                 # Capture Claude CLI output immediately after run_command
                 claude_stdout = session.claude_stdout
                 claude_stderr = session.claude_stderr
 
                 # Find transcript
-                session.find_transcript()
+                with timer.span("transcript"):
+                    session.find_transcript()
 
                 # Collect data
-                collector = DataCollector(
-                    trace_path=session.trace_path,
-                    transcript_path=session.transcript_path,
-                )
-                collected_data = collector.collect()
+                with timer.span("collect"):
+                    collector = DataCollector(
+                        trace_path=session.trace_path,
+                        transcript_path=session.transcript_path,
+                    )
+                    collected_data = collector.collect()
 
                 # Propagate Claude CLI output to collected data
                 collected_data.claude_cli_stdout = claude_stdout
                 collected_data.claude_cli_stderr = claude_stderr
 
-                # Analyze CLI output plus Claude state logs for warnings/errors
-                log_dirs = [
-                    session.isolated_home / ".claude" / "state" / "logs",
-                    self.project_path / ".claude" / "state" / "logs",
-                ]
-                log_content = collect_log_content(log_dirs)
-                combined_output = ""
-                if claude_stdout:
-                    combined_output += f"=== Claude CLI stdout ===\n{claude_stdout}\n"
-                if claude_stderr:
-                    combined_output += f"=== Claude CLI stderr ===\n{claude_stderr}\n"
-                if log_content:
-                    combined_output += f"=== Claude state logs ===\n{log_content}\n"
-                collected_data.log_analysis = analyze_logs(combined_output)
+                # Archive the run for --replay
+                with timer.span("state_logs"):
+                    state_logs = analyze_log_dirs(log_dirs, log_offsets)
+                with timer.span("record"):
+                    self._record_session(
+                        fixture_name, test_config, session, state_logs,
+                        duration_ms=int((time.time() - start_time) * 1000),
+                    )
 
                 # Fill in missing data
                 if not collected_data.start_timestamp:
                     collected_data.start_timestamp = start_timestamp
-                if not collected_data.prompt:
-                    collected_data.prompt = test_config.prompt
-
-                # Evaluate expectations
-                expectations = self._evaluate_expectations(
-                    test_config.expectations, collected_data
-                )
 
-                # Calculate duration
-                duration_ms = int((time.time() - start_time) * 1000)
-
-                # Build Claude session log from captured output
-                claude_session_log = ""
-                if claude_stdout:
-                    claude_session_log += f"=== Claude CLI stdout ===\n{claude_stdout}\n"
-                if claude_stderr:
-                    claude_session_log += f"=== Claude CLI stderr ===\n{claude_stderr}\n"
-
-                # Build result
-                builder = ReportBuilder(self.project_path)
-                test_result = builder.build_test_result(
-                    test_id=test_config.test_id,
-                    test_name=test_config.test_name,
-                    data=collected_data,
-                    expectations=expectations,
-                    description=test_config.description,
-                    tags=test_config.tags,
-                    model=test_config.model,
-                    tools_allowed=test_config.tools,
-                    fixture_id=fixture_name,
-                    package=fixture_config.package,
-                    test_repo=str(self.project_path),
+                test_result = self._build_result(
+                    fixture_name, fixture_config, test_config, collected_data, state_logs,
+                    duration_ms=int((time.time() - start_time) * 1000),
                     test_command=test_command,
                     setup_commands=setup_commands,
                     cleanup_commands=cleanup_commands,
-                    pytest_output=claude_session_log,
+                    timer=timer,
                 )
 
-                # Override duration with measured time
-                test_result.duration_ms = duration_ms
-
-                logger.info(f"Test complete: {test_config.test_id} - {test_result.status.value}")
-                return test_result
-
         except subprocess.TimeoutExpired:
             duration_ms = int((time.time() - start_time) * 1000)
-            return self._create_timeout_result(
+            test_result = self._create_timeout_result(
                 test_config, fixture_config, duration_ms, test_command,
                 setup_commands, cleanup_commands
             )
@@ -565,7 +736,7 @@ class TestRunner:
         except Exception as e:
             duration_ms = int((time.time() - start_time) * 1000)
             logger.error(f"Test failed with exception: {e}")
-            return self._create_error_result(
+            test_result = self._create_error_result(
                 test_config, fixture_config, duration_ms, str(e),
                 test_command, setup_commands, cleanup_commands
             )
@@ -573,6 +744,200 @@ class TestRunner:
         finally:
             # Clean up installed plugins
             self._cleanup_plugins(installed_files, installed_dirs)
+            timer.finish()
+
+        timer.apply(test_result)
+        self._store_result(fixture_name, test_config, cache_key, test_result)
+        return test_result
+
+    def _build_result(
+        self,
+        fixture_name: str,
+        fixture_config: FixtureConfig,
+        test_config: TestConfig,
+        collected_data: CollectedData,
+        state_logs: LogAnalysisResult,
+        duration_ms: int,
+        test_command: str,
+        setup_commands: list[str],
+        cleanup_commands: list[str],
+        timer: PhaseTimer | None = None,
+    ) -> TestResult:
+        """Analyze logs, evaluate expectations and build the TestResult.
+
+        Shared by live runs and replays; collected_data must carry the
+        Claude CLI output.
+        """
+        timer = timer or PhaseTimer()
+        claude_stdout = collected_data.claude_cli_stdout
+        claude_stderr = collected_data.claude_cli_stderr
+
+        with timer.span("evaluate"):
+            # Analyze CLI output plus Claude state logs for warnings/errors
+            combined_output = ""
+            if claude_stdout:
+                combined_output += f"=== Claude CLI stdout ===\n{claude_stdout}\n"
+            if claude_stderr:
+                combined_output += f"=== Claude CLI stderr ===\n{claude_stderr}\n"
+            collected_data.log_analysis = merge_log_analysis([
+                analyze_logs(combined_output),
+                state_logs,
+            ])
+
+            # Fill in missing data
+            if not collected_data.prompt:
+                collected_data.prompt = test_config.prompt
+
+            # Evaluate expectations
+            expectations = self._evaluate_expectations(
+                test_config.expectations, collected_data
+            )
+
+        # Build result (enrichment, timeline tree)
+        with timer.span("report"):
+            builder = ReportBuilder(self.project_path)
+            test_result = builder.build_test_result(
+                test_id=test_config.test_id,
+                test_name=test_config.test_name,
+                data=collected_data,
+                expectations=expectations,
+                description=test_config.description,
+                tags=test_config.tags,
+                model=test_config.model,
+                tools_allowed=test_config.tools,
+                fixture_id=fixture_name,
+                package=fixture_config.package,
+                test_repo=str(self.project_path),
+                test_command=test_command,
+                setup_commands=setup_commands,
+                cleanup_commands=cleanup_commands,
+                pytest_output=combined_output,
+            )
+
+        # Override duration with measured time
+        test_result.duration_ms = duration_ms
+
+        logger.info(f"Test complete: {test_config.test_id} - {test_result.status.value}")
+        return test_result
+
+    def _record_session(
+        self,
+        fixture_name: str,
+        test_config: TestConfig,
+        session: Any,
+        state_logs: LogAnalysisResult,
+        duration_ms: int,
+    ) -> None:
+        """Archive a run as a replay bundle (never fails the test)."""
+        if self.bundles_path is None:
+            return
+        try:
+            write_bundle(
+                self.bundles_path,
+                fixture_name,
+                test_config.test_id,
+                trace_path=session.trace_path,
+                transcript_path=session.transcript_path,
+                claude_stdout=session.claude_stdout,
+                claude_stderr=session.claude_stderr,
+                state_logs=state_logs,
+                log_dirs={
+                    "home": session.isolated_home / ".claude" / "state" / "logs",
+                    "project": session.project_path / ".claude" / "state" / "logs",
+                },
+                metadata={
+                    "prompt": test_config.prompt,
+                    "model": test_config.model,
+                    "duration_ms": duration_ms,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record session bundle for {test_config.test_id}: {e}")
+
+    def _result_key(
+        self,
+        fixture_dir: Path,
+        fixture_config: FixtureConfig,
+        test_path: Path,
+        test_config: TestConfig,
+    ) -> str | None:
+        """Result cache key of a test; None when results are not cached."""
+        if self.result_cache_path is None:
+            return None
+        from .plugin_snapshots import find_synaptic_canvas_path
+
+        try:
+            return result_key(
+                test_path,
+                fixture_dir / "fixture.yaml",
+                fixture_config.setup_plugins,
+                test_config.model,
+                find_synaptic_canvas_path(self.fixtures_path),
+            )
+        except Exception as e:
+            logger.warning(f"Cannot compute result cache key for {test_config.test_id}: {e}")
+            return None
+
+    def _store_result(
+        self,
+        fixture_name: str,
+        test_config: TestConfig,
+        cache_key: str | None,
+        test_result: TestResult,
+    ) -> None:
+        """Cache a passing live result for --changed-only (never fails the test)."""
+        if cache_key is None:
+            return
+        try:
+            store_result(self.result_cache_path, fixture_name, test_config.test_id, cache_key, test_result)
+        except Exception as e:
+            logger.warning(f"Failed to cache result for {test_config.test_id}: {e}")
+
+    def _replay_test(
+        self,
+        fixture_name: str,
+        fixture_config: FixtureConfig,
+        test_config: TestConfig,
+        test_command: str,
+        setup_commands: list[str],
+        cleanup_commands: list[str],
+        timer: PhaseTimer,
+    ) -> TestResult:
+        """Evaluate a test against its recorded bundle instead of running Claude."""
+        try:
+            bundle = load_bundle(self.replay_path, fixture_name, test_config.test_id)
+        except BundleError as e:
+            return self._create_error_result(
+                test_config, fixture_config, 0, str(e),
+                test_command, setup_commands, cleanup_commands
+            )
+        if bundle is None:
+            return self._create_skipped_result(
+                test_config, fixture_config,
+                reason=f"No recorded session in {self.replay_path}",
+            )
+
+        # Report the recorded run's duration, not the replay's
+        duration_ms = int(bundle.duration_ms)
+        try:
+            with timer.span("collect"):
+                collected_data = bundle.collect()
+            with timer.span("state_logs"):
+                state_logs = bundle.analyze_state_logs()
+            return self._build_result(
+                fixture_name, fixture_config, test_config, collected_data, state_logs,
+                duration_ms=duration_ms,
+                test_command=test_command,
+                setup_commands=setup_commands,
+                cleanup_commands=cleanup_commands,
+                timer=timer,
+            )
+        except Exception as e:
+            logger.error(f"Replay failed with exception: {e}")
+            return self._create_error_result(
+                test_config, fixture_config, duration_ms, str(e),
+                test_command, setup_commands, cleanup_commands
+            )
 
     def _build_test_command(self, test_config: TestConfig) -> str:
         """Build the Claude CLI command string."""
@@ -599,6 +964,10 @@ class TestRunner:
     ) -> list[Expectation]:
         """Evaluate expectations against collected data."""
         evaluator = ExpectationEvaluator(data)
+        evaluator.prepare([
+            (ExpectationType(exp_config.get("type", "tool_call")), exp_config.get("expected", {}))
+            for exp_config in expectation_configs
+        ])
         results = []
 
         for exp_config in expectation_configs:
@@ -617,6 +986,7 @@ class TestRunner:
         self,
         test_config: TestConfig,
         fixture_config: FixtureConfig,
+        reason: str | None = None,
     ) -> TestResult:
         """Create a result for a skipped test."""
         return TestResult(
@@ -630,7 +1000,7 @@ class TestRunner:
             status_icon=StatusIcon.SKIPPED,
             pass_rate="0/0",
             tags=test_config.tags,
-            skip_reason=test_config.skip_reason,
+            skip_reason=reason or test_config.skip_reason,
             metadata=TestMetadata(
                 fixture=fixture_config.name,
                 package=fixture_config.package,
@@ -796,6 +1166,30 @@ def main():
         action="store_true",
         help="Skip HTML report generation",
     )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=1,
+        help="Run up to N tests of a fixture concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="BUNDLE_DIR",
+        help="Re-evaluate recorded session bundles instead of running Claude",
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Reuse cached results of tests whose YAML, plugins and model are unchanged",
+    )
+    parser.add_argument(
+        "--phase-profile",
+        metavar="MODES",
+        type=parse_profile_modes,
+        default=frozenset(),
+        help="Profile each test alongside its phase timings: cpu, memory or all",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -816,6 +1210,10 @@ def main():
     runner = TestRunner(
         project_path=args.project,
         fixtures_path=args.fixtures,
+        workers=args.workers,
+        replay_path=args.replay,
+        changed_only=args.changed_only,
+        profile=args.phase_profile,
     )
 
     # Run tests
@@ -0,0 +1,18 @@
+"""
+Pytest configuration for the harness unit tests.
+
+Real fixture runs use marketplace templates and plugin snapshots by
+default; the unit tests copy marketplace data directly and run sc-install
+per plugin unless a test opts into templates or snapshots.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _harness_unit_test_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable marketplace templates and plugin snapshots for harness unit tests."""
+    monkeypatch.setenv("SC_TEST_HOME_TEMPLATES", "off")
+    monkeypatch.setenv("SC_PLUGIN_SNAPSHOTS", "off")
@@ -34,8 +34,13 @@ from harness.html_report.assets import (
     JS_TOGGLE_FUNCTIONS,
     JS_MARKDOWN_RENDERER,
     JS_ASSESSMENT_LOADER,
+    JS_LAZY_TIMELINE,
     JS_INITIALIZATION,
     get_all_scripts,
+    # Shared asset files
+    SHARED_ASSETS_ENV,
+    shared_asset_urls,
+    shared_assets_enabled,
     # Manager class
     AssetManager,
 )
@@ -516,6 +521,44 @@ class TestJSInitialization:
         assert "document.readyState" in JS_INITIALIZATION
 
 
+class TestJSLazyTimeline:
+    """Tests for lazy timeline JavaScript."""
+
+    def test_decompresses_payload(self):
+        """Verify payloads are gzip-decompressed in the browser."""
+        assert "DecompressionStream('gzip')" in JS_LAZY_TIMELINE
+        assert "function loadTimeline" in JS_LAZY_TIMELINE
+
+    def test_loads_on_open(self):
+        """Verify timelines render when their section is opened."""
+        assert "details[data-lazy-timeline]" in JS_LAZY_TIMELINE
+        assert "'toggle'" in JS_LAZY_TIMELINE
+
+    def test_copy_timeline_loads_first(self):
+        """Verify copying a lazy timeline renders it first."""
+        assert "await loadTimeline(timelineId)" in get_all_scripts()
+
+
+class TestSharedAssets:
+    """Tests for shared asset file names and the env switch."""
+
+    def test_urls_are_content_addressed(self):
+        """Verify asset names carry a hash of their content."""
+        css_url, js_url = shared_asset_urls()
+        assert css_url.startswith("report-assets/report-") and css_url.endswith(".css")
+        assert js_url.endswith(".js")
+        assert shared_asset_urls() == (css_url, js_url)
+
+    def test_env_switch(self, monkeypatch):
+        """Verify SC_REPORT_SHARED_ASSETS enables shared assets."""
+        monkeypatch.delenv(SHARED_ASSETS_ENV, raising=False)
+        assert not shared_assets_enabled()
+        monkeypatch.setenv(SHARED_ASSETS_ENV, "on")
+        assert shared_assets_enabled()
+        monkeypatch.setenv(SHARED_ASSETS_ENV, "off")
+        assert not shared_assets_enabled()
+
+
 class TestGetAllCss:
     """Tests for combined CSS output."""
 
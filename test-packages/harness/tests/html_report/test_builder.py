@@ -6,6 +6,8 @@ These tests verify the main HTMLReportBuilder orchestrator.
 import pytest
 from datetime import datetime
 
+from harness.html_report.assets import SHARED_ASSETS_DIR, get_all_css, get_all_scripts
+
 from harness.models import (
     FixtureReport,
     FixtureMeta,
@@ -397,3 +399,38 @@ class TestHTMLReportBuilderTransforms:
         assert timeline.timeline_id == "timeline-1"
         assert len(timeline.entries) == 2
         assert timeline.tool_call_count == 2
+
+
+class TestHTMLReportBuilderWrite:
+    """Tests for streaming reports to files."""
+
+    def test_write_matches_build(self, tmp_path):
+        """Test write() streams the same document build() returns."""
+        builder = HTMLReportBuilder()
+        report = create_fixture_report([
+            create_minimal_test_result("test-1", "Test One"),
+            create_minimal_test_result("test-2", "Test Two", TestStatus.FAIL),
+        ])
+
+        path = builder.write(report, tmp_path / "nested" / "report.html")
+
+        assert path.read_text(encoding="utf-8") == builder.build(report)
+        assert [p.name for p in path.parent.iterdir()] == ["report.html"]
+
+    def test_shared_assets(self, tmp_path):
+        """Test shared assets are linked and written once per directory."""
+        builder = HTMLReportBuilder(BuilderConfig(shared_assets=True))
+        report = create_fixture_report()
+
+        first = builder.write(report, tmp_path / "first.html").read_text(encoding="utf-8")
+        builder.write(report, tmp_path / "second.html")
+
+        assets = sorted((tmp_path / SHARED_ASSETS_DIR).iterdir(), key=lambda p: p.suffix)
+        assert [p.suffix for p in assets] == [".css", ".js"]
+        assert assets[0].read_text(encoding="utf-8") == get_all_css()
+        assert assets[1].read_text(encoding="utf-8") == get_all_scripts()
+        assert f'<link rel="stylesheet" href="{SHARED_ASSETS_DIR}/{assets[0].name}">' in first
+        assert f'<script src="{SHARED_ASSETS_DIR}/{assets[1].name}"></script>' in first
+        assert "<style>" not in first
+        assert len(first) < len(HTMLReportBuilder().build(report)) / 4
+
@@ -3,10 +3,15 @@
 These tests verify the HTML component builders generate correct output.
 """
 
+import base64
+import gzip
+import json
+import re
+
 import pytest
 from datetime import datetime
 
-from harness.models import TestStatus, TimelineEntryType
+from harness.models import PhaseStats, PhaseTiming, ProfileHotspot, TestStatus, TimelineEntryType
 from harness.html_report.models import (
     BuilderConfig,
     HeaderDisplayModel,
@@ -114,6 +119,34 @@ class TestHeaderBuilder:
         assert "startup" in html
         assert "5 tests" in html
         assert "3 passed, 2 failed" in html
+        assert "phase-stats" not in html
+
+    def test_header_phase_stats(self):
+        """Test phase percentiles are listed with nested phases indented."""
+        builder = HeaderBuilder()
+        data = HeaderDisplayModel(
+            fixture_name="Test Fixture",
+            package="sc-startup",
+            agent_or_skill="startup",
+            total_tests=4,
+            summary_text="4 passed",
+            generated_at=datetime(2024, 1, 15, 10, 30, 0),
+            report_path="/path/to/report.html",
+            phase_stats=[
+                PhaseStats(name="claude", depth=0, count=4, p50_ms=61000, p90_ms=88500,
+                           max_ms=95000, total_ms=250000),
+                PhaseStats(name="evaluate/expectations", depth=1, count=4, p50_ms=12.4,
+                           p90_ms=20, max_ms=21, total_ms=60),
+            ],
+        )
+        html = builder.build(data)
+
+        assert "Phase timings (4 test runs)" in html
+        assert "<td>61.0 s</td>" in html
+        assert "<td>88.5 s</td>" in html
+        assert '<tr class="phase-depth-1">' in html
+        assert "<td>expectations</td>" in html
+        assert "<td>12 ms</td>" in html
 
     def test_header_with_file_links(self):
         """Test header with file path links.
@@ -208,6 +241,22 @@ class TestStatusBannerBuilder:
         assert 'class="status-banner fail"' in html
         assert "FAIL" in html
 
+    def test_cached_banner(self):
+        """Test a result reused from the result cache is marked."""
+        builder = StatusBannerBuilder()
+        data = StatusBannerDisplayModel(
+            status=TestStatus.PASS,
+            passed_count=2,
+            total_count=2,
+            duration_seconds=90.0,
+            timestamp=datetime(2024, 1, 15, 10, 30, 0),
+            cached=True,
+        )
+        html = builder.build(data)
+
+        assert '<div class="cached">cached result</div>' in html
+        assert "cached result" not in builder.build(data.model_copy(update={"cached": False}))
+
 
 class TestExpectationsBuilder:
     """Tests for ExpectationsBuilder component."""
@@ -307,6 +356,38 @@ class TestTimelineBuilder:
         assert 'class="timeline-item tool_call depth-0"' in html
         assert "#1" in html
         assert "#2" in html
+        assert "data-lazy-timeline" not in html
+
+    def test_lazy_timeline_payload(self):
+        """Test long timelines are embedded compressed instead of rendered inline."""
+        data = TimelineDisplayModel(
+            timeline_id="timeline-3",
+            entries=[
+                TimelineItemDisplayModel(
+                    seq=i,
+                    entry_type=TimelineEntryType.TOOL_CALL,
+                    tool_name="Bash",
+                    elapsed_ms=i * 100,
+                    command=f"echo step-{i}",
+                )
+                for i in range(1, 6)
+            ],
+            tool_call_count=5
+        )
+        inline_html = TimelineBuilder(BuilderConfig(lazy_timeline_entries=5)).build(data)
+        html = TimelineBuilder(BuilderConfig(lazy_timeline_entries=4)).build(data)
+
+        assert "data-lazy-timeline" not in inline_html
+        assert '<details data-lazy-timeline="timeline-3">' in html
+        assert "Timeline (5 tool calls)" in html
+        assert "timeline-item" not in html
+        match = re.search(
+            r'<script type="application/json" id="timeline-3-data" data-encoding="gzip\+base64">([^<]+)</script>',
+            html,
+        )
+        payload = json.loads(gzip.decompress(base64.b64decode(match.group(1))))
+        assert payload["html"] in inline_html
+        assert "echo step-5" in payload["html"]
 
     def test_timeline_tool_call_content(self):
         """Test tool call entry content."""
@@ -745,6 +826,28 @@ class TestDebugBuilder:
         assert "PASSED" in html
         assert "Side Effects" in html
         assert "No files were created" in html
+        assert "Phase Timings" not in html
+        assert "Profile Hotspots" not in html
+
+    def test_debug_phase_timings(self):
+        """Test per-test phases and profile hotspots are shown when recorded."""
+        builder = DebugBuilder()
+        data = DebugDisplayModel(
+            test_index=1,
+            phases=[
+                PhaseTiming(name="claude", depth=0, start_ms=250, duration_ms=61000, peak_memory_kb=2048),
+                PhaseTiming(name="evaluate/expectations", depth=1, start_ms=61300, duration_ms=4.2),
+            ],
+            profile=[ProfileHotspot(function="collector.py:10(<lambda>)", calls=12, total_ms=3.5, cumulative_ms=9)],
+        )
+        html = builder.build(data)
+
+        assert "<h3>Phase Timings</h3>" in html
+        assert "<td>61.0 s</td>" in html
+        assert "<td>2,048 KB</td>" in html
+        assert '<tr class="phase-depth-1"><td>expectations</td>' in html
+        assert "<h3>Profile Hotspots</h3>" in html
+        assert "collector.py:10(&lt;lambda&gt;)" in html
 
 
 class TestAssessmentBuilder:
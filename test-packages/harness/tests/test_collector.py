@@ -10,6 +10,7 @@ Tests the data collection functionality including:
 """
 
 import json
+import pickle
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -22,11 +23,15 @@ from harness.collector import (
     CorrelatedToolCall,
     DataCollector,
     SubagentLifecycle,
+    SpooledEvents,
     ToolError,
+    cap_payload,
     correlate_events,
+    correlate_tool_calls_with_agents,
     extract_claude_responses,
     extract_errors_from_transcript,
     extract_tool_names_from_transcript,
+    iter_trace_events,
     parse_timestamp,
     parse_trace_file,
     parse_transcript,
@@ -819,3 +824,136 @@ class TestDataCollector:
 
         intent = collector._infer_intent(tc)
         assert intent == "Check for files"
+
+    def test_reads_jsonl_log_segments(self, tmp_path):
+        """ai_cli's ai-cli-*.jsonl segments are analyzed like per-event .json logs."""
+        log_dir = tmp_path / ".claude" / "state" / "logs" / "sc-codex"
+        log_dir.mkdir(parents=True)
+        (log_dir / "ai-cli-20260120_120000_000.jsonl").write_text(
+            json.dumps({"timestamp": "2026-01-20T12:00:00.000+00:00", "event": "task_start"}) + "\n"
+            + json.dumps({"timestamp": "2026-01-20T12:00:01.000+00:00", "event": "task_end",
+                          "status": "error", "error": "runner exited 3"}) + "\n"
+            + '{"timestamp": "2026-01-20T12:00:02'  # a line still being written
+        )
+        (log_dir / "ai-cli-20260120_115900.json").write_text(
+            json.dumps({"timestamp": "2026-01-20T11:59:00+00:00", "level": "warning", "message": "legacy"}, indent=2)
+        )
+
+        data = DataCollector(project_path=tmp_path).collect()
+
+        assert data.has_errors is True
+        assert [e.message for e in data.log_analysis.errors] == ["runner exited 3"]
+        assert [w.message for w in data.log_analysis.warnings] == ["legacy"]
+
+
+def write_jsonl(path: Path, records: list) -> Path:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return path
+
+
+STREAM_TRACE = [
+    {"event": "SessionStart", "session_id": "s1", "ts": "2026-01-16T01:00:00Z"},
+    {"event": "SubagentStart", "agent_id": "a1", "agent_type": "Explore", "ppid": 7,
+     "ts": "2026-01-16T01:00:02Z"},
+    {"event": "PreToolUse", "tool_name": "Bash", "tool_use_id": "t2", "ppid": 7,
+     "tool_input": {"command": "ls"}, "ts": "2026-01-16T01:00:03Z"},
+    {"event": "PreToolUse", "tool_name": "Read", "tool_use_id": "t1",
+     "stdin": json.dumps({"tool_input": {"file_path": "a.py"}}), "ts": "2026-01-16T01:00:01Z"},
+    {"event": "PostToolUse", "tool_use_id": "t2", "tool_response": {"stdout": "x" * 50},
+     "ts": "2026-01-16T01:00:04Z"},
+    {"event": "SubagentStop", "agent_id": "a1", "agent_transcript_path": "/tmp/a1.jsonl",
+     "ts": "2026-01-16T01:00:05Z"},
+    {"event": "PostToolUse", "tool_use_id": "t9", "tool_name": "Grep", "ts": "2026-01-16T01:00:06Z"},
+    {"event": "SessionEnd", "reason": "done", "ts": "2026-01-16T01:00:07Z"},
+]
+
+STREAM_TRANSCRIPT = [
+    {"type": "tool_use", "id": "t2", "name": "Bash"},
+    {"type": "tool_result", "tool_use_id": "t2", "content": "boom", "is_error": True},
+    {"type": "assistant", "message": {"content": [{"type": "text", "text": "Done"}],
+                                      "usage": {"input_tokens": 3, "output_tokens": 4}}},
+]
+
+
+class TestStreamingCollector:
+    """collect() streams each file once and matches the list-based functions."""
+
+    def test_matches_list_based_functions(self, tmp_path):
+        trace = write_jsonl(tmp_path / "trace.jsonl", STREAM_TRACE)
+        transcript = write_jsonl(tmp_path / "transcript.jsonl", STREAM_TRANSCRIPT)
+
+        data = DataCollector(trace_path=trace, transcript_path=transcript).collect()
+        events = parse_trace_file(trace)
+        tool_calls, subagents = correlate_events(events)
+        errors = extract_errors_from_transcript(STREAM_TRANSCRIPT)
+        extract_tool_names_from_transcript(STREAM_TRANSCRIPT, errors)
+
+        assert [tc.tool_use_id for tc in data.tool_calls] == ["t1", "t2", "t9"]
+        assert [tc.tool_use_id for tc in tool_calls] == ["t1", "t2", "t9"]
+        assert data.subagents == subagents
+        assert data.tool_to_agent_map == correlate_tool_calls_with_agents(events) == {"t2": ("a1", "Explore")}
+        assert data.errors == errors and errors[0].tool_name == "Bash"
+        assert data.tool_calls[1].is_error and data.tool_calls[1].error_content == "boom"
+        assert data.tool_calls[0].tool_input == {"file_path": "a.py"}
+        assert data.session_id == "s1" and data.end_reason == "done"
+        assert data.final_response == "Done"
+        assert data.token_usage.input_tokens == 3 and data.token_usage.output_tokens == 4
+
+    def test_raw_events_are_spooled_and_reiterable(self, tmp_path):
+        trace = write_jsonl(tmp_path / "trace.jsonl", STREAM_TRACE)
+        transcript = write_jsonl(tmp_path / "transcript.jsonl", STREAM_TRANSCRIPT)
+        data = DataCollector(trace_path=trace, transcript_path=transcript).collect()
+        trace.unlink()
+        transcript.unlink()
+
+        assert isinstance(data.raw_hook_events, SpooledEvents)
+        assert len(data.raw_hook_events) == len(STREAM_TRACE)
+        assert data.raw_hook_events[3]["tool_input"] == {"file_path": "a.py"}
+        assert list(data.raw_transcript_entries) == STREAM_TRANSCRIPT
+        assert list(data.raw_transcript_entries) == STREAM_TRANSCRIPT
+        assert pickle.loads(pickle.dumps(data.raw_transcript_entries)) == STREAM_TRANSCRIPT
+
+    def test_spool_rolls_over_to_disk(self):
+        spool = SpooledEvents(max_memory=64)
+        for i in range(100):
+            spool.append_line(json.dumps({"i": i}).encode())
+
+        assert spool.spilled
+        assert [e["i"] for e in spool] == list(range(100))
+        assert spool[-1] == {"i": 99}
+
+    def test_iter_trace_events_is_lazy(self, tmp_path):
+        trace = write_jsonl(tmp_path / "trace.jsonl", STREAM_TRACE)
+        events = iter_trace_events(trace)
+
+        assert next(events)["session_id"] == "s1"
+        assert list(events) == parse_trace_file(trace)[1:]
+
+
+class TestPayloadCap:
+    """Oversized tool_response strings are truncated with a marker."""
+
+    def test_cap_payload(self):
+        capped, dropped = cap_payload({"stdout": "a" * 30, "items": ["b" * 5]}, 10)
+
+        assert dropped == 20
+        assert capped["stdout"].startswith("a" * 10)
+        assert "[truncated 20 chars]" in capped["stdout"]
+        assert capped["items"] == ["b" * 5]
+
+    def test_small_payload_unchanged(self):
+        payload = {"stdout": "ok"}
+        assert cap_payload(payload, 10) == (payload, 0)
+        assert cap_payload("x" * 100, None) == ("x" * 100, 0)
+
+    def test_collector_truncates_and_spills(self, tmp_path):
+        trace = write_jsonl(tmp_path / "trace.jsonl", STREAM_TRACE)
+        spill_dir = tmp_path / "spill"
+
+        data = DataCollector(trace_path=trace, max_payload_chars=10, spill_dir=spill_dir).collect()
+        call = next(tc for tc in data.tool_calls if tc.tool_use_id == "t2")
+
+        assert call.response_truncated_chars == 40
+        assert "[truncated 40 chars]" in call.tool_response["stdout"]
+        assert json.loads(Path(call.response_spill_path).read_text()) == {"stdout": "x" * 50}
+        assert data.raw_hook_events[4]["tool_response"] == {"stdout": "x" * 50}
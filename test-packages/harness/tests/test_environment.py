@@ -4,12 +4,14 @@ Unit tests for harness.environment module.
 Tests the environment isolation functionality including:
 - Isolated HOME creation and cleanup
 - Marketplace data copying
+- Marketplace template preparation and cloning
 - Transcript path computation
 - Context manager behavior
 """
 
 import os
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,12 +19,17 @@ import pytest
 
 from harness.environment import (
     DEFAULT_TEST_HOME_PREFIX,
+    TEMPLATE_GRACE_SECONDS,
+    TEMPLATE_KEEP,
     cleanup_test_environment,
+    clone_marketplace_template,
     copy_marketplace_data,
     create_isolated_home,
     get_git_state,
     get_transcript_path,
     isolated_claude_session,
+    marketplace_fingerprint,
+    prepare_marketplace_template,
     setup_test_environment,
 )
 
@@ -131,6 +138,120 @@ class TestCopyMarketplaceData:
             assert result is False
 
 
+@pytest.fixture
+def marketplace_home(tmp_path):
+    """A source HOME with marketplace registry data."""
+    plugins = tmp_path / "source" / ".claude" / "plugins"
+    (plugins / "marketplaces" / "synaptic-canvas" / "packages").mkdir(parents=True)
+    (plugins / "known_marketplaces.json").write_text('{"synaptic-canvas": {}}')
+    (plugins / "marketplaces" / "synaptic-canvas" / "registry.json").write_text("{}")
+    (plugins / "marketplaces" / "synaptic-canvas" / "packages" / "sc-a.yaml").write_text("name: sc-a\n")
+    return tmp_path / "source"
+
+
+class TestMarketplaceTemplates:
+    """Tests for template-based marketplace setup."""
+
+    def test_template_built_once_per_fingerprint(self, marketplace_home, tmp_path):
+        root = tmp_path / "templates"
+        first = prepare_marketplace_template(marketplace_home, root)
+        second = prepare_marketplace_template(marketplace_home, root)
+
+        assert first == second
+        assert first.name.startswith("marketplace-")
+        assert [p.name for p in root.iterdir()] == [first.name]
+
+    def test_changed_marketplace_builds_new_template(self, marketplace_home, tmp_path):
+        root = tmp_path / "templates"
+        before = marketplace_fingerprint(marketplace_home)
+        first = prepare_marketplace_template(marketplace_home, root)
+        (marketplace_home / ".claude" / "plugins" / "marketplaces" / "synaptic-canvas" / "new.json").write_text("{}")
+
+        assert marketplace_fingerprint(marketplace_home) != before
+        assert prepare_marketplace_template(marketplace_home, root) != first
+
+    def test_clone_matches_copy(self, marketplace_home, tmp_path):
+        template = prepare_marketplace_template(marketplace_home, tmp_path / "templates")
+        cloned = tmp_path / "cloned"
+        copied = tmp_path / "copied"
+
+        method = clone_marketplace_template(template, cloned)
+        with patch.dict(os.environ, {"SC_TEST_HOME_TEMPLATES": "off"}):
+            copy_marketplace_data(copied, marketplace_home)
+
+        assert method in ("reflink", "hardlink", "copy")
+        listing = lambda home: sorted(
+            str(p.relative_to(home)) for p in home.rglob("*") if p.is_file()
+        )
+        assert listing(cloned) == listing(copied)
+        assert (cloned / ".claude" / "plugins" / "known_marketplaces.json").read_text() == '{"synaptic-canvas": {}}'
+
+    def test_clone_cannot_modify_template(self, marketplace_home, tmp_path):
+        template = prepare_marketplace_template(marketplace_home, tmp_path / "templates")
+        home = tmp_path / "home"
+        clone_marketplace_template(template, home)
+        registry = home / ".claude" / "plugins" / "marketplaces" / "synaptic-canvas" / "registry.json"
+
+        # Replacing a file (as git and Claude do) leaves the template intact
+        registry.unlink()
+        registry.write_text('{"changed": true}')
+        (home / ".claude" / "plugins" / "known_marketplaces.json").write_text("{}")
+
+        assert (template / "marketplaces" / "synaptic-canvas" / "registry.json").read_text() == "{}"
+        assert (template / "known_marketplaces.json").read_text() == '{"synaptic-canvas": {}}'
+
+    def test_symlink_overlay(self, marketplace_home, tmp_path):
+        template = prepare_marketplace_template(marketplace_home, tmp_path / "templates")
+        home = tmp_path / "home"
+
+        assert clone_marketplace_template(template, home, method="symlink") == "symlink"
+        plugins = home / ".claude" / "plugins"
+        assert (plugins / "marketplaces").is_symlink()
+        assert (plugins / "marketplaces" / "synaptic-canvas" / "registry.json").read_text() == "{}"
+        assert not (plugins / "known_marketplaces.json").is_symlink()
+
+        cleanup_test_environment(home, force=True)
+        assert (template / "marketplaces" / "synaptic-canvas" / "registry.json").exists()
+
+    def test_copy_marketplace_data_uses_templates(self, marketplace_home, tmp_path):
+        root = tmp_path / "templates"
+        home = create_isolated_home(base_dir=str(tmp_path))
+        try:
+            with patch.dict(os.environ, {"SC_TEST_HOME_TEMPLATES": str(root)}):
+                assert copy_marketplace_data(home, marketplace_home) is True
+            assert len(list(root.glob("marketplace-*"))) == 1
+            assert (home / ".claude" / "plugins" / "marketplaces" / "synaptic-canvas" / "packages" / "sc-a.yaml").exists()
+        finally:
+            cleanup_test_environment(home)
+        assert len(list(root.glob("marketplace-*"))) == 1
+
+    def test_prune_keeps_recently_used_templates(self, marketplace_home, tmp_path):
+        root = tmp_path / "templates"
+        in_use = [root / f"marketplace-inuse{i}" for i in range(TEMPLATE_KEEP + 1)]
+        for template in in_use:
+            template.mkdir(parents=True)
+        stale = root / "marketplace-stale"
+        stale.mkdir()
+        stale_time = time.time() - TEMPLATE_GRACE_SECONDS - 60
+        os.utime(stale, (stale_time, stale_time))
+
+        prepare_marketplace_template(marketplace_home, root)
+
+        assert all(template.is_dir() for template in in_use)
+        assert not stale.exists()
+
+    def test_reuse_marks_template_used(self, marketplace_home, tmp_path):
+        template = prepare_marketplace_template(marketplace_home, tmp_path / "templates")
+        os.utime(template, (0, 0))
+
+        assert prepare_marketplace_template(marketplace_home, tmp_path / "templates") == template
+        assert template.stat().st_mtime > time.time() - 60
+
+    def test_disabled_templates(self, marketplace_home, tmp_path):
+        with patch.dict(os.environ, {"SC_TEST_HOME_TEMPLATES": "off"}):
+            assert prepare_marketplace_template(marketplace_home) is None
+
+
 class TestSetupTestEnvironment:
     """Tests for setup_test_environment function."""
 
@@ -154,6 +275,16 @@ class TestSetupTestEnvironment:
 
             assert "SC_TEST_PROJECT" in env
 
+    def test_exports_trace_path(self):
+        """Test that the session trace file is exported for hooks."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            isolated_home = Path(temp_dir)
+            trace_path = Path(temp_dir) / "trace.worker-1.jsonl"
+
+            env = setup_test_environment(isolated_home, Path("/fake/project"), trace_path=trace_path)
+
+            assert env["SC_TRACE_PATH"] == str(trace_path)
+
     def test_inherits_current_env(self):
         """Test that current environment is inherited."""
         with tempfile.TemporaryDirectory() as temp_dir:
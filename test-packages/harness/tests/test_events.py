@@ -0,0 +1,213 @@
+"""
+Unit tests for harness.events module.
+
+Tests the normalized event records including:
+- parse_ts_ns() fast path and fallback layouts
+- HookEvent / TranscriptRecord normalization
+- Records built by DataCollector.collect() and consumed downstream
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from harness.collector import CollectedData, DataCollector, SpooledEvents
+from harness.enrichment import build_timeline_tree
+from harness.events import (
+    HookEvent,
+    TranscriptRecord,
+    hook_events,
+    ns_to_datetime,
+    parse_ts_ns,
+    transcript_records,
+)
+from harness.expectations import HookEventExpectation
+from harness.models import HookEventType
+from harness.result import Success
+from harness.schemas import ArtifactPaths, TestContext, TestContextPaths
+
+
+def _utc_ns(*args) -> int:
+    dt = datetime(*args, tzinfo=timezone.utc)
+    return int(dt.timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+
+
+class TestParseTsNs:
+    """Timestamps are parsed once into UTC epoch nanoseconds."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("2026-01-16T01:26:35Z", _utc_ns(2026, 1, 16, 1, 26, 35)),
+            ("2026-01-16T01:26:35.123Z", _utc_ns(2026, 1, 16, 1, 26, 35, 123000)),
+            ("2026-01-16T01:26:35.123456Z", _utc_ns(2026, 1, 16, 1, 26, 35, 123456)),
+            ("2026-01-16T01:26:35.123456", _utc_ns(2026, 1, 16, 1, 26, 35, 123456)),
+            ("2026-01-16T01:26:35.123456+00:00", _utc_ns(2026, 1, 16, 1, 26, 35, 123456)),
+            ("2026-01-16 01:26:35", _utc_ns(2026, 1, 16, 1, 26, 35)),
+        ],
+    )
+    def test_fast_path_layouts(self, value, expected):
+        assert parse_ts_ns(value) == expected
+
+    def test_nanosecond_fraction_kept(self):
+        assert parse_ts_ns("2026-01-16T01:26:35.123456789Z") % 1_000_000_000 == 123456789
+
+    def test_offset_converted_to_utc(self):
+        assert parse_ts_ns("2026-01-16T03:26:35.5+02:00") == _utc_ns(2026, 1, 16, 1, 26, 35, 500000)
+
+    @pytest.mark.parametrize("value", [None, "", 12, "not a timestamp", "2026-13-40T01:26:35Z", "2026-01-16T25:00:00Z"])
+    def test_invalid_values(self, value):
+        assert parse_ts_ns(value) is None
+
+    def test_matches_strptime(self):
+        value = "2026-01-16T01:26:35.654321Z"
+        parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+        assert ns_to_datetime(parse_ts_ns(value)) == parsed
+
+    def test_ns_to_datetime_none(self):
+        assert ns_to_datetime(None) is None
+
+
+class TestRecords:
+    """Raw dicts are reduced to slot records with the correlation fields."""
+
+    def test_hook_event_from_raw(self):
+        record = HookEvent.from_raw(3, {
+            "ts": "2026-01-16T01:26:35.123Z",
+            "event": "PreToolUse",
+            "tool_use_id": "toolu_1",
+            "tool_name": "Task",
+            "pid": 42,
+        })
+
+        assert record.seq == 3
+        assert record.kind == "PreToolUse"
+        assert record.tool_use_id == "toolu_1"
+        assert record.pid == 42
+        assert record.ts == datetime(2026, 1, 16, 1, 26, 35, 123000)
+        assert not hasattr(record, "__dict__")
+
+    def test_hook_event_name_key(self):
+        assert HookEvent.from_raw(0, {"hook_event_name": "Stop"}).kind == "Stop"
+
+    def test_transcript_record_from_raw(self):
+        record = TranscriptRecord.from_raw({
+            "type": "assistant",
+            "uuid": "u2",
+            "parentUuid": "u1",
+            "timestamp": "2026-01-16T01:26:36Z",
+            "isSidechain": True,
+            "message": {"content": [
+                {"type": "text", "text": "hi"},
+                {"type": "tool_use", "name": "Bash", "id": "toolu_a"},
+                {"type": "tool_use", "name": "Read", "id": "toolu_b"},
+            ]},
+        })
+
+        assert record.parent_uuid == "u1"
+        assert record.tool_use == ("Bash", "toolu_a")
+        assert record.has_tool_result is False
+        assert record.is_sidechain is True
+        assert record.timestamp == "2026-01-16T01:26:36Z"
+        assert record.ts_ns == _utc_ns(2026, 1, 16, 1, 26, 36)
+
+    def test_existing_records_pass_through(self):
+        hook = HookEvent(0, "Stop")
+        entry = TranscriptRecord(uuid="u1")
+
+        assert hook_events([hook])[0] is hook
+        assert transcript_records([entry, {"uuid": "u2"}])[0] is entry
+
+
+TRACE = [
+    {"ts": "2026-01-16T01:26:35Z", "event": "SessionStart", "session_id": "s1"},
+    {"ts": "2026-01-16T01:26:36Z", "event": "PreToolUse", "tool_name": "Bash",
+     "tool_use_id": "toolu_1", "tool_input": {"command": "ls"}},
+    {"ts": "2026-01-16T01:26:37Z", "event": "PostToolUse", "tool_name": "Bash",
+     "tool_use_id": "toolu_1", "tool_response": {"stdout": "a.py"}},
+    {"ts": "2026-01-16T01:26:38Z", "event": "PreToolUse", "tool_name": "Read",
+     "tool_use_id": "toolu_2", "tool_input": {"file_path": "a.py"}},
+]
+
+TRANSCRIPT = [
+    {"type": "user", "uuid": "u1", "parentUuid": None, "timestamp": "2026-01-16T01:26:35.000Z",
+     "message": {"role": "user", "content": "list files"}},
+    {"type": "assistant", "uuid": "u2", "parentUuid": "u1", "timestamp": "2026-01-16T01:26:35.750Z",
+     "message": {"role": "assistant", "content": [{"type": "tool_use", "name": "Bash", "id": "toolu_1"}],
+                 "usage": {"input_tokens": 10, "output_tokens": 5}}},
+    {"type": "user", "uuid": "u3", "parentUuid": "u2", "timestamp": "2026-01-16T01:26:37.000Z",
+     "message": {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "toolu_1"}]}},
+]
+
+
+def _collect(tmp_path) -> CollectedData:
+    for name, rows in (("trace.jsonl", TRACE), ("transcript.jsonl", TRANSCRIPT)):
+        (tmp_path / name).write_text("".join(json.dumps(row) + "\n" for row in rows))
+    return DataCollector(tmp_path / "trace.jsonl", tmp_path / "transcript.jsonl").collect()
+
+
+class TestCollectedRecords:
+    """collect() builds the records in its single pass."""
+
+    def test_records_built_at_ingest(self, tmp_path):
+        data = _collect(tmp_path)
+
+        assert [r.kind for r in data.hook_records] == [e["event"] for e in TRACE]
+        assert [r.seq for r in data.hook_records] == [0, 1, 2, 3]
+        assert [r.uuid for r in data.transcript_records] == ["u1", "u2", "u3"]
+        assert data.hook_event_records() is data.hook_records
+
+    def test_records_built_lazily(self):
+        data = CollectedData(raw_hook_events=TRACE, raw_transcript_entries=TRANSCRIPT)
+
+        assert [r.tool_use_id for r in data.hook_event_records()] == [None, "toolu_1", "toolu_1", "toolu_2"]
+        assert data.transcript_entry_records()[2].has_tool_result
+
+    def test_spooled_index_decodes_one_line(self):
+        spool = SpooledEvents(max_memory=64)
+        for row in TRACE:
+            spool.append_line(json.dumps(row).encode())
+
+        assert spool[2] == TRACE[2]
+        assert spool[-1] == TRACE[-1]
+        with pytest.raises(IndexError):
+            spool[len(TRACE)]
+
+    def test_timeline_tree_same_from_records_and_dicts(self, tmp_path):
+        data = _collect(tmp_path)
+        context = TestContext(
+            fixture_id="f", test_id="t", test_name="T", package="p",
+            paths=TestContextPaths(fixture_yaml="fixture.yaml", test_yaml="test.yaml"),
+        )
+        paths = ArtifactPaths(transcript="t.jsonl", trace="trace.jsonl", enriched="t.json")
+
+        from_dicts = build_timeline_tree(TRANSCRIPT, TRACE, context, paths)
+        from_records = build_timeline_tree(
+            data.transcript_entry_records(), data.hook_event_records(), context, paths,
+            token_usage=data.token_usage,
+        )
+
+        assert isinstance(from_records, Success)
+        assert from_records.value.model_dump() == from_dicts.value.model_dump()
+        assert from_records.value.tree.nodes["u2"].elapsed_ms == 750
+
+    def test_hook_expectation_decodes_matching_events_only(self, tmp_path):
+        data = _collect(tmp_path)
+        decoded = []
+
+        class Recording(list):
+            def __getitem__(self, index):
+                decoded.append(index)
+                return super().__getitem__(index)
+
+        data.raw_hook_events = Recording(TRACE)
+        result = HookEventExpectation(
+            id="exp-1", description="Read used", event=HookEventType.PRE_TOOL_USE,
+            filters={"tool_name": "Read"},
+        ).evaluate(data)
+
+        assert result.status.value == "pass"
+        assert result.matched_at.sequence == 4
+        assert decoded == [3]
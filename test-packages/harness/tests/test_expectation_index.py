@@ -0,0 +1,206 @@
+"""
+Unit tests for harness.expectation_index module.
+
+Tests the shared expectation index including:
+- First-match sequences identical to a linear scan per pattern
+- Combined pattern prefilter safety
+- Single pass per pattern group with cached texts
+- Shared use by evaluate_expectations() and the reporter evaluator
+"""
+
+import json
+import random
+import re
+from datetime import datetime
+
+import pytest
+
+from harness.collector import ClaudeResponseText, CollectedData, CorrelatedToolCall
+from harness.expectation_index import (
+    INPUT_JSON,
+    OUTPUT_TEXT,
+    SEARCH_TEXT,
+    ExpectationIndex,
+    combine_patterns,
+    tool_search_text,
+)
+from harness.expectations import (
+    HookEventExpectation,
+    NotExpectation,
+    OutputContainsExpectation,
+    ToolCallExpectation,
+    evaluate_expectations,
+)
+from harness.models import ExpectationType, HookEventType, TestStatus
+from harness.reporter import ExpectationEvaluator
+
+
+def _tool_call(i: int, tool: str, tool_input: dict, stdout: str | None = None) -> CorrelatedToolCall:
+    return CorrelatedToolCall(
+        tool_use_id=f"toolu_{i}",
+        tool_name=tool,
+        tool_input=tool_input,
+        tool_response={"stdout": stdout} if stdout is not None else None,
+        pre_timestamp=datetime(2026, 1, 16, 1, 0, i % 60),
+    )
+
+
+def _data(calls: int = 200, seed: int = 5) -> CollectedData:
+    rng = random.Random(seed)
+    commands = ["git status", "git diff HEAD", "ls -la", "cat config.yaml", "pytest -q", "echo done"]
+    tool_calls = []
+    for i in range(calls):
+        tool = rng.choice(["Bash", "Bash", "Read", "Skill", "Task"])
+        if tool == "Bash":
+            tool_calls.append(_tool_call(i, tool, {"command": rng.choice(commands)}, stdout=f"out {i}"))
+        elif tool == "Read":
+            tool_calls.append(_tool_call(i, tool, {"file_path": f"src/mod_{i % 17}.py"}))
+        elif tool == "Skill":
+            tool_calls.append(_tool_call(i, tool, {"skill": "sc-startup", "args": f"--step {i}"}))
+        else:
+            tool_calls.append(_tool_call(i, tool, {"prompt": f"explore {i}", "subagent_type": "Explore"}))
+    hooks = [
+        {"event": "PreToolUse", "tool_name": tc.tool_name, "tool_use_id": tc.tool_use_id,
+         "agent_id": "agent-1" if i % 3 == 0 else None}
+        for i, tc in enumerate(tool_calls)
+    ]
+    return CollectedData(
+        tool_calls=tool_calls,
+        raw_hook_events=hooks,
+        claude_responses=[ClaudeResponseText(text="Startup report complete", timestamp=datetime.now())],
+    )
+
+
+def _linear_first(data: CollectedData, tool: str, text, pattern: re.Pattern) -> int | None:
+    for seq, tool_call in enumerate(data.tool_calls, 1):
+        if tool_call.tool_name == tool and pattern.search(text(tool_call)):
+            return seq
+    return None
+
+
+class TestFirstMatch:
+    """Indexed first matches equal a linear scan per pattern."""
+
+    PATTERNS = [r"git\s+diff", r"^ls", r"config\.ya?ml", r"mod_1[0-6]", r"--step 9\d", r"never", r"(a|b)\1"]
+
+    @pytest.mark.parametrize("tool", ["Bash", "Read", "Skill", "Task"])
+    def test_matches_linear_scan(self, tool):
+        data = _data()
+        index = ExpectationIndex(data)
+        compiled = [re.compile(p) for p in self.PATTERNS]
+        for pattern in compiled:
+            index.register(tool, SEARCH_TEXT, pattern)
+            index.register(tool, INPUT_JSON, pattern)
+
+        for pattern in compiled:
+            assert index.first_match(tool, SEARCH_TEXT, pattern) == _linear_first(data, tool, tool_search_text, pattern)
+            assert index.first_match(tool, INPUT_JSON, pattern) == _linear_first(
+                data, tool, lambda tc: json.dumps(tc.tool_input), pattern
+            )
+
+    def test_group_resolved_in_one_pass(self):
+        data = _data()
+        index = ExpectationIndex(data)
+        compiled = [re.compile(p) for p in self.PATTERNS]
+        for pattern in compiled:
+            index.register("Bash", SEARCH_TEXT, pattern)
+
+        index.first_match("Bash", SEARCH_TEXT, compiled[0])
+
+        assert not index._pending
+        assert all(("Bash", SEARCH_TEXT, p.flags, p.pattern) in index._first for p in compiled)
+        assert len(index._texts) <= len(index.tool_positions("Bash"))
+
+    def test_flags_are_part_of_the_key(self):
+        data = CollectedData(tool_calls=[_tool_call(0, "Bash", {"command": "GIT status"})])
+        index = ExpectationIndex(data)
+
+        assert index.first_match("Bash", SEARCH_TEXT, re.compile("git")) is None
+        assert index.first_match("Bash", SEARCH_TEXT, re.compile("git", re.I)) == 1
+
+    def test_output_text_requires_response(self):
+        data = CollectedData(tool_calls=[
+            _tool_call(0, "Bash", {"command": "true"}),
+            _tool_call(1, "Bash", {"command": "true"}, stdout=""),
+        ])
+        index = ExpectationIndex(data)
+
+        assert index.text(OUTPUT_TEXT, 0) is None
+        assert index.first_match("Bash", OUTPUT_TEXT, re.compile(".*")) == 2
+
+
+class TestCombinePatterns:
+    """The combined prefilter never hides a match of one of its patterns."""
+
+    def test_alternation_matches_any(self):
+        combined = combine_patterns([re.compile("foo"), re.compile(r"ba(r|z)")], 0)
+
+        assert combined.search("xbaz")
+        assert not combined.search("qux")
+
+    @pytest.mark.parametrize("pattern", [r"(a)\1", r"(?P<x>a)(?P=x)", r"(a)?(?(1)b|c)"])
+    def test_group_references_not_combined(self, pattern):
+        assert combine_patterns([re.compile("foo"), re.compile(pattern)], 0) is None
+
+    def test_colliding_group_names_not_combined(self):
+        assert combine_patterns([re.compile("(?P<n>a)"), re.compile("(?P<n>b)")], 0) is None
+
+
+class TestSharedEvaluation:
+    """Expectations evaluated with a shared index report the same results."""
+
+    def _expectations(self):
+        return [
+            ToolCallExpectation(id="e1", description="diff", tool="Bash", pattern=r"git diff"),
+            ToolCallExpectation(id="e2", description="ls", tool="Bash", pattern=r"^ls"),
+            ToolCallExpectation(id="e3", description="out", tool="Bash", pattern=r"out 1\d\d", match_output=True),
+            ToolCallExpectation(id="e4", description="any read", tool="Read"),
+            ToolCallExpectation(id="e5", description="missing", tool="Write"),
+            NotExpectation(ToolCallExpectation(id="e6", description="no rm", tool="Bash", pattern=r"rm -rf")),
+            HookEventExpectation(id="e7", description="agent read", event=HookEventType.PRE_TOOL_USE,
+                                 filters={"tool_name": "Read", "agent_id": "agent-1"}),
+            HookEventExpectation(id="e8", description="regex", event=HookEventType.PRE_TOOL_USE,
+                                 filters={"tool_name": "regex:^Sk"}),
+            OutputContainsExpectation(id="e9", description="report", pattern="startup report"),
+        ]
+
+    def test_shared_index_matches_private_evaluation(self):
+        data = _data()
+        private = [exp.evaluate(data) for exp in self._expectations()]
+        shared = evaluate_expectations(self._expectations(), data)
+
+        strip = lambda r: r.model_dump(exclude={"matched_at": {"timestamp"}})  # noqa: E731
+        assert [strip(r) for r in shared] == [strip(r) for r in private]
+        assert [r.status for r in shared][:6] == [TestStatus.PASS] * 4 + [TestStatus.FAIL, TestStatus.PASS]
+
+    def test_match_output_prefers_earlier_call(self):
+        data = CollectedData(tool_calls=[
+            _tool_call(0, "Bash", {"command": "make"}, stdout="build ok"),
+            _tool_call(1, "Bash", {"command": "echo ok"}, stdout=""),
+        ])
+        exp = ToolCallExpectation(id="e1", description="ok", tool="Bash", pattern="ok", match_output=True)
+
+        result = exp.evaluate(data)
+
+        assert result.matched_at.sequence == 1
+        assert result.actual["output_preview"] == "build ok"
+
+    def test_reporter_evaluator_prepares_patterns(self):
+        data = _data()
+        evaluator = ExpectationEvaluator(data)
+        specs = [
+            (ExpectationType.TOOL_CALL, {"tool": "Bash", "pattern": "GIT DIFF", "flags": "i"}),
+            (ExpectationType.TOOL_NOT_CALLED, {"tool": "Bash", "pattern": "rm -rf"}),
+            (ExpectationType.TOOL_CALL, {"tool": "Bash", "pattern": "("}),
+        ]
+        evaluator.prepare(specs)
+
+        first = evaluator.evaluate("e1", specs[0][0], "diff", specs[0][1])
+        second = evaluator.evaluate("e2", specs[1][0], "no rm", specs[1][1])
+
+        assert first.matched_at.sequence == _linear_first(
+            data, "Bash", lambda tc: json.dumps(tc.tool_input), re.compile("git diff", re.I)
+        )
+        assert second.status == TestStatus.PASS
+        with pytest.raises(re.error):
+            evaluator.evaluate("e3", specs[2][0], "bad", specs[2][1])
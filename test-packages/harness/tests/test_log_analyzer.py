@@ -6,16 +6,24 @@ Tests the log analysis functionality including:
 - Warning and error detection
 - LogAnalysisResult properties
 - Filtering allowed warnings
+- Streaming analysis of log directories from per-test offsets
 """
 
+import gzip
+import os
+
 import pytest
 
 from harness.log_analyzer import (
     LogAnalysisResult,
     LogEntry,
     LogLevel,
+    analyze_log_dirs,
     analyze_logs,
+    collect_log_content,
     filter_allowed_warnings,
+    merge_log_analysis,
+    snapshot_log_offsets,
 )
 
 
@@ -307,3 +315,124 @@ class TestFilterAllowedWarnings:
         # Pattern matches raw_line but not message
         filtered = filter_allowed_warnings(result, ["module\\.submodule"])
         assert len(filtered.warnings) == 0
+
+
+LOG_LINES = [
+    "2024-01-15 10:30:45,123 - app.core - WARNING - Slow response",
+    "2024-01-15  10:30:46.500 - app.core - ERROR - Timed out",
+    "WARNING:myapp.module:Deprecated config",
+    "ERROR - app - WARNING: wrapped warning",
+    "WARNING tests.conftest:setup:42 pytest style",
+    "CRITICAL: bare critical",
+    "INFO:myapp:started",
+    "plain output line",
+    "",
+]
+
+
+class TestAnalyzeLogDirs:
+    """Log directories are streamed from the offsets taken at test start."""
+
+    def _write(self, path, lines, mode="w"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, mode) as f:
+            f.write("".join(line + "\n" for line in lines))
+
+    def test_same_entries_as_analyze_logs(self, tmp_path):
+        self._write(tmp_path / "logs" / "hooks.log", LOG_LINES)
+
+        streamed = analyze_log_dirs([tmp_path / "logs"])
+        in_memory = analyze_logs("\n".join(LOG_LINES))
+
+        strip = lambda entries: [(e.level, e.message, e.logger_name, e.timestamp, e.line_number) for e in entries]  # noqa: E731
+        assert strip(streamed.all_entries) == strip(in_memory.all_entries)
+        assert strip(streamed.warnings) == strip(in_memory.warnings)
+        assert strip(streamed.errors) == strip(in_memory.errors)
+        assert streamed.all_entries[1].timestamp.microsecond == 500000
+        assert {e.source for e in streamed.all_entries} == {str(tmp_path / "logs" / "hooks.log")}
+
+    def test_only_content_after_offsets(self, tmp_path):
+        log = tmp_path / "logs" / "hooks.log"
+        self._write(log, ["ERROR:app:from an earlier test"])
+        offsets = snapshot_log_offsets([tmp_path / "logs", tmp_path / "missing"])
+
+        self._write(log, ["WARNING:app:from this test"], mode="a")
+        self._write(tmp_path / "logs" / "nested" / "new.log", ["ERROR:app:new file"])
+        result = analyze_log_dirs([tmp_path / "logs"], offsets)
+
+        assert [e.message for e in result.warnings] == ["from this test"]
+        assert [e.message for e in result.errors] == ["new file"]
+        assert result.warnings[0].line_number == 1
+        assert result.raw_content == ""
+        assert "from an earlier test" not in result.read_raw_content()
+        assert "from this test" in result.read_raw_content()
+        assert collect_log_content([tmp_path / "logs"], offsets) == result.read_raw_content()
+
+    def test_unchanged_files_are_skipped(self, tmp_path):
+        self._write(tmp_path / "logs" / "hooks.log", ["ERROR:app:old"])
+        offsets = snapshot_log_offsets([tmp_path / "logs"])
+
+        result = analyze_log_dirs([tmp_path / "logs"], offsets)
+
+        assert not result.has_issues
+        assert result.regions == []
+
+    def test_truncated_or_replaced_file_read_from_start(self, tmp_path):
+        log = tmp_path / "logs" / "hooks.log"
+        self._write(log, ["INFO:app:" + "x" * 200])
+        offsets = snapshot_log_offsets([tmp_path / "logs"])
+
+        self._write(log, ["ERROR:app:rotated"])
+        replacement = tmp_path / "replacement.log"
+        self._write(replacement, ["INFO:app:" + "y" * 400, "WARNING:app:replaced"])
+        other = tmp_path / "logs" / "other.log"
+        self._write(other, ["INFO:app:short"])
+        offsets[str(other)] = (os.stat(other).st_ino + 1, 0)
+        os.replace(replacement, tmp_path / "logs" / "hooks2.log")
+
+        result = analyze_log_dirs([tmp_path / "logs"], offsets)
+
+        assert [e.message for e in result.errors] == ["rotated"]
+        assert [e.message for e in result.warnings] == ["replaced"]
+        assert [r.start for r in result.regions] == [0, 0, 0]
+
+    def test_gzip_logs_use_decompressed_positions(self, tmp_path):
+        old = tmp_path / "logs" / "hooks.1.log.gz"
+        old.parent.mkdir()
+        with gzip.open(old, "wt") as f:
+            f.write("ERROR:app:rotated before the test\n")
+        grown = tmp_path / "logs" / "hooks.2.log.gz"
+        with gzip.open(grown, "wt") as f:
+            f.write("INFO:app:" + "x" * 2000 + "\n")
+        offsets = snapshot_log_offsets([tmp_path / "logs"])
+
+        with gzip.open(grown, "at") as f:
+            f.write("WARNING:app:" + "y" * 2000 + "\n")
+        result = analyze_log_dirs([tmp_path / "logs"], offsets)
+
+        assert not result.errors
+        assert [e.message for e in result.warnings] == ["y" * 2000]
+        assert [(r.path, r.start) for r in result.regions] == [(str(grown), 0)]
+        assert result.regions[0].end == len("INFO:app:" + "x" * 2000 + "\n" + "WARNING:app:" + "y" * 2000 + "\n")
+        assert result.read_raw_content().endswith("y" * 2000 + "\n")
+        assert collect_log_content([tmp_path / "logs"], offsets) == result.read_raw_content()
+
+    def test_undecodable_bytes_replaced(self, tmp_path):
+        log = tmp_path / "logs" / "hooks.log"
+        log.parent.mkdir()
+        log.write_bytes(b"ERROR:app:bad \xff byte\n")
+
+        result = analyze_log_dirs([tmp_path / "logs"])
+
+        assert result.errors[0].message == "bad \ufffd byte"
+
+    def test_raw_content_read_on_demand(self, tmp_path):
+        log = tmp_path / "logs" / "hooks.log"
+        self._write(log, ["WARNING:app:kept"])
+        result = merge_log_analysis([analyze_logs("ERROR:cli:output"), analyze_log_dirs([tmp_path / "logs"])])
+        filtered = filter_allowed_warnings(result, ["nothing"])
+
+        assert filtered.read_raw_content() == f"ERROR:cli:output\n=== {log} ===\nWARNING:app:kept\n"
+
+        log.unlink()
+        assert "no longer available" in filtered.read_raw_content()
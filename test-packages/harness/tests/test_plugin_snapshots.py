@@ -0,0 +1,251 @@
+"""
+Unit tests for plugin_snapshots.py - content-addressed plugin snapshots.
+
+Builds a minimal synaptic-canvas checkout (the real sc-install sources plus
+a synthetic package) and checks that materialized snapshots match a direct
+sc-install, are reused across projects, and are rebuilt on any change.
+
+Run with:
+    pytest test-packages/harness/tests/test_plugin_snapshots.py -v
+"""
+
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+
+from harness import plugin_snapshots
+from harness.plugin_snapshots import (
+    PluginSnapshotError,
+    install_plugin_snapshot,
+    snapshot_key,
+    snapshot_root,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _files(root: Path) -> dict[str, bytes]:
+    return {
+        p.relative_to(root).as_posix(): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+@pytest.fixture
+def sc_checkout(tmp_path, monkeypatch):
+    """synaptic-canvas checkout with one token-expanding package."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    root = tmp_path / "synaptic-canvas"
+    (root / "tools").mkdir(parents=True)
+    shutil.copy(REPO_ROOT / "tools" / "sc-install.py", root / "tools" / "sc-install.py")
+    shutil.copytree(
+        REPO_ROOT / "src" / "sc_cli", root / "src" / "sc_cli",
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    (root / "version.yaml").write_text("version: 1.0.0\n")
+
+    pkg = root / "packages" / "sc-demo"
+    (pkg / "commands").mkdir(parents=True)
+    (pkg / "agents").mkdir()
+    (pkg / "scripts").mkdir()
+    (pkg / "manifest.yaml").write_text(
+        "name: sc-demo\nversion: 1.0.0\n"
+        "variables:\n  REPO_NAME:\n    auto: git-repo-basename\n"
+        "artifacts:\n  commands:\n    - commands/sc-demo.md\n"
+        "  agents:\n    - agents/sc-demo-agent.md\n"
+        "  scripts:\n    - scripts/demo.py\n"
+    )
+    (pkg / "commands" / "sc-demo.md").write_text("---\nname: sc-demo\n---\n\nWorks on {{REPO_NAME}}.\n")
+    (pkg / "agents" / "sc-demo-agent.md").write_text("---\nname: sc-demo-agent\nversion: 1.0.0\n---\n\n# Agent\n")
+    (pkg / "scripts" / "demo.py").write_text("print('demo')\n")
+    return root
+
+
+def _project(tmp_path: Path, name: str) -> Path:
+    project = tmp_path / name
+    (project / ".claude").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(project)], check=True)
+    return project
+
+
+class TestPluginSnapshots:
+    """Snapshots are built once and materialized like a direct sc-install."""
+
+    def test_miss_then_hit(self, tmp_path, sc_checkout):
+        root = tmp_path / "snapshots"
+        first = install_plugin_snapshot(["sc-demo"], _project(tmp_path, "alpha"), sc_checkout, root)
+        second = install_plugin_snapshot(["sc-demo"], _project(tmp_path, "beta"), sc_checkout, root)
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert first.key == second.key
+        assert second.files == 4
+        assert second.expanded == 1
+        assert "snapshot hit" in second.summary
+        assert "Done installing sc-demo" in second.install_output["sc-demo"]
+
+    def test_matches_direct_install(self, tmp_path, sc_checkout):
+        snapshot_project = _project(tmp_path, "alpha")
+        install_plugin_snapshot(["sc-demo"], snapshot_project, sc_checkout, tmp_path / "snapshots")
+
+        direct_project = _project(tmp_path / "direct", "alpha")
+        subprocess.run(
+            [sys.executable, str(sc_checkout / "tools" / "sc-install.py"), "install", "sc-demo",
+             "--dest", str(direct_project / ".claude"), "--force"],
+            check=True, capture_output=True, cwd=sc_checkout,
+        )
+
+        assert _files(snapshot_project / ".claude") == _files(direct_project / ".claude")
+        assert "Works on alpha." in (snapshot_project / ".claude" / "commands" / "sc-demo.md").read_text()
+
+    def test_only_expanded_files_are_private(self, tmp_path, sc_checkout):
+        root = tmp_path / "snapshots"
+        project = _project(tmp_path, "alpha")
+        install = install_plugin_snapshot(["sc-demo"], project, sc_checkout, root)
+
+        claude = project / ".claude"
+        assert install.method == "hardlink"
+        assert (claude / "agents" / "sc-demo-agent.md").stat().st_nlink == 2
+        assert (claude / "scripts" / "demo.py").stat().st_nlink == 2
+        assert not (claude / "scripts" / "demo.py").stat().st_mode & 0o222
+        assert (claude / "scripts" / "demo.py").stat().st_mode & 0o100
+        assert (claude / "commands" / "sc-demo.md").stat().st_nlink == 1
+        assert (claude / "agents" / "registry.yaml").stat().st_nlink == 1
+
+    def test_package_change_builds_new_snapshot(self, tmp_path, sc_checkout):
+        root = tmp_path / "snapshots"
+        before = snapshot_key(["sc-demo"], sc_checkout)
+        install_plugin_snapshot(["sc-demo"], _project(tmp_path, "alpha"), sc_checkout, root)
+
+        (sc_checkout / "packages" / "sc-demo" / "scripts" / "demo.py").write_text("print('changed')\n")
+        project = _project(tmp_path, "beta")
+        install = install_plugin_snapshot(["sc-demo"], project, sc_checkout, root)
+
+        assert install.key != before
+        assert install.cache_hit is False
+        assert (project / ".claude" / "scripts" / "demo.py").read_text() == "print('changed')\n"
+
+    def test_installer_change_builds_new_snapshot(self, sc_checkout):
+        before = snapshot_key(["sc-demo"], sc_checkout)
+        with open(sc_checkout / "src" / "sc_cli" / "install.py", "a") as f:
+            f.write("\n# changed\n")
+
+        assert snapshot_key(["sc-demo"], sc_checkout) != before
+
+    def test_registry_merged_into_existing(self, tmp_path, sc_checkout):
+        project = _project(tmp_path, "alpha")
+        registry = project / ".claude" / "agents" / "registry.yaml"
+        registry.parent.mkdir()
+        registry.write_text("agents:\n  existing-agent:\n    version: 0.1.0\n    path: .claude/agents/existing-agent.md\n")
+
+        install_plugin_snapshot(["sc-demo"], project, sc_checkout, tmp_path / "snapshots")
+
+        agents = yaml.safe_load(registry.read_text())["agents"]
+        assert set(agents) == {"existing-agent", "sc-demo-agent"}
+
+    def test_install_failure_raises(self, tmp_path, sc_checkout):
+        with pytest.raises(PluginSnapshotError) as exc_info:
+            install_plugin_snapshot(["sc-missing"], _project(tmp_path, "alpha"), sc_checkout, tmp_path / "snapshots")
+
+        assert exc_info.value.package == "sc-missing"
+        assert exc_info.value.return_code != 0
+        assert not list((tmp_path / "snapshots").iterdir())
+
+    def test_concurrent_installs_into_one_project(self, tmp_path, sc_checkout):
+        other = sc_checkout / "packages" / "sc-other"
+        (other / "agents").mkdir(parents=True)
+        (other / "manifest.yaml").write_text(
+            "name: sc-other\nversion: 1.0.0\nartifacts:\n  agents:\n    - agents/sc-other-agent.md\n"
+        )
+        (other / "agents" / "sc-other-agent.md").write_text("---\nname: sc-other-agent\nversion: 1.0.0\n---\n")
+        root = tmp_path / "snapshots"
+        project = _project(tmp_path, "alpha")
+        for packages in (["sc-demo"], ["sc-other"]):
+            install_plugin_snapshot(packages, _project(tmp_path, f"warm-{packages[0]}"), sc_checkout, root)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            installs = list(pool.map(
+                lambda n: install_plugin_snapshot([("sc-demo", "sc-other")[n % 2]], project, sc_checkout, root),
+                range(16),
+            ))
+
+        assert all(install.cache_hit for install in installs)
+        agents = yaml.safe_load((project / ".claude" / "agents" / "registry.yaml").read_text())["agents"]
+        assert set(agents) == {"sc-demo-agent", "sc-other-agent"}
+        assert "Works on alpha." in (project / ".claude" / "commands" / "sc-demo.md").read_text()
+        assert not [p for p in (project / ".claude").rglob("*.tmp")]
+
+    def test_materialize_failure_raises(self, tmp_path, sc_checkout, monkeypatch):
+        def vanished(source, dest, content=None):
+            raise FileNotFoundError(dest)
+
+        monkeypatch.setattr(plugin_snapshots, "_write_private", vanished)
+
+        with pytest.raises(PluginSnapshotError, match="sc-demo") as exc_info:
+            install_plugin_snapshot(["sc-demo"], _project(tmp_path, "alpha"), sc_checkout, tmp_path / "snapshots")
+
+        assert "Failed to materialize plugin snapshot" in exc_info.value.stderr
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("SC_PLUGIN_SNAPSHOTS", "off")
+
+        assert snapshot_root() is None
+
+
+class TestYAMLTestItemSnapshots:
+    """YAMLTestItem installs plugins from snapshots and reports hits/misses."""
+
+    def _item(self, tmp_path):
+        from harness.pytest_plugin import YAMLTestItem
+
+        with patch.object(YAMLTestItem, "__init__", lambda self, *args, **kwargs: None):
+            item = YAMLTestItem.__new__(YAMLTestItem)
+            item._installed_plugin_files = []
+            item._installed_plugin_dirs = []
+            item.expected_plugins = []
+            item.plugin_install_results = []
+            item._sc_manage_install_pending = []
+            item.test_config = MagicMock()
+            item.test_config.source_path = tmp_path
+        return item
+
+    def test_results_record_snapshot_outcome(self, tmp_path, sc_checkout, monkeypatch):
+        from harness.fixture_loader import SetupConfig
+
+        monkeypatch.setenv("SC_PLUGIN_SNAPSHOTS", str(tmp_path / "snapshots"))
+        setup = SetupConfig(plugins=["sc-demo@synaptic-canvas", "sc-manage@synaptic-canvas"])
+        outcomes = []
+        for name in ("alpha", "beta"):
+            item = self._item(tmp_path)
+            session = MagicMock(project_path=_project(tmp_path, name))
+            with patch.object(item, "_find_synaptic_canvas_path", return_value=sc_checkout):
+                with patch.object(item, "_install_with_sc_install") as mock_sc_install:
+                    item._install_plugins(session, setup)
+            mock_sc_install.assert_not_called()
+            outcomes.append(item.plugin_install_results)
+
+        assert [r.snapshot_hit for r in outcomes[0]] == [False, None]
+        assert [r.snapshot_hit for r in outcomes[1]] == [True, None]
+        assert outcomes[1][0].success
+        assert outcomes[1][0].stdout.startswith("snapshot hit")
+
+    def test_snapshot_failure_raises_installation_error(self, tmp_path, sc_checkout, monkeypatch):
+        from harness.fixture_loader import SetupConfig
+        from harness.pytest_plugin import PluginInstallationError
+
+        monkeypatch.setenv("SC_PLUGIN_SNAPSHOTS", str(tmp_path / "snapshots"))
+        item = self._item(tmp_path)
+        session = MagicMock(project_path=_project(tmp_path, "alpha"))
+        with patch.object(item, "_find_synaptic_canvas_path", return_value=sc_checkout):
+            with pytest.raises(PluginInstallationError) as exc_info:
+                item._install_plugins(session, SetupConfig(plugins=["sc-missing@synaptic-canvas"]))
+
+        assert exc_info.value.plugin_name == "sc-missing@synaptic-canvas"
+        assert item.plugin_install_results[0].success is False
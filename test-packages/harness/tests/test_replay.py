@@ -0,0 +1,303 @@
+"""
+Unit tests for harness.replay module.
+
+Tests recorded session bundles including:
+- Archiving trace, transcript, CLI output and appended state logs
+- Replayed CollectedData identical to collecting the original files
+- Atomic replacement, format checks and the SC_TEST_BUNDLES switch
+- TestRunner --replay evaluating bundles without running Claude
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from harness.collector import DataCollector
+from harness.log_analyzer import analyze_log_dirs, snapshot_log_offsets
+from harness.models import TestStatus
+from harness.replay import (
+    BUNDLE_DIR_ENV,
+    BUNDLE_METADATA,
+    BundleError,
+    bundle_path,
+    bundles_root,
+    iter_bundles,
+    load_bundle,
+    read_bundle,
+    write_bundle,
+)
+# Aliased so pytest does not try to collect it as a test class
+from harness.runner import TestRunner as HarnessRunner
+
+TRACE = [
+    {"ts": "2026-01-16T01:26:35Z", "event": "SessionStart", "session_id": "s1"},
+    {"ts": "2026-01-16T01:26:35.5Z", "event": "UserPromptSubmit", "prompt": "list files"},
+    {"ts": "2026-01-16T01:26:36Z", "event": "PreToolUse", "tool_name": "Bash",
+     "tool_use_id": "toolu_1", "tool_input": {"command": "ls -la"}},
+    {"ts": "2026-01-16T01:26:37Z", "event": "PostToolUse", "tool_name": "Bash",
+     "tool_use_id": "toolu_1", "tool_response": {"stdout": "a.py"}},
+]
+
+TRANSCRIPT = [
+    {"type": "user", "uuid": "u1", "parentUuid": None, "timestamp": "2026-01-16T01:26:35.000Z",
+     "message": {"role": "user", "content": "list files"}},
+    {"type": "assistant", "uuid": "u2", "parentUuid": "u1", "timestamp": "2026-01-16T01:26:38.000Z",
+     "message": {"role": "assistant", "content": [{"type": "text", "text": "Found a.py"}]}},
+]
+
+
+class FakeSession:
+    """The parts of IsolatedSession a recording reads."""
+
+    def __init__(self, root: Path):
+        self.isolated_home = root / "home"
+        self.trace_path = root / "project" / "reports" / "trace.jsonl"
+        self.transcript_path = root / "transcript.jsonl"
+        self.claude_stdout = "Found a.py\n"
+        self.claude_stderr = "WARNING: slow start\n"
+
+
+def _write_lines(path: Path, rows) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join((row if isinstance(row, str) else json.dumps(row)) + "\n" for row in rows))
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    """A finished run: trace, transcript, state logs with earlier content."""
+    session = FakeSession(tmp_path)
+    project = tmp_path / "project"
+    _write_lines(session.trace_path, TRACE)
+    _write_lines(session.transcript_path, TRANSCRIPT)
+
+    home_log = session.isolated_home / ".claude" / "state" / "logs" / "hooks.log"
+    _write_lines(home_log, ["ERROR:hooks:from an earlier test"])
+    log_dirs = {
+        "home": session.isolated_home / ".claude" / "state" / "logs",
+        "project": project / ".claude" / "state" / "logs",
+    }
+    offsets = snapshot_log_offsets(log_dirs.values())
+    with open(home_log, "a") as f:
+        f.write("WARNING:hooks:from this test\n")
+    _write_lines(log_dirs["project"] / "nested" / "agent.log", ["ERROR:agent:failed"])
+    _write_lines(log_dirs["project"] / "events.json", [{"level": "warning", "message": "structured"}])
+
+    state_logs = analyze_log_dirs(log_dirs.values(), offsets)
+    return session, project, log_dirs, state_logs
+
+
+def _record(root, recorded, test_id="t0", **metadata):
+    session, project, log_dirs, state_logs = recorded
+    return write_bundle(
+        root, "fx", test_id,
+        trace_path=session.trace_path,
+        transcript_path=session.transcript_path,
+        claude_stdout=session.claude_stdout,
+        claude_stderr=session.claude_stderr,
+        state_logs=state_logs,
+        log_dirs=log_dirs,
+        project_path=project,
+        metadata={"duration_ms": 93000, **metadata},
+    )
+
+
+class TestBundles:
+    """Bundles hold what a run produced and replay it faithfully."""
+
+    def test_layout_and_metadata(self, tmp_path, recorded):
+        path = _record(tmp_path / "bundles", recorded, prompt="list files")
+
+        assert path == bundle_path(tmp_path / "bundles", "fx", "t0")
+        meta = json.loads((path / BUNDLE_METADATA).read_text())
+        assert meta["prompt"] == "list files"
+        assert meta["files"]["trace"] == "trace.jsonl.gz"
+        assert sorted(log["file"] for log in meta["files"]["logs"]) == [
+            "logs/home/hooks.log.gz",
+            "logs/project/events.json.gz",
+            "logs/project/nested/agent.log.gz",
+        ]
+        with gzip.open(path / "logs" / "home" / "hooks.log.gz", "rt") as f:
+            assert f.read() == "WARNING:hooks:from this test\n"
+        assert (path / "project" / ".claude" / "state" / "logs" / "events.json").exists()
+
+    def test_jsonl_structured_logs_replayed(self, tmp_path, recorded):
+        session, project, log_dirs, _ = recorded
+        segment = log_dirs["project"] / "sc-codex" / "ai-cli-20260120_120000_000.jsonl"
+        _write_lines(segment, [{"event": "task_end", "status": "error", "error": "from an earlier test"}])
+        offsets = snapshot_log_offsets(log_dirs.values())
+        with open(segment, "a") as f:
+            f.write(json.dumps({"event": "task_end", "status": "error", "error": "runner exited 3"}) + "\n")
+        state_logs = analyze_log_dirs(log_dirs.values(), offsets)
+        path = _record(tmp_path / "bundles", (session, project, log_dirs, state_logs))
+
+        archived = path / "project" / ".claude" / "state" / "logs" / "sc-codex" / "ai-cli-20260120_120000_000.jsonl"
+        assert "from an earlier test" not in archived.read_text()
+        replayed = load_bundle(path.parent.parent, "fx", "t0").collect()
+        assert [e.message for e in replayed.log_analysis.errors] == ["runner exited 3"]
+
+    def test_unchanged_structured_logs_not_archived(self, tmp_path, recorded):
+        session, project, log_dirs, _ = recorded
+        offsets = snapshot_log_offsets(log_dirs.values())
+        state_logs = analyze_log_dirs(log_dirs.values(), offsets)
+        path = _record(tmp_path / "bundles", (session, project, log_dirs, state_logs))
+
+        assert not (path / "project").exists()
+        assert json.loads((path / BUNDLE_METADATA).read_text())["files"]["logs"] == []
+
+    def test_gzip_state_log_archived_decompressed(self, tmp_path, recorded):
+        session, project, log_dirs, _ = recorded
+        rotated = log_dirs["home"] / "hooks.1.log.gz"
+        with gzip.open(rotated, "wt") as f:
+            f.write("WARNING:hooks:rotated during the test\n")
+        state_logs = analyze_log_dirs([log_dirs["home"]])
+        path = _record(tmp_path / "bundles", (session, project, log_dirs, state_logs))
+
+        bundle = load_bundle(path.parent.parent, "fx", "t0")
+        messages = [e.message for e in bundle.analyze_state_logs().warnings]
+        assert "rotated during the test" in messages
+
+    def test_collect_matches_original(self, tmp_path, recorded):
+        session, project, _, _ = recorded
+        bundle = load_bundle(_record(tmp_path / "bundles", recorded).parent.parent, "fx", "t0")
+
+        replayed = bundle.collect()
+        original = DataCollector(session.trace_path, session.transcript_path, project_path=project).collect()
+
+        assert replayed.tool_calls == original.tool_calls
+        assert replayed.session_id == original.session_id == "s1"
+        assert replayed.final_response == original.final_response
+        assert replayed.log_analysis.warnings[0].message == original.log_analysis.warnings[0].message
+        assert replayed.claude_cli_stderr == session.claude_stderr
+        assert bundle.duration_ms == 93000
+
+    def test_state_logs_keep_sources(self, tmp_path, recorded):
+        _, _, log_dirs, state_logs = recorded
+        bundle = load_bundle(_record(tmp_path / "bundles", recorded).parent.parent, "fx", "t0")
+
+        replayed = bundle.analyze_state_logs()
+
+        key = lambda e: (e.level, e.message, e.source, e.line_number)  # noqa: E731
+        assert sorted(map(key, replayed.all_entries)) == sorted(map(key, state_logs.all_entries))
+        assert "from an earlier test" not in replayed.read_raw_content()
+        assert "from this test" in replayed.read_raw_content()
+
+    def test_rerecording_replaces_bundle(self, tmp_path, recorded):
+        root = tmp_path / "bundles"
+        _record(root, recorded, prompt="first")
+        path = _record(root, recorded, prompt="second")
+
+        assert read_bundle(path).metadata["prompt"] == "second"
+        assert [p.name for p in path.parent.iterdir()] == ["t0"]
+
+    def test_unknown_format_rejected(self, tmp_path, recorded):
+        root = tmp_path / "bundles"
+        _record(root, recorded, test_id="good")
+        broken = _record(root, recorded, test_id="broken")
+        (broken / BUNDLE_METADATA).write_text(json.dumps({"format": 99}))
+
+        with pytest.raises(BundleError):
+            read_bundle(broken)
+        assert [b.test_id for b in iter_bundles(root)] == ["good"]
+        assert load_bundle(root, "fx", "missing") is None
+
+    def test_bundles_root_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(BUNDLE_DIR_ENV, raising=False)
+        assert bundles_root(tmp_path) == tmp_path / "bundles"
+        monkeypatch.setenv(BUNDLE_DIR_ENV, "off")
+        assert bundles_root(tmp_path) is None
+        monkeypatch.setenv(BUNDLE_DIR_ENV, str(tmp_path / "elsewhere"))
+        assert bundles_root(tmp_path) == tmp_path / "elsewhere"
+
+
+@pytest.fixture
+def replay_project(tmp_path, recorded):
+    """A fixture with a recorded test (t0) and an unrecorded one (t1)."""
+    project = tmp_path / "runner"
+    tests_dir = project / "fixtures" / "fx" / "tests"
+    tests_dir.mkdir(parents=True)
+    (project / "fixtures" / "fx" / "fixture.yaml").write_text("name: fx\npackage: sc-test\n")
+    expectations = (
+        "expectations:\n"
+        "  - id: exp-001\n"
+        "    type: tool_call\n"
+        "    description: Listed files\n"
+        "    expected:\n"
+        "      tool: Bash\n"
+        "      pattern: 'ls -la'\n"
+    )
+    for i in range(2):
+        (tests_dir / f"test_{i}.yaml").write_text(
+            f"test_id: t{i}\ntest_name: Test {i}\nexecution:\n  prompt: list files\n{expectations}"
+        )
+    _record(project / "reports" / "bundles", recorded)
+    return project
+
+
+class TestRunnerReplay:
+    """TestRunner evaluates bundles instead of running Claude."""
+
+    def test_replay_fixture(self, replay_project, monkeypatch):
+        def no_session(*args, **kwargs):
+            raise AssertionError("replay must not start a Claude session")
+
+        monkeypatch.setattr("harness.runner.isolated_claude_session", no_session)
+        runner = HarnessRunner(replay_project, replay_path=replay_project / "reports" / "bundles")
+
+        report = runner.run_fixture("fx", generate_html=False)
+
+        recorded, missing = report.tests
+        assert recorded.expectations[0].status == TestStatus.PASS
+        assert recorded.duration_ms == 93000
+        assert missing.status == TestStatus.SKIPPED
+        assert "No recorded session" in missing.skip_reason
+        assert runner.bundles_path is None
+
+    def test_live_runner_records_by_default(self, replay_project, monkeypatch):
+        monkeypatch.delenv(BUNDLE_DIR_ENV, raising=False)
+        assert HarnessRunner(replay_project).bundles_path == replay_project / "reports" / "bundles"
+        monkeypatch.setenv(BUNDLE_DIR_ENV, "off")
+        assert HarnessRunner(replay_project).bundles_path is None
+
+
+class TestPytestReplay:
+    """YAMLTestItem evaluates its bundle in --replay mode."""
+
+    def _item(self, project, test_file):
+        from unittest.mock import patch
+
+        from harness.fixture_loader import FixtureConfig, TestConfig
+        from harness.pytest_plugin import YAMLTestItem
+
+        with patch.object(YAMLTestItem, "__init__", lambda self, *args, **kwargs: None):
+            item = YAMLTestItem.__new__(YAMLTestItem)
+        item.fixture_config = FixtureConfig(name="fx", source_path=project / "fixtures" / "fx" / "fixture.yaml")
+        item.test_config = TestConfig.from_yaml(project / "fixtures" / "fx" / "tests" / test_file)
+        item.collected_data = None
+        item.evaluated_expectations = []
+        item.execution_duration_ms = 0
+        item.execution_error = None
+        item.expected_plugins = []
+        return item
+
+    def test_replay_session(self, replay_project):
+        from harness.pytest_plugin import YAMLTestFailure
+
+        item = self._item(replay_project, "test_0.yaml")
+
+        # The recorded state logs hold warnings, so the implicit check fails
+        with pytest.raises(YAMLTestFailure):
+            item._replay_session(replay_project / "reports" / "bundles")
+
+        assert [e.status for e in item.evaluated_expectations] == [TestStatus.PASS, TestStatus.FAIL]
+        assert item.collected_data.log_analysis.errors[0].message == "failed"
+        assert item.collected_data.session_id == "s1"
+        assert item.claude_stdout == "Found a.py\n"
+        assert item.execution_duration_ms == 93000
+
+    def test_missing_bundle_skips(self, replay_project):
+        item = self._item(replay_project, "test_1.yaml")
+
+        with pytest.raises(pytest.skip.Exception):
+            item._replay_session(replay_project / "reports" / "bundles")
@@ -686,7 +686,7 @@ class TestNewSectionDetection:
         # Fields that map to each section
         section_field_mapping = {
             "test_identity": {"test_id", "test_name", "tab_label", "description"},
-            "test_status": {"timestamp", "duration_ms", "status", "status_icon", "pass_rate", "tags", "skip_reason"},
+            "test_status": {"timestamp", "duration_ms", "status", "status_icon", "pass_rate", "tags", "skip_reason", "cached"},
             "metadata": {"metadata"},
             "reproduce": {"reproduce"},
             "execution": {"execution"},
@@ -694,7 +694,7 @@ class TestNewSectionDetection:
             "timeline": {"timeline", "timeline_tree"},
             "response": {"claude_response"},
             "side_effects": {"side_effects"},
-            "debug": {"debug", "artifacts"},
+            "debug": {"debug", "artifacts", "phases", "profile"},
             "log_analysis": {"log_analysis", "allow_warnings"},
         }
 
@@ -0,0 +1,278 @@
+"""
+Unit tests for harness.result_cache module.
+
+Tests the test result cache including:
+- Keys covering the test and fixture YAML, package files and model
+- Storing passing results only, reloading them marked as cached
+- The SC_TEST_RESULT_CACHE switch
+- TestRunner and YAMLTestItem reusing results with --changed-only
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from harness.models import StatusIcon, TestStatus
+from harness.result_cache import (
+    RESULT_CACHE_ENV,
+    cached_result_path,
+    load_cached_result,
+    result_cache_root,
+    result_key,
+    store_result,
+)
+# Aliased so pytest does not try to collect it as a test class
+from harness.runner import FixtureConfig as RunnerFixtureConfig
+from harness.runner import TestConfig as RunnerTestConfig
+from harness.runner import TestRunner as HarnessRunner
+
+TEST_YAML = """test_id: t0
+test_name: Test 0
+execution:
+  prompt: list files
+  model: haiku
+expectations:
+  - id: exp-001
+    type: tool_call
+    description: Listed files
+    expected:
+      tool: Bash
+      pattern: 'ls -la'
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A fixture with one test, results cached under reports/result-cache."""
+    monkeypatch.delenv(RESULT_CACHE_ENV, raising=False)
+    monkeypatch.delenv("SC_SYNAPTIC_CANVAS_PATH", raising=False)
+    root = tmp_path / "project"
+    tests_dir = root / "fixtures" / "fx" / "tests"
+    tests_dir.mkdir(parents=True)
+    (root / "fixtures" / "fx" / "fixture.yaml").write_text(
+        "name: fx\npackage: sc-demo\nsetup:\n  plugins:\n    - sc-demo@synaptic-canvas\n"
+    )
+    (tests_dir / "test_0.yaml").write_text(TEST_YAML)
+    return root
+
+
+@pytest.fixture
+def sc_checkout(tmp_path):
+    """synaptic-canvas checkout with one package."""
+    root = tmp_path / "synaptic-canvas"
+    (root / "tools").mkdir(parents=True)
+    (root / "tools" / "sc-install.py").write_text("# installer\n")
+    (root / "packages" / "sc-demo" / "commands").mkdir(parents=True)
+    (root / "packages" / "sc-demo" / "commands" / "sc-demo.md").write_text("# Demo\n")
+    return root
+
+
+def _passing_result(runner, test_id="t0"):
+    test_config = RunnerTestConfig(test_id=test_id, test_name=f"Test {test_id}")
+    result = runner._create_skipped_result(test_config, RunnerFixtureConfig(name="fx"))
+    return result.model_copy(update={
+        "status": TestStatus.PASS,
+        "status_icon": StatusIcon.PASS,
+        "skip_reason": None,
+        "duration_ms": 95000,
+    })
+
+
+class TestResultKey:
+    """Keys change exactly when something a result depends on changes."""
+
+    def _key(self, project, sc_checkout, model="haiku"):
+        fixture_dir = project / "fixtures" / "fx"
+        return result_key(
+            fixture_dir / "tests" / "test_0.yaml",
+            fixture_dir / "fixture.yaml",
+            ["sc-demo@synaptic-canvas"],
+            model,
+            sc_checkout,
+        )
+
+    def test_stable_and_ignores_formatting(self, project, sc_checkout):
+        key = self._key(project, sc_checkout)
+        test_yaml = project / "fixtures" / "fx" / "tests" / "test_0.yaml"
+        test_yaml.write_text("# a comment\n" + TEST_YAML)
+
+        assert self._key(project, sc_checkout) == key
+
+    def test_test_and_fixture_changes(self, project, sc_checkout):
+        key = self._key(project, sc_checkout)
+        test_yaml = project / "fixtures" / "fx" / "tests" / "test_0.yaml"
+        test_yaml.write_text(TEST_YAML.replace("ls -la", "ls -l"))
+        changed_test = self._key(project, sc_checkout)
+        (project / "fixtures" / "fx" / "fixture.yaml").write_text("name: fx\ndescription: edited\n")
+
+        assert len({key, changed_test, self._key(project, sc_checkout)}) == 3
+
+    def test_package_installer_and_model_changes(self, project, sc_checkout):
+        key = self._key(project, sc_checkout)
+        (sc_checkout / "packages" / "sc-demo" / "commands" / "sc-demo.md").write_text("# Demo v2\n")
+        changed_package = self._key(project, sc_checkout)
+        (sc_checkout / "tools" / "sc-install.py").write_text("# installer v2\n")
+        changed_installer = self._key(project, sc_checkout)
+
+        keys = {key, changed_package, changed_installer, self._key(project, sc_checkout, model="sonnet")}
+        assert len(keys) == 4
+
+
+class TestStorage:
+    """Only passing results are stored; they come back marked as cached."""
+
+    def test_round_trip(self, tmp_path, project):
+        result = _passing_result(HarnessRunner(project))
+
+        assert store_result(tmp_path, "fx", "t0", "k1", result)
+        cached = load_cached_result(tmp_path, "fx", "t0", "k1")
+
+        assert cached.cached is True
+        assert cached.model_dump(exclude={"cached"}) == result.model_dump(exclude={"cached"})
+        assert load_cached_result(tmp_path, "fx", "t0", "k2") is None
+        assert load_cached_result(tmp_path, "fx", "other", "k1") is None
+
+    def test_failed_and_cached_results_not_stored(self, tmp_path, project):
+        result = _passing_result(HarnessRunner(project))
+        failed = result.model_copy(update={"status": TestStatus.FAIL})
+
+        assert not store_result(tmp_path, "fx", "t0", "k1", failed)
+        assert not store_result(tmp_path, "fx", "t0", "k1", result.model_copy(update={"cached": True}))
+        assert not cached_result_path(tmp_path, "fx", "t0").exists()
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path, project):
+        store_result(tmp_path, "fx", "t0", "k1", _passing_result(HarnessRunner(project)))
+        path = cached_result_path(tmp_path, "fx", "t0")
+        entry = json.loads(path.read_text())
+        entry["result"]["status"] = "not-a-status"
+        path.write_text(json.dumps(entry))
+
+        assert load_cached_result(tmp_path, "fx", "t0", "k1") is None
+        path.write_text("{truncated")
+        assert load_cached_result(tmp_path, "fx", "t0", "k1") is None
+
+    def test_result_cache_root_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(RESULT_CACHE_ENV, raising=False)
+        assert result_cache_root(tmp_path) == tmp_path / "result-cache"
+        monkeypatch.setenv(RESULT_CACHE_ENV, "off")
+        assert result_cache_root(tmp_path) is None
+        monkeypatch.setenv(RESULT_CACHE_ENV, str(tmp_path / "elsewhere"))
+        assert result_cache_root(tmp_path) == tmp_path / "elsewhere"
+
+
+class TestRunnerChangedOnly:
+    """TestRunner(changed_only=True) reuses results of unchanged tests."""
+
+    def _cache(self, runner, project):
+        fixture_dir = project / "fixtures" / "fx"
+        test_path = fixture_dir / "tests" / "test_0.yaml"
+        key = runner._result_key(
+            fixture_dir,
+            RunnerFixtureConfig.from_yaml(fixture_dir / "fixture.yaml"),
+            test_path,
+            RunnerTestConfig.from_yaml(test_path),
+        )
+        store_result(runner.result_cache_path, "fx", "t0", key, _passing_result(runner))
+
+    def test_reuses_unchanged_and_runs_changed(self, project, monkeypatch):
+        sessions = []
+
+        def no_session(*args, **kwargs):
+            sessions.append(kwargs)
+            raise RuntimeError("no Claude here")
+
+        monkeypatch.setattr("harness.runner.isolated_claude_session", no_session)
+        runner = HarnessRunner(project, changed_only=True)
+        self._cache(runner, project)
+
+        cached = runner.run_fixture("fx", generate_html=False).tests[0]
+        assert cached.cached and cached.status == TestStatus.PASS
+        assert cached.duration_ms == 95000
+        assert sessions == []
+
+        test_yaml = project / "fixtures" / "fx" / "tests" / "test_0.yaml"
+        test_yaml.write_text(TEST_YAML.replace("ls -la", "ls -l"))
+        rerun = runner.run_fixture("fx", generate_html=False).tests[0]
+        assert not rerun.cached and rerun.status == TestStatus.FAIL
+        assert len(sessions) == 1
+
+    def test_without_changed_only_always_runs(self, project, monkeypatch):
+        monkeypatch.setattr("harness.runner.isolated_claude_session", MagicMock(side_effect=RuntimeError))
+        runner = HarnessRunner(project)
+        self._cache(runner, project)
+
+        assert not runner.run_fixture("fx", generate_html=False).tests[0].cached
+
+    def test_replay_and_disabled_cache(self, project, monkeypatch):
+        assert HarnessRunner(project, replay_path=project / "bundles").result_cache_path is None
+        monkeypatch.setenv(RESULT_CACHE_ENV, "off")
+        assert HarnessRunner(project, changed_only=True).result_cache_path is None
+
+
+class TestPytestChangedOnly:
+    """YAMLTestItem skips execution when its result is cached."""
+
+    def _item(self, project, changed_only):
+        from harness.fixture_loader import FixtureConfig, TestConfig
+        from harness.pytest_plugin import YAMLTestItem
+
+        with patch.object(YAMLTestItem, "__init__", lambda self, *args, **kwargs: None):
+            item = YAMLTestItem.__new__(YAMLTestItem)
+        options = {"--report-dir": str(project / "reports"), "--changed-only": changed_only}
+        item.config = MagicMock()
+        item.config.getoption.side_effect = lambda name, default=None: options.get(name, default)
+        item.fixture_config = FixtureConfig.from_yaml(project / "fixtures" / "fx" / "fixture.yaml", load_tests=False)
+        item.test_config = TestConfig.from_yaml(project / "fixtures" / "fx" / "tests" / "test_0.yaml")
+        item.execution_duration_ms = 0
+        item.cache_key = None
+        item.cached_result = None
+        return item
+
+    def test_cached_result_reused(self, project):
+        item = self._item(project, changed_only=True)
+        store_result(
+            project / "reports" / "result-cache", "fx", "t0",
+            item._result_key(), _passing_result(HarnessRunner(project)),
+        )
+
+        with patch.object(type(item), "_find_project_path", side_effect=AssertionError("must not run")):
+            item.runtest()
+
+        assert item.cached_result.cached
+        assert item.execution_duration_ms == 95000
+
+    def test_cache_miss_runs_test(self, project):
+        item = self._item(project, changed_only=True)
+
+        with patch.object(type(item), "_find_project_path", side_effect=RuntimeError("ran")):
+            with pytest.raises(RuntimeError, match="ran"):
+                item.runtest()
+
+        assert item.cached_result is None
+        assert item.cache_key == item._result_key()
+
+    def test_report_marks_cached_and_stores_passing(self, project, tmp_path):
+        from harness.pytest_plugin import _generate_fixture_report, _report_state
+
+        item = self._item(project, changed_only=True)
+        cached = _passing_result(HarnessRunner(project)).model_copy(update={"cached": True})
+        _report_state.reset()
+        _report_state.record_fixture_config("fx", item.fixture_config)
+        _report_state.record_test_result(
+            fixture_name="fx", test_id="t0", test_config=item.test_config, passed=True,
+            duration_ms=95000, cached_result=cached,
+        )
+        _report_state.record_test_result(
+            fixture_name="fx", test_id="t1", test_config=item.test_config, passed=True,
+            duration_ms=1000, cache_key="k1",
+        )
+
+        reports = tmp_path / "reports"
+        assert _generate_fixture_report("fx", reports, project) is not None
+        _report_state.reset()
+
+        tests = json.loads((reports / "fx.json").read_text())["tests"]
+        assert [t["cached"] for t in tests] == [True, False]
+        assert "cached result" in (reports / "fx.html").read_text()
+        assert load_cached_result(reports / "result-cache", "fx", "t0", "k1").duration_ms == 1000
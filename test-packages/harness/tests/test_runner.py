@@ -0,0 +1,218 @@
+"""
+Unit tests for harness.runner parallel fixture execution.
+
+Tests that run_fixture:
+- Runs tests concurrently with --workers, one trace file and project copy per worker
+- Schedules longest-first from the previous report's durations
+- Returns results in discovery order regardless of completion order
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from harness.models import (
+    ClaudeResponse,
+    DebugInfo,
+    ExecutionSection,
+    ReproduceSection,
+    SideEffects,
+    StatusIcon,
+    TestMetadata,
+    TestResult,
+    TestStatus,
+)
+# Aliased so pytest does not try to collect it as a test class
+from harness.runner import TestRunner as HarnessRunner
+
+
+def make_result(test_id: str, duration_ms: int = 0) -> TestResult:
+    return TestResult(
+        test_id=test_id,
+        test_name=test_id,
+        tab_label=test_id,
+        description="",
+        timestamp=datetime.now(),
+        duration_ms=duration_ms,
+        status=TestStatus.PASS,
+        status_icon=StatusIcon.PASS,
+        pass_rate="0/0",
+        metadata=TestMetadata(fixture="parallel", package="sc-test", model="haiku", test_repo="."),
+        reproduce=ReproduceSection(test_command=""),
+        execution=ExecutionSection(prompt="", model="haiku"),
+        expectations=[],
+        timeline=[],
+        side_effects=SideEffects(),
+        claude_response=ClaudeResponse(preview="", full_text="", word_count=0),
+        debug=DebugInfo(),
+    )
+
+
+@pytest.fixture
+def fixture_project(tmp_path):
+    """A project with one fixture of six tests."""
+    tests_dir = tmp_path / "fixtures" / "parallel" / "tests"
+    tests_dir.mkdir(parents=True)
+    (tmp_path / "fixtures" / "parallel" / "fixture.yaml").write_text(
+        "name: parallel\npackage: sc-test\n"
+    )
+    for i in range(6):
+        (tests_dir / f"test_{i}.yaml").write_text(
+            f"test_id: t{i}\ntest_name: Test {i}\nexecution:\n  prompt: p{i}\n"
+        )
+    (tmp_path / ".claude").mkdir()
+    (tmp_path / ".claude" / "settings.json").write_text("{}")
+    return tmp_path
+
+
+class FakeRunTest:
+    """Stand-in for TestRunner.run_test that records scheduling."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.started: list[str] = []
+        self.active_traces: set[Path] = set()
+        self.active_projects: set[Path] = set()
+        self.projects: set[Path] = set()
+        self.max_active = 0
+        self.shared_trace = False
+        self.shared_project = False
+        self.lock = threading.Lock()
+
+    def __call__(self, runner, fixture_name, test_file, fixture_config=None, trace_path=None, project_path=None):
+        test_id = "t" + Path(test_file).stem.split("_")[1]
+        with self.lock:
+            self.started.append(test_id)
+            if trace_path in self.active_traces:
+                self.shared_trace = True
+            if project_path is not None and project_path in self.active_projects:
+                self.shared_project = True
+            self.active_traces.add(trace_path)
+            self.active_projects.add(project_path)
+            self.projects.add(project_path)
+            self.max_active = max(self.max_active, len(self.active_traces))
+        if project_path is not None:
+            # The worker's copy is a real, writable project
+            assert (project_path / ".claude" / "settings.json").is_file()
+            (project_path / ".claude" / "state" / "logs").mkdir(parents=True, exist_ok=True)
+            (project_path / ".claude" / "state" / "logs" / f"{test_id}.log").write_text(test_id)
+        # Later tests finish first, so completion order differs from discovery order
+        time.sleep(self.delay * (6 - int(test_id[1:])) / 6)
+        with self.lock:
+            self.active_traces.discard(trace_path)
+            self.active_projects.discard(project_path)
+        return make_result(test_id)
+
+
+@pytest.fixture
+def fake_run_test(monkeypatch):
+    fake = FakeRunTest()
+    monkeypatch.setattr(HarnessRunner, "run_test", lambda self, *args, **kwargs: fake(self, *args, **kwargs))
+    return fake
+
+
+class TestParallelFixture:
+    """run_fixture(workers=N) runs tests concurrently."""
+
+    def test_results_in_discovery_order(self, fixture_project, fake_run_test):
+        runner = HarnessRunner(project_path=fixture_project, workers=3)
+        report = runner.run_fixture("parallel", generate_html=False)
+
+        assert [t.test_id for t in report.tests] == ["t0", "t1", "t2", "t3", "t4", "t5"]
+        assert report.fixture.summary.passed == 6
+
+    def test_workers_use_separate_trace_files(self, fixture_project, fake_run_test):
+        runner = HarnessRunner(project_path=fixture_project)
+        runner.run_fixture("parallel", generate_html=False, workers=3)
+
+        assert fake_run_test.max_active == 3
+        assert not fake_run_test.shared_trace
+        assert runner.worker_trace_path(0) != runner.worker_trace_path(1)
+
+    def test_workers_use_separate_project_copies(self, fixture_project, fake_run_test):
+        (fixture_project / "reports").mkdir()
+        (fixture_project / "reports" / "old.json").write_text("{}")
+        runner = HarnessRunner(project_path=fixture_project)
+        runner.run_fixture("parallel", generate_html=False, workers=3)
+
+        assert len(fake_run_test.projects) == 3
+        assert not fake_run_test.shared_project
+        for project in fake_run_test.projects:
+            assert project.name == fixture_project.name
+            assert project != fixture_project
+            assert not project.exists()  # removed after the fixture run
+        # State logs written by the tests stayed in the copies
+        assert not (fixture_project / ".claude" / "state").exists()
+
+    def test_copy_project_skips_reports(self, fixture_project, tmp_path_factory):
+        (fixture_project / "reports").mkdir()
+        (fixture_project / "reports" / "old.json").write_text("{}")
+        runner = HarnessRunner(project_path=fixture_project)
+
+        copy = runner.copy_project(tmp_path_factory.mktemp("worker"))
+
+        assert (copy / ".claude" / "settings.json").read_text() == "{}"
+        assert (copy / "fixtures" / "parallel" / "fixture.yaml").is_file()
+        assert not (copy / "reports").exists()
+
+    def test_run_test_uses_given_project(self, fixture_project, tmp_path_factory, monkeypatch):
+        session = MagicMock(side_effect=RuntimeError("no Claude here"))
+        monkeypatch.setattr("harness.runner.isolated_claude_session", session)
+        runner = HarnessRunner(project_path=fixture_project)
+        copy = runner.copy_project(tmp_path_factory.mktemp("worker"))
+
+        runner.run_test("parallel", "test_0.yaml", project_path=copy)
+        runner.run_test("parallel", "test_1.yaml")
+
+        assert [c.kwargs["project_path"] for c in session.call_args_list] == [copy, fixture_project]
+
+    def test_sequential_by_default(self, fixture_project, fake_run_test):
+        runner = HarnessRunner(project_path=fixture_project)
+        runner.run_fixture("parallel", generate_html=False)
+
+        assert fake_run_test.started == ["t0", "t1", "t2", "t3", "t4", "t5"]
+        assert fake_run_test.max_active == 1
+        assert fake_run_test.projects == {None}
+
+
+class TestScheduling:
+    """Tests are scheduled longest-first from the previous report."""
+
+    def test_longest_first_from_history(self, fixture_project):
+        runner = HarnessRunner(project_path=fixture_project)
+        history = {"tests": [
+            {"test_id": f"t{i}", "duration_ms": ms, "status": "pass"}
+            for i, ms in enumerate([100, 500, 300, 900, 200, 400])
+        ]}
+        (runner.reports_path / "parallel.json").write_text(json.dumps(history))
+
+        order = runner.schedule_tests("parallel", runner.discover_tests("parallel"))
+
+        assert [p.stem for p in order] == ["test_3", "test_1", "test_5", "test_2", "test_4", "test_0"]
+
+    def test_unknown_tests_run_first(self, fixture_project):
+        runner = HarnessRunner(project_path=fixture_project)
+        history = {"tests": [{"test_id": "t0", "duration_ms": 900, "status": "pass"}]}
+        (runner.reports_path / "parallel.json").write_text(json.dumps(history))
+
+        order = runner.schedule_tests("parallel", runner.discover_tests("parallel"))
+
+        assert [p.stem for p in order] == ["test_1", "test_2", "test_3", "test_4", "test_5", "test_0"]
+
+    def test_history_from_written_report(self, fixture_project, monkeypatch):
+        durations = {f"t{i}": (i + 1) * 100 for i in range(6)}
+        monkeypatch.setattr(
+            HarnessRunner, "run_test",
+            lambda self, fixture, test_file, config=None, trace_path=None: make_result(
+                "t" + Path(test_file).stem.split("_")[1], durations["t" + Path(test_file).stem.split("_")[1]]
+            ),
+        )
+        runner = HarnessRunner(project_path=fixture_project)
+        runner.run_fixture("parallel", generate_html=False)
+
+        assert runner.historical_durations("parallel") == durations
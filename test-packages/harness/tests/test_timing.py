@@ -0,0 +1,237 @@
+"""
+Unit tests for harness.timing module.
+
+Tests per-phase timing including:
+- Nested span paths, depths and ordering
+- Optional cpu (cProfile) and memory (tracemalloc) profiling
+- Profile mode parsing
+- Per-phase percentiles across a fixture's tests
+- TestRunner and YAMLTestItem recording phases in the JSON report
+"""
+
+import json
+import time
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+
+from harness.models import PhaseTiming, TestStatus
+from harness.timing import PROFILE_MODES, PhaseTimer, parse_profile_modes, phase_stats
+# Aliased so pytest does not try to collect them as test classes
+from harness.runner import FixtureConfig as RunnerFixtureConfig
+from harness.runner import TestConfig as RunnerTestConfig
+from harness.runner import TestRunner as HarnessRunner
+
+
+def _result(runner, phases, test_id="t0", cached=False):
+    test_config = RunnerTestConfig(test_id=test_id, test_name=f"Test {test_id}")
+    result = runner._create_skipped_result(test_config, RunnerFixtureConfig(name="fx"))
+    return result.model_copy(update={"status": TestStatus.PASS, "phases": phases, "cached": cached})
+
+
+def _phase(name, duration_ms):
+    return PhaseTiming(name=name, depth=name.count("/"), start_ms=0, duration_ms=duration_ms)
+
+
+class TestPhaseTimer:
+    """Spans record nested phases in start order."""
+
+    def test_nested_spans(self):
+        timer = PhaseTimer()
+        with timer.span("home"):
+            pass
+        with timer.span("evaluate"):
+            with timer.span("logs"):
+                pass
+            with timer.span("expectations"):
+                time.sleep(0.01)
+        timer.finish()
+
+        assert [(p.name, p.depth) for p in timer.phases] == [
+            ("home", 0),
+            ("evaluate", 0),
+            ("evaluate/logs", 1),
+            ("evaluate/expectations", 1),
+        ]
+        evaluate, expectations = timer.phases[1], timer.phases[3]
+        assert expectations.duration_ms >= 10
+        assert evaluate.duration_ms >= expectations.duration_ms
+        assert evaluate.start_ms <= expectations.start_ms
+        assert all(p.peak_memory_kb is None for p in timer.phases)
+
+    def test_span_recorded_on_error(self):
+        timer = PhaseTimer()
+        with pytest.raises(RuntimeError):
+            with timer.span("claude"):
+                raise RuntimeError("timed out")
+        timer.finish()
+
+        assert [p.name for p in timer.phases] == ["claude"]
+
+    def test_apply(self, tmp_path):
+        timer = PhaseTimer()
+        with timer.span("collect"):
+            pass
+        timer.finish()
+        result = timer.apply(_result(HarnessRunner(tmp_path), []))
+
+        assert [p.name for p in result.phases] == ["collect"]
+        assert result.profile == []
+
+    def test_memory_profile(self):
+        assert not tracemalloc.is_tracing()
+        timer = PhaseTimer({"memory"})
+        with timer.span("outer"):
+            with timer.span("allocate"):
+                blob = bytearray(4 * 1024 * 1024)
+            del blob
+        timer.finish()
+
+        outer, allocate = timer.phases
+        assert allocate.peak_memory_kb >= 4096
+        assert outer.peak_memory_kb >= allocate.peak_memory_kb
+        assert not tracemalloc.is_tracing()
+
+    def test_cpu_profile(self, tmp_path):
+        def busy():
+            return sum(i * i for i in range(50_000))
+
+        timer = PhaseTimer({"cpu"})
+        with timer.span("busy"):
+            busy()
+        timer.finish()
+        result = timer.apply(_result(HarnessRunner(tmp_path), []))
+
+        assert 0 < len(result.profile) <= 25
+        assert any("busy" in h.function or "genexpr" in h.function for h in result.profile)
+        assert result.profile == sorted(result.profile, key=lambda h: h.total_ms, reverse=True)
+
+    def test_one_cpu_profile_at_a_time(self, tmp_path):
+        first = PhaseTimer({"cpu"})
+        second = PhaseTimer({"cpu"})
+        second.finish()
+        first.finish()
+        third = PhaseTimer({"cpu"})
+        third.finish()
+
+        assert first.hotspots
+        assert second.hotspots == []
+        assert third.hotspots
+
+
+class TestParseProfileModes:
+    """--phase-profile values."""
+
+    def test_modes(self):
+        assert parse_profile_modes(None) == frozenset()
+        assert parse_profile_modes("") == frozenset()
+        assert parse_profile_modes("CPU") == {"cpu"}
+        assert parse_profile_modes("cpu, memory") == set(PROFILE_MODES)
+        assert parse_profile_modes("all") == set(PROFILE_MODES)
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown profile mode"):
+            parse_profile_modes("cpu,disk")
+
+
+class TestPhaseStats:
+    """Percentiles over the tests of a fixture."""
+
+    def test_percentiles(self, tmp_path):
+        runner = HarnessRunner(tmp_path)
+        tests = [
+            _result(runner, [_phase("claude", ms), _phase("claude/tool", 1)], test_id=f"t{ms}")
+            for ms in (10, 20, 30, 40, 50)
+        ]
+        claude, tool = phase_stats(tests)
+
+        assert (claude.name, claude.depth, claude.count) == ("claude", 0, 5)
+        assert claude.p50_ms == 30
+        assert claude.p90_ms == 46
+        assert claude.max_ms == 50
+        assert claude.total_ms == 150
+        assert (tool.name, tool.depth, tool.count) == ("claude/tool", 1, 5)
+
+    def test_cached_results_left_out(self, tmp_path):
+        runner = HarnessRunner(tmp_path)
+        tests = [
+            _result(runner, [_phase("claude", 10)]),
+            _result(runner, [_phase("claude", 99_000)], test_id="t1", cached=True),
+        ]
+
+        assert [(s.count, s.max_ms) for s in phase_stats(tests)] == [(1, 10)]
+        assert phase_stats([]) == []
+
+
+class TestRunnerPhases:
+    """TestRunner records test and fixture phases in the JSON report."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SC_TEST_RESULT_CACHE", "off")
+        tests_dir = tmp_path / "fixtures" / "fx" / "tests"
+        tests_dir.mkdir(parents=True)
+        (tmp_path / "fixtures" / "fx" / "fixture.yaml").write_text("name: fx\n")
+        (tests_dir / "test_0.yaml").write_text("test_id: t0\ntest_name: Test 0\nexecution:\n  prompt: hi\n")
+        monkeypatch.setattr(
+            "harness.runner.isolated_claude_session", MagicMock(side_effect=RuntimeError("no Claude here"))
+        )
+        return tmp_path
+
+    def test_phases_in_report(self, project):
+        report = HarnessRunner(project).run_fixture("fx", generate_html=False)
+
+        assert [p.name for p in report.tests[0].phases] == ["home"]
+        assert [s.name for s in report.fixture.phase_stats] == ["home"]
+        assert [p.name for p in report.fixture.phases] == ["tests", "report"]
+
+        data = json.loads((project / "reports" / "fx.json").read_text())
+        assert [p["name"] for p in data["fixture"]["phases"]] == ["tests", "report"]
+        assert data["tests"][0]["phases"][0]["name"] == "home"
+
+    def test_parallel_workers_with_cpu_profile(self, project):
+        tests_dir = project / "fixtures" / "fx" / "tests"
+        for i in range(1, 4):
+            (tests_dir / f"test_{i}.yaml").write_text(
+                f"test_id: t{i}\ntest_name: Test {i}\nexecution:\n  prompt: hi\n"
+            )
+
+        report = HarnessRunner(project, workers=2, profile={"cpu"}).run_fixture("fx", generate_html=False)
+
+        assert len(report.tests) == 4
+        assert all(test.phases for test in report.tests)
+
+    def test_html_phase(self, project):
+        report = HarnessRunner(project, profile={"cpu"}).run_fixture("fx")
+
+        assert [p.name for p in report.fixture.phases] == ["tests", "report", "html"]
+        assert report.tests[0].profile
+        assert "Phase timings (1 test runs)" in (project / "reports" / "fx.html").read_text()
+
+
+class TestPytestPhases:
+    """YAMLTestItem times its run and the report attaches the phases."""
+
+    def test_phases_reported(self, tmp_path):
+        from harness.fixture_loader import TestConfig
+        from harness.pytest_plugin import _generate_fixture_report, _report_state
+
+        timer = PhaseTimer()
+        with timer.span("collect"):
+            pass
+        timer.finish()
+
+        test_config = TestConfig(test_id="t0", test_name="Test 0")
+        _report_state.reset()
+        _report_state.record_test_result(
+            fixture_name="fx", test_id="t0", test_config=test_config, passed=False,
+            duration_ms=1000, phase_timer=timer,
+        )
+        reports = tmp_path / "reports"
+        assert _generate_fixture_report("fx", reports, tmp_path) is not None
+        _report_state.reset()
+
+        data = json.loads((reports / "fx.json").read_text())
+        assert [p["name"] for p in data["tests"][0]["phases"]] == ["collect"]
+        assert [s["name"] for s in data["fixture"]["phase_stats"]] == ["collect"]
@@ -0,0 +1,217 @@
+"""
+Per-phase timing of harness test runs.
+
+A test's ``duration_ms`` covers everything from HOME creation to the
+report. PhaseTimer records where that time goes as nested spans:
+
+    timer = PhaseTimer()
+    with timer.span("home"):
+        ...
+    with timer.span("evaluate"):
+        with timer.span("expectations"):
+            ...
+    timer.finish()
+    result.phases = timer.phases        # [PhaseTiming(name="home"), ...,
+                                        #  PhaseTiming(name="evaluate/expectations")]
+
+Phase names are the "/"-joined path of the open spans. Spans cost two
+perf_counter() calls; profiling is opt-in:
+
+- ``cpu``:    cProfile over the whole run; the slowest functions by own
+              time are kept as ``TestResult.profile``
+- ``memory``: tracemalloc; each phase records the peak traced memory
+              while it ran (tracing slows Python code down severalfold)
+
+Only one cProfile profiler can be active per process (from Python 3.12
+cProfile is built on sys.monitoring, and enabling a second one raises), so
+one PhaseTimer profiles at a time and timers created while it runs, such
+as those of parallel workers, record no profile. Before 3.12 cProfile only
+sees the thread that created the timer; from 3.12 it sees every thread, so
+with parallel workers the profiled test's hotspots include the others'
+work. tracemalloc is process-wide, so memory peaks of parallel workers
+include each other.
+
+phase_stats() aggregates the phases of a fixture's tests into percentiles
+for the report header; cached and skipped results are left out since they
+did not run.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+from .models import PhaseStats, PhaseTiming, ProfileHotspot, TestResult
+
+# Profiling modes accepted by PhaseTimer and the --phase-profile options
+PROFILE_MODES = ("cpu", "memory")
+
+# Functions kept from a cProfile run, by own (total) time
+PROFILE_TOP = 25
+
+logger = logging.getLogger(__name__)
+
+# Held by the PhaseTimer whose cProfile profiler is active
+_cpu_profile_lock = threading.Lock()
+
+
+def parse_profile_modes(value: str | None) -> frozenset[str]:
+    """Profiling modes from a comma-separated option value.
+
+    "all" enables every mode; None or "" enables none.
+
+    Raises:
+        ValueError: For an unknown mode
+    """
+    modes = {m.strip().lower() for m in (value or "").split(",") if m.strip()}
+    if "all" in modes:
+        return frozenset(PROFILE_MODES)
+    unknown = modes - set(PROFILE_MODES)
+    if unknown:
+        raise ValueError(f"Unknown profile mode(s) {sorted(unknown)}; use {', '.join(PROFILE_MODES)} or all")
+    return frozenset(modes)
+
+
+class PhaseTimer:
+    """Records nested phase timings (and optional profiles) of one run."""
+
+    def __init__(self, profile: Iterable[str] = ()):
+        """Start timing; profiling starts immediately if requested.
+
+        Args:
+            profile: Profiling modes (see PROFILE_MODES)
+        """
+        modes = frozenset(profile)
+        self.phases: list[PhaseTiming] = []
+        self.hotspots: list[ProfileHotspot] = []
+        self._origin = time.perf_counter()
+        # Open spans: [name, start, peak of finished children]
+        self._stack: list[list] = []
+        # Closed spans: (path, depth, start, end, peak); models are built in finish()
+        self._closed: list[tuple] = []
+        self._memory = "memory" in modes
+        self._started_tracing = False
+        if self._memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._profiler: cProfile.Profile | None = None
+        if "cpu" in modes:
+            self._start_profiler()
+
+    def _start_profiler(self) -> None:
+        """Enable cProfile unless another timer (or tool) is profiling."""
+        if not _cpu_profile_lock.acquire(blocking=False):
+            logger.debug("cpu profile skipped: another test is being profiled")
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:  # another profiling tool is active (Python 3.12+)
+            _cpu_profile_lock.release()
+            logger.debug(f"cpu profile skipped: {e}")
+            return
+        self._profiler = profiler
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a phase nested in the open spans."""
+        if self._memory:
+            if self._stack:
+                self._stack[-1][2] = max(self._stack[-1][2], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame = [name, time.perf_counter(), 0]
+        path = "/".join([*(f[0] for f in self._stack), name])
+        depth = len(self._stack)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._stack.pop()
+            peak = None
+            if self._memory:
+                peak = max(tracemalloc.get_traced_memory()[1], frame[2])
+                if self._stack:
+                    self._stack[-1][2] = max(self._stack[-1][2], peak)
+            self._closed.append((path, depth, frame[1], end, peak))
+
+    def finish(self) -> None:
+        """Stop profiling and build the phases in start order."""
+        if self._profiler is not None:
+            self._profiler.disable()
+            _cpu_profile_lock.release()
+            self.hotspots = _hotspots(self._profiler)
+            self._profiler = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._closed.sort(key=lambda span: span[2])
+        self.phases = [
+            PhaseTiming(
+                name=path,
+                depth=depth,
+                start_ms=round((start - self._origin) * 1000, 3),
+                duration_ms=round((end - start) * 1000, 3),
+                peak_memory_kb=peak // 1024 if peak is not None else None,
+            )
+            for path, depth, start, end, peak in self._closed
+        ]
+
+    def apply(self, result: TestResult) -> TestResult:
+        """Attach the recorded phases and profile to a result."""
+        result.phases = list(self.phases)
+        result.profile = list(self.hotspots)
+        return result
+
+
+def _hotspots(profiler: cProfile.Profile) -> list[ProfileHotspot]:
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [
+        ProfileHotspot(
+            function=f"{filename}:{line}({function})",
+            calls=calls,
+            total_ms=round(total * 1000, 3),
+            cumulative_ms=round(cumulative * 1000, 3),
+        )
+        for (filename, line, function), (_, calls, total, cumulative, _) in rows[:PROFILE_TOP]
+    ]
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Linearly interpolated percentile of sorted values."""
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def phase_stats(tests: Iterable[TestResult]) -> list[PhaseStats]:
+    """Per-phase percentiles over the tests that ran, in first-seen order."""
+    durations: dict[str, list[float]] = {}
+    depths: dict[str, int] = {}
+    for test in tests:
+        if test.cached:
+            continue
+        for phase in test.phases:
+            durations.setdefault(phase.name, []).append(phase.duration_ms)
+            depths.setdefault(phase.name, phase.depth)
+    stats = []
+    for name, values in durations.items():
+        ordered = sorted(values)
+        stats.append(PhaseStats(
+            name=name,
+            depth=depths[name],
+            count=len(ordered),
+            p50_ms=round(_percentile(ordered, 0.5), 3),
+            p90_ms=round(_percentile(ordered, 0.9), 3),
+            max_ms=ordered[-1],
+            total_ms=round(sum(ordered), 3),
+        ))
+    return stats
@@ -1,6 +1,9 @@
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure src/ is importable for 'sc_cli'
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -9,3 +12,16 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 if str(CODEX_SCRIPTS) not in sys.path:
     sys.path.insert(0, str(CODEX_SCRIPTS))
+
+# Keep validator runs from writing the shared YAML parse cache under ~/.cache
+os.environ.setdefault("SC_REPO_MODEL_CACHE", "off")
+# ...and ai_cli runs from caching probes of fake runner binaries under ~/.cache
+os.environ.setdefault("AI_CLI_RUNNER_CACHE", "off")
+# ...and sc-install list/info from writing the package index under ~/.claude/cache
+os.environ.setdefault("SC_PACKAGE_INDEX", "off")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _ai_cli_log_dir(tmp_path_factory):
+    """Keep ai_cli logs written by tests (and their subprocesses) out of the checkout."""
+    os.environ["AI_CLI_LOG_DIR"] = str(tmp_path_factory.mktemp("ai-cli-logs"))
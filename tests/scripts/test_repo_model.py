@@ -0,0 +1,189 @@
+"""Tests for scripts/repo_model.py - the shared validator parse cache."""
+
+import datetime
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import repo_model  # noqa: E402
+from repo_model import CachedYAMLError, RepositoryModel, get_repository_model, split_frontmatter  # noqa: E402
+
+
+def load_script(name: str):
+    spec = importlib.util.spec_from_file_location("repo_model_test_" + name.replace("-", "_"), SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "repo-model.json"
+    monkeypatch.setenv("SC_REPO_MODEL_CACHE", str(path))
+    monkeypatch.setattr(repo_model, "_models", {})
+    return path
+
+
+@pytest.fixture
+def sample_repo(tmp_path):
+    root = tmp_path / "repo"
+    pkg = root / "packages" / "sc-sample"
+    (pkg / "commands").mkdir(parents=True)
+    (pkg / "agents").mkdir()
+    (pkg / "skills" / "sc-sample-skill").mkdir(parents=True)
+    (root / "version.yaml").write_text("version: 1.0.0\n")
+    (pkg / "manifest.yaml").write_text(
+        "name: sc-sample\nversion: 1.0.0\ndescription: Sample\nauthor: test\nlicense: MIT\n"
+        "artifacts:\n  commands:\n    - commands/sc-sample.md\n"
+    )
+    (pkg / "commands" / "sc-sample.md").write_text("---\nname: sc-sample\nversion: 1.0.0\n---\n\n# Body\n")
+    (pkg / "agents" / "sc-agent.md").write_text("---\nname: sc-agent\nversion: 1.0.0\n---\n\n# Agent\n")
+    (pkg / "skills" / "sc-sample-skill" / "SKILL.md").write_text("---\nname: sc-sample-skill\n---\n")
+    return root
+
+
+class TestParseYaml:
+    """parse_yaml matches yaml.safe_load and parses each text once."""
+
+    def test_memoized_per_content(self):
+        model = RepositoryModel()
+        first = model.parse_yaml("name: a\nlist: [1, 2]\n")
+        second = model.parse_yaml("name: a\nlist: [1, 2]\n")
+
+        assert first == second == {"name": "a", "list": [1, 2]}
+        assert model.stats["parsed"] == 1
+        assert model.stats["memory_hits"] == 1
+
+    def test_results_are_private_copies(self):
+        model = RepositoryModel()
+        model.parse_yaml("items: [1]\n")["items"].append(2)
+
+        assert model.parse_yaml("items: [1]\n") == {"items": [1]}
+
+    def test_errors_are_reraised(self):
+        model = RepositoryModel()
+        with pytest.raises(yaml.YAMLError):
+            model.parse_yaml("key: [unclosed\n")
+        with pytest.raises(yaml.YAMLError):
+            model.parse_yaml("key: [unclosed\n")
+        assert model.stats["parsed"] == 1
+
+    def test_split_frontmatter(self):
+        assert split_frontmatter("---\nname: x\n---\nbody\n") == "name: x"
+        assert split_frontmatter("# no frontmatter\n") is None
+
+
+class TestDiskCache:
+    """Parses persist across models keyed by content hash."""
+
+    def test_second_process_reads_from_disk(self, tmp_path):
+        path = tmp_path / "cache.json"
+        writer = RepositoryModel(path)
+        writer.parse_yaml("name: cached\n")
+        writer.save()
+
+        reader = RepositoryModel(path)
+        assert reader.parse_yaml("name: cached\n") == {"name": "cached"}
+        assert reader.stats == {"parsed": 0, "memory_hits": 0, "disk_hits": 1}
+
+    def test_changed_content_is_reparsed(self, tmp_path):
+        path = tmp_path / "cache.json"
+        writer = RepositoryModel(path)
+        writer.parse_yaml("version: 1.0.0\n")
+        writer.save()
+
+        reader = RepositoryModel(path)
+        assert reader.parse_yaml("version: 2.0.0\n") == {"version": "2.0.0"}
+        assert reader.stats["parsed"] == 1
+
+    def test_errors_replayed_with_message_and_line(self, tmp_path):
+        path = tmp_path / "cache.json"
+        text = "a: 1\nb: [unclosed\nc: 2\n"
+        writer = RepositoryModel(path)
+        with pytest.raises(yaml.YAMLError) as original:
+            writer.parse_yaml(text)
+        writer.save()
+
+        with pytest.raises(CachedYAMLError) as replayed:
+            RepositoryModel(path).parse_yaml(text)
+        assert str(replayed.value) == str(original.value)
+        assert replayed.value.problem_mark.line == original.value.problem_mark.line
+
+    def test_non_json_values_not_persisted(self, tmp_path):
+        path = tmp_path / "cache.json"
+        writer = RepositoryModel(path)
+        assert writer.parse_yaml("date: 2024-01-15\n") == {"date": datetime.date(2024, 1, 15)}
+        writer.save()
+
+        reader = RepositoryModel(path)
+        assert reader.parse_yaml("date: 2024-01-15\n") == {"date": datetime.date(2024, 1, 15)}
+        assert reader.stats["parsed"] == 1
+
+    def test_save_merges_concurrent_writers(self, tmp_path):
+        path = tmp_path / "cache.json"
+        first, second = RepositoryModel(path), RepositoryModel(path)
+        first.parse_yaml("a: 1\n")
+        second.parse_yaml("b: 2\n")
+        first.save()
+        second.save()
+
+        reader = RepositoryModel(path)
+        reader.parse_yaml("a: 1\n")
+        reader.parse_yaml("b: 2\n")
+        assert reader.stats["disk_hits"] == 2
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        assert RepositoryModel(path).parse_yaml("a: 1\n") == {"a": 1}
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("SC_REPO_MODEL_CACHE", "off")
+        monkeypatch.setattr(repo_model, "_models", {})
+
+        assert get_repository_model().cache_path is None
+
+
+class TestSharedAcrossValidators:
+    """Validators share one model in-process and the disk cache standalone."""
+
+    def test_warm_covers_manifests_and_frontmatter(self, cache_path, sample_repo):
+        model = get_repository_model()
+
+        assert model.warm(sample_repo) == 5
+        assert model.stats["parsed"] == 5
+
+    def test_validators_reuse_warmed_model(self, cache_path, sample_repo):
+        model = get_repository_model()
+        model.warm(sample_repo)
+        parsed = model.stats["parsed"]
+
+        audit = load_script("audit-versions")
+        schema = load_script("validate-frontmatter-schema")
+        audit.get_manifest_version(sample_repo / "packages" / "sc-sample")
+        audit.extract_version_from_frontmatter(sample_repo / "packages" / "sc-sample" / "commands" / "sc-sample.md")
+        schema.extract_frontmatter(str(sample_repo / "packages" / "sc-sample" / "agents" / "sc-agent.md"))
+
+        assert model.stats["parsed"] == parsed
+        assert model.stats["memory_hits"] == 3
+
+    def test_standalone_validator_reads_disk_cache(self, cache_path, sample_repo, monkeypatch):
+        warmer = get_repository_model()
+        warmer.warm(sample_repo)
+        warmer.save()
+        monkeypatch.setattr(repo_model, "_models", {})
+
+        artifacts = load_script("validate-manifest-artifacts")
+        result = artifacts.load_manifest(sample_repo / "packages" / "sc-sample")
+
+        model = get_repository_model()
+        assert result.value.name == "sc-sample"
+        assert model.stats == {"parsed": 0, "memory_hits": 0, "disk_hits": 1}
@@ -34,6 +34,9 @@ import security_scan
 from security_scan import (
     CheckResult,
     CheckStatus,
+    ContentRule,
+    ContentScanner,
+    IncrementalScanCache,
     ScanConfiguration,
     ScanResults,
     SecurityError,
@@ -43,6 +46,7 @@ from security_scan import (
     format_json_output,
     format_text_output,
     main,
+    scan_file,
 )
 
 # Add harness to path
@@ -815,6 +819,227 @@ class TestHelperFunctions:
         assert len(matches) > 0
 
 
+# =============================================================================
+# Content Scan Engine Tests
+# =============================================================================
+
+
+class TestContentScanEngine:
+    """Test the single-walk, multi-rule content scan engine."""
+
+    RULES = (
+        ContentRule("secret", r'secret\s*=\s*["\047][^"\047]+["\047]', ignore_case=True),
+        ContentRule("aws", r'AWS_SECRET\s*=\s*["\047][^"\047]+["\047]', ignore_case=True),
+        ContentRule("eval", r"eval\(", include_glob="*.py"),
+    )
+
+    def test_line_attributed_to_every_matching_rule(self, tmp_path):
+        """A line matching overlapping rules is reported once per rule."""
+        path = tmp_path / "conf.py"
+        path.write_text("x = 1\nAWS_SECRET = 'abc'\nvalue = eval(s)\n")
+
+        matches = scan_file(path.as_posix(), self.RULES)
+
+        assert [(m.rule_id, m.line_number) for m in matches] == [("secret", 2), ("aws", 2), ("eval", 3)]
+        assert matches[0].line_content == "AWS_SECRET = 'abc'"
+
+    def test_match_does_not_span_lines(self, tmp_path):
+        """An unterminated quote must not pair with a quote on a later line."""
+        path = tmp_path / "conf.txt"
+        path.write_text("secret = 'unterminated\nother = 'x'\nsecret='ok'\n")
+
+        matches = scan_file(path.as_posix(), self.RULES[:1])
+
+        assert [m.line_number for m in matches] == [3]
+
+    def test_include_glob_limits_rules(self, tmp_path):
+        (tmp_path / "a.txt").write_text("eval(x)\n")
+        (tmp_path / "b.py").write_text("eval(x)\n")
+
+        matches = ContentScanner(self.RULES).scan(tmp_path)
+
+        assert [Path(m.file_path).name for m in matches] == ["b.py"]
+
+    def test_binary_files_skipped(self, tmp_path):
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"\x00\x01secret = 'abc'\n")
+
+        assert scan_file(path.as_posix(), self.RULES) == []
+
+    def test_large_file_memory_mapped(self, tmp_path, monkeypatch):
+        """Files over the mmap threshold give the same results, across anchor chunks."""
+        monkeypatch.setattr(security_scan, "MMAP_THRESHOLD", 64)
+        monkeypatch.setattr(security_scan, "ANCHOR_CHUNK_SIZE", 50)
+        path = tmp_path / "big.txt"
+        path.write_text("filler\n" * 40 + "pad pad secret = 'abc'\n" + "filler\n" * 40 + "SECRET='z'")
+
+        matches = scan_file(path.as_posix(), self.RULES[:1])
+
+        assert [m.line_number for m in matches] == [41, 82]
+
+    def test_pattern_without_anchor_uses_full_scan(self, tmp_path):
+        (tmp_path / "a.txt").write_text("foo\nnone\nbar\n")
+        rule = ContentRule("alt", r"(foo|bar)")
+
+        assert rule.required_literals() is None
+        assert [m.line_number for m in ContentScanner([rule]).scan(tmp_path)] == [1, 3]
+
+    def test_literal_prefix_anchors(self):
+        assert ContentRule("a", r"api_key\s*=", ignore_case=True).required_literals() == (b"api_key",)
+        assert ContentRule("b", r"pickle\.loads").required_literals() == (b"pickle.loads",)
+        # The character before a quantifier is optional and must not be required
+        assert ContentRule("c", r"abcd?e").required_literals() == (b"abc",)
+
+    def test_excluded_dirs_and_files(self, tmp_path):
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "x.txt").write_text("secret = 'a'\n")
+        (tmp_path / "security-scan.txt").write_text("secret = 'a'\n")
+        (tmp_path / "kept.txt").write_text("secret = 'a'\n")
+
+        scanner = ContentScanner(self.RULES, exclude_dirs=["node_modules"], exclude_files=["security-scan"])
+
+        assert [Path(m.file_path).name for m in scanner.scan(tmp_path)] == ["kept.txt"]
+
+    def test_jobs_match_sequential(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(security_scan, "SCAN_BATCH_SIZE", 4)
+        for i in range(20):
+            (tmp_path / f"f{i:02d}.py").write_text("ok\n" * i + "secret = 'v'\neval(x)\n")
+
+        sequential = ContentScanner(self.RULES).scan(tmp_path)
+        parallel = ContentScanner(self.RULES, jobs=3).scan(tmp_path)
+
+        assert parallel == sequential
+        assert len(sequential) == 40
+
+    def test_scanner_walks_tree_once(self, temp_repo, monkeypatch):
+        """Secrets and Python safety share one walk of the search path."""
+        (temp_repo / "app.py").write_text("api_key = 'k'\neval(x)\n")
+        walks = []
+        real_walk = security_scan.os.walk
+
+        def counting_walk(*args, **kwargs):
+            walks.append(args[0])
+            return real_walk(*args, **kwargs)
+
+        monkeypatch.setattr(security_scan.os, "walk", counting_walk)
+        scanner = SecurityScanner(ScanConfiguration(repo_root=temp_repo))
+        scanner.scan_secrets()
+        scanner.check_python_safety()
+
+        assert len(walks) == 1
+        assert scanner.checks["secrets_detection"].status == CheckStatus.FAILED
+        assert scanner.checks["python_safety"].status == CheckStatus.FAILED
+
+
+class TestIncrementalScan:
+    """Test the git-blob keyed incremental scan cache."""
+
+    RULES = TestContentScanEngine.RULES
+
+    @pytest.fixture
+    def git_tree(self, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for args in (["init", "-q"], ["config", "user.email", "t@example.com"], ["config", "user.name", "t"]):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+        for i in range(10):
+            (repo / f"f{i}.py").write_text("ok\n" * i + "secret = 'v'\n")
+        (repo / "clean.txt").write_text("nothing here\n")
+        subprocess.run(["git", "add", "-A"], cwd=repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-q", "-m", "seed"], cwd=repo, check=True, capture_output=True)
+        return repo
+
+    def scan(self, repo, cache_path):
+        scanner = ContentScanner(self.RULES, exclude_dirs=[".git"])
+        cache = IncrementalScanCache(cache_path, repo, scanner.ruleset_hash())
+        matches = scanner.scan(repo, cache=cache)
+        cache.save()
+        return matches, scanner.stats
+
+    def test_warm_run_reads_nothing(self, git_tree, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        cold, cold_stats = self.scan(git_tree, cache_path)
+        warm, warm_stats = self.scan(git_tree, cache_path)
+
+        assert cold_stats["scanned"] == 11
+        assert warm_stats == {"files": 11, "cache_hits": 11, "scanned": 0}
+        assert warm == cold == ContentScanner(self.RULES, exclude_dirs=[".git"]).scan(git_tree)
+
+    def test_one_changed_file_rescanned(self, git_tree, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        self.scan(git_tree, cache_path)
+
+        (git_tree / "f3.py").write_text("clean now\n")
+        matches, stats = self.scan(git_tree, cache_path)
+
+        assert stats["scanned"] == 1
+        assert matches == ContentScanner(self.RULES, exclude_dirs=[".git"]).scan(git_tree)
+        assert "f3.py" not in {Path(m.file_path).name for m in matches}
+
+    def test_untracked_files_always_scanned(self, git_tree, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        self.scan(git_tree, cache_path)
+        (git_tree / "new.py").write_text("eval(x)\n")
+
+        self.scan(git_tree, cache_path)
+        matches, stats = self.scan(git_tree, cache_path)
+
+        assert stats["scanned"] == 1
+        assert [m.rule_id for m in matches if m.file_path.endswith("new.py")] == ["eval"]
+
+    def test_committed_change_picked_up(self, git_tree, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        self.scan(git_tree, cache_path)
+        (git_tree / "f0.py").write_text("eval(y)\n")
+        subprocess.run(["git", "commit", "-qam", "edit"], cwd=git_tree, check=True, capture_output=True)
+
+        matches, stats = self.scan(git_tree, cache_path)
+
+        assert stats["scanned"] == 1
+        assert [m.rule_id for m in matches if m.file_path.endswith("f0.py")] == ["eval"]
+
+    def test_ruleset_change_invalidates(self, git_tree, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        self.scan(git_tree, cache_path)
+
+        scanner = ContentScanner(self.RULES[:1], exclude_dirs=[".git"])
+        scanner.scan(git_tree, cache=IncrementalScanCache(cache_path, git_tree, scanner.ruleset_hash()))
+
+        assert scanner.stats["cache_hits"] == 0
+
+    def test_deleted_files_pruned(self, git_tree, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        self.scan(git_tree, cache_path)
+        (git_tree / "f1.py").unlink()
+
+        self.scan(git_tree, cache_path)
+
+        assert "f1.py" not in json.loads(cache_path.read_text())["files"]
+
+    def test_without_git_falls_back_to_full_scan(self, tmp_path):
+        (tmp_path / "a.py").write_text("secret = 'v'\n")
+        cache_path = tmp_path / "cache.json"
+
+        matches, stats = self.scan(tmp_path, cache_path)
+
+        assert stats["scanned"] == 1
+        assert len(matches) == 1
+        assert not cache_path.exists()
+
+    def test_scanner_incremental_config(self, git_tree, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        config = ScanConfiguration(repo_root=git_tree, incremental=True, cache_file=cache_path)
+
+        first = SecurityScanner(config)
+        first.scan_secrets()
+        second = SecurityScanner(config)
+        second.scan_secrets()
+
+        assert cache_path.exists()
+        assert second.content_stats["scanned"] == 0
+        assert second.checks["secrets_detection"] == first.checks["secrets_detection"]
+
+
 # =============================================================================
 # Output Format Tests
 # =============================================================================
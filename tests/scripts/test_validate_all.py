@@ -513,6 +513,125 @@ class TestRunValidatorsParallel:
         assert result.value.failed == 1
 
 
+MAIN_VALIDATOR = """#!/usr/bin/env python3
+import argparse
+import os
+import sys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fail", action="store_true")
+    args = parser.parse_args()
+    print(f"cwd={os.path.basename(os.getcwd())}")
+    print("checked", file=sys.stderr)
+    if os.environ.get("VALIDATOR_RAISE"):
+        raise RuntimeError("boom")
+    return 1 if args.fail else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+"""
+
+
+class TestInProcess:
+    """Tests for --in-process execution."""
+
+    @pytest.fixture
+    def module(self):
+        from importlib.util import spec_from_file_location, module_from_spec
+        spec = spec_from_file_location(
+            "validate_all_in_process",
+            Path(__file__).parent.parent.parent / "scripts" / "validate-all.py"
+        )
+        module = module_from_spec(spec)
+        # Registered so process-pool workers can unpickle the runner
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        yield module
+        sys.modules.pop(spec.name, None)
+
+    @pytest.fixture
+    def main_script(self, mock_scripts):
+        script = mock_scripts / "with_main.py"
+        script.write_text(MAIN_VALIDATOR)
+        return script
+
+    @pytest.mark.parametrize("script,args", [("pass.py", []), ("fail.py", []), ("with_main.py", []),
+                                             ("with_main.py", ["--fail"])])
+    def test_matches_subprocess(self, module, temp_dir, mock_scripts, main_script, script, args):
+        """In-process results carry the same exit code and output as a subprocess."""
+        config = module.ValidatorConfig(name="Same", command=["python3", str(mock_scripts / script), *args])
+
+        expected = module.run_validator(config, cwd=temp_dir).value
+        actual = module.run_validator_in_process(config, cwd=temp_dir).value
+
+        assert (actual.exit_code, actual.passed, actual.command) == (expected.exit_code, expected.passed, expected.command)
+        assert actual.stdout == expected.stdout
+        assert actual.stderr == expected.stderr
+
+    def test_restores_argv_and_cwd(self, module, temp_dir, main_script):
+        argv, cwd = list(sys.argv), Path.cwd()
+        config = module.ValidatorConfig(name="Main", command=["python3", str(main_script), "--fail"])
+
+        module.run_validator_in_process(config, cwd=temp_dir)
+
+        assert sys.argv == argv
+        assert Path.cwd() == cwd
+
+    def test_exception_reported_as_failure(self, module, main_script, monkeypatch):
+        monkeypatch.setenv("VALIDATOR_RAISE", "1")
+        config = module.ValidatorConfig(name="Boom", command=["python3", str(main_script)])
+
+        result = module.run_validator_in_process(config).value
+
+        assert result.exit_code == 1
+        assert "RuntimeError: boom" in result.stderr
+
+    def test_missing_script(self, module):
+        config = module.ValidatorConfig(name="Missing", command=["python3", "does/not/exist.py"])
+
+        result = module.run_validator_in_process(config)
+
+        assert result.is_failure()
+        assert "Script not found" in result.error.message
+
+    def test_sequential_records_timings(self, module, mock_scripts, main_script):
+        validators = [
+            module.ValidatorConfig(name="Main", command=["python3", str(main_script)]),
+            module.ValidatorConfig(name="Shell", command=["sh", "-c", "exit 0"]),
+        ]
+
+        summary = module.run_validators_sequential(validators, in_process=True).value
+
+        assert summary.all_passed is True
+        assert summary.execution_mode == "in-process"
+        assert [(t.name, t.mode) for t in summary.timings] == [("Main", "in-process"), ("Shell", "subprocess")]
+
+    def test_parallel_in_process(self, module, mock_scripts, main_script):
+        validators = [
+            module.ValidatorConfig(name="Pass", command=["python3", str(mock_scripts / "pass.py")]),
+            module.ValidatorConfig(name="Fail", command=["python3", str(main_script), "--fail"]),
+            module.ValidatorConfig(name="Main", command=["python3", str(main_script)]),
+        ]
+
+        summary = module.run_validators_parallel(validators, max_workers=2, in_process=True).value
+
+        assert (summary.passed, summary.failed) == (2, 1)
+        assert [r.name for r in summary.results] == ["Fail", "Main", "Pass"]
+        assert [t.name for t in summary.timings] == ["Fail", "Main", "Pass"]
+
+    def test_subprocess_mode_timings(self, module, mock_scripts):
+        validators = [module.ValidatorConfig(name="Pass", command=["python3", str(mock_scripts / "pass.py")])]
+
+        data = json.loads(module.run_validators_sequential(validators).value.to_json())
+
+        assert data["execution_mode"] == "subprocess"
+        assert data["timings"][0]["mode"] == "subprocess"
+        assert data["timings"][0]["duration_seconds"] == data["results"][0]["duration_seconds"]
+
+
 class TestGetValidators:
     """Tests for get_validators function."""
 
@@ -0,0 +1,92 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from agent_runner import runner
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    agents = tmp_path / ".claude" / "agents"
+    agents.mkdir(parents=True)
+    (agents / "registry.yaml").write_text(
+        "agents:\n  demo:\n    version: 1.0.0\n    path: .claude/agents/demo.md\n", encoding="utf-8"
+    )
+    (agents / "demo.md").write_text("---\nname: demo\nversion: 1.0.0\n---\n# Demo\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(runner.CACHE_ENV_VAR, raising=False)
+    runner._manifests.clear()
+    yield tmp_path
+    runner._manifests.clear()
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> dict:
+    reads = {"registry": 0, "agent": 0}
+    load_yaml_file, read_bytes = runner._load_yaml_file, runner._read_bytes
+
+    def counting_load(path):
+        reads["registry"] += 1
+        return load_yaml_file(path)
+
+    def counting_read(path):
+        reads["agent"] += 1
+        return read_bytes(path)
+
+    monkeypatch.setattr(runner, "_load_yaml_file", counting_load)
+    monkeypatch.setattr(runner, "_read_bytes", counting_read)
+    return reads
+
+
+def test_resolution_cached_until_files_change(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    reads = _count_reads(monkeypatch)
+    first = runner.validate_only("demo")
+    assert reads == {"registry": 1, "agent": 1}
+
+    assert runner.validate_only("demo") == first
+    runner._manifests.clear()  # a new process loads the manifest from disk
+    assert runner.validate_only("demo") == first
+    assert reads == {"registry": 1, "agent": 1}
+    manifest = json.loads((project / runner.CACHE_PATH).read_text(encoding="utf-8"))
+    assert manifest["files"][str(project / ".claude" / "agents" / "demo.md")]["sha256"] == first["agent"]["sha256"]
+
+    agent = project / ".claude" / "agents" / "demo.md"
+    agent.write_text(agent.read_text(encoding="utf-8").replace("1.0.0", "1.10.0"), encoding="utf-8")
+    with pytest.raises(ValueError, match="Version mismatch"):
+        runner.validate_only("demo")
+    assert reads == {"registry": 1, "agent": 2}
+
+    registry = project / ".claude" / "agents" / "registry.yaml"
+    registry.write_text(registry.read_text(encoding="utf-8").replace("1.0.0", "1.10.0"), encoding="utf-8")
+    result = runner.validate_only("demo")
+    assert result["agent"]["version"] == "1.10.0" and result["agent"]["sha256"] != first["agent"]["sha256"]
+    assert reads == {"registry": 2, "agent": 2}
+
+
+def test_cache_off_rereads_every_time(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(runner.CACHE_ENV_VAR, "off")
+    reads = _count_reads(monkeypatch)
+    for _ in range(3):
+        runner.validate_only("demo")
+    assert reads == {"registry": 3, "agent": 3}
+    assert not (project / runner.CACHE_PATH).exists()
+
+
+def test_registry_returned_as_copy(project: Path) -> None:
+    runner.load_registry()["agents"]["demo"]["path"] = "elsewhere.md"
+    assert runner.load_registry()["agents"]["demo"]["path"] == ".claude/agents/demo.md"
+
+
+def test_audit_appends_rotated_jsonl(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "AUDIT_MAX_BYTES", 600)
+    paths = [runner.invoke("demo", {"n": n})["audit_path"] for n in range(6)]
+
+    assert set(paths) == {runner.AUDIT_LOG}
+    logs = project / runner.LOGS_DIR
+    segments = sorted(logs.glob("agent-runner-*.jsonl")) + [logs / "agent-runner.jsonl"]
+    assert len(segments) > 1
+    records = [json.loads(line) for path in segments for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 6
+    assert {r["agent"] for r in records} == {"demo"} and {r["outcome"] for r in records} == {"prepared"}
+    assert all(os.path.getsize(path) < 600 + 300 for path in segments)
@@ -0,0 +1,124 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from ai_cli import logging as ai_logging
+from ai_cli.logging import JsonlLogSink, close_logs, flush_logs, iter_log_events, write_log
+
+
+@pytest.fixture(autouse=True)
+def _isolated_sinks():
+    close_logs()
+    yield
+    close_logs()
+    ai_logging._derive_package_name.cache_clear()
+
+
+def _lines(log_dir: Path) -> list:
+    return [
+        json.loads(line)
+        for path in sorted(log_dir.glob("ai-cli-*.jsonl"))
+        for line in path.read_text(encoding="utf-8").splitlines()
+    ]
+
+
+def test_write_log_buffers_compact_jsonl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AI_CLI_LOG_FLUSH_SECONDS", "60")
+    for n in range(3):
+        path = write_log({"component": "ai_cli", "event": "task_start", "n": n}, log_dir=tmp_path)
+
+    segment = Path(path)
+    assert segment.parent == tmp_path and segment.suffix == ".jsonl"
+    assert segment.read_text(encoding="utf-8") == ""
+
+    flush_logs()
+    text = segment.read_text(encoding="utf-8")
+    assert text.count("\n") == 3 and ": " not in text
+    assert [r["n"] for r in _lines(tmp_path)] == [0, 1, 2]
+    assert list(tmp_path.iterdir()) == [segment]
+
+
+def test_error_events_flush_immediately(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AI_CLI_LOG_FLUSH_SECONDS", "60")
+    write_log({"event": "task_start"}, log_dir=tmp_path)
+    write_log({"event": "cli_exception", "error": "boom"}, log_dir=tmp_path)
+
+    assert [r["event"] for r in _lines(tmp_path)] == ["task_start", "cli_exception"]
+
+
+def test_periodic_flush(tmp_path: Path) -> None:
+    sink = JsonlLogSink(tmp_path, flush_seconds=0.05)
+    sink.write({"event": "hook_start"})
+
+    deadline = time.time() + 5
+    while not _lines(tmp_path) and time.time() < deadline:
+        time.sleep(0.02)
+    sink.close()
+
+    assert [r["event"] for r in _lines(tmp_path)] == ["hook_start"]
+
+
+def test_rotates_by_size_and_age(tmp_path: Path) -> None:
+    sink = JsonlLogSink(tmp_path, max_bytes=200, flush_seconds=0)
+    for n in range(10):
+        sink.write({"event": "task_end", "n": n, "padding": "x" * 40})
+        time.sleep(0.002)
+    sink.close()
+
+    segments = sorted(tmp_path.glob("ai-cli-*.jsonl"))
+    assert len(segments) >= 3
+    assert all(path.stat().st_size < 200 + 100 for path in segments)
+    assert [r["n"] for r in _lines(tmp_path)] == list(range(10))
+
+    aged = tmp_path / "aged"
+    sink = JsonlLogSink(aged, rotate_seconds=0, flush_seconds=0)
+    for n in range(3):
+        sink.write({"n": n})
+        time.sleep(0.002)
+    sink.close()
+    assert len(list(aged.glob("ai-cli-*.jsonl"))) == 3
+
+
+def test_writers_share_open_segment(tmp_path: Path) -> None:
+    first = JsonlLogSink(tmp_path, flush_seconds=0)
+    second = JsonlLogSink(tmp_path, flush_seconds=0)
+
+    assert first.write({"pid": 1}) == second.write({"pid": 2})
+    first.close()
+    second.close()
+    assert [r["pid"] for r in _lines(tmp_path)] == [1, 2]
+
+
+def test_iter_log_events_time_range(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AI_CLI_LOG_FLUSH_SECONDS", "60")
+    legacy_ts = datetime.now(timezone.utc) - timedelta(minutes=1)
+    (tmp_path / "ai-cli-20260120_115900.json").write_text(
+        json.dumps({"timestamp": legacy_ts.isoformat(), "event": "legacy"}, indent=2)
+    )
+    boundaries = []
+    for n in range(3):
+        time.sleep(0.01)
+        boundaries.append(datetime.now(timezone.utc))
+        time.sleep(0.01)
+        write_log({"event": f"e{n}"}, log_dir=tmp_path)
+
+    events = [r["event"] for r in iter_log_events(tmp_path)]
+    assert events == ["legacy", "e0", "e1", "e2"]
+
+    ranged = iter_log_events(tmp_path, since=boundaries[0], until=boundaries[2].replace(tzinfo=None))
+    assert [r["event"] for r in ranged] == ["e0", "e1"]
+    assert list(iter_log_events(tmp_path, since=datetime.now(timezone.utc) + timedelta(days=1))) == []
+    assert list(iter_log_events(tmp_path / "missing")) == []
+
+
+def test_package_name_computed_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    ai_logging._derive_package_name.cache_clear()
+    monkeypatch.delenv("AI_CLI_LOG_DIR", raising=False)
+    monkeypatch.setenv("AI_CLI_PACKAGE_NAME", "sc-first")
+    assert ai_logging._derive_package_name() == "sc-first"
+
+    monkeypatch.setenv("AI_CLI_PACKAGE_NAME", "sc-second")
+    assert ai_logging._default_log_dir().name == "sc-first"
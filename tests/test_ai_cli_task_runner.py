@@ -1,11 +1,15 @@
 import json
+import os
+import subprocess
+import sys
+import time
 from pathlib import Path
 
 import pytest
 from jsonschema import ValidationError as SchemaValidationError
 from jsonschema import validate as validate_schema
 
-from ai_cli import task_runner
+from ai_cli import runner_cache, task_runner
 
 
 def test_resolve_model_codex_aliases() -> None:
@@ -240,3 +244,189 @@ def test_run_pretool_hooks_failure(tmp_path: Path) -> None:
     )
     with pytest.raises(RuntimeError):
         task_runner.run_pretool_hooks(agent_file, payload)
+
+
+def _assistant(agent_id: str, content) -> dict:
+    entry = task_runner._jsonl_entry(agent_id, "assistant", "", None)
+    entry["message"]["content"] = content
+    return entry
+
+
+def test_resume_context_reads_indexed_tail(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(task_runner, "_default_output_dir", lambda runner: tmp_path)
+    transcript = tmp_path / "agent-1.jsonl"
+    task_runner._append_transcript(transcript, task_runner._jsonl_entry("agent-1", "user", "go", None))
+    for n in range(200):
+        task_runner._append_transcript(transcript, _assistant("agent-1", f"turn {n}"))
+    task_runner._append_transcript(
+        transcript, _assistant("agent-1", [{"type": "text", "text": "last a"}, {"type": "tool_use"}, "last b"])
+    )
+
+    index_lines = transcript.with_suffix(".idx").read_text(encoding="utf-8").splitlines()
+    assert len(index_lines) == 202
+    assert index_lines[-1].split()[1] == str(transcript.stat().st_size)
+
+    monkeypatch.setattr(task_runner, "_scanned_entries", lambda path: pytest.fail("transcript scanned"))
+    payload = task_runner.TaskToolInput(description="Test", prompt="more", subagent_type="test", resume="agent-1")
+    assert task_runner._resume_context(payload, "claude") == "turn 199\nlast a\nlast b"
+
+
+def test_resume_context_without_current_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(task_runner, "_default_output_dir", lambda runner: tmp_path)
+    transcript = tmp_path / "agent-2.jsonl"
+    lines = [json.dumps(_assistant("agent-2", f"turn {n}")) for n in range(5)]
+    lines[3:3] = ["", "{not json", json.dumps(task_runner._jsonl_entry("agent-2", "user", "again", None))]
+    transcript.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    payload = task_runner.TaskToolInput(description="Test", prompt="more", subagent_type="test", resume="agent-2")
+
+    assert task_runner._resume_context(payload, "claude") == "turn 2\nturn 3\nturn 4"
+
+    # Entries appended without indexing make the index stale; the tail is read instead.
+    task_runner._append_transcript(transcript, _assistant("agent-2", "turn 5"))
+    with transcript.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(_assistant("agent-2", "turn 6")) + "\n")
+    assert task_runner._resume_context(payload, "claude") == "turn 4\nturn 5\nturn 6"
+
+
+def test_resume_context_index_started_mid_transcript(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(task_runner, "_default_output_dir", lambda runner: tmp_path)
+    transcript = tmp_path / "agent-3.jsonl"
+    lines = [json.dumps(_assistant("agent-3", f"old {n}")) for n in range(5)]
+    transcript.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    task_runner._append_transcript(transcript, _assistant("agent-3", "new"))
+    payload = task_runner.TaskToolInput(description="Test", prompt="more", subagent_type="test", resume="agent-3")
+
+    # The index is current but covers only the last entry.
+    assert task_runner._resume_context(payload, "claude") == "old 3\nold 4\nnew"
+
+
+def test_resume_context_short_transcript_uses_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(task_runner, "_default_output_dir", lambda runner: tmp_path)
+    transcript = tmp_path / "agent-4.jsonl"
+    task_runner._append_transcript(transcript, task_runner._jsonl_entry("agent-4", "user", "go", None))
+    task_runner._append_transcript(transcript, _assistant("agent-4", "done"))
+
+    # A typical background transcript: one user and one assistant entry.
+    monkeypatch.setattr(task_runner, "_scanned_entries", lambda path: pytest.fail("transcript scanned"))
+    payload = task_runner.TaskToolInput(description="Test", prompt="more", subagent_type="test", resume="agent-4")
+    assert task_runner._resume_context(payload, "claude") == "done"
+
+
+def test_reverse_lines_across_blocks(tmp_path: Path) -> None:
+    path = tmp_path / "lines.txt"
+    path.write_bytes("alpha\nbeta\n\nγάμμα\ndelta".encode("utf-8"))
+    lines = list(task_runner._reverse_lines(path, block_size=3))
+    assert [line.decode("utf-8") for line in lines] == ["delta", "γάμμα", "", "beta", "alpha"]
+
+
+def _fake_binary(bin_dir: Path, name: str, script: str) -> Path:
+    bin_dir.mkdir(exist_ok=True)
+    path = bin_dir / name
+    path.write_text(f"#!{sys.executable}\n{script}", encoding="utf-8")
+    path.chmod(0o755)
+    return path
+
+
+def test_runner_probe_cached_across_processes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    probes = tmp_path / "probes.txt"
+    fake = _fake_binary(
+        tmp_path / "bin",
+        "claude",
+        f"import sys\nopen({str(probes)!r}, 'a').write('probe\\n')\nprint('claude 1.0')\n",
+    )
+    monkeypatch.setenv("PATH", f"{fake.parent}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("AI_CLI_RUNNER_CACHE", str(tmp_path / "runners.json"))
+
+    for _ in range(3):
+        task_runner._check_runner_available.cache_clear()  # a new process
+        assert task_runner._check_runner_available("claude") == "claude 1.0"
+    assert probes.read_text().count("probe") == 1
+    cache = json.loads((tmp_path / "runners.json").read_text(encoding="utf-8"))
+    assert cache["binaries"][str(fake.resolve())]["version"] == "claude 1.0"
+
+    # Replacing the binary changes its size/mtime and forces a new probe.
+    fake.write_text(fake.read_text().replace("claude 1.0", "claude 2.0.1"), encoding="utf-8")
+    task_runner._check_runner_available.cache_clear()
+    assert task_runner._check_runner_available("claude") == "claude 2.0.1"
+    assert probes.read_text().count("probe") == 2
+
+    monkeypatch.setenv("AI_CLI_RUNNER_CACHE", "off")
+    task_runner._check_runner_available.cache_clear()
+    task_runner._check_runner_available("claude")
+    assert probes.read_text().count("probe") == 3
+    task_runner._check_runner_available.cache_clear()
+
+
+def test_codex_model_fallback_remembered(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = tmp_path / "calls.txt"
+    fake = _fake_binary(
+        tmp_path / "bin",
+        "codex",
+        "import sys\n"
+        f"open({str(calls)!r}, 'a').write(sys.argv[4] + '\\n')\n"
+        "if sys.argv[4] == 'gpt-5.2-codex':\n"
+        "    sys.exit(\"The 'gpt-5.2-codex' model is not supported when using Codex with a ChatGPT account.\")\n"
+        "print('ok')\n",
+    )
+    monkeypatch.setenv("PATH", f"{fake.parent}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("AI_CLI_RUNNER_CACHE", str(tmp_path / "runners.json"))
+    monkeypatch.setenv("CODEX_HOME", str(tmp_path / "codex-home"))
+    monkeypatch.delenv("CODEX_API_KEY", raising=False)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(task_runner, "_check_runner_available", lambda runner: f"{runner} 1.0")
+
+    assert task_runner.run_sync("codex", "gpt-5.2-codex", "hello") == "ok"
+    assert task_runner.run_sync("codex", "gpt-5.2-codex", "hello") == "ok"
+    assert calls.read_text().split() == ["gpt-5.2-codex", "gpt-5.2", "gpt-5.2"]
+
+
+def test_codex_model_fallback_scoped_to_account(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _fake_binary(tmp_path / "bin", "codex", "print('ok')\n")
+    codex_home = tmp_path / "codex-home"
+    codex_home.mkdir()
+    auth = codex_home / "auth.json"
+    monkeypatch.setenv("PATH", f"{fake.parent}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("AI_CLI_RUNNER_CACHE", str(tmp_path / "runners.json"))
+    monkeypatch.setenv("CODEX_HOME", str(codex_home))
+    monkeypatch.delenv("CODEX_API_KEY", raising=False)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    auth.write_text(json.dumps({"OPENAI_API_KEY": None, "tokens": {"account_id": "acct-1"}}), encoding="utf-8")
+    runner_cache.record_model_fallback("codex", "gpt-5.2-codex", "gpt-5.2")
+    assert runner_cache.model_fallback("codex", "gpt-5.2-codex") == "gpt-5.2"
+
+    # A token refresh keeps the account; switching to an API key does not.
+    auth.write_text(
+        json.dumps({"OPENAI_API_KEY": None, "tokens": {"account_id": "acct-1"}, "last_refresh": "now"}),
+        encoding="utf-8",
+    )
+    assert runner_cache.model_fallback("codex", "gpt-5.2-codex") == "gpt-5.2"
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    assert runner_cache.model_fallback("codex", "gpt-5.2-codex") is None
+    monkeypatch.delenv("OPENAI_API_KEY")
+
+    expired = time.time() + runner_cache.MODEL_FALLBACK_TTL_SECONDS + 60
+    monkeypatch.setattr(runner_cache.time, "time", lambda: expired)
+    assert runner_cache.model_fallback("codex", "gpt-5.2-codex") is None
+
+
+def test_runner_cache_updates_from_many_processes(tmp_path: Path) -> None:
+    fake = _fake_binary(tmp_path / "bin", "codex", "print('ok')\n")
+    cache = tmp_path / "runners.json"
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from ai_cli import runner_cache\n"
+        "for i in range(20):\n"
+        "    runner_cache.update(Path(sys.argv[1]), model_fallbacks={f'{sys.argv[2]}-{i}': {}})\n"
+    )
+    scripts_dir = Path(runner_cache.__file__).resolve().parents[1]
+    env = {**os.environ, "AI_CLI_RUNNER_CACHE": str(cache), "PYTHONPATH": str(scripts_dir)}
+    procs = [
+        subprocess.Popen([sys.executable, "-c", script, str(fake.resolve()), f"p{n}"], env=env)
+        for n in range(4)
+    ]
+    assert [proc.wait(timeout=60) for proc in procs] == [0, 0, 0, 0]
+
+    entry = json.loads(cache.read_text(encoding="utf-8"))["binaries"][str(fake.resolve())]
+    assert len(entry["model_fallbacks"]) == 80
@@ -0,0 +1,183 @@
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ai_cli import task_runner, worker
+from ai_cli.logging import close_logs
+from ai_cli.task_tool import TaskToolInput
+
+FAKE_CLAUDE = """#!{python}
+import sys, time
+if sys.argv[1:] == ["--version"]:
+    print("claude 0.0-fake")
+    sys.exit(0)
+prompt = sys.argv[-1]
+time.sleep({delay})
+if "fail" in prompt:
+    print("fake failure", file=sys.stderr)
+    sys.exit(3)
+print("done: " + prompt.splitlines()[-3])
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Project directory with a fake `claude` on PATH that sleeps per run."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake = bin_dir / "claude"
+    fake.write_text(FAKE_CLAUDE.format(python=sys.executable, delay=0.3), encoding="utf-8")
+    fake.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("AI_CLI_WORKER_SOCKET", raising=False)
+    monkeypatch.delenv("AI_CLI_WORKER", raising=False)
+    task_runner._check_runner_available.cache_clear()
+    yield tmp_path
+    task_runner._check_runner_available.cache_clear()
+    close_logs()
+
+
+@pytest.fixture
+def start_worker(project: Path):
+    started = []
+
+    def start(**kwargs) -> worker.TaskWorker:
+        task_worker = worker.TaskWorker(**kwargs)
+        thread = threading.Thread(target=task_worker.serve_forever, daemon=True)
+        thread.start()
+        deadline = time.time() + 5
+        while not task_worker.socket_path.exists() and time.time() < deadline:
+            time.sleep(0.01)
+        started.append((task_worker, thread))
+        return task_worker
+
+    yield start
+    for task_worker, thread in started:
+        task_worker.shutdown()
+        thread.join(timeout=10)
+
+
+def _payload(prompt: str) -> TaskToolInput:
+    return TaskToolInput(description="Test", prompt=prompt, subagent_type="general-purpose")
+
+
+def _wait_done(agent_id: str, timeout: float = 10) -> dict:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = worker.task_status(agent_id)
+        if status["status"] in ("success", "error"):
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"{agent_id} did not finish")
+
+
+def test_worker_caps_concurrent_runs(project: Path, start_worker, monkeypatch: pytest.MonkeyPatch) -> None:
+    start_worker(max_concurrent=2)
+    monkeypatch.setattr(task_runner, "_start_child", lambda *args: pytest.fail("run-child started"))
+
+    outputs = [
+        task_runner.run_background(_payload(f"task {n}"), "claude", "haiku", project / ".sc" / "sessions")
+        for n in range(5)
+    ]
+    statuses = [_wait_done(out.agentId) for out in outputs]
+
+    assert [s["status"] for s in statuses] == ["success"] * 5
+    stats = worker.task_status()
+    assert stats["peak_running"] == 2 and stats["completed"] == 5 and stats["running"] == 0
+    for n, out in enumerate(outputs):
+        lines = [json.loads(line) for line in Path(out.output_file).read_text(encoding="utf-8").splitlines()]
+        assert [line["type"] for line in lines] == ["user", "assistant"]
+        assert lines[1]["message"]["content"] == f"done: Task: task {n}"
+
+
+def test_worker_reports_errors_and_unknown_agents(project: Path, start_worker) -> None:
+    start_worker()
+    out = task_runner.run_background(_payload("please fail"), "claude", "haiku", project / ".sc" / "sessions")
+
+    assert _wait_done(out.agentId)["status"] == "error"
+    last = json.loads(Path(out.output_file).read_text(encoding="utf-8").splitlines()[-1])
+    assert last["is_error"] is True and "fake failure" in last["message"]["content"]
+    assert worker.task_status("no-such-agent") == {"ok": False, "error": "unknown_agent", "agentId": "no-such-agent"}
+
+
+def test_worker_queue_is_bounded(project: Path, start_worker) -> None:
+    start_worker(max_concurrent=1, queue_size=1)
+    output_dir = project / ".sc" / "sessions"
+    first = task_runner.run_background(_payload("first"), "claude", "haiku", output_dir)
+    deadline = time.time() + 5
+    while worker.task_status(first.agentId)["status"] != "running" and time.time() < deadline:
+        time.sleep(0.01)
+
+    second = task_runner.run_background(_payload("second"), "claude", "haiku", output_dir)
+    assert worker.task_status(second.agentId)["status"] == "queued"
+    with pytest.raises(RuntimeError, match="queue is full"):
+        task_runner.run_background(_payload("third"), "claude", "haiku", output_dir)
+    assert _wait_done(second.agentId)["status"] == "success"
+
+
+def test_falls_back_to_run_child_without_worker(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    children = []
+    monkeypatch.setattr(task_runner, "_start_child", lambda *args: children.append(args))
+    output_dir = project / ".sc" / "sessions"
+    task_runner.run_background(_payload("no worker"), "claude", "haiku", output_dir)
+
+    # A stale socket file, and a worker serving another directory, both fall back too.
+    socket_path = project / ".sc" / "ai-cli-worker.sock"
+    socket_path.write_text("", encoding="utf-8")
+    task_runner.run_background(_payload("stale socket"), "claude", "haiku", output_dir)
+    socket_path.unlink()
+
+    other = project / "other"
+    other.mkdir()
+    monkeypatch.chdir(other)
+    task_worker = worker.TaskWorker(socket_path=socket_path)
+    thread = threading.Thread(target=task_worker.serve_forever, daemon=True)
+    thread.start()
+    while not socket_path.exists():
+        time.sleep(0.01)
+    monkeypatch.chdir(project)
+    task_runner.run_background(_payload("other cwd"), "claude", "haiku", output_dir)
+    task_worker.shutdown()
+    thread.join(timeout=10)
+
+    prompts = [json.loads(Path(args[4]).read_text(encoding="utf-8"))["prompt"] for args in children]
+    assert prompts == ["no worker", "stale socket", "other cwd"]
+
+
+def test_worker_disabled_by_env(project: Path, start_worker, monkeypatch: pytest.MonkeyPatch) -> None:
+    start_worker()
+    monkeypatch.setenv("AI_CLI_WORKER", "off")
+    assert worker.submit(_payload("x"), "claude", "haiku", "agent-1", project / "x.jsonl") is False
+
+
+def test_second_worker_refuses_live_socket(project: Path, start_worker) -> None:
+    start_worker()
+    with pytest.raises(RuntimeError, match="already running"):
+        worker.TaskWorker().serve_forever()
+
+
+def test_worker_survives_runner_exceptions(project: Path, start_worker, monkeypatch: pytest.MonkeyPatch) -> None:
+    real_run = task_runner.run_background_child_with_payload
+
+    def flaky_run(payload, **kwargs):
+        if "explode" in payload.prompt:
+            raise OSError("transcript directory vanished")
+        return real_run(payload=payload, **kwargs)
+
+    monkeypatch.setattr(task_runner, "run_background_child_with_payload", flaky_run)
+    start_worker(max_concurrent=1)
+    output_dir = project / ".sc" / "sessions"
+    outputs = [
+        task_runner.run_background(_payload(prompt), "claude", "haiku", output_dir)
+        for prompt in ("explode", "after", "explode again", "still running")
+    ]
+
+    assert [_wait_done(out.agentId)["status"] for out in outputs] == ["error", "success", "error", "success"]
+    stats = worker.task_status()
+    assert stats["completed"] == 4 and stats["running"] == 0
@@ -0,0 +1,209 @@
+"""
+Tests for the sc-install local package index.
+
+The index must return the same manifests as _parse_manifest, re-parse only
+packages whose manifest.yaml changed, and be shared with skill_integration.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from sc_cli import install as sc_install
+from sc_cli import skill_integration
+
+
+MANIFEST = """name: {name}
+version: {version}
+description: {description}
+artifacts:
+  commands:
+    - commands/{name}.md
+  scripts:
+    - scripts/{name}.py
+"""
+
+
+def write_package(packages_dir: Path, name: str, version: str = "1.0.0", description: str = "A package") -> Path:
+    pkg_dir = packages_dir / name
+    pkg_dir.mkdir(parents=True, exist_ok=True)
+    (pkg_dir / "manifest.yaml").write_text(
+        MANIFEST.format(name=name, version=version, description=description), encoding="utf-8"
+    )
+    return pkg_dir
+
+
+@pytest.fixture
+def temp_home(tmp_path, monkeypatch):
+    fake_home = tmp_path / "home"
+    fake_home.mkdir()
+    monkeypatch.setenv("HOME", str(fake_home))
+    monkeypatch.setattr(Path, "home", lambda: fake_home)
+    monkeypatch.delenv("SC_PACKAGE_INDEX", raising=False)
+    return fake_home
+
+
+@pytest.fixture
+def packages_dir(tmp_path, monkeypatch, temp_home):
+    packages = tmp_path / "packages"
+    for name in ["sc-alpha", "sc-beta", "sc-gamma"]:
+        write_package(packages, name, description=f"{name} description")
+    write_package(packages, "shared")
+    monkeypatch.setattr(sc_install, "PACKAGES_DIR", packages)
+    return packages
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Count _parse_manifest calls per package."""
+    calls: list[str] = []
+    original = sc_install._parse_manifest
+
+    def counting(pkg_dir: Path):
+        calls.append(pkg_dir.name)
+        return original(pkg_dir)
+
+    monkeypatch.setattr(sc_install, "_parse_manifest", counting)
+    return calls
+
+
+def bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestPackageIndex:
+    """_load_package_index builds and reuses the index."""
+
+    def test_matches_parse_manifest(self, packages_dir):
+        manifests = sc_install._load_package_index()
+
+        assert list(manifests) == ["sc-alpha", "sc-beta", "sc-gamma"]
+        for name, manifest in manifests.items():
+            assert manifest == sc_install._parse_manifest(packages_dir / name)
+
+    def test_index_file_is_versioned(self, packages_dir):
+        sc_install._load_package_index()
+
+        index = json.loads(sc_install._get_package_index_path(packages_dir).read_text())
+        assert index["version"] == sc_install.PACKAGE_INDEX_VERSION
+        assert index["packages_dir"] == str(packages_dir)
+        assert index["packages"]["sc-beta"]["version"] == "1.0.0"
+        assert len(index["packages"]["sc-beta"]["manifest_sha256"]) == 64
+
+    def test_warm_index_parses_nothing(self, packages_dir, parse_counter):
+        sc_install._load_package_index()
+        parse_counter.clear()
+
+        sc_install._load_package_index()
+        assert parse_counter == []
+
+    def test_only_changed_package_reparsed(self, packages_dir, parse_counter):
+        sc_install._load_package_index()
+        parse_counter.clear()
+
+        write_package(packages_dir, "sc-beta", version="2.0.0", description="sc-beta description")
+        bump_mtime(packages_dir / "sc-beta" / "manifest.yaml")
+        manifests = sc_install._load_package_index()
+
+        assert parse_counter == ["sc-beta"]
+        assert manifests["sc-beta"].version == "2.0.0"
+
+    def test_touched_manifest_not_reparsed(self, packages_dir, parse_counter):
+        sc_install._load_package_index()
+        parse_counter.clear()
+
+        bump_mtime(packages_dir / "sc-alpha" / "manifest.yaml")
+        sc_install._load_package_index()
+        sc_install._load_package_index()
+
+        assert parse_counter == []
+
+    def test_added_and_removed_packages(self, packages_dir, parse_counter):
+        sc_install._load_package_index()
+        parse_counter.clear()
+
+        write_package(packages_dir, "sc-delta")
+        (packages_dir / "sc-gamma" / "manifest.yaml").unlink()
+        manifests = sc_install._load_package_index()
+
+        assert list(manifests) == ["sc-alpha", "sc-beta", "sc-delta"]
+        assert parse_counter == ["sc-delta"]
+
+    def test_version_mismatch_rebuilds(self, packages_dir, parse_counter, monkeypatch):
+        sc_install._load_package_index()
+        parse_counter.clear()
+
+        monkeypatch.setattr(sc_install, "PACKAGE_INDEX_VERSION", sc_install.PACKAGE_INDEX_VERSION + 1)
+        sc_install._load_package_index()
+        assert sorted(parse_counter) == ["sc-alpha", "sc-beta", "sc-gamma"]
+
+    def test_corrupt_index_rebuilds(self, packages_dir):
+        sc_install._load_package_index()
+        sc_install._get_package_index_path(packages_dir).write_text("{broken")
+
+        assert list(sc_install._load_package_index()) == ["sc-alpha", "sc-beta", "sc-gamma"]
+
+    def test_checkouts_keep_separate_indexes(self, packages_dir, parse_counter, tmp_path):
+        worktree = tmp_path / "worktree" / "packages"
+        write_package(worktree, "sc-delta")
+        sc_install._load_package_index()
+        sc_install._load_package_index(worktree)
+        parse_counter.clear()
+
+        assert list(sc_install._load_package_index()) == ["sc-alpha", "sc-beta", "sc-gamma"]
+        assert list(sc_install._load_package_index(worktree)) == ["sc-delta"]
+        assert parse_counter == []
+        assert sc_install._get_package_index_path(packages_dir) != sc_install._get_package_index_path(worktree)
+
+    def test_env_override_dir(self, packages_dir, monkeypatch, tmp_path):
+        monkeypatch.setenv("SC_PACKAGE_INDEX", str(tmp_path / "index"))
+        sc_install._load_package_index()
+
+        assert sc_install._get_package_index_path(packages_dir).parent == tmp_path / "index"
+        assert sc_install._get_package_index_path(packages_dir).exists()
+
+    def test_env_off_disables_index(self, packages_dir, parse_counter, monkeypatch, temp_home):
+        monkeypatch.setenv("SC_PACKAGE_INDEX", "off")
+        sc_install._load_package_index()
+        sc_install._load_package_index()
+
+        assert sc_install._get_package_index_path(packages_dir) is None
+        assert len(parse_counter) == 6
+        assert not (temp_home / ".claude" / "cache" / "package-index").exists()
+
+
+class TestIndexConsumers:
+    """list and skill_integration read from the same index."""
+
+    def test_list_uses_index(self, packages_dir, parse_counter, capsys):
+        sc_install.main(["index"])
+        parse_counter.clear()
+
+        assert sc_install.main(["list", "--search", "beta"]) == 0
+        out = capsys.readouterr().out
+        assert "sc-beta" in out
+        assert "sc-alpha" not in out
+        assert parse_counter == []
+
+    def test_index_rebuild_command(self, packages_dir, parse_counter, capsys):
+        sc_install.main(["index"])
+        parse_counter.clear()
+
+        assert sc_install.main(["index", "--rebuild"]) == 0
+        assert len(parse_counter) == 3
+        assert "Indexed 3 packages" in capsys.readouterr().out
+
+    def test_query_marketplace_packages_uses_index(self, packages_dir, parse_counter):
+        sc_install._load_package_index()
+        parse_counter.clear()
+
+        result = skill_integration.query_marketplace_packages(search_query="gamma")
+
+        assert result["status"] == "success"
+        assert [p["name"] for p in result["packages"]] == ["sc-gamma"]
+        assert result["packages"][0]["artifacts"]["commands"] == 1
+        assert parse_counter == []
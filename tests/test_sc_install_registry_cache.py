@@ -0,0 +1,264 @@
+"""
+Tests for the sc-install registry cache and concurrent registry fetching.
+
+A local http.server stands in for remote registries: it counts requests,
+honours If-None-Match with 304 replies, and can add latency per request.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from sc_cli import install as sc_install
+
+
+REGISTRY_DATA = {
+    "packages": {
+        "sc-alpha": {"version": "1.0.0", "description": "Alpha package", "tier": "free"},
+        "sc-beta": {"version": "2.1.0", "description": "Beta package", "tier": "premium"},
+    }
+}
+
+
+class RegistryServer:
+    """Threaded HTTP server serving registry.json with ETag support."""
+
+    def __init__(self, data: dict, delay: float = 0.0, etag: str = '"v1"'):
+        self.data = data
+        self.delay = delay
+        self.etag = etag
+        self.requests: list[dict] = []
+        self.fail = False
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                server.requests.append({
+                    "path": self.path,
+                    "if_none_match": self.headers.get("If-None-Match"),
+                })
+                if server.delay:
+                    time.sleep(server.delay)
+                if server.fail:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                if server.etag and self.headers.get("If-None-Match") == server.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = json.dumps(server.data).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if server.etag:
+                    self.send_header("ETag", server.etag)
+                self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def temp_home(tmp_path, monkeypatch):
+    fake_home = tmp_path / "home"
+    fake_home.mkdir()
+    monkeypatch.setenv("HOME", str(fake_home))
+    monkeypatch.setattr(Path, "home", lambda: fake_home)
+    return fake_home
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def factory(**kwargs) -> RegistryServer:
+        server = RegistryServer(REGISTRY_DATA, **kwargs)
+        servers.append(server)
+        return server
+
+    yield factory
+    for server in servers:
+        server.close()
+
+
+def write_config(home: Path, registries: dict) -> None:
+    config_dir = home / ".claude"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    lines = ["marketplaces:", "  default: " + next(iter(registries)), "  registries:"]
+    for name, url in registries.items():
+        lines += [f"    {name}:", f"      url: {url}", "      status: active"]
+    (config_dir / "config.yaml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+# ==============================================================================
+# Cache behaviour
+# ==============================================================================
+
+class TestRegistryCache:
+    """_fetch_registry_cached stores, revalidates and serves registry.json."""
+
+    def test_cache_written_with_validators(self, temp_home, make_server):
+        server = make_server()
+        data = sc_install._fetch_registry_cached(server.url)
+
+        assert data == REGISTRY_DATA
+        cache_files = list((temp_home / ".claude" / "cache" / "registries").glob("*.json"))
+        assert len(cache_files) == 1
+        entry = json.loads(cache_files[0].read_text())
+        assert entry["url"] == f"{server.url}/registry.json"
+        assert entry["etag"] == '"v1"'
+        assert entry["last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def test_fresh_entry_served_without_request(self, temp_home, make_server):
+        server = make_server()
+        sc_install._fetch_registry_cached(server.url)
+        sc_install._fetch_registry_cached(server.url)
+
+        assert len(server.requests) == 1
+
+    def test_stale_entry_revalidated_with_etag(self, temp_home, make_server):
+        server = make_server()
+        sc_install._fetch_registry_cached(server.url)
+        data = sc_install._fetch_registry_cached(server.url, ttl=0)
+
+        assert data == REGISTRY_DATA
+        assert len(server.requests) == 2
+        assert server.requests[1]["if_none_match"] == '"v1"'
+
+    def test_not_modified_renews_entry(self, temp_home, make_server):
+        server = make_server()
+        sc_install._fetch_registry_cached(server.url)
+        sc_install._fetch_registry_cached(server.url, refresh=True)
+        sc_install._fetch_registry_cached(server.url)
+
+        # Initial fetch + one 304 revalidation; the renewed entry is fresh again
+        assert len(server.requests) == 2
+
+    def test_changed_registry_replaces_entry(self, temp_home, make_server):
+        server = make_server()
+        sc_install._fetch_registry_cached(server.url)
+        server.data = {"packages": {"sc-gamma": {"version": "0.1.0"}}}
+        server.etag = '"v2"'
+
+        data = sc_install._fetch_registry_cached(server.url, refresh=True)
+        assert list(data["packages"]) == ["sc-gamma"]
+        assert sc_install._read_registry_cache(f"{server.url}/registry.json")["etag"] == '"v2"'
+
+    def test_network_failure_serves_stale(self, temp_home, make_server, capsys):
+        server = make_server()
+        sc_install._fetch_registry_cached(server.url)
+        server.fail = True
+
+        data = sc_install._fetch_registry_cached(server.url, ttl=0)
+        assert data == REGISTRY_DATA
+        assert "cached copy" in capsys.readouterr().err
+
+    def test_offline_serves_stale_without_request(self, temp_home, make_server):
+        server = make_server()
+        sc_install._fetch_registry_cached(server.url)
+
+        data = sc_install._fetch_registry_cached(server.url, ttl=0, offline=True)
+        assert data == REGISTRY_DATA
+        assert len(server.requests) == 1
+
+    def test_offline_without_cache_fails(self, temp_home, make_server, capsys):
+        server = make_server()
+        assert sc_install._fetch_registry_cached(server.url, offline=True) is None
+        assert server.requests == []
+        assert "offline" in capsys.readouterr().err
+
+    def test_corrupt_cache_entry_refetched(self, temp_home, make_server):
+        server = make_server()
+        sc_install._fetch_registry_cached(server.url)
+        sc_install._registry_cache_path(f"{server.url}/registry.json").write_text("{not json")
+
+        assert sc_install._fetch_registry_cached(server.url) == REGISTRY_DATA
+        assert len(server.requests) == 2
+
+
+# ==============================================================================
+# Concurrent fetching
+# ==============================================================================
+
+class TestConcurrentFetch:
+    """Several registries are fetched in parallel, results in input order."""
+
+    def test_registries_fetched_concurrently(self, temp_home, make_server):
+        servers = [make_server(delay=0.3) for _ in range(4)]
+        registries = {f"reg{i}": {"url": s.url} for i, s in enumerate(servers)}
+
+        start = time.perf_counter()
+        results = sc_install._fetch_registries(registries)
+        elapsed = time.perf_counter() - start
+
+        assert list(results) == list(registries)
+        assert all(r == REGISTRY_DATA for r in results.values())
+        assert elapsed < 0.3 * len(servers) / 2
+
+    def test_failed_registry_does_not_block_others(self, temp_home, make_server):
+        good = make_server()
+        bad = make_server()
+        bad.fail = True
+
+        results = sc_install._fetch_registries({"bad": {"url": bad.url}, "good": {"url": good.url}})
+        assert results == {"bad": None, "good": REGISTRY_DATA}
+
+
+# ==============================================================================
+# Commands
+# ==============================================================================
+
+class TestCommandsUseCache:
+    """list/search/info go through the cache and honour --offline."""
+
+    def test_list_all_registries_second_run_cached(self, temp_home, make_server, capsys):
+        servers = [make_server(), make_server()]
+        write_config(temp_home, {"one": servers[0].url, "two": servers[1].url})
+
+        assert sc_install.main(["list", "--all-registries"]) == 0
+        assert sc_install.main(["list", "--all-registries"]) == 0
+
+        assert [len(s.requests) for s in servers] == [1, 1]
+        out = capsys.readouterr().out
+        assert out.index("Registry: one") < out.index("Registry: two")
+        assert "sc-alpha" in out
+
+    def test_search_offline_uses_cache(self, temp_home, make_server, capsys):
+        server = make_server()
+        write_config(temp_home, {"one": server.url})
+        assert sc_install.main(["search", "beta"]) == 0
+        server.close()
+
+        capsys.readouterr()
+        assert sc_install.main(["search", "beta", "--offline"]) == 0
+        assert "sc-beta" in capsys.readouterr().out
+
+    def test_info_refresh_revalidates(self, temp_home, make_server, capsys):
+        server = make_server()
+        write_config(temp_home, {"one": server.url})
+
+        assert sc_install.main(["info", "sc-alpha", "--registry", "one"]) == 0
+        assert sc_install.main(["info", "sc-alpha", "--registry", "one", "--refresh"]) == 0
+        assert len(server.requests) == 2
+        assert server.requests[1]["if_none_match"] == '"v1"'
+
+    def test_offline_and_refresh_are_exclusive(self, capsys):
+        with pytest.raises(SystemExit):
+            sc_install.build_parser().parse_args(["list", "--offline", "--refresh"])
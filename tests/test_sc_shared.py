@@ -11,10 +11,13 @@ from pydantic import BaseModel
 SHARED_DIR = Path(__file__).parent.parent / "packages" / "shared" / "scripts"
 sys.path.insert(0, str(SHARED_DIR))
 
+import sc_shared
 from sc_shared import (
+    AgentInvokeRequest,
     extract_hook_json,
     extract_json_from_command,
     get_tool_command,
+    invoke_agent_runner,
     is_path_allowed,
     is_git_repo,
     validate_allowed_path,
@@ -90,3 +93,25 @@ def test_is_git_repo(tmp_path: Path):
 
     subprocess.run(["git", "init"], cwd=tmp_path, check=True, stdout=subprocess.DEVNULL)
     assert is_git_repo(tmp_path) is True
+
+
+def test_invoke_agent_runner_caches_digests_and_appends_audit(tmp_path, monkeypatch):
+    agents = tmp_path / ".claude" / "agents"
+    agents.mkdir(parents=True)
+    (agents / "registry.yaml").write_text(
+        "agents:\n  demo:\n    version: 1.0.0\n    path: .claude/agents/demo.md\n", encoding="utf-8"
+    )
+    (agents / "demo.md").write_text("---\nversion: 1.0.0\n---\n# Demo\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(sc_shared.CACHE_ENV_VAR, raising=False)
+    monkeypatch.setattr(sc_shared, "_manifests", {})
+
+    first = invoke_agent_runner(AgentInvokeRequest(agent="demo"))
+    monkeypatch.setattr(sc_shared, "_read_bytes", lambda path: pytest.fail("agent file re-read"))
+    monkeypatch.setattr(sc_shared, "_load_yaml_file", lambda path: pytest.fail("registry re-parsed"))
+    second = invoke_agent_runner(AgentInvokeRequest(agent="demo", params={"n": 2}))
+
+    assert second.agent == first.agent and second.agent["version"] == "1.0.0"
+    assert first.audit_path == second.audit_path == sc_shared.AUDIT_LOG
+    lines = (tmp_path / sc_shared.AUDIT_LOG).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["file_sha256"] for line in lines] == [first.agent["sha256"]] * 2